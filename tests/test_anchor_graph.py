@@ -0,0 +1,76 @@
+"""Tests for the compiled anchor dependency graph (anchor_graph.py)."""
+
+import sys
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+sys.path.insert(0, str(TOOLS_DIR.parent))
+sys.path.insert(0, str(TOOLS_DIR))
+
+from tools.anchor_graph import ANCHOR, READING, compile_anchor_graph  # noqa: E402
+
+
+ANCHORS = {"a_root": {}, "a_mid": {}, "a_leaf": {}, "a_other": {}}
+READINGS = {
+    "r1": {"depends_on": ["a_root"], "supports": ["a_mid"]},
+    "r2": {"depends_on": ["a_root"], "supports": ["a_mid"]},
+    "r3": {"depends_on": ["a_mid"], "supports": ["a_leaf"]},
+    "r4": {"depends_on": ["a_leaf"]},
+    "r5": {"depends_on": ["a_other"]},
+}
+
+
+def _reach_table(graph):
+    return {(s, t): graph.reaches(s, t) for s in graph.nodes for t in graph.nodes}
+
+
+def test_downstream_closure_and_frontier():
+    graph = compile_anchor_graph(ANCHORS, READINGS)
+    assert graph.downstream("a_root") == {
+        "readings": ["r1", "r2", "r3", "r4"],
+        "anchors": ["a_mid", "a_leaf"],
+    }
+    assert graph.downstream("a_other") == {"readings": ["r5"], "anchors": []}
+    assert graph.cycles() == []
+    assert graph.cycle_paths() == []
+
+    frontier = graph.cascade_frontier("a_root")
+    assert frontier.readings == (("r1", 1), ("r2", 1))
+    assert frontier.anchors == (("a_mid", 1), ("a_mid", 1))
+    assert frontier.max_depth == 2
+    assert graph.cascade_frontier("a_root") is frontier
+    assert graph.cascade_frontier("a_leaf").max_depth == 0
+
+
+def test_incremental_edges_match_rebuild_and_detect_cycles():
+    graph = compile_anchor_graph(ANCHORS, {})
+    for reading_id, reading in READINGS.items():
+        graph.add_reading(reading_id, reading["depends_on"], reading.get("supports", []))
+        graph.reaches((ANCHOR, "a_root"), (READING, reading_id))  # keep the index built
+    assert _reach_table(graph) == _reach_table(compile_anchor_graph(ANCHORS, READINGS))
+
+    frontier = graph.cascade_frontier("a_root")
+    graph.add_reading("r6", ["a_other"])
+    assert graph.cascade_frontier("a_root") is frontier  # unrelated edge keeps the memo
+    graph.add_reading("r8", ["a_mid"])
+    assert graph.cascade_frontier("a_root") is not frontier
+    assert "r8" in graph.downstream("a_root")["readings"]
+    frontier = graph.cascade_frontier("a_root")
+
+    graph.add_reading("r7", ["a_leaf"], supports=["a_root"])
+    assert graph.cascade_frontier("a_root") is not frontier
+    cycles = graph.cycles()
+    assert len(cycles) == 1
+    assert {node_id for _, node_id in cycles[0]} == {
+        "a_root",
+        "a_mid",
+        "a_leaf",
+        "r1",
+        "r2",
+        "r3",
+        "r7",
+    }
+    assert graph.cycle_paths() == [["a_root", "r1", "a_mid", "r3", "a_leaf", "r7", "a_root"]]
+    assert graph.reaches((ANCHOR, "a_leaf"), (READING, "r1"))
+    assert not graph.reaches((ANCHOR, "a_other"), (ANCHOR, "a_root"))
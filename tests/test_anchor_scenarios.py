@@ -0,0 +1,111 @@
+"""Tests for batch anchor demotion scenarios (anchor_scenarios.py)."""
+
+import sys
+from itertools import combinations
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+sys.path.insert(0, str(TOOLS_DIR.parent))
+sys.path.insert(0, str(TOOLS_DIR))
+
+from tools.anchor_scenarios import CapPropagator, build_report, diff_matrices  # noqa: E402
+from tools.anchor_tracker import AnchorTracker  # noqa: E402
+
+
+ANCHORS = {
+    "a_toponym": {"confidence": "CERTAIN", "level": 1},
+    "a_linear_b": {"confidence": "HIGH", "level": 2},
+    "a_loan": {"confidence": "MEDIUM", "level": 4},
+    "a_suffix": {"confidence": "PROBABLE", "level": 5},
+}
+READINGS = {
+    "PA-I-TO": {
+        "confidence": "CERTAIN",
+        "depends_on": ["a_toponym"],
+        "supported_hypotheses": ["toponym"],
+    },
+    "KU-RO": {
+        "confidence": "HIGH",
+        "depends_on": ["a_linear_b"],
+        "supports": ["a_loan"],
+    },
+    "SA-RA₂": {"confidence": "MEDIUM", "depends_on": ["a_linear_b", "a_loan"]},
+    "JA-SA": {
+        "confidence": "LOW",
+        "depends_on": ["a_loan", "a_suffix"],
+        "supports": ["a_linear_b"],
+    },
+}
+
+
+def _tracker():
+    tracker = AnchorTracker()
+    tracker.anchors = ANCHORS
+    tracker.readings = READINGS
+    return tracker
+
+
+def test_single_scenarios_cap_through_feedback_cycle():
+    propagator = CapPropagator(_tracker(), status="REJECTED")
+    baseline = build_report(propagator, pairwise=False)["baseline"]
+    assert baseline["readings"] == {
+        "PA-I-TO": "PROBABLE",  # single-hypothesis cap
+        "KU-RO": "HIGH",
+        "SA-RA₂": "MEDIUM",
+        "JA-SA": "MEDIUM",
+    }
+    assert baseline["anchors"]["a_suffix"] == "MEDIUM"  # level 5 maximum
+
+    # a_linear_b -> KU-RO -> a_loan -> JA-SA -> a_linear_b is one cycle
+    cell = propagator.describe(propagator.single("a_suffix"))
+    assert cell["readings"] == {"JA-SA": "SPECULATIVE", "KU-RO": "PROBABLE", "SA-RA₂": "LOW"}
+    assert cell["anchors"] == {"a_linear_b": "PROBABLE", "a_loan": "LOW", "a_suffix": "SPECULATIVE"}
+    assert cell["readings_demoted"] == 3
+
+    direct = CapPropagator(_tracker(), status="REJECTED", feedback=False)
+    assert direct.describe(direct.single("a_suffix"))["readings"] == {"JA-SA": "SPECULATIVE"}
+    assert propagator.describe(propagator.single("a_toponym"))["readings"] == {
+        "PA-I-TO": "SPECULATIVE"
+    }
+
+
+def test_pairs_reuse_singles_and_matrices_diff():
+    for status in ("QUESTIONED", "DEMOTED", "REJECTED"):
+        propagator = CapPropagator(_tracker(), status=status)
+        for first, second in combinations(ANCHORS, 2):
+            demoted = {propagator.graph.ordinal[("anchor", a)]: status for a in (first, second)}
+            full = propagator._sweep(demoted, -1, propagator.baseline.__getitem__, True)
+            assert propagator.describe(propagator.pair(first, second)) == propagator.describe(full)
+
+    old = build_report(CapPropagator(_tracker(), status="DEMOTED"), pairwise=True)
+    new = build_report(CapPropagator(_tracker(), status="REJECTED"), pairwise=True)
+    assert len(old["scenarios"]) == 4 + 6
+    assert diff_matrices(old, old) == []
+    changes = diff_matrices(old, new)
+    assert ("a_toponym", "PA-I-TO", "POSSIBLE", "SPECULATIVE") in changes
+
+
+def test_incrementally_registered_reading_is_swept_in_order():
+    def tracker(readings):
+        tracker = AnchorTracker()
+        tracker.anchors = {"A": {"confidence": "HIGH", "level": 2}, "B": dict(ANCHORS["a_loan"])}
+        tracker.readings = readings
+        return tracker
+
+    incremental = tracker({"r1": {"confidence": "LOW", "depends_on": ["B"]}})
+    incremental._graph().component_order()  # index built before the new reading
+    incremental.register_reading("r2", ["A"], confidence="HIGH")
+    fresh = tracker(dict(incremental.readings))
+
+    for t in (incremental, fresh):
+        propagator = CapPropagator(t, status="REJECTED")
+        assert propagator.describe(propagator.single("A"))["readings"] == {"r2": "SPECULATIVE"}
+
+
+def test_validate_consistency_reports_cycles_from_graph_components():
+    result = _tracker().validate_consistency()
+    assert result.circular_dependencies == [
+        ["a_linear_b", "KU-RO", "a_loan", "JA-SA", "a_linear_b"]
+    ]
+    assert not result.is_valid
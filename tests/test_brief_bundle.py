@@ -0,0 +1,53 @@
+"""Tests for the indexed reading brief bundle (brief_bundle.py)."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+sys.path.insert(0, str(TOOLS_DIR.parent))
+sys.path.insert(0, str(TOOLS_DIR))
+
+from tools.brief_bundle import BriefBundle, index_path, write_bundle  # noqa: E402
+
+
+def _brief(tablet_id, links):
+    return {
+        "metadata": {"tool": "reading_pipeline.py", "stage": "PREPARE", "tablet_id": tablet_id},
+        "brief": {
+            "tablet_id": tablet_id,
+            "site": tablet_id[:2],
+            "readiness_score": 0.5,
+            "document_type": "administrative",
+            "raw_text": "KU-RO 10 · QE-RA₂-U",
+            "cross_tablet_links": [{"linked_tablet": "HT 9"}] * links,
+        },
+    }
+
+
+def test_bundle_round_trip_and_paging(tmp_path):
+    path = tmp_path / "briefs.jsonl"
+    briefs = [(f"HT {i}", _brief(f"HT {i}", i)) for i in range(7)]
+    index = write_bundle(path, iter(briefs[:3] + [("ZZ 1", None)] + briefs[3:]))
+
+    assert index_path(path) == tmp_path / "briefs.index.json"
+    assert index["skipped"] == ["ZZ 1"]
+
+    bundle = BriefBundle(path)
+    assert len(bundle) == 7
+    assert bundle.ids() == [tablet_id for tablet_id, _ in briefs]
+    assert bundle.get("HT 5") == briefs[5][1]
+    assert bundle.get("ZZ 1") is None
+    assert [e["tablet_id"] for e in bundle.page(2, size=3)] == ["HT 3", "HT 4", "HT 5"]
+    assert bundle.page(3, size=3)[0]["cross_tablet_links"] == 6
+
+
+def test_bundle_rejects_stale_index(tmp_path):
+    path = tmp_path / "briefs.jsonl"
+    write_bundle(path, [("HT 1", _brief("HT 1", 1))])
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("{}\n")
+    with pytest.raises(ValueError):
+        BriefBundle(path)
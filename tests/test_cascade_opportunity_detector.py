@@ -0,0 +1,120 @@
+"""Tests for incremental readiness deltas in cascade_opportunity_detector.py."""
+
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+sys.path.insert(0, str(TOOLS_DIR.parent))
+sys.path.insert(0, str(TOOLS_DIR))
+
+from tools.cascade_opportunity_detector import CascadeOpportunityDetector  # noqa: E402
+
+
+INSCRIPTIONS = {
+    "HT 1": {"transliteratedWords": ["KU-RO", "SA-RA₂", "GRA", "10", "DA-RE", "5"]},
+    "HT 2": {"transliteratedWords": ["sa-ra₂", "DA-RE", "MI-NU-TE", "VIN", "3"]},
+    "KH 7": {"transliteratedWords": ["MI-NU-TE", "A-DU", "A-DU", "CYP", "2"]},
+    "ZA 4": {"transliteratedWords": ["A-DU", "QE-RA₂-U", "QE-RA₂-U"]},
+    "PH 9": {"transliteratedWords": ["GRA", "4"]},
+}
+
+
+def _detector(threshold=0.5):
+    detector = CascadeOpportunityDetector(threshold=threshold)
+    detector.inscriptions = INSCRIPTIONS
+    detector.word_to_tablets = defaultdict(set)
+    for tablet_id, data in INSCRIPTIONS.items():
+        syllabic = [t for t in data["transliteratedWords"] if "-" in t]
+        detector.tablet_syllabic_words[tablet_id] = syllabic
+        for word in syllabic:
+            detector.word_to_tablets[word].add(tablet_id)
+    detector.readiness_details = {"HT 1": {"arithmetic_status": "VERIFIED"}}
+    detector.identified_words = {"KU-RO"}
+    return detector
+
+
+def test_identify_and_rollback_match_inline_readiness():
+    detector = _detector()
+    state = detector.readiness_state()
+    baseline = {t: state.score(t) for t in INSCRIPTIONS}
+
+    assert sorted(state.identify("SA-RA₂")) == ["HT 1", "HT 2"]
+    state.identify("a-du")
+    assert state.identify("A-DU") == []  # already assumed
+    for tablet_id in INSCRIPTIONS:
+        score, total, unknown, words = detector._compute_readiness_inline(
+            tablet_id, extra_identified={"SA-RA₂", "A-DU"}
+        )
+        assert state.score(tablet_id) == (score, total, unknown)
+        assert state.unknown_words(tablet_id) == words
+    assert state.newly_identified("HT 2") == ["sa-ra₂"]
+
+    for _ in range(3):
+        state.rollback()
+    assert {t: state.score(t) for t in INSCRIPTIONS} == baseline
+    assert baseline["PH 9"] == (0.0, 0, 0)
+
+
+def test_cascade_and_what_if_use_baseline_scores():
+    detector = _detector(threshold=0.45)
+    report = detector.compute_cascade_from_word("MI-NU-TE", "HIGH")
+    direct = {o.tablet_id: o for o in report.opportunities if o.cascade_depth == 0}
+    assert set(direct) == {"HT 2", "KH 7"}
+    for opp in direct.values():
+        assert opp.current_readiness == detector._compute_readiness_inline(opp.tablet_id)[0]
+        assert opp.readiness_delta > 0
+    assert detector.readiness_state().marked == set()
+
+    reports = {r.trigger_word: r for r in detector.compute_what_if_all()}
+    assert set(reports) == {"SA-RA₂", "sa-ra₂", "DA-RE", "MI-NU-TE", "A-DU", "QE-RA₂-U"}
+    what_if = reports["MI-NU-TE"].opportunities
+    assert [(o.tablet_id, o.new_readiness) for o in what_if] == [
+        (o.tablet_id, o.new_readiness) for o in report.opportunities if o.cascade_depth == 0
+    ]
+
+
+def test_incidence_rows_decode_sorted_and_fold_case():
+    detector = _detector()
+    matrix = detector.incidence()
+    assert matrix.tablet_ids(matrix.word_bits("sa-ra₂")) == ["HT 1", "HT 2"]
+    assert matrix.tablet_ids(matrix.word_bits("SA-RA₂")) == ["HT 1"]
+    assert matrix.tablet_ids(matrix.mask(["ZA 4", "HT 2", "XX 1"])) == ["HT 2", "ZA 4"]
+    for word in detector.word_to_tablets:
+        bits = matrix.word_bits(word)
+        assert matrix.tablet_ids(bits) == sorted(detector.find_tablets_with_word(word))
+
+
+def test_leaderboard_matches_reports_and_restricts_by_site():
+    detector = _detector(threshold=0.3)
+    rankings = {row["word"]: row for row in detector.rank_all_words()}
+    assert rankings
+    for word, row in rankings.items():
+        report = detector.compute_cascade_from_word(word, "HIGH")
+        gains = [o for o in report.opportunities if o.readiness_delta > 0]
+        assert row["direct_tablets"] == report.direct_tablets
+        assert row["cascade_tablets"] == report.cascade_tablets
+        assert row["tablets_improved"] == len(gains)
+        assert row["total_readiness_delta"] == round(sum(o.readiness_delta for o in gains), 3)
+
+    restricted = detector.rank_all_words(site="kh")
+    assert [row["word"] for row in restricted] == ["A-DU", "MI-NU-TE"]
+    assert all(row["direct_tablets"] == 1 and row["cascade_tablets"] == 0 for row in restricted)
+    assert detector.rank_all_words(doc_type="religious") == []
+
+
+def test_mark_identified_rescores_touched_tablets_only():
+    detector = _detector()
+    state = detector.readiness_state()
+    untouched = dict(state.baseline)
+    assert detector.mark_identified(["A-DU"]) == {"KH 7", "ZA 4"}
+    assert state.marked == set()
+
+    fresh = _detector()
+    fresh.identified_words |= {"A-DU"}
+    for tablet_id in INSCRIPTIONS:
+        assert state.score(tablet_id)[0] == fresh._compute_readiness_inline(tablet_id)[0]
+        assert state.unknown_words(tablet_id) == fresh._compute_readiness_inline(tablet_id)[3]
+    assert state.baseline["HT 1"] == untouched["HT 1"]
+    assert "A-DU" not in {r.trigger_word for r in detector.compute_what_if_all()}
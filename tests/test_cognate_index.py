@@ -0,0 +1,79 @@
+"""Tests for the sign-level Linear B near-match index (cognate_index.py)."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+sys.path.insert(0, str(TOOLS_DIR.parent))
+sys.path.insert(0, str(TOOLS_DIR))
+
+from tools.cognate_index import (  # noqa: E402
+    CognateIndex,
+    batch_near_matches,
+    sign_distance,
+    split_signs,
+)
+from tools.sign_registry import SignRegistry  # noqa: E402
+
+
+REGISTRY = SignRegistry(
+    {
+        "AB01": {"phonetic_value": "da"},
+        "AB80": {"phonetic_value": "ma"},
+        "AB04": {"phonetic_value": "te"},
+        "AB05": {"phonetic_value": "to"},
+        "AB08": {"phonetic_value": "a"},
+        "AB59": {"phonetic_value": "ta"},
+        "AB06": {"phonetic_value": "na"},
+    }
+)
+
+VOCABULARY = {
+    "da-ma-te": {"meaning": "Demeter"},
+    "a-ta-na-to": {"meaning": "Athena-related"},
+    "da-ma": {"meaning": "short form"},
+}
+
+
+def _index(max_distance=2):
+    index = CognateIndex(max_distance=max_distance, registry=REGISTRY)
+    index.add_vocabulary(VOCABULARY)
+    index.add_cognates({"identicalWords": {"da-ma-te": ["KN 1"], "pa-i-to": ["KN 2"]}})
+    return index
+
+
+def test_sign_distance_counts_signs_with_cutoff():
+    assert split_signs("DA-MA-TE") == ["DA", "MA", "TE"]
+    assert sign_distance(["da", "ma", "te"], ["da", "ma", "to"]) == 1
+    assert sign_distance(["a"], ["b", "c", "d", "e"], limit=1) == 2
+
+
+def test_near_classifies_edits_and_merges_sources():
+    index = _index()
+    exact, short = index.near("DA-MA-TE", 1)
+    assert (exact.word, exact.distance, exact.edits) == ("da-ma-te", 0, [])
+    assert exact.sources == ["damos_vocabulary", "cognates_json"]
+    assert short.word == "da-ma" and short.edits[0]["type"] == "final_deletion"
+
+    (athena,) = index.near("A-TA-NA-TE", 1)
+    assert athena.edits == [{"type": "vowel_alternation", "position": 3, "from": "TE", "to": "to"}]
+
+
+def test_near_matches_brute_force_and_rejects_deeper_queries():
+    index = _index()
+    forms = list(VOCABULARY) + ["pa-i-to"]
+    for word in ("DA-TE", "A-TA-NA", "PA-I-TE", "KU-RO"):
+        key = index.key(word)
+        expected = sorted(f for f in forms if sign_distance(key, index.key(f)) <= 2)
+        assert sorted(m.word for m in index.near(word, 2)) == expected
+    with pytest.raises(ValueError):
+        _index(max_distance=1).near("DA-MA", 2)
+
+
+def test_batch_respects_min_freq():
+    report = batch_near_matches(_index(), {"DA-MA-TE": 3, "DA-MA": 1}, min_freq=2, max_distance=1)
+    assert report["words_checked"] == 1
+    assert list(report["results"]) == ["DA-MA-TE"]
@@ -0,0 +1,105 @@
+"""Tests for the sharded comparative cache (comparative_cache.py)."""
+
+import json
+import sys
+import threading
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+sys.path.insert(0, str(TOOLS_DIR.parent))
+sys.path.insert(0, str(TOOLS_DIR))
+
+from tools import comparative_integrator  # noqa: E402
+from tools.comparative_cache import ComparativeCache  # noqa: E402
+
+
+def test_update_skips_unchanged_and_lru_is_bounded(tmp_path):
+    cache = ComparativeCache(tmp_path, shards=4, max_entries=2)
+    assert cache.update("akkadian", {"kalu": {"m": "all"}, "matu": {"m": "less"}}) == 2
+    assert cache.update("akkadian", {"kalu": {"m": "all"}, "matu": {"m": "lack"}}) == 1
+    assert cache.put("akkadian", "kalu", {"m": "all"}) is False
+
+    assert cache.get("akkadian", "matu") == {"m": "lack"}
+    assert cache.get("akkadian", "karanu", "absent") == "absent"
+    assert cache.get("akkadian", "karanu", "absent") == "absent"  # remembered miss
+
+    stats = cache.stats()
+    assert stats["hits"] == 2 and stats["misses"] == 1
+    assert stats["evictions"] >= 1 and stats["entries"] <= 2
+
+    fresh = ComparativeCache(tmp_path, shards=4)
+    assert fresh.get("akkadian", "kalu") == {"m": "all"}
+    assert fresh.terms("akkadian") == ["kalu", "matu"]
+
+
+def test_compaction_keeps_latest_and_readers_follow(tmp_path):
+    writer = ComparativeCache(tmp_path, shards=1)
+    reader = ComparativeCache(tmp_path, shards=1, max_entries=0)
+    writer.update("luwian", {"-iya": 1, "-assa": 1})
+    assert reader.get("luwian", "-iya") == 1
+
+    writer.update("luwian", {"-iya": 2})
+    assert reader.get("luwian", "-iya") == 2  # appended line picked up incrementally
+
+    assert writer.compact("luwian") > 0
+    lines = writer.shard_path("luwian", 0).read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["t"] for line in lines] == ["-iya", "-assa"]
+    assert reader.get("luwian", "-iya") == 2 and reader.get("luwian", "-assa") == 1
+
+
+def test_concurrent_writers_lose_no_records(tmp_path):
+    def write(worker):
+        cache = ComparativeCache(tmp_path, shards=3)
+        for i in range(50):
+            cache.put("akkadian", f"w{worker}-{i}", {"n": i})
+
+    threads = [threading.Thread(target=write, args=(w,)) for w in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    records = dict(ComparativeCache(tmp_path, shards=3).items("akkadian"))
+    assert len(records) == 200
+    assert records["w3-49"] == {"n": 49}
+
+
+def test_integrator_overlays_cache_without_mutating_embedded_data(tmp_path, monkeypatch):
+    legacy = tmp_path / "akkadian_admin_terms.json"
+    legacy.write_text(json.dumps({"terms": {"kullum": {"meaning": "total"}}}), encoding="utf-8")
+    monkeypatch.setattr(comparative_integrator, "AKKADIAN_FILE", legacy)
+    embedded = dict(comparative_integrator.AKKADIAN_ADMIN_VOCABULARY)
+
+    integrator = comparative_integrator.ComparativeIntegrator(
+        store_path=":memory:", cache_dir=tmp_path / "shards"
+    )
+    assert list(integrator.akkadian)[-1] == "kullum"
+    assert "kullum" in {m.term for m in integrator.query_akkadian("kull")}
+
+    integrator.akkadian["kalu"] = {"meaning": "every"}
+    assert integrator.akkadian["kalu"] == {"meaning": "every"}
+    assert comparative_integrator.AKKADIAN_ADMIN_VOCABULARY == embedded
+
+
+def test_luwian_queries_read_only_cached_terms_and_save_keeps_the_overlay(tmp_path, monkeypatch):
+    monkeypatch.setattr(comparative_integrator, "LUWIAN_FILE", tmp_path / "missing.json")
+    integrator = comparative_integrator.ComparativeIntegrator(
+        store_path=":memory:", cache_dir=tmp_path / "shards"
+    )
+    integrator.luwian["-wanti"] = {"meaning": "3pl. present", "linear_a_equivalent": "-TE"}
+    integrator.save_cache()
+    assert integrator.cache.terms("luwian") == ["-wanti"]
+    assert integrator.cache.terms("akkadian") == []
+
+    first = [m.term for m in integrator.query_luwian("-wanti")]
+    assert first[0] == "-wanti"
+
+    def reparse(path):
+        raise AssertionError(f"query re-parsed {path.name}")
+
+    monkeypatch.setattr(integrator.cache, "_shard_latest", reparse)
+    stats = integrator.cache.metrics
+    lookups = stats.hits + stats.misses
+    assert [m.term for m in integrator.query_luwian("-wanti")] == first
+    assert stats.hits + stats.misses == lookups + 1  # base terms are not looked up
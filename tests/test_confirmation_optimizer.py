@@ -0,0 +1,97 @@
+"""Tests for the K-word confirmation optimizer (confirmation_optimizer.py)."""
+
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+sys.path.insert(0, str(TOOLS_DIR.parent))
+sys.path.insert(0, str(TOOLS_DIR))
+
+from tools.cascade_opportunity_detector import CascadeOpportunityDetector  # noqa: E402
+from tools.confirmation_optimizer import ConfirmationOptimizer  # noqa: E402
+
+
+def _detector(inscriptions, threshold=0.5):
+    detector = CascadeOpportunityDetector(threshold=threshold)
+    detector.inscriptions = inscriptions
+    for tablet_id, data in inscriptions.items():
+        syllabic = [t for t in data["transliteratedWords"] if "-" in t]
+        detector.tablet_syllabic_words[tablet_id] = syllabic
+        for word in syllabic:
+            detector.word_to_tablets[word].add(tablet_id)
+    return detector
+
+
+def _tablet(*words):
+    return {"transliteratedWords": [*words, "GRA", "1"]}
+
+
+def test_site_balance_prefers_a_fresh_site():
+    inscriptions = {
+        "HT 1": _tablet("A-A"),
+        "HT 2": _tablet("A-A"),
+        "HT 5": _tablet("A-A"),
+        "HT 3": _tablet("BE-BE"),
+        "HT 4": _tablet("BE-BE"),
+        "KH 1": _tablet("CE-CE"),
+        "KH 2": _tablet("DE-DE", "DE-DE", "SE-SE", "SE-SE", "TE-TE"),
+    }
+    detector = _detector(inscriptions)
+
+    plain = ConfirmationOptimizer(detector).optimize(3)
+    assert [p.word for p in plain] == ["A-A", "BE-BE", "CE-CE"]
+    assert [p.cumulative_crossings for p in plain] == [3, 5, 6]
+    assert plain[0].crossed_tablets == ["HT 1", "HT 2", "HT 5"]
+
+    balanced = ConfirmationOptimizer(detector, site_balanced=True).optimize(3)
+    assert [p.word for p in balanced] == ["A-A", "CE-CE", "BE-BE"]
+
+
+def test_cached_greedy_matches_full_recomputation_and_verifies():
+    words = ["KU-NI", "MI-RA", "SA-SA", "RE-A", "DI-NA", "PA-TA", "TU-RU"]
+    inscriptions = {}
+    for i in range(40):
+        picked = [words[(i * 3 + j * j) % len(words)] for j in range(1 + i % 4)]
+        inscriptions[f"{('HT', 'KH', 'ZA')[i % 3]} {i}"] = _tablet(*picked)
+    detector = _detector(inscriptions, threshold=0.45)
+    optimizer = ConfirmationOptimizer(detector)
+
+    picks = optimizer.optimize(5)
+    chosen = [p.word for p in picks]
+
+    # Reference: recompute every candidate's marginal gain before each pick
+    removed = defaultdict(int)
+    reference = []
+    for _ in range(len(chosen)):
+        best = max(
+            (w for w in optimizer.postings if w not in reference),
+            key=lambda w: (optimizer._gain(w, removed, None), [-ord(c) for c in w]),
+        )
+        reference.append(best)
+        for tablet_id, n in optimizer.postings[best].items():
+            removed[tablet_id] += n
+    assert chosen == reference
+
+    crossed = optimizer.verify(chosen)
+    assert len(crossed) == picks[-1].cumulative_crossings
+    assert sorted(t for p in picks for t in p.crossed_tablets) == crossed
+    assert optimizer.state.marked == set()
+
+
+def test_tablets_already_at_threshold_need_nothing():
+    inscriptions = {
+        "HT 1": _tablet("A-A", "A-A", "A-A", "BE-BE"),
+        "HT 2": _tablet("BE-BE", "CE-CE"),
+    }
+    detector = _detector(inscriptions, threshold=0.45)
+    detector.identified_words = {"A-A"}
+    detector.readiness_cache = {"HT 1": 0.2}  # stale scorer output disagrees
+    optimizer = ConfirmationOptimizer(detector)
+
+    assert optimizer.state.score("HT 1")[0] >= detector.threshold
+    assert optimizer._tokens_needed("HT 1", 1) == 0
+    assert "HT 1" not in optimizer.need
+    assert all("HT 1" not in p.crossed_tablets for p in optimizer.optimize(2))
+    assert "HT 1" not in optimizer.verify(["BE-BE"])
@@ -0,0 +1,68 @@
+"""Tests for batch occurrence extraction in corpus_consistency_validator.py."""
+
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+sys.path.insert(0, str(TOOLS_DIR.parent))
+sys.path.insert(0, str(TOOLS_DIR))
+
+from tools.corpus_consistency_validator import CorpusConsistencyValidator  # noqa: E402
+from tools.corpus_index import compile_corpus  # noqa: E402
+
+
+CORPUS = {
+    "inscriptions": {
+        "HT 1": {
+            "site": "Hagia Triada",
+            "context": "LMIB",
+            "transliteratedWords": ["SA-RA₂", "GRA", "10", "\n", "KU-RO", "20"],
+        },
+        "KH 5": {
+            "site": "Khania",
+            "context": "LMIB",
+            "transliteratedWords": ["ku-ro", "CYP", "3", "\n", "KI-RO", "1"],
+        },
+        "ZA 2": {"_parse_error": "bad", "transliteratedWords": ["KU-RO"]},
+    }
+}
+
+
+def _validator():
+    validator = CorpusConsistencyValidator()
+    validator.corpus = CORPUS
+    validator.compiled = compile_corpus(CORPUS)
+    validator.statistics = {"top_words": {"KU-RO": 6, "KI-RO": 5, "SA-RA₂": 5, "GRA": 9}}
+    return validator
+
+
+def test_single_pass_matches_per_word_lookup():
+    validator = _validator()
+    batch = validator.find_occurrences_many(["KU-RO", "ku-ro", "KI-RO", "A-DU"])
+    assert set(batch) == {"KU-RO", "ku-ro", "KI-RO", "A-DU"}
+    assert [(o.inscription_id, o.position) for o in batch["KU-RO"]] == [("HT 1", 4), ("KH 5", 0)]
+    assert batch["A-DU"] == []
+    for word, occurrences in batch.items():
+        assert occurrences == validator.find_occurrences(word)
+
+    kuro = batch["KU-RO"][0]
+    assert (kuro.site, kuro.line_position, kuro.has_number) == ("HT", "start", True)
+
+
+def test_batch_reports_identical_across_workers():
+    validator = _validator()
+    serial = validator.validate_multiple_words(min_frequency=5)
+    parallel = validator.validate_multiple_words(min_frequency=5, workers=2)
+    assert list(serial) == ["KU-RO", "KI-RO", "SA-RA₂"]
+
+    def strip(report):
+        data = asdict(report)
+        data.pop("generated")
+        return data
+
+    for word in serial:
+        assert strip(serial[word]) == strip(parallel[word])
+        assert strip(serial[word]) == strip(validator.validate_word(word))
+    assert serial["KU-RO"].total_occurrences == 2
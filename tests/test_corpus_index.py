@@ -0,0 +1,131 @@
+"""Tests for the shared compiled corpus layout (corpus_index.py)."""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+sys.path.insert(0, str(TOOLS_DIR.parent))
+sys.path.insert(0, str(TOOLS_DIR))
+
+from tools.corpus_index import (  # noqa: E402
+    KIND_LOGOGRAM,
+    KIND_NUMERAL,
+    KIND_WORD,
+    NO_OFFSET,
+    compile_corpus,
+    compile_inscription,
+)
+
+
+SAMPLE_CORPUS = {
+    "inscriptions": {
+        "HT1": {
+            "site": "Haghia Triada",
+            "context": "LMIB",
+            "support": "Tablet",
+            "transliteratedWords": [
+                "KA-RO-PA₃",
+                "VIN",
+                "10",
+                "\n",
+                "SA-RA₂",
+                "GRA",
+                "5",
+                "\n",
+                "KU-RO",
+                "15",
+            ],
+        },
+        "KH5": {
+            "site": "Khania",
+            "context": "LMIB",
+            "transliteratedWords": ["A-DU", "\n", "\n", "DA-ME", "OLE"],
+        },
+        "ZA9": {"_parse_error": "bad entry"},
+    }
+}
+
+
+def test_line_arrays():
+    layout = compile_inscription("HT1", SAMPLE_CORPUS["inscriptions"]["HT1"]["transliteratedWords"])
+    assert layout.line_number == [1, 1, 1, 1, 2, 2, 2, 2, 3, 3]
+    assert layout.line_index[4:7] == [0, 1, 2]
+    assert layout.line_initial[0] and layout.line_initial[4] and layout.line_initial[8]
+    assert layout.line_final[2] and layout.line_final[6] and layout.line_final[9]
+    assert not layout.line_initial[5] and not layout.line_final[5]
+    assert layout.line_count == 3
+
+
+def test_kinds_give_numerals_precedence():
+    layout = compile_inscription("X", ["KU-RO", "10", "VIN", "OLE+KI"])
+    assert layout.kinds[1] == KIND_NUMERAL
+    assert layout.kinds[2] == KIND_LOGOGRAM
+    assert layout.kinds[3] == KIND_LOGOGRAM
+
+
+def test_single_sign_words_are_words():
+    layout = compile_inscription("X", ["A", "TE", "VIN", "10"])
+    assert layout.kinds[:3] == [KIND_WORD, KIND_WORD, KIND_LOGOGRAM]
+
+    compiled = compile_corpus(
+        {"inscriptions": {"HT2": {"site": "Haghia Triada", "transliteratedWords": ["TE", "VIN"]}}}
+    )
+    postings = compiled.postings
+    assert postings.sign_postings["TE"] == [(0, 0, 0)]
+    assert "TE" not in postings.logogram_postings
+    assert "VIN" in postings.logogram_postings
+
+
+def test_next_offsets_stop_at_line_break():
+    layout = compile_inscription("HT1", SAMPLE_CORPUS["inscriptions"]["HT1"]["transliteratedWords"])
+    assert layout.next_logogram[0] == 1
+    assert layout.next_numeral[0] == 2
+    # GRA on line 2 must not be visible from line 1's final numeral.
+    assert layout.next_logogram[2] == NO_OFFSET
+    assert layout.next_logogram[8] == NO_OFFSET
+    assert layout.next_numeral[8] == 1
+
+
+def test_adjacent_matches_corpus_lookup_shape():
+    compiled = compile_corpus(SAMPLE_CORPUS)
+    adj = compiled.adjacent("HT1", 4)
+    assert adj == {
+        "preceding_logogram": None,
+        "following_logogram": "GRA",
+        "following_numeral": "5",
+        "line_number": 2,
+    }
+    assert compiled.adjacent("HT1", 5)["preceding_logogram"] is None
+    assert compiled.adjacent("HT1", 6)["preceding_logogram"] == "GRA"
+    assert compiled.adjacent("MISSING", 0)["line_number"] == 0
+
+
+def test_lines_skip_empty_lines():
+    compiled = compile_corpus(SAMPLE_CORPUS)
+    assert compiled.layout("KH5").lines() == [["A-DU"], ["DA-ME", "OLE"]]
+    assert compiled.layout("KH5").line_number[3] == 3
+
+
+def test_items_skip_parse_errors():
+    compiled = compile_corpus(SAMPLE_CORPUS)
+    assert "ZA9" in compiled
+    assert [insc_id for insc_id, _ in compiled.items()] == ["HT1", "KH5"]
+    assert len(list(compiled.items(include_errors=True))) == 3
+
+
+def test_lazy_layouts_are_safe_across_threads():
+    for _ in range(50):
+        compiled = compile_corpus(SAMPLE_CORPUS, lazy=True)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: compiled.adjacent("HT1", 0), range(8)))
+        assert all(r == results[0] for r in results)
+        assert results[0]["following_logogram"] == "VIN"
+
+
+def test_ensure_layouts_compiles_deferred_inscriptions():
+    compiled = compile_corpus(SAMPLE_CORPUS, lazy=True)
+    layouts = compiled.ensure_layouts()
+    assert list(layouts) == ["HT1", "KH5", "ZA9"]
+    assert compiled.layouts is layouts
@@ -0,0 +1,142 @@
+"""Tests for corpus_lookup.py query and batch behavior on a synthetic corpus."""
+
+import json
+import sys
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+sys.path.insert(0, str(TOOLS_DIR.parent))
+sys.path.insert(0, str(TOOLS_DIR))
+
+from tools.corpus_index import compile_corpus  # noqa: E402
+from tools.corpus_lookup import CorpusLookup, read_batch_queries  # noqa: E402
+from tools.index_snapshot import read_snapshot  # noqa: E402
+
+
+SAMPLE_CORPUS = {
+    "inscriptions": {
+        "HT1": {
+            "site": "Haghia Triada",
+            "context": "LMIB",
+            "support": "Tablet",
+            "transliteratedWords": ["SI-RU", "VIN", "10", "\n", "KU-RO", "10"],
+        },
+        "KH7": {
+            "site": "Khania",
+            "context": "LMIB",
+            "support": "Tablet",
+            "transliteratedWords": ["KU-RO", "GRA", "5"],
+        },
+    }
+}
+
+
+def _lookup() -> CorpusLookup:
+    lookup = CorpusLookup()
+    lookup.corpus = SAMPLE_CORPUS
+    lookup.compiled = compile_corpus(SAMPLE_CORPUS)
+    lookup._build_index()
+    return lookup
+
+
+def test_search_exact_is_case_insensitive():
+    results = _lookup().search_exact("ku-ro")
+    assert [r["inscription"] for r in results] == ["HT1", "KH7"]
+    assert results[0]["adjacent"]["line_number"] == 2
+    assert results[1]["adjacent"]["following_logogram"] == "GRA"
+
+
+def test_run_batch_preserves_order_and_reports_errors():
+    queries = [
+        {"id": "a", "type": "exact", "pattern": "KU-RO", "site": "KH"},
+        {"id": "b", "type": "regex", "pattern": "[("},
+        {"id": "c", "type": "verify", "pattern": "KU-RO"},
+        {"id": "d", "type": "nope", "pattern": "KU-RO"},
+        {"id": "e", "type": "sign", "pattern": "RU"},
+        {"id": "f", "type": "exact", "pattern": "KU-RO", "context": "x"},
+        {"id": "g", "type": "wildcard", "pattern": "KU-*", "context": None},
+        {"id": "h", "type": "exact", "pattern": "KU-RO", "site": 7},
+    ]
+    records = list(_lookup().run_batch(queries, workers=3))
+    assert [r["id"] for r in records] == ["a", "b", "c", "d", "e", "f", "g", "h"]
+    assert records[0]["total_results"] == 1
+    assert "Invalid regex" in records[1]["error"]
+    assert records[2]["verification"]["total_occurrences"] == 2
+    assert "Unknown query type" in records[3]["error"]
+    assert [r["word"] for r in records[4]["results"]] == ["SI-RU"]
+    assert [r["error"].split(":")[0] for r in records[5:]] == [
+        "Invalid context",
+        "Invalid context",
+        "Invalid site",
+    ]
+
+    # Anything else a query trips over becomes its own error record
+    lookup = _lookup()
+    lookup.search_sign = lambda *args: 1 / 0
+    records = list(lookup.run_batch([queries[4], queries[0]], workers=2))
+    assert records[0]["error"].startswith("ZeroDivisionError")
+    assert records[1]["total_results"] == 1
+
+
+def test_read_batch_queries_keeps_bad_lines(tmp_path):
+    path = tmp_path / "queries.jsonl"
+    path.write_text(
+        json.dumps({"type": "exact", "pattern": "KU-RO"}) + "\n\nnot json\n[1]\n",
+        encoding="utf-8",
+    )
+    queries = read_batch_queries(str(path))
+    assert [q["id"] for q in queries] == [1, 3, 4]
+    assert "error" in queries[1] and "error" in queries[2]
+
+
+def _write_corpus(path, corpus):
+    path.write_text(json.dumps(corpus, ensure_ascii=False), encoding="utf-8")
+
+
+def test_snapshot_round_trip_matches_json_index(tmp_path):
+    corpus_path = tmp_path / "corpus.json"
+    snapshot_path = tmp_path / "cache" / "corpus_lookup.idx"
+    _write_corpus(corpus_path, SAMPLE_CORPUS)
+
+    built = CorpusLookup()
+    assert built.load_corpus(corpus_path, snapshot_path)
+    assert snapshot_path.exists()
+
+    mapped = CorpusLookup()
+    assert mapped.load_snapshot(snapshot_path, corpus_path)
+    assert list(mapped.word_index) == list(built.word_index)
+    for word in built.word_index:
+        assert mapped.search_exact(word, context_size=2) == built.search_exact(word, context_size=2)
+    assert mapped.search_sign("RU") == built.search_sign("RU")
+    assert mapped.verify_reading_consistency("KU-RO") == built.verify_reading_consistency("KU-RO")
+
+
+def test_stale_snapshot_is_rebuilt(tmp_path):
+    corpus_path = tmp_path / "corpus.json"
+    snapshot_path = tmp_path / "corpus_lookup.idx"
+    _write_corpus(corpus_path, SAMPLE_CORPUS)
+    assert CorpusLookup().load_corpus(corpus_path, snapshot_path)
+
+    changed = json.loads(json.dumps(SAMPLE_CORPUS))
+    changed["inscriptions"]["ZA1"] = {"site": "Zakros", "transliteratedWords": ["KU-RO", "9"]}
+    _write_corpus(corpus_path, changed)
+    assert not CorpusLookup().load_snapshot(snapshot_path, corpus_path)
+
+    lookup = CorpusLookup()
+    assert lookup.load_corpus(corpus_path, snapshot_path)
+    assert len(lookup.search_exact("KU-RO")) == 3
+    assert read_snapshot(snapshot_path).meta["source"]["size"] == corpus_path.stat().st_size
+    assert CorpusLookup().load_snapshot(snapshot_path, corpus_path)
+
+
+def test_corrupt_snapshot_falls_back_to_json(tmp_path):
+    corpus_path = tmp_path / "corpus.json"
+    snapshot_path = tmp_path / "corpus_lookup.idx"
+    _write_corpus(corpus_path, SAMPLE_CORPUS)
+    snapshot_path.write_bytes(b"not a snapshot")
+
+    lookup = CorpusLookup()
+    assert lookup.load_corpus(corpus_path, snapshot_path)
+    assert len(lookup.search_exact("KU-RO")) == 2
+    assert CorpusLookup().load_snapshot(snapshot_path, corpus_path)
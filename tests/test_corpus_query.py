@@ -0,0 +1,168 @@
+"""Tests for the structural corpus query engine (corpus_query.py)."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+sys.path.insert(0, str(TOOLS_DIR.parent))
+sys.path.insert(0, str(TOOLS_DIR))
+
+from tools.corpus_index import compile_corpus  # noqa: E402
+from tools.corpus_query import (  # noqa: E402
+    CorpusQueryEngine,
+    Query,
+    SignSequenceQuery,
+    parse_query,
+)
+
+
+SAMPLE_CORPUS = {
+    "inscriptions": {
+        "HT1": {
+            "site": "Haghia Triada",
+            "context": "LMIB",
+            "transliteratedWords": ["SI-RU", "VIN", "12", "\n", "SI-RU-TE", "VIN", "3"],
+        },
+        "HT2": {
+            "site": "Haghia Triada",
+            "context": "LMIA",
+            "transliteratedWords": ["KA-SI", "RU-MA", "VIN+RI", "20"],
+        },
+        "KH3": {
+            "site": "Khania",
+            "context": "LMIB",
+            "transliteratedWords": ["A-DU", "SI-RU", "GRA", "VIN", "10"],
+        },
+        "ZA4": {
+            "site": "Zakros",
+            "context": "LMIB",
+            "transliteratedWords": ["SI-RU", "VIN", "50"],
+        },
+    }
+}
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return CorpusQueryEngine(compile_corpus(SAMPLE_CORPUS))
+
+
+def _hits(results):
+    return [(m["inscription"], m["start_position"]) for m in results]
+
+
+def test_plain_sequence_stays_inside_words(engine):
+    results = engine.search(SignSequenceQuery(signs="SI-RU"))
+    assert _hits(results) == [("HT1", 0), ("HT1", 4), ("KH3", 1), ("ZA4", 0)]
+
+
+def test_cross_word_sequence(engine):
+    results = engine.search(SignSequenceQuery(signs="SI-RU", cross_words=True, sites=["HT"]))
+    assert ("HT2", 0) in _hits(results)
+    assert results[-1]["words"] == ["KA-SI", "RU-MA"]
+
+
+def test_single_sign_words_are_searchable():
+    corpus = {
+        "inscriptions": {
+            "HT9": {"site": "Haghia Triada", "transliteratedWords": ["A", "TE", "VIN", "5"]}
+        }
+    }
+    engine = CorpusQueryEngine(compile_corpus(corpus))
+    assert _hits(engine.search(SignSequenceQuery("TE", whole_words=True, logogram="VIN"))) == [
+        ("HT9", 1)
+    ]
+    assert _hits(engine.search(SignSequenceQuery("A-TE", cross_words=True))) == [("HT9", 0)]
+
+
+def test_formula_constraints(engine):
+    query = SignSequenceQuery(
+        signs="SI-RU",
+        logogram="VIN",
+        logogram_within=2,
+        numeral_min=10,
+        line_initial=True,
+        sites=["HT|KH"],
+    )
+    results = engine.search(query)
+    assert _hits(results) == [("HT1", 0)]
+    assert results[0]["numeral_value"] == 12.0
+
+
+def test_logogram_window_and_ligature_base(engine):
+    query = SignSequenceQuery(signs="SI-RU", logogram="VIN", logogram_within=2, numeral_min=10)
+    assert ("KH3", 1) in _hits(engine.search(query))
+    ligature = SignSequenceQuery(signs="RU-MA", logogram="VIN", logogram_within=1)
+    assert _hits(engine.search(ligature)) == [("HT2", 1)]
+
+
+def test_whole_words_and_line_final(engine):
+    assert ("HT1", 4) not in _hits(engine.search(SignSequenceQuery("SI-RU", whole_words=True)))
+    assert _hits(engine.search(SignSequenceQuery("RU-MA", line_final=True))) == []
+
+
+def test_plan_orders_filters_by_selectivity(engine):
+    plan = engine.plan(SignSequenceQuery(signs="SI-RU", logogram="GRA", sites=["KH"]))
+    counts = [f["inscriptions"] for f in plan.filters]
+    assert counts == sorted(counts)
+    assert plan.candidate_inscriptions == 1
+
+
+def test_empty_query_rejected():
+    with pytest.raises(ValueError):
+        SignSequenceQuery(signs="")
+
+
+# ── Declarative pattern queries ──────────────────────────────────────
+
+
+def test_dsl_triplets_group_and_sum(engine):
+    query = parse_query(
+        "FIND word AS x, logogram AS commodity, numeral AS qty GROUP BY site, commodity SUM qty"
+    )
+    result = engine.run_pattern(query)
+    assert ("HT2", 1) in [(r["inscription"], r["position"]) for r in result["rows"]]
+    groups = {(g["site"], g["commodity"]): g for g in result["groups"]}
+    assert groups[("HT", "VIN")]["count"] == 3
+    assert groups[("HT", "VIN")]["sum_qty"] == 35.0
+
+
+def test_dsl_pushdown_uses_word_postings(engine):
+    query = parse_query('FIND ^ word "SI-RU", logogram VIN, numeral >= 10 WHERE site IN HT|KH')
+    plan = engine.plan_pattern(query)
+    assert plan.driver_index == "word" and plan.driver_key == "SI-RU"
+    rows = engine.run_pattern(query)["rows"]
+    assert [(r["inscription"], r["position"]) for r in rows] == [("HT1", 0)]
+
+
+def test_builder_matches_dsl(engine):
+    built = (
+        Query()
+        .word(as_="x")
+        .logogram("VIN", as_="commodity")
+        .numeral(ge=10, as_="qty")
+        .where(sites="HT|KH|ZA")
+        .build()
+    )
+    parsed = parse_query(
+        "FIND word AS x, logogram VIN AS commodity, numeral >= 10 AS qty WHERE site = HT|KH|ZA"
+    )
+    assert engine.run_pattern(built)["rows"] == engine.run_pattern(parsed)["rows"]
+
+
+def test_lines_block_patterns_unless_cross_lines(engine):
+    across = "FIND numeral, word"
+    assert engine.run_pattern(parse_query(across))["rows"] == []
+    rows = engine.run_pattern(parse_query(across + " WHERE cross_lines"))["rows"]
+    assert [r["tokens"] for r in rows] == [["12", "SI-RU-TE"]]
+
+
+def test_dsl_errors():
+    for bad in ("FIND", "FIND verb", "FIND word GROUP BY nope", "FIND numeral >= x"):
+        with pytest.raises(ValueError):
+            parse_query(bad)
+    with pytest.raises(ValueError, match=r"'KU-\(RO'"):
+        parse_query('FIND word ~ "KU-(RO"')
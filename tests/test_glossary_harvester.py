@@ -0,0 +1,208 @@
+"""Tests for the cache-first glossary harvester against a local HTTP server."""
+
+import io
+import json
+import sys
+import threading
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+sys.path.insert(0, str(TOOLS_DIR.parent))
+sys.path.insert(0, str(TOOLS_DIR))
+
+from tools.glossary_harvester import (  # noqa: E402
+    STATUS_CACHED,
+    STATUS_ERROR,
+    STATUS_FETCHED,
+    STATUS_REVALIDATED,
+    STATUS_STALE,
+    GlossaryHarvester,
+    iter_glossary_entries,
+    iter_glossary_file,
+    iter_text_chunks,
+    latency_report,
+)
+
+
+GLOSSARY = {"entries": [{"cf": "kalû", "gw": "all", "pos": "N"}]}
+ETAG = '"v1"'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    hits = {}
+    flaky_failures = 1
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        counts = type(self).hits
+        counts[self.path] = counts.get(self.path, 0) + 1
+        if self.path == "/flaky" and counts[self.path] <= type(self).flaky_failures:
+            self.send_response(503)
+            self.send_header("Retry-After", "0")
+            self.end_headers()
+            return
+        if self.path == "/short" and counts[self.path] == 1:
+            self.send_response(200)
+            self.send_header("Content-Length", "100")
+            self.end_headers()
+            self.wfile.write(b'{"entries"')  # connection drops mid-body
+            return
+        if self.path == "/cut":
+            self.send_response(200)
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            self.wfile.write(b'64\r\n{"entries"')  # chunk promises 100 bytes, sends 10
+            return
+        if self.path == "/missing":
+            self.send_response(404)
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = json.dumps(GLOSSARY).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture()
+def server():
+    _Handler.hits = {}
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _harvester(tmp_path, **kwargs):
+    kwargs.setdefault("host_interval", 0.0)
+    kwargs.setdefault("backoff", 0.01)
+    return GlossaryHarvester(tmp_path / "cache", **kwargs)
+
+
+def test_cache_first_then_conditional_revalidation(tmp_path, server):
+    harvester = _harvester(tmp_path)
+    first = harvester.fetch("saa01", f"{server}/g")
+    assert first.status == STATUS_FETCHED and first.load_json() == GLOSSARY
+
+    assert harvester.fetch("saa01", f"{server}/g").status == STATUS_CACHED
+    assert _Handler.hits["/g"] == 1
+
+    expired = _harvester(tmp_path, ttl=0)
+    revalidated = expired.fetch("saa01", f"{server}/g")
+    assert revalidated.status == STATUS_REVALIDATED
+    assert revalidated.load_json() == GLOSSARY
+    assert _Handler.hits["/g"] == 2
+
+
+def test_retry_and_concurrent_fetch_keep_order(tmp_path, server):
+    harvester = _harvester(tmp_path, workers=3, retries=2)
+    results = harvester.fetch_many(
+        [("a", f"{server}/a"), ("flaky", f"{server}/flaky"), ("gone", f"{server}/missing")]
+    )
+    assert [r.key for r in results] == ["a", "flaky", "gone"]
+    assert results[1].status == STATUS_FETCHED and results[1].attempts == 2
+    assert results[2].status == STATUS_ERROR and results[2].attempts == 1
+
+    report = latency_report(results)
+    assert report["status_counts"] == {STATUS_FETCHED: 2, STATUS_ERROR: 1}
+    assert all("latency_ms" in row for row in report["results"])
+
+
+def test_truncated_bodies_are_retried_and_never_cached(tmp_path, server):
+    harvester = _harvester(tmp_path, retries=1)
+    short = harvester.fetch("short", f"{server}/short")
+    assert short.status == STATUS_FETCHED and short.attempts == 2
+    assert short.load_json() == GLOSSARY
+
+    cut = harvester.fetch("cut", f"{server}/cut")
+    assert cut.status == STATUS_ERROR and cut.attempts == 2
+    assert "IncompleteRead" in cut.error
+    assert sorted(p.name for p in (tmp_path / "cache").iterdir()) == [
+        "short.json",
+        "short.json.meta",
+    ]
+
+
+def test_stale_cache_served_when_server_unreachable(tmp_path, server):
+    _harvester(tmp_path).fetch("saa01", f"{server}/g")
+    dead = _harvester(tmp_path, ttl=0, retries=0, timeout=1)
+    result = dead.fetch("saa01", "http://127.0.0.1:9/g")
+    assert result.status == STATUS_STALE
+    assert result.load_json() == GLOSSARY
+
+
+def test_offline_uses_cache_only(tmp_path, server):
+    offline = _harvester(tmp_path, offline=True)
+    assert offline.fetch("saa01", f"{server}/g").status == STATUS_ERROR
+    _harvester(tmp_path).fetch("saa01", f"{server}/g")
+    assert offline.fetch("saa01", f"{server}/g").load_json() == GLOSSARY
+    assert _Handler.hits["/g"] == 1
+
+
+# ── Streaming entry parser ───────────────────────────────────────────
+
+TRICKY = {
+    "type": "glossary",
+    "instances": {"a": [1, 2, {"x": "]}[{"}], "b": 'quote \\" brace }'},
+    "count": -12.5e3,
+    "entries": [
+        {"cf": "šarru", "gw": "king", "pos": "N", "forms": [{"n": "šar-ru"}]},
+        7,
+        {"cf": 'x"y', "gw": "{not: json}", "senses": []},
+        {"cf": "kalû", "gw": "all", "pos": "N"},
+    ],
+    "terms": [{"cf": "ignored", "gw": "second list"}],
+    "tail": [None, True, False],
+}
+
+
+def _chunks(text, size):
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 64, 100000])
+def test_streaming_matches_full_parse(size):
+    text = json.dumps(TRICKY, ensure_ascii=False)
+    expected = [e for e in TRICKY["entries"] if isinstance(e, dict)]
+    assert list(iter_glossary_entries(_chunks(text, size))) == expected
+
+
+def test_streaming_falls_back_to_terms_and_handles_binary_streams():
+    doc = {"project": "x", "terms": [{"cf": "a", "gw": "b"}]}
+    raw = io.BytesIO(json.dumps(doc, ensure_ascii=False).encode("utf-8"))
+    assert list(iter_glossary_entries(iter_text_chunks(raw, chunk_size=3))) == doc["terms"]
+    assert list(iter_glossary_entries(["[1, 2]"])) == []
+    with pytest.raises(ValueError):
+        list(iter_glossary_entries(['{"entries": [{"cf": "a"}']))
+
+
+def test_streaming_memory_is_bounded_by_entry_size(tmp_path):
+    path = tmp_path / "big.json"
+    entry = {"cf": "šarru", "gw": "king", "pos": "N", "forms": ["šar-ru"] * 20}
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"entries": [')
+        f.write(",".join(json.dumps(dict(entry, n=i), ensure_ascii=False) for i in range(5000)))
+        f.write("]}")
+    size = path.stat().st_size
+
+    tracemalloc.start()
+    count = sum(1 for _ in iter_glossary_file(path))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert count == 5000
+    assert peak < size / 2
@@ -0,0 +1,69 @@
+"""Tests for GORILAIndexer secondary indexes and batch lookup."""
+
+import sys
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+sys.path.insert(0, str(TOOLS_DIR.parent))
+sys.path.insert(0, str(TOOLS_DIR))
+
+from tools.gorila_indexer import GORILAIndexer  # noqa: E402
+
+
+def _entry(tablet_id, volume, page, site, kind="tablet", sequences=()):
+    return {
+        "tablet_id": tablet_id,
+        "site_code": site,
+        "volume": volume,
+        "page": page,
+        "inscription_type": kind,
+        "key_sequences": list(sequences),
+    }
+
+
+def _indexer():
+    indexer = GORILAIndexer()
+    indexer.index = {
+        "HT 1": _entry("HT 1", 1, 5, "HT", sequences=["a-du", "ku-ro"]),
+        "HT 13": _entry("HT 13", 1, 2, "HT", sequences=["ku-ro"]),
+        "HT 122": _entry("HT 122", 3, 19, "HT", sequences=["po-to-ku-ro"]),
+        "KN Zf 2": _entry("KN Zf 2", 5, 150, "KN", "scepter", ["sa-ra2"]),
+    }
+    return indexer
+
+
+def test_lookup_many_normalizes_corpus_ids():
+    found = _indexer().lookup_many(["HT13", "ht 13", "KNZf2", "HT122a", "HT 12", "HT13"])
+    assert {k: v and v["tablet_id"] for k, v in found.items()} == {
+        "HT13": "HT 13",
+        "ht 13": "HT 13",
+        "KNZf2": "KN Zf 2",
+        "HT122a": "HT 122",
+        "HT 12": None,
+    }
+
+
+def test_secondary_indexes_keep_query_order():
+    indexer = _indexer()
+    assert [d["tablet_id"] for d in indexer.get_volume_contents(1)] == ["HT 13", "HT 1"]
+    assert [d["tablet_id"] for d in indexer.get_inscriptions_by_site("ht")] == [
+        "HT 13",
+        "HT 1",
+        "HT 122",
+    ]
+    assert [d["tablet_id"] for d in indexer.get_inscriptions_by_type("SCEPTER")] == ["KN Zf 2"]
+
+
+def test_search_matches_substring_scan():
+    indexer = _indexer()
+    for pattern in ("ku-ro", "u-r", "o-ku", "to-ku-ro", "ra2", "-", "", "zz", "A-DU"):
+        expected = [
+            d["tablet_id"]
+            for d in indexer.index.values()
+            if any(pattern.lower() in s for s in d["key_sequences"])
+        ]
+        assert [d["tablet_id"] for d in indexer.search_transcription(pattern)] == expected
+
+    indexer.index = {"ZA 4": _entry("ZA 4", 4, 1, "ZA", sequences=["ku-ro"])}
+    assert [d["tablet_id"] for d in indexer.search_transcription("ku")] == ["ZA 4"]
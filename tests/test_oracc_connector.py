@@ -0,0 +1,82 @@
+"""Tests for ORACCConnector batch verification on the static dictionary."""
+
+import json
+import sys
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+sys.path.insert(0, str(TOOLS_DIR.parent))
+sys.path.insert(0, str(TOOLS_DIR))
+
+from tools import oracc_connector  # noqa: E402
+from tools.oracc_connector import VOCABULARY_LEXICON, ORACCConnector  # noqa: E402
+
+
+def _connector():
+    connector = ORACCConnector(store_path=":memory:")
+    connector.build_static_dictionary()
+    return connector
+
+
+def test_batch_matches_term_by_term_verification():
+    connector = _connector()
+    terms = ["ku-ro", "ki-ro", "KU_RO", "ku-ro", "sa-ra", "zz-zz"]
+    batch = connector.batch_verify_terms(terms, workers=3)
+    for term in set(terms):
+        assert batch["results"][term] == connector.verify_akkadian_parallel(term)
+    assert batch["total_terms"] == 6
+    assert batch["summary"]["high_confidence"].count("ku-ro") == 2
+    assert batch["timing"]["unique_terms"] == 5
+
+
+def test_candidate_resolution_is_memoized_and_reset_on_change():
+    connector = _connector()
+    calls = []
+    connector.batch_verify_terms(["ku-ro"], progress=lambda done, total: calls.append(done))
+    assert calls == [1]
+    again = connector.batch_verify_terms(["ku-ro", "ki-ro"])
+    first_lookups = again["timing"]["candidate_lookups"]
+    assert connector.batch_verify_terms(["ku-ro", "ki-ro"])["timing"]["candidate_lookups"] == 0
+
+    connector.vocabulary = dict(connector.vocabulary)
+    refreshed = connector.batch_verify_terms(["ku-ro", "ki-ro"])
+    assert refreshed["timing"]["candidate_lookups"] >= first_lookups > 0
+
+
+def test_substring_queries_keep_vocabulary_order_unless_ranked():
+    connector = ORACCConnector(store_path=":memory:")
+    connector.vocabulary = {
+        "šamnu": {"term": "šamnu", "meaning": "oil measured by the kurru", "root": "ŠMN"},
+        "kurru": {"term": "kurru", "meaning": "a dry measure", "root": "KRR"},
+    }
+    assert [r["term"] for r in connector.query("kurru")] == ["šamnu", "kurru"]
+    assert [r["term"] for r in connector.query("kurru", ranked=True)] == ["kurru", "šamnu"]
+
+    verification = connector.verify_akkadian_parallel("kurru")
+    assert [c["term"] for c in verification["akkadian_candidates"]] == ["šamnu", "kurru"]
+
+
+def test_ingested_glossary_terms_persist_in_the_store(tmp_path, monkeypatch):
+    monkeypatch.setattr(oracc_connector, "INGEST_BATCH_SIZE", 2)
+    glossary = tmp_path / "saa01.json"
+    entries = [
+        {"cf": "kullatu", "gw": "totality", "pos": "N"},
+        {"cf": "napḫaru", "gw": "total", "pos": "N"},
+        {"cf": "kullatu", "gw": "all", "pos": "N"},
+        {"cf": "šamnu", "gw": "oil", "pos": "N"},
+    ]
+    glossary.write_text(json.dumps({"entries": entries}), encoding="utf-8")
+    db = tmp_path / "vocabulary.sqlite"
+
+    connector = ORACCConnector(store_path=db)
+    assert connector.ingest_glossary(glossary) == 3
+    assert connector.store.fingerprint(VOCABULARY_LEXICON) == connector._vocabulary_fingerprint
+    assert [r["term"] for r in connector.query("kull")] == ["kullatu"]
+    connector.store.close()
+
+    reopened = ORACCConnector(store_path=db)
+    assert reopened.load_store_vocabulary() == 3
+    assert list(reopened.vocabulary) == ["kullatu", "napḫaru", "šamnu"]
+    assert reopened.query_root("ŠMN")[0]["meaning"] == "oil"
+    assert reopened.store.count(VOCABULARY_LEXICON) == 3
@@ -0,0 +1,106 @@
+"""Tests for the shared readiness engine (readiness_store.py)."""
+
+import sys
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+sys.path.insert(0, str(TOOLS_DIR.parent))
+sys.path.insert(0, str(TOOLS_DIR))
+
+from tools import reading_pipeline  # noqa: E402
+from tools.reading_pipeline import SelectStage  # noqa: E402
+from tools.readiness_store import ReadinessStore, composite_readiness  # noqa: E402
+
+
+INSCRIPTIONS = {
+    "HT 1": {"transliteratedWords": ["KU-RO", "SA-RA₂", "GRA", "10", "DA-RE", "5"]},
+    "HT 2": {"transliteratedWords": ["sa-ra₂", "MI-NU-TE", "VIN", "3"]},
+    "KH 7": {"transliteratedWords": ["MI-NU-TE", "A-DU", "CYP", "2"]},
+    "ZA 4": {"transliteratedWords": ["QE-RA₂-U", "QE-RA₂-U"]},
+}
+
+
+def _store(known, arithmetic, calls):
+    def score(tablet_id):
+        calls.append(tablet_id)
+        words = [t for t in INSCRIPTIONS[tablet_id]["transliteratedWords"] if "-" in t]
+        unknown = sum(1 for w in words if w.upper() not in known)
+        structural = len(INSCRIPTIONS[tablet_id]["transliteratedWords"]) - len(words)
+        return {
+            "score": composite_readiness(len(words), unknown, arithmetic[tablet_id], structural)
+        }
+
+    return ReadinessStore(
+        INSCRIPTIONS,
+        score_tablet=score,
+        word_status=lambda w: w.upper() in known,
+        tablet_status=lambda t: arithmetic[t],
+        name="test",
+    )
+
+
+def test_persisted_table_rescores_only_changed_tablets(tmp_path):
+    path = tmp_path / "scores.json"
+    known, arithmetic, calls = {"KU-RO"}, dict.fromkeys(INSCRIPTIONS, 0.2), []
+    store = _store(known, arithmetic, calls)
+    store.save(path)
+    assert sorted(calls) == sorted(INSCRIPTIONS)
+
+    calls.clear()
+    warm = _store(known, arithmetic, calls)
+    assert warm.load(path) == set()
+    assert warm.all_rows() == store.all_rows()
+    assert calls == []
+
+    known.add("SA-RA₂")  # a word status change, then an arithmetic one
+    arithmetic["ZA 4"] = 1.0
+    changed = _store(known, arithmetic, calls)
+    assert changed.load(path) == {"HT 1", "HT 2", "ZA 4"}
+    rows = changed.all_rows()
+    assert sorted(calls) == ["HT 1", "HT 2", "ZA 4"]
+    assert rows == _store(known, arithmetic, []).all_rows()
+
+    calls.clear()
+    known.add("A-DU")
+    assert changed.mark_words(["a-du"]) == {"KH 7"}
+    assert changed.row("KH 7") == {"score": composite_readiness(2, 1, 0.2, 2)}
+    assert calls == ["KH 7"]
+    assert _store(known, arithmetic, []).load(tmp_path / "missing.json") == set(INSCRIPTIONS)
+
+
+def test_select_stage_applies_recorded_reading_incrementally():
+    stage = SelectStage()
+    stage.inscriptions = INSCRIPTIONS
+    stage.dependencies = {"DA-RE": {}}
+    before = {t: stage._compute_readiness_live(t) for t in INSCRIPTIONS}
+    assert before["HT 1"]["anchored_words"] == 3
+
+    stale = stage.apply_recorded_reading("HT 2", words=["mi-nu-te"])
+    assert stale == {"HT 2", "KH 7"}
+    assert "HT 2" in stage.already_read
+
+    fresh = SelectStage()
+    fresh.inscriptions = INSCRIPTIONS
+    fresh.dependencies = dict(stage.dependencies)
+    for tablet_id in INSCRIPTIONS:
+        assert stage._compute_readiness_live(tablet_id) == fresh._compute_readiness_live(tablet_id)
+    assert stage._compute_readiness_live("KH 7")["unknown_words"] == 0
+    assert stage._compute_readiness_live("HT 1") is before["HT 1"]
+
+
+def test_select_stage_looks_up_gorila_only_for_selected_tablets(monkeypatch):
+    looked_up = []
+
+    def references(tablet_ids):
+        tablet_ids = list(tablet_ids)
+        looked_up.extend(tablet_ids)
+        return {t: {"volume": "I", "page": 1} for t in tablet_ids}
+
+    monkeypatch.setattr(reading_pipeline, "gorila_references", references)
+    stage = SelectStage()
+    stage.inscriptions = INSCRIPTIONS
+    queue = stage.build_queue(top_n=2, site_balanced=True)
+    assert looked_up == [entry.tablet_id for entry in queue]
+    assert len(queue) == 2
+    assert all(entry.gorila_volume == "I" for entry in queue)
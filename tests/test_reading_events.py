@@ -0,0 +1,149 @@
+"""Tests for the reading event journal and propagation bus (reading_events.py)."""
+
+import json
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+sys.path.insert(0, str(TOOLS_DIR.parent))
+sys.path.insert(0, str(TOOLS_DIR))
+
+import anchor_tracker  # noqa: E402
+import cascade_opportunity_detector  # noqa: E402
+import reading_events  # noqa: E402
+from tools import reading_pipeline  # noqa: E402
+from tools.anchor_tracker import AnchorTracker  # noqa: E402
+from tools.cascade_opportunity_detector import CascadeOpportunityDetector  # noqa: E402
+from tools.reading_events import EventBus, EventJournal  # noqa: E402
+from tools.reading_pipeline import RecordStage, SelectStage  # noqa: E402
+
+
+INSCRIPTIONS = {
+    "HT 1": {"transliteratedWords": ["KU-RO", "SA-RA₂", "GRA", "10", "DA-RE", "5"]},
+    "HT 2": {"transliteratedWords": ["sa-ra₂", "MI-NU-TE", "VIN", "3"]},
+    "KH 7": {"transliteratedWords": ["MI-NU-TE", "A-DU", "CYP", "2"]},
+    "ZA 4": {"transliteratedWords": ["A-DU", "QE-RA₂-U", "QE-RA₂-U"]},
+}
+
+
+def test_journal_sequences_events_and_isolates_failing_subscribers(tmp_path):
+    journal = EventJournal(tmp_path / "events.jsonl")
+    first = journal.append("HT 2", ["MI-NU-TE", "MI-NU-TE", "A-DU"], "possible", ["anchor_x"])
+    assert [(e.seq, e.word, e.confidence) for e in first] == [
+        (1, "MI-NU-TE", "POSSIBLE"),
+        (2, "A-DU", "POSSIBLE"),
+    ]
+    with open(journal.path, "ab") as f:
+        f.write(b'{"seq": 99, "reading_id"')  # torn line from a writer that died
+    bus = EventBus(journal)
+    seen = []
+    bus.subscribe("broken", lambda events: 1 / 0)
+    bus.subscribe("tracker", lambda events: seen.extend(e.seq for e in events) or {"T"})
+
+    events, outcomes = bus.publish("KH 7", [], "SPECULATIVE")
+    assert [(e.seq, e.word) for e in events] == [(3, None)]
+    assert outcomes["broken"]["error"].startswith("ZeroDivisionError")
+    assert outcomes["tracker"]["result"] == ["T"]
+    assert seen == [3]
+    assert [e.seq for e in journal.events(since=1)] == [2, 3]
+    assert journal.latest_by_word()["A-DU"].seq == 2
+
+
+def test_record_propagates_to_subscribed_stages(tmp_path):
+    selector = SelectStage()
+    selector.inscriptions = INSCRIPTIONS
+    selector.dependencies = {"DA-RE": {}}
+    for tablet_id in INSCRIPTIONS:
+        selector._compute_readiness_live(tablet_id)
+
+    detector = CascadeOpportunityDetector(threshold=0.5)
+    detector.inscriptions = INSCRIPTIONS
+    detector.word_to_tablets = defaultdict(set)
+    for tablet_id, data in INSCRIPTIONS.items():
+        syllabic = [t for t in data["transliteratedWords"] if "-" in t]
+        detector.tablet_syllabic_words[tablet_id] = syllabic
+        for word in syllabic:
+            detector.word_to_tablets[word].add(tablet_id)
+    detector.identified_words = {"KU-RO"}
+    detector.readiness_state()
+
+    tracker = AnchorTracker()
+    tracker.anchors = {"anchor_x": {"confidence": "MEDIUM"}}
+
+    bus = EventBus(EventJournal(tmp_path / "events.jsonl"))
+    bus.subscribe("select", selector.apply_reading_events)
+    bus.subscribe("cascade", detector.apply_reading_events)
+    bus.subscribe("anchors", tracker.apply_reading_events)
+    result = RecordStage(bus=bus).record_reading(
+        "HT 2", confidence="HIGH", depends_on=["anchor_x"], words=["MI-NU-TE", "A-DU"]
+    )
+
+    outcomes = result["propagation"]
+    assert result["events"] == [1, 2]
+    assert outcomes["select"]["result"] == ["HT 2", "KH 7", "ZA 4"]
+    assert outcomes["cascade"]["result"] == ["HT 2", "KH 7", "ZA 4"]
+    assert outcomes["anchors"]["result"] == [
+        {"reading_id": "HT 2", "max_confidence": "MEDIUM", "over_cap": ["MI-NU-TE", "A-DU"]}
+    ]
+    assert "HT 2" in selector.already_read
+    assert selector._compute_readiness_live("KH 7")["unknown_words"] == 0
+    assert detector._is_word_identified("A-DU")
+
+    # Words are journaled upper-cased, whatever the caller typed
+    bus.publish("ZA 4", ["qe-ra₂-u"], "LOW")
+    assert detector._is_word_identified("QE-RA₂-U")
+    assert bus.journal.events()[-1].word == "QE-RA₂-U"
+    assert tracker.graph.reaches(("anchor", "anchor_x"), ("reading", "HT 2"))
+
+    # A later process replays the journal into the same handlers
+    replayed = SelectStage()
+    replayed.inscriptions = INSCRIPTIONS
+    replayed.dependencies = {"DA-RE": {}}
+    bus.replay(replayed.apply_reading_events)
+    for tablet_id in INSCRIPTIONS:
+        assert replayed._compute_readiness_live(tablet_id) == selector._compute_readiness_live(
+            tablet_id
+        )
+
+
+def test_record_cli_propagates_to_downstream_tools(tmp_path, monkeypatch):
+    def load_tracker(self):
+        self.anchors = {"anchor_x": {"confidence": "MEDIUM"}}
+        self.readings = {}
+        return True
+
+    def load_detector(self):
+        self.inscriptions = INSCRIPTIONS
+        for tablet_id, data in INSCRIPTIONS.items():
+            syllabic = [t for t in data["transliteratedWords"] if "-" in t]
+            self.tablet_syllabic_words[tablet_id] = syllabic
+            for word in syllabic:
+                self.word_to_tablets[word].add(tablet_id)
+        self.identified_words = {"KU-RO"}
+        return True
+
+    monkeypatch.setattr(reading_events, "JOURNAL_FILE", tmp_path / "events.jsonl")
+    monkeypatch.setattr(anchor_tracker.AnchorTracker, "load_data", load_tracker)
+    monkeypatch.setattr(
+        cascade_opportunity_detector.CascadeOpportunityDetector, "load_data", load_detector
+    )
+    monkeypatch.setattr(reading_pipeline.RecordStage, "load_data", lambda self: True)
+    monkeypatch.setattr(reading_pipeline, "apply_to_readiness_table", lambda: {"rescored": 3})
+    output = tmp_path / "record.json"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["reading_pipeline.py", "--record", "HT 2", "--confidence", "HIGH"]
+        + ["--depends-on", "anchor_x", "--words", "mi-nu-te", "--output", str(output)],
+    )
+    reading_pipeline.main()
+
+    result = json.loads(output.read_text(encoding="utf-8"))
+    outcomes = result["propagation"]
+    assert list(outcomes) == ["readiness_table", "anchors", "cascade"]
+    assert outcomes["readiness_table"]["result"] == {"rescored": 3}
+    assert outcomes["anchors"]["result"][0]["over_cap"] == ["MI-NU-TE"]
+    assert outcomes["cascade"]["result"] == ["HT 2", "KH 7"]
+    assert [e.word for e in reading_events.EventJournal().events()] == ["MI-NU-TE"]
@@ -0,0 +1,119 @@
+"""Tests for PrepareStage in the reading pipeline (reading_pipeline.py)."""
+
+import sys
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+sys.path.insert(0, str(TOOLS_DIR.parent))
+sys.path.insert(0, str(TOOLS_DIR))
+
+from tools import reading_pipeline  # noqa: E402
+from tools.reading_pipeline import (  # noqa: E402
+    KNOWN_FUNCTION_WORDS,
+    PrepareStage,
+    _is_word,
+    brief_to_dict,
+    prepare_many,
+)
+
+
+INSCRIPTIONS = {
+    "HT 1": {"transliteratedWords": ["KU-RO", "da-ku-se-ne", "GRA", "10", "TE"]},
+    "HT 2": {"transliteratedWords": ["DA-KU-SE-NE", "MI-NU-TE", "VIN", "3"]},
+    "KH 7": {"transliteratedWords": ["MI-NU-TE", "A-DU", "CYP", "2", "KU-RO"]},
+    "ZA 4": {"transliteratedWords": ["A-DU", "PA-I-TO", "TE"]},
+    "PH 1": {"transliteratedWords": ["PA-I-TO", "QE-RA₂-U"]},
+}
+
+
+def _stage(link_hops=1):
+    stage = PrepareStage(link_hops=link_hops)
+    stage.inscriptions = INSCRIPTIONS
+    stage.known_names = {"DA-KU-SE-NE", "MI-NU-TE", "PA-I-TO"}
+    stage.dependencies = {}
+    stage.personnel_dossiers = {}
+    return stage
+
+
+def _brute_force_links(stage, words, tablet_id):
+    """The original linear scan: every word against every other inscription."""
+    links, seen = [], set()
+    for word in words:
+        if not _is_word(word):
+            continue
+        upper = word.upper()
+        if not (
+            upper in stage.known_names
+            or upper in KNOWN_FUNCTION_WORDS
+            or upper in stage.dependencies
+        ):
+            continue
+        for other_id, data in stage.inscriptions.items():
+            other = data["transliteratedWords"]
+            if other_id == tablet_id or upper not in [w.upper() for w in other]:
+                continue
+            if (upper, other_id) not in seen:
+                seen.add((upper, other_id))
+                links.append(
+                    {
+                        "shared_word": word,
+                        "linked_tablet": other_id,
+                        "linked_site": other_id.split()[0],
+                        "word_type": (
+                            "function" if upper in KNOWN_FUNCTION_WORDS else "name/reading"
+                        ),
+                    }
+                )
+    links.sort(key=lambda x: (x["shared_word"], x["linked_tablet"]))
+    return links
+
+
+def test_posting_links_match_linear_scan():
+    stage = _stage()
+    for tablet_id, data in INSCRIPTIONS.items():
+        words = data["transliteratedWords"]
+        assert stage._find_cross_tablet_links(words, tablet_id) == _brute_force_links(
+            stage, words, tablet_id
+        )
+    # Postings are built once and reused across briefs
+    assert stage.token_postings() is stage.token_postings()
+
+
+def test_multi_hop_links_follow_names_not_function_words():
+    stage = _stage(link_hops=3)
+    links = stage._find_cross_tablet_links(["da-ku-se-ne"], "HT 1")
+
+    assert [(x["linked_tablet"], x.get("hop"), x.get("via")) for x in links] == [
+        ("HT 2", None, None),
+        ("KH 7", 2, "HT 2"),
+    ]
+    # KH 7 reaches ZA 4 only through the function word A-DU, which is not followed
+    assert "ZA 4" not in {x["linked_tablet"] for x in links}
+    assert stage._find_cross_tablet_links(["da-ku-se-ne"], "HT 1", hops=1) == links[:1]
+
+
+def test_prepare_many_in_workers_matches_serial():
+    stage = _stage(link_hops=2)
+    tablet_ids = ["HT 1", "ZA 4", "XX 0", "KH 7", "PH 1"]
+
+    serial = list(prepare_many(stage, tablet_ids))
+    assert [t for t, _ in serial] == tablet_ids
+    assert serial[2][1] is None
+    assert serial[0][1] == brief_to_dict(stage.prepare_brief("HT 1"))
+    assert list(prepare_many(stage, tablet_ids, workers=2)) == serial
+
+
+def test_prepare_many_without_fork_uses_the_callers_stage(monkeypatch):
+    stage = _stage(link_hops=2)
+    tablet_ids = ["HT 1", "KH 7", "PH 1"]
+    serial = list(prepare_many(stage, tablet_ids))
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("a spawned pool would reload the stage from disk")
+
+    monkeypatch.setattr(
+        reading_pipeline.multiprocessing, "get_all_start_methods", lambda: ["spawn"]
+    )
+    monkeypatch.setattr(reading_pipeline, "ProcessPoolExecutor", no_pool)
+    assert list(prepare_many(stage, tablet_ids, workers=2)) == serial
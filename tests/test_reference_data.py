@@ -0,0 +1,87 @@
+"""Tests for versioned reference datasets and their lazy consumers."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+sys.path.insert(0, str(TOOLS_DIR.parent))
+sys.path.insert(0, str(TOOLS_DIR))
+
+from tools.reference_data import (  # noqa: E402
+    ReferenceDataError,
+    available_datasets,
+    load_document,
+    load_reference,
+)
+
+
+def _write(directory, name, data, fmt=1):
+    doc = {"metadata": {"dataset": name, "format": fmt, "version": "test"}, "data": data}
+    path = directory / f"{name}.json"
+    path.write_text(json.dumps(doc, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def test_compiled_copy_is_used_until_source_changes(tmp_path):
+    ref, compiled = tmp_path / "ref", tmp_path / "compiled"
+    ref.mkdir()
+    path = _write(ref, "lex", {"šarru": {"meaning": "king"}})
+    kwargs = {"reference_dir": ref, "compiled_dir": compiled}
+
+    first = load_reference("lex", **kwargs)
+    assert (compiled / "lex.marshal").exists()
+    first["šarru"]["meaning"] = "mutated"
+    assert load_reference("lex", **kwargs) == {"šarru": {"meaning": "king"}}
+
+    _write(ref, "lex", {"kalû": {"meaning": "all"}})
+    os.utime(path, ns=(1, 1))
+    assert load_reference("lex", **kwargs) == {"kalû": {"meaning": "all"}}
+
+    (compiled / "lex.marshal").write_bytes(b"garbage")
+    assert load_document("lex", **kwargs)["metadata"]["version"] == "test"
+
+
+def test_missing_or_incompatible_dataset_raises(tmp_path):
+    _write(tmp_path, "old", {}, fmt=0)
+    _write(tmp_path, "other", {})
+    (tmp_path / "other.json").rename(tmp_path / "renamed.json")
+    for name in ("old", "renamed", "absent"):
+        with pytest.raises(ReferenceDataError):
+            load_reference(name, reference_dir=tmp_path, compiled_dir=None)
+
+
+def test_shipped_datasets_load():
+    assert {
+        "damos_vocabulary",
+        "gorila_index",
+        "hypothesis_lexicons",
+        "oracc_static_dictionary",
+        "sigla_signs",
+    } <= set(available_datasets())
+
+    from tools.gorila_indexer import GORILAIndexer
+
+    indexer = GORILAIndexer()
+    assert sorted(indexer.volumes) == [1, 2, 3, 4, 5]
+    assert indexer.lookup_tablet("HT 13")["volume"] == 1
+
+
+def test_hypothesis_lexicons_load_on_first_access():
+    code = (
+        "import hypothesis_tester as h\n"
+        "assert h.extract_consonants('ku-ro') == 'KR'\n"
+        "assert 'SEMITIC_LEXICON' not in vars(h)\n"
+        "assert h.SEMITIC_LEXICON and 'SEMITIC_LEXICON' in vars(h)\n"
+        "from hypothesis_tester import GREEK_LEXICON\n"
+        "assert GREEK_LEXICON is h.reference('GREEK_LEXICON')\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=TOOLS_DIR, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,53 @@
+"""Tests for the shared multi-key sign registry (sign_registry.py)."""
+
+import sys
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+sys.path.insert(0, str(TOOLS_DIR.parent))
+sys.path.insert(0, str(TOOLS_DIR))
+
+from tools.sign_registry import SignRegistry, base_value, normalize_ab, normalize_sign  # noqa: E402
+
+
+SIGNS = {
+    "AB60": {
+        "phonetic_value": "ra",
+        "frequency": 162,
+        "sites": ["HT", "ZA"],
+        "variants": [{"form": "standard"}, {"form": "cursive"}],
+        "examples": ["HT 13", "ZA 4"],
+    },
+    "AB64": {"phonetic_value": "ra2", "frequency": 12, "sites": ["HT"], "examples": ["HT 1"]},
+    "AB08": {"phonetic_value": "a", "frequency": 200, "sites": ["HT"], "examples": ["HT 13"]},
+    "VIN": {"phonetic_value": "", "frequency": 12, "sites": ["HT", "KH"], "examples": []},
+}
+
+
+def test_normalization():
+    assert normalize_sign(" RA₂ ") == "ra2"
+    assert base_value("RA₂") == "ra" and base_value("*301") == "*301"
+    assert normalize_ab("ab8") == normalize_ab("8") == "AB08"
+    assert normalize_ab("*301") == "*301"
+
+
+def test_resolution_by_every_key():
+    registry = SignRegistry(SIGNS)
+    for sign_id in ("AB60", "ab60", "60", "ra", "RA", "AB60/cursive"):
+        assert registry.resolve(sign_id) == "AB60", sign_id
+    assert registry.resolve("RA₂") == registry.resolve("ra2") == "AB64"
+    assert registry.get("vin") is SIGNS["VIN"]
+    assert registry.resolve("") is None and "zz" not in registry
+    assert registry.variant("ab60/CURSIVE") == {"form": "cursive"}
+    assert registry.homophones("ra₃") == ["AB60", "AB64"]
+
+
+def test_site_tablet_and_frequency_indexes():
+    registry = SignRegistry(SIGNS)
+    assert registry.by_site("ht") == ["AB08", "AB60", "AB64", "VIN"]
+    assert registry.by_tablet("ht13") == ["AB60", "AB08"]
+    assert registry.by_tablet("HT 1") == ["AB64"]
+    assert registry.by_frequency(12, 162) == ["AB60", "AB64", "VIN"]
+    assert registry.by_frequency(13) == ["AB08", "AB60"]
+    assert registry.by_frequency(100, 10) == []
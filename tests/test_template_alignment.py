@@ -0,0 +1,101 @@
+"""Tests for slot-sequence template alignment (template_alignment.py)."""
+
+import json
+import random
+import sys
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+sys.path.insert(0, str(TOOLS_DIR.parent))
+sys.path.insert(0, str(TOOLS_DIR))
+
+from tools.admin_isomorphism_scorer import AdminIsomorphismScorer  # noqa: E402
+from tools.template_alignment import (  # noqa: E402
+    DEFAULT_SCORING,
+    SLOT_IDS,
+    SLOT_TYPES,
+    TemplateAligner,
+    _global_score,
+    _local_score,
+    align,
+    encode,
+)
+
+
+def test_labels_encode_by_precedence():
+    assert encode(["SUBTOTAL", "TOTAL_LINE", "HEADER_WORD", "LEXICAL_ITEM", "PRICE"]) == (
+        SLOT_IDS["SUBTOTAL"],
+        SLOT_IDS["TOTAL"],
+        SLOT_IDS["HEADER"],
+        SLOT_IDS["WORD"],
+        0,
+    )
+    assert encode(["VIN/OLE_LOGOGRAM", "NUMERAL", "DEITY?"]) == (
+        SLOT_IDS["COMMODITY"],
+        SLOT_IDS["QUANTITY"],
+        SLOT_IDS["DEITY"],
+    )
+
+
+def test_trie_scores_match_pairwise_alignment():
+    rng = random.Random(3)
+    table = DEFAULT_SCORING.matrix()
+    library = {f"t{i}": rng.choices(SLOT_TYPES, k=rng.randint(0, 7)) for i in range(60)}
+    for local, band in ((True, None), (False, None), (False, 1)):
+        aligner = TemplateAligner(library, local=local, band=band)
+        for _ in range(10):
+            query = rng.choices(SLOT_TYPES, k=rng.randint(1, 9))
+            profile = [table[t] for t in encode(query)]
+            scores = aligner.score(query)
+            for name, code in aligner.codes.items():
+                if local:
+                    raw = _local_score(profile, code, 1.0)
+                else:
+                    raw = _global_score(profile, code, 1.0, band)
+                expected = aligner._normalize(
+                    raw, aligner._self_score(encode(query)), aligner._self_score(code)
+                )
+                assert abs(scores[name] - expected) < 1e-9
+            ranked = sorted(scores.items(), key=lambda kv: -kv[1])
+            assert [s for _, s in aligner.best(query, 4)] == [s for _, s in ranked[:4]]
+
+
+def test_alignment_respects_slot_order():
+    slots = ["RECIPIENT", "COMMODITY", "QUANTITY", "TOTAL"]
+    same = align(slots, slots)
+    assert same.normalized == 1.0 and same.pairs == [(i, i) for i in range(4)]
+    assert align(slots, list(reversed(slots))).normalized < 0.5
+
+    local = align(["HEADER_WORD", "COMMODITY_LOGOGRAM", "NUMERAL"], ["COMMODITY", "QUANTITY"], True)
+    assert local.normalized == 1.0 and local.pairs == [(1, 0), (2, 1)]
+
+
+def test_scorer_aligns_mined_documents_against_extra_library(tmp_path):
+    library = tmp_path / "library.json"
+    library.write_text(
+        json.dumps({"templates": {"short_list": {"slots": ["COMMODITY", "QUANTITY", "TOTAL"]}}}),
+        encoding="utf-8",
+    )
+    scorer = AdminIsomorphismScorer(library_path=library)
+    scorer.context_data = {
+        "document_structures": {
+            "commodity_lists": {
+                "templates": [
+                    {
+                        "name": "Standard Commodity List (ku-ro)",
+                        "documents": {
+                            "HT 9a": ["COMMODITY_LOGOGRAM", "NUMERAL", "TOTAL", "NUMERAL"]
+                        },
+                    }
+                ]
+            }
+        }
+    }
+    scorer.align_document_templates(top=2)
+
+    result = scorer.results["document_alignments"]
+    assert result["library_size"] == 7 and result["documents_aligned"] == 1
+    matches = result["documents"]["HT 9a"]["matches"]
+    assert matches[0] == {"akkadian_template": "short_list", "score": 1.0}
+    assert len(matches) == 2
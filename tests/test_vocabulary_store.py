@@ -0,0 +1,99 @@
+"""Tests for the indexed comparative vocabulary store (vocabulary_store.py)."""
+
+import sys
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+sys.path.insert(0, str(TOOLS_DIR.parent))
+sys.path.insert(0, str(TOOLS_DIR))
+
+from tools.vocabulary_store import VocabularyStore, consonant_skeleton  # noqa: E402
+
+
+LEXICON = {
+    "kullatu": {"term": "kullatu", "meaning": "totality, all", "root": "KLL"},
+    "kalû": {"term": "kalû", "meaning": "to complete", "root": "KL"},
+    "napḫaru": {"term": "napḫaru", "meaning": "total, sum", "root": "PḪR"},
+    "šamnu": {"term": "šamnu", "meaning": "oil, fat", "root": "ŠMN"},
+    "Kurru": {"term": "Kurru", "meaning": "a dry measure", "root": "KRR"},
+}
+
+
+def _store():
+    store = VocabularyStore(":memory:")
+    store.sync("akk", LEXICON)
+    return store
+
+
+def _scan(query):
+    """The linear scan the store replaces (term, root or meaning substring)."""
+    q = query.lower()
+    return sorted(
+        t
+        for t, d in LEXICON.items()
+        if q in t.lower() or query.upper() in d["root"] or q in d["meaning"].lower()
+    )
+
+
+def test_search_matches_linear_scan_and_ranks_fields():
+    store = _store()
+    for query in ("kul", "tot", "KL", "al", "ḫar", "oil", "zzz", "a"):
+        assert sorted(h.term for h in store.search("akk", query)) == _scan(query), query
+    hits = store.search("akk", "tal")
+    assert [h.field for h in hits] == ["meaning", "meaning"]
+    ranked = store.search("akk", "kul")
+    assert ranked[0].term == "kullatu" and ranked[0].relevance == 1.0
+
+
+def test_exact_root_and_skeleton_lookups():
+    store = _store()
+    assert store.get("akk", "kalû")["root"] == "KL"
+    assert [d["term"] for d in store.get_folded("akk", "KURRU")] == ["Kurru"]
+    assert [d["term"] for d in store.by_root("akk", "kll")] == ["kullatu"]
+    assert consonant_skeleton("ku-ro") == "KR"
+    assert [d["term"] for d in store.by_skeleton("akk", "KU-RU")] == ["Kurru"]
+
+
+def test_resolve_many_joins_then_falls_back_to_substring():
+    store = _store()
+    resolved = store.resolve_many("akk", ["šamnu", "napḫ", "kal", "missing", "šamnu"])
+    assert resolved["šamnu"]["root"] == "ŠMN"
+    assert resolved["napḫ"]["term"] == "napḫaru"
+    assert resolved["kal"]["term"] == "kalû"
+    assert resolved["missing"] is None
+    assert store.resolve_many("akk", ["napḫ"], fuzzy=False) == {"napḫ": None}
+
+
+def test_sync_skips_unchanged_lexicon_and_persists(tmp_path):
+    path = tmp_path / "vocab.sqlite"
+    with VocabularyStore(path) as store:
+        assert store.sync("akk", LEXICON)
+        assert not store.sync("akk", LEXICON)
+        assert store.sync("ug", {"yn": {"meaning": "wine"}})
+
+    with VocabularyStore(path) as reopened:
+        assert reopened.lexicons() == {"akk": 5, "ug": 1}
+        assert [h.term for h in reopened.search("ug", "wine")] == ["yn"]
+        changed = dict(LEXICON)
+        del changed["šamnu"]
+        assert reopened.sync("akk", changed)
+        assert reopened.count("akk") == 4
+        assert reopened.search("akk", "oil") == []
+
+
+def test_upsert_replaces_and_appends_without_rewriting():
+    store = _store()
+    before = store.fingerprint("akk")
+    fingerprint = store.upsert(
+        "akk",
+        {
+            "šamnu": {"term": "šamnu", "meaning": "fat", "root": "ŠMN"},
+            "karānu": {"term": "karānu", "meaning": "wine", "root": "KRN"},
+        },
+    )
+    assert fingerprint == store.fingerprint("akk") != before
+    assert store.lexicons()["akk"] == store.count("akk") == 6
+    assert [h.term for h in store.search("akk", "oil")] == []
+    assert [h.term for h in store.search("akk", "wine")] == ["karānu"]
+    assert store.get("akk", "šamnu")["meaning"] == "fat"
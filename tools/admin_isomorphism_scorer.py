@@ -9,6 +9,7 @@ Usage:
     python3 tools/admin_isomorphism_scorer.py --score
     python3 tools/admin_isomorphism_scorer.py --identify
     python3 tools/admin_isomorphism_scorer.py --all --output data/admin_isomorphism.json
+    python3 tools/admin_isomorphism_scorer.py --align --library data/comparative/ur3_templates.json
 """
 
 import json
@@ -17,7 +18,9 @@ import sys
 from pathlib import Path
 from collections import Counter
 from datetime import datetime
-from typing import List
+from typing import Dict, List, Optional
+
+from template_alignment import TemplateAligner
 
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
@@ -154,9 +157,27 @@ LINEAR_A_DOCUMENT_TYPES = {
 }
 
 
+def load_template_library(path: Path) -> Dict[str, List[str]]:
+    """
+    Load extra Akkadian templates: {name: {"slots": [...]}} or {name: [...]},
+    optionally wrapped in {"templates": ...}.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict) and isinstance(data.get("templates"), dict):
+        data = data["templates"]
+    library = {}
+    for name, template in data.items():
+        slots = template.get("slots", []) if isinstance(template, dict) else template
+        if slots:
+            library[name] = list(slots)
+    return library
+
+
 class AdminIsomorphismScorer:
-    def __init__(self, verbose=False):
+    def __init__(self, verbose=False, library_path: Optional[Path] = None):
         self.verbose = verbose
+        self.library_path = library_path
         self.corpus = None
         self.akkadian = None
         self.audit_data = None
@@ -181,6 +202,7 @@ class AdminIsomorphismScorer:
             "isomorphism_scores": {},
             "positional_identifications": [],
             "khania_copper_analysis": {},
+            "document_alignments": {},
             "summary": {},
             "findings": [],
             "first_principles_verification": {},
@@ -271,6 +293,14 @@ class AdminIsomorphismScorer:
         """Score structural similarity between Linear A and Akkadian document templates."""
         print("\n[Phase 1] Scoring template isomorphism...")
 
+        # Ordered slot alignment for the whole grid in one batch
+        aligner = TemplateAligner(
+            {name: t.get("slots", []) for name, t in AKKADIAN_DOCUMENT_TEMPLATES.items()}
+        )
+        alignments = aligner.score_all(
+            {name: t.get("observed_slots", []) for name, t in LINEAR_A_DOCUMENT_TYPES.items()}
+        )
+
         comparisons = {}
         for la_type, la_template in LINEAR_A_DOCUMENT_TYPES.items():
             la_slots = la_template.get("observed_slots", [])
@@ -296,6 +326,7 @@ class AdminIsomorphismScorer:
 
                 comparisons[la_type][akk_type] = {
                     "slot_overlap": round(slot_score, 3),
+                    "slot_alignment": round(alignments[la_type][akk_type], 3),
                     "structural_similarity": round(structure_score, 3),
                     "combined_score": round(combined, 3),
                 }
@@ -500,9 +531,80 @@ class AdminIsomorphismScorer:
         print(f"  Found {len(kh_tablets)} Khania CYP tablets")
         print(f"  {len(cyp_words)} unique words in CYP context")
 
+    def _mined_document_templates(self) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Slot sequences of commodity-list documents, by mined template name.
+
+        Read from the contextual analysis output when it carries them;
+        otherwise mined from the loaded corpus with contextual_analyzer.py.
+        """
+        structures = (self.context_data or {}).get("document_structures", {})
+        templates = structures.get("commodity_lists", {}).get("templates", [])
+        if not any("documents" in t for t in templates) and self.corpus:
+            from contextual_analyzer import ContextualAnalyzer
+
+            analyzer = ContextualAnalyzer(verbose=self.verbose)
+            analyzer.corpus = self.corpus
+            templates = analyzer.analyze_document_structures()["commodity_lists"]["templates"]
+        return {t["name"]: t.get("documents", {}) for t in templates}
+
+    def align_document_templates(self, top: int = 3):
+        """Align every mined Linear A document against the Akkadian template library."""
+        print("\n[Phase 4] Aligning mined document templates...")
+
+        library = {name: t.get("slots", []) for name, t in AKKADIAN_DOCUMENT_TEMPLATES.items()}
+        if self.library_path:
+            library.update(load_template_library(self.library_path))
+        # Documents are longer than library templates: local alignment
+        aligner = TemplateAligner(library, local=True)
+
+        documents = {}
+        by_template = {}
+        best_counts = Counter()
+        for mined_name, docs in self._mined_document_templates().items():
+            template_counts = Counter()
+            best_scores = []
+            for insc_id, slots in docs.items():
+                matches = aligner.best(slots, k=top)
+                if not matches:
+                    continue
+                documents[insc_id] = {
+                    "mined_template": mined_name,
+                    "slots": slots,
+                    "matches": [
+                        {"akkadian_template": name, "score": round(score, 3)}
+                        for name, score in matches
+                    ],
+                }
+                template_counts[matches[0][0]] += 1
+                best_scores.append(matches[0][1])
+            best_counts.update(template_counts)
+            by_template[mined_name] = {
+                "documents": len(best_scores),
+                "mean_best_score": (
+                    round(sum(best_scores) / len(best_scores), 3) if best_scores else 0.0
+                ),
+                "best_template_counts": dict(template_counts.most_common()),
+            }
+
+        self.results["document_alignments"] = {
+            "method": "Smith-Waterman local alignment over slot types (template_alignment.py)",
+            "library_size": len(library),
+            "documents_aligned": len(documents),
+            "best_template_counts": dict(best_counts.most_common()),
+            "by_mined_template": by_template,
+            "documents": documents,
+        }
+        print(f"  Aligned {len(documents)} documents against {len(library)} templates")
+        for mined_name, data in by_template.items():
+            print(
+                f"    {mined_name:35s} {data['documents']:4d} docs, "
+                f"mean best score {data['mean_best_score']:.3f}"
+            )
+
     def generate_findings(self):
         """Generate key findings from isomorphism analysis."""
-        print("\n[Phase 4] Generating findings...")
+        print("\n[Phase 5] Generating findings...")
 
         findings = []
 
@@ -605,6 +707,9 @@ class AdminIsomorphismScorer:
             "khania_cyp_tablets": self.results.get("khania_copper_analysis", {}).get(
                 "total_kh_cyp_tablets", 0
             ),
+            "documents_aligned": self.results.get("document_alignments", {}).get(
+                "documents_aligned", 0
+            ),
         }
 
     def save_results(self, output_path: Path):
@@ -624,6 +729,7 @@ class AdminIsomorphismScorer:
         print(f"Total identifications: {summ.get('total_identifications', 0)}")
         print(f"High-confidence identifications: {summ.get('high_confidence_identifications', 0)}")
         print(f"Khania CYP tablets analyzed: {summ.get('khania_cyp_tablets', 0)}")
+        print(f"Documents aligned to templates: {summ.get('documents_aligned', 0)}")
 
         print("\nBest Template Matches:")
         for la_type, match_data in self.results.get("isomorphism_scores", {}).items():
@@ -643,10 +749,11 @@ class AdminIsomorphismScorer:
 
         print("\n" + "=" * 70)
 
-    def run_full_analysis(self):
+    def run_full_analysis(self, top: int = 3):
         self.score_template_isomorphism()
         self.identify_positional_meanings()
         self.analyze_khania_copper()
+        self.align_document_templates(top=top)
         self.generate_findings()
         self.verify_first_principles()
         self.compile_summary()
@@ -657,13 +764,18 @@ def main():
     parser.add_argument("--score", action="store_true", help="Score template isomorphism only")
     parser.add_argument("--identify", action="store_true", help="Identify positional meanings only")
     parser.add_argument("--khania", action="store_true", help="Analyze Khania copper only")
+    parser.add_argument("--align", action="store_true", help="Align mined document templates only")
+    parser.add_argument(
+        "--library", type=str, help="Extra Akkadian template library (JSON) for --align"
+    )
+    parser.add_argument("--top", type=int, default=3, help="Matches kept per document")
     parser.add_argument("--all", "-a", action="store_true", help="Run full analysis")
     parser.add_argument("--output", "-o", type=str, default="data/admin_isomorphism.json")
     parser.add_argument("--verbose", "-v", action="store_true")
 
     args = parser.parse_args()
 
-    if not any([args.score, args.identify, args.khania, args.all]):
+    if not any([args.score, args.identify, args.khania, args.align, args.all]):
         parser.print_help()
         return 1
 
@@ -672,12 +784,13 @@ def main():
     print("Structural Document Comparison: Linear A ↔ Akkadian")
     print("=" * 70)
 
-    scorer = AdminIsomorphismScorer(verbose=args.verbose)
+    library_path = PROJECT_ROOT / args.library if args.library else None
+    scorer = AdminIsomorphismScorer(verbose=args.verbose, library_path=library_path)
     if not scorer.load_all_data():
         return 1
 
     if args.all:
-        scorer.run_full_analysis()
+        scorer.run_full_analysis(top=args.top)
     else:
         if args.score:
             scorer.score_template_isomorphism()
@@ -685,6 +798,8 @@ def main():
             scorer.identify_positional_meanings()
         if args.khania:
             scorer.analyze_khania_copper()
+        if args.align:
+            scorer.align_document_templates(top=args.top)
         scorer.generate_findings()
         scorer.verify_first_principles()
         scorer.compile_summary()
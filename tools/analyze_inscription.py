@@ -127,6 +127,22 @@ class InscriptionAnalyzer:
         print(f"Inscription '{inscription_id}' not found in corpus")
         return False
 
+    def gorila_reference(self, inscription_id: str) -> dict:
+        """
+        Look up the inscription's GORILA volume/page entry (empty if unindexed).
+        """
+        from gorila_indexer import GORILAIndexer
+
+        entry = GORILAIndexer().lookup_tablet(inscription_id)
+        if not entry:
+            return {}
+        return {
+            "tablet_id": entry["tablet_id"],
+            "volume": entry["volume"],
+            "page": entry["page"],
+            "condition": entry["condition"],
+        }
+
     def identify_anchors(self) -> List[dict]:
         """
         Identify all available anchors in the inscription.
@@ -382,6 +398,7 @@ class InscriptionAnalyzer:
             "support": self.inscription_data.get("support", ""),
             "scribe": self.inscription_data.get("scribe", ""),
             "findspot": self.inscription_data.get("findspot", ""),
+            "gorila": self.gorila_reference(self.inscription_data["_id"]),
             "analyzed": datetime.now().isoformat(),
         }
 
@@ -437,6 +454,12 @@ class InscriptionAnalyzer:
             lines.append(f"- **Scribe**: {md['scribe']}")
         if md["findspot"]:
             lines.append(f"- **Findspot**: {md['findspot']}")
+        if md.get("gorila"):
+            gorila = md["gorila"]
+            lines.append(
+                f"- **GORILA**: {gorila['tablet_id']} (Vol. {gorila['volume']}, "
+                f"p. {gorila['page']}; {gorila['condition']})"
+            )
 
         # Transliteration
         lines.append("\n---\n")
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Shared compiled anchor dependency graph.
+
+Anchors and readings from ``anchors.json`` / ``reading_dependencies.json``
+are compiled once into one directed graph:
+
+- anchor -> reading   (reading ``depends_on`` the anchor)
+- reading -> anchor   (reading ``supports`` the anchor)
+
+Strongly connected components are found with Tarjan's algorithm and the
+condensation is walked sinks-first to give every node a reachability
+bitset (Python int keyed by node ordinal).  "What lies downstream of
+anchor X?" is then a decode of one int.  Adding an edge updates the
+bitsets in place unless it closes a new cycle, in which case the index is
+rebuilt on next use.  Either way the topological component order is
+recomputed the next time it is asked for.
+
+Adjacency lists keep file order, so every listing is deterministic.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+ANCHOR = "anchor"
+READING = "reading"
+
+
+@dataclass(frozen=True)
+class CascadeFrontier:
+    """
+    Nodes visited by AnchorTracker.cascade_from_anchor for one anchor.
+
+    Direct readings are listed at depth 1 and the anchors they support at
+    depth 1.  The walk stops there: readings of those downstream anchors only
+    deepen ``max_depth`` (they are flagged for review, not demoted).
+    """
+
+    readings: Tuple[Tuple[str, int], ...]
+    anchors: Tuple[Tuple[str, int], ...]
+    max_depth: int
+
+
+def _ordered_unique(values: Iterable[Any]) -> List[str]:
+    seen = {}
+    for value in values:
+        seen.setdefault(str(value), None)
+    return list(seen)
+
+
+class AnchorGraph:
+    """Anchor/reading dependency graph with an SCC-based reachability index."""
+
+    def __init__(self, anchors: Dict[str, Any], readings: Dict[str, Any]):
+        self.nodes: List[Tuple[str, str]] = []  # ordinal -> (kind, id)
+        self.ordinal: Dict[Tuple[str, str], int] = {}
+        self.successors: List[List[int]] = []
+
+        self.anchor_mask = 0
+        self.reading_mask = 0
+
+        self._reach: List[int] = []
+        self._components: List[List[int]] = []
+        self._dirty = True
+        self._order_stale = False  # _reach current, _components not in topological order
+        self._frontiers: Dict[str, CascadeFrontier] = {}
+
+        for anchor_id in anchors:
+            self._node(ANCHOR, anchor_id)
+        for reading_id, reading in readings.items():
+            reading = reading if isinstance(reading, dict) else {}
+            self.add_reading(
+                reading_id, reading.get("depends_on", []) or [], reading.get("supports", []) or []
+            )
+
+    # ------------------------------------------------------------------
+    # Construction and incremental updates
+    # ------------------------------------------------------------------
+
+    def _node(self, kind: str, node_id: str) -> int:
+        key = (kind, str(node_id))
+        index = self.ordinal.get(key)
+        if index is None:
+            index = len(self.nodes)
+            self.ordinal[key] = index
+            self.nodes.append(key)
+            self.successors.append([])
+            if kind == ANCHOR:
+                self.anchor_mask |= 1 << index
+            else:
+                self.reading_mask |= 1 << index
+            if not self._dirty:
+                self._reach.append(0)
+                self._components.append([index])
+                self._order_stale = True
+        return index
+
+    def add_edge(self, source: Tuple[str, str], target: Tuple[str, str]):
+        """Add one edge, keeping the reachability index current where possible."""
+        u = self._node(*source)
+        v = self._node(*target)
+        if v in self.successors[u]:
+            return
+        self.successors[u].append(v)
+
+        # Frontiers of every anchor that reaches the edge's source may change
+        for anchor_id in list(self._frontiers):
+            a = self.ordinal[(ANCHOR, anchor_id)]
+            if a == u or self._dirty or (self._reach[a] >> u) & 1:
+                del self._frontiers[anchor_id]
+
+        if self._dirty:
+            return
+        if u == v or (self._reach[v] >> u) & 1:
+            self._dirty = True  # new cycle: SCCs change, rebuild lazily
+            return
+        added = self._reach[v] | (1 << v)
+        for x, bits in enumerate(self._reach):
+            if x == u or (bits >> u) & 1:
+                self._reach[x] = bits | added
+        self._order_stale = True
+
+    def add_reading(self, reading_id: str, depends_on: Iterable[str], supports: Iterable[str] = ()):
+        """Register a reading node with its dependency and support edges."""
+        self._node(READING, reading_id)
+        for anchor_id in _ordered_unique(depends_on):
+            self.add_edge((ANCHOR, anchor_id), (READING, reading_id))
+        for anchor_id in _ordered_unique(supports):
+            self.add_edge((READING, reading_id), (ANCHOR, anchor_id))
+
+    # ------------------------------------------------------------------
+    # SCCs and reachability
+    # ------------------------------------------------------------------
+
+    def _rebuild(self):
+        """Tarjan SCCs (emitted sinks-first) and per-node reachability bitsets."""
+        n = len(self.nodes)
+        index = [-1] * n
+        low = [0] * n
+        on_stack = [False] * n
+        stack: List[int] = []
+        components: List[List[int]] = []
+        counter = 0
+
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            work = [(root, 0)]
+            while work:
+                node, i = work.pop()
+                if i == 0:
+                    index[node] = low[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack[node] = True
+                successors = self.successors[node]
+                if i < len(successors):
+                    work.append((node, i + 1))
+                    nxt = successors[i]
+                    if index[nxt] == -1:
+                        work.append((nxt, 0))
+                    elif on_stack[nxt]:
+                        low[node] = min(low[node], index[nxt])
+                    continue
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(sorted(component))
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+
+        reach = [0] * n
+        for component in components:
+            members = 0
+            for m in component:
+                members |= 1 << m
+            bits = 0
+            for m in component:
+                for s in self.successors[m]:
+                    if not (members >> s) & 1:
+                        bits |= (1 << s) | reach[s]
+            if len(component) > 1 or component[0] in self.successors[component[0]]:
+                bits |= members
+            for m in component:
+                reach[m] = bits
+
+        self._components = components
+        self._reach = reach
+        self._dirty = False
+        self._order_stale = False
+
+    def _ensure(self, ordered: bool = False):
+        if self._dirty or (ordered and self._order_stale):
+            self._rebuild()
+
+    def components(self) -> List[List[Tuple[str, str]]]:
+        """Strongly connected components, sinks first, as (kind, id) lists."""
+        self._ensure(ordered=True)
+        return [[self.nodes[m] for m in component] for component in self._components]
+
+    def cycles(self) -> List[List[Tuple[str, str]]]:
+        """Components that contain a cycle."""
+        self._ensure()
+        return [
+            [self.nodes[m] for m in component]
+            for component in self._components
+            if len(component) > 1 or component[0] in self.successors[component[0]]
+        ]
+
+    def cycle_paths(self) -> List[List[str]]:
+        """
+        One closed path per cyclic component, as node ids ending where they start.
+
+        The path starts at the component's first node in file order and takes
+        the shortest route back to it through the component's own edges.
+        """
+        self._ensure()
+        paths = []
+        for component in self._components:
+            members = set(component)
+            start = min(component)
+            parent: Dict[int, int] = {}
+            frontier = [start]
+            while frontier and start not in parent:
+                next_frontier = []
+                for u in frontier:
+                    for v in self.successors[u]:
+                        if v in members and v not in parent:
+                            parent[v] = u
+                            next_frontier.append(v)
+                frontier = next_frontier
+            if start not in parent:
+                continue  # single node without a self-loop
+            path = [start]
+            node = parent[start]
+            while node != start:
+                path.append(node)
+                node = parent[node]
+            path.append(start)
+            paths.append([self.nodes[m][1] for m in reversed(path)])
+        return paths
+
+    def component_order(self) -> List[List[int]]:
+        """SCC member ordinals in topological order (sources first)."""
+        self._ensure(ordered=True)
+        return self._components[::-1]
+
+    def predecessors(self) -> List[List[int]]:
+        """Incoming adjacency by ordinal, in node order."""
+        incoming: List[List[int]] = [[] for _ in self.nodes]
+        for u, successors in enumerate(self.successors):
+            for v in successors:
+                incoming[v].append(u)
+        return incoming
+
+    def downstream_mask(self, anchor_id: str) -> int:
+        """Reachability bitset of an anchor, including the anchor itself."""
+        u = self.ordinal.get((ANCHOR, anchor_id))
+        if u is None:
+            return 0
+        self._ensure()
+        return self._reach[u] | (1 << u)
+
+    def _decode(self, bits: int) -> List[Tuple[str, str]]:
+        out = []
+        while bits:
+            lowest = bits & -bits
+            out.append(self.nodes[lowest.bit_length() - 1])
+            bits ^= lowest
+        return out
+
+    def reaches(self, source: Tuple[str, str], target: Tuple[str, str]) -> bool:
+        """True if `target` is downstream of `source`."""
+        u, v = self.ordinal.get(source), self.ordinal.get(target)
+        if u is None or v is None:
+            return False
+        self._ensure()
+        return bool((self._reach[u] >> v) & 1)
+
+    def downstream(self, anchor_id: str) -> Dict[str, List[str]]:
+        """Every reading and anchor transitively downstream of an anchor."""
+        u = self.ordinal.get((ANCHOR, anchor_id))
+        if u is None:
+            return {"readings": [], "anchors": []}
+        self._ensure()
+        bits = self._reach[u] & ~(1 << u)
+        return {
+            "readings": [node_id for _, node_id in self._decode(bits & self.reading_mask)],
+            "anchors": [node_id for _, node_id in self._decode(bits & self.anchor_mask)],
+        }
+
+    def impact_all(self) -> Dict[str, Dict[str, List[str]]]:
+        """downstream() for every anchor node, in one pass over the index."""
+        self._ensure()
+        return {node_id: self.downstream(node_id) for kind, node_id in self.nodes if kind == ANCHOR}
+
+    # ------------------------------------------------------------------
+    # Cascade frontiers (AnchorTracker.cascade_from_anchor)
+    # ------------------------------------------------------------------
+
+    def readings_of(self, anchor_id: str) -> List[str]:
+        """Readings that depend directly on an anchor, in file order."""
+        u = self.ordinal.get((ANCHOR, anchor_id))
+        if u is None:
+            return []
+        return [self.nodes[v][1] for v in self.successors[u]]
+
+    def supported_by(self, reading_id: str) -> List[str]:
+        """Anchors a reading supports, in file order."""
+        u = self.ordinal.get((READING, reading_id))
+        if u is None:
+            return []
+        return [self.nodes[v][1] for v in self.successors[u]]
+
+    def cascade_frontier(self, anchor_id: str) -> CascadeFrontier:
+        """Memoised cascade walk for one anchor (see CascadeFrontier)."""
+        frontier = self._frontiers.get(anchor_id)
+        if frontier is None:
+            frontier = self._walk_frontier(anchor_id)
+            self._frontiers[anchor_id] = frontier
+        return frontier
+
+    def _walk_frontier(self, anchor_id: str) -> CascadeFrontier:
+        visited = {anchor_id}
+        readings: List[Tuple[str, int]] = []
+        downstream: List[str] = []
+        for reading_id in self.readings_of(anchor_id):
+            if reading_id in visited:
+                continue
+            visited.add(reading_id)
+            readings.append((reading_id, 1))
+            # The same supported anchor is reported once per supporting reading
+            downstream.extend(a for a in self.supported_by(reading_id) if a not in visited)
+
+        max_depth = 1 if downstream else 0
+        for supported in downstream:
+            for reading_id in self.readings_of(supported):
+                if reading_id not in visited:
+                    visited.add(reading_id)
+                    max_depth = 2
+        return CascadeFrontier(
+            readings=tuple(readings),
+            anchors=tuple((a, 1) for a in downstream),
+            max_depth=max_depth,
+        )
+
+
+def compile_anchor_graph(
+    anchors: Optional[Dict[str, Any]], readings: Optional[Dict[str, Any]]
+) -> AnchorGraph:
+    """Compile ``anchors.json`` / ``reading_dependencies.json`` mappings into a graph."""
+    return AnchorGraph(anchors or {}, readings or {})
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Anchor Demotion Scenarios for Linear A
+
+Robustness audit of the whole anchor dependency graph in one run.  Where
+anchor_tracker.py --cascade simulates one anchor at a time, this tool
+computes the confidence cap of every reading under every single-anchor
+(and optionally every pairwise) demotion scenario and writes the result
+as a scenario matrix that can be diffed between releases.
+
+Cap rules (METHODOLOGY.md Part 2, reading_dependencies.json cascade_rules):
+    anchor   min(anchor confidence, hierarchy level maximum), lowered by the
+             scenario status when the anchor is demoted:
+                 QUESTIONED  one level down
+                 DEMOTED     POSSIBLE at most
+                 REJECTED    SPECULATIVE
+             With feedback (default), an anchor one of whose supporting
+             readings loses cap is treated as QUESTIONED.
+    reading  lowest cap among the anchors it depends on, then PROBABLE at
+             most with single-hypothesis support (compute_max_confidence).
+
+Propagation:
+    The graph is swept once per scenario in topological order of its
+    strongly connected components (anchor_graph.py), iterating inside a
+    component until caps settle.  Only nodes downstream of the demoted
+    anchor are visited; every other node keeps its memoised baseline cap.
+    A pairwise scenario reuses the two single-anchor results and only
+    re-sweeps nodes downstream of both anchors.
+
+Usage:
+    python3 tools/anchor_scenarios.py
+    python3 tools/anchor_scenarios.py --status REJECTED --pairwise
+    python3 tools/anchor_scenarios.py --output data/anchor_scenarios.json
+    python3 tools/anchor_scenarios.py --diff data/anchor_scenarios.json
+
+Attribution:
+    Part of Linear A Decipherment Project
+    Batch robustness audit on top of anchor_tracker.py
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime
+from itertools import combinations
+from typing import Dict, List, Optional, Tuple
+
+from anchor_graph import ANCHOR, READING
+from anchor_tracker import (
+    ANCHOR_LEVEL_MAX_CONFIDENCE,
+    CONFIDENCE_LEVELS,
+    CONFIDENCE_RANK,
+    AnchorTracker,
+)
+
+
+SCENARIO_STATUSES = ["QUESTIONED", "DEMOTED", "REJECTED"]
+PROBABLE_RANK = CONFIDENCE_RANK["PROBABLE"]
+HIGH_RANK = CONFIDENCE_RANK["HIGH"]
+
+
+def _rank(confidence: Optional[str]) -> int:
+    return CONFIDENCE_RANK.get(str(confidence or "SPECULATIVE").upper(), 0)
+
+
+def demoted_rank(rank: int, status: str) -> int:
+    """Cap rank of an anchor after a status change."""
+    if status == "REJECTED":
+        return 0
+    if status == "DEMOTED":
+        return min(rank, CONFIDENCE_RANK["POSSIBLE"])
+    if status == "QUESTIONED":
+        return max(rank - 1, 0)
+    return rank
+
+
+class CapPropagator:
+    """Memoised confidence-cap propagation over a tracker's compiled anchor graph."""
+
+    def __init__(self, tracker: AnchorTracker, status: str = "DEMOTED", feedback: bool = True):
+        self.tracker = tracker
+        self.status = status
+        self.feedback = feedback
+        self.graph = tracker._graph()
+        self.order = self.graph.component_order()
+        self.incoming = self.graph.predecessors()
+
+        nodes = self.graph.nodes
+        self.own_rank: List[int] = []  # anchors: confidence/level cap; readings: unused
+        self.single_hypothesis: List[bool] = []
+        for kind, node_id in nodes:
+            if kind == ANCHOR:
+                anchor = tracker.anchors.get(node_id, {})
+                level_max = ANCHOR_LEVEL_MAX_CONFIDENCE.get(anchor.get("level", 6), "LOW")
+                self.own_rank.append(min(_rank(anchor.get("confidence")), _rank(level_max)))
+                self.single_hypothesis.append(False)
+            else:
+                reading = tracker.readings.get(node_id, {})
+                self.own_rank.append(0)
+                self.single_hypothesis.append(len(reading.get("supported_hypotheses", [])) == 1)
+
+        top = len(CONFIDENCE_LEVELS) - 1
+        caps = self._sweep({}, -1, lambda m: top, use_feedback=False)
+        self.baseline: List[int] = [caps[m] for m in range(len(nodes))]
+        self._singles: Dict[str, Dict[int, int]] = {}
+
+    def _cap(self, node: int, caps, demoted: Dict[int, str], use_feedback: bool) -> int:
+        if self.graph.nodes[node][0] == ANCHOR:
+            rank = self.own_rank[node]
+            if node in demoted:
+                return demoted_rank(rank, demoted[node])
+            if use_feedback and any(caps(p) < self.baseline[p] for p in self.incoming[node]):
+                return demoted_rank(rank, "QUESTIONED")
+            return rank
+        anchors = self.incoming[node]
+        if not anchors:
+            return 0
+        rank = min(caps(a) for a in anchors)
+        if self.single_hypothesis[node] and rank >= HIGH_RANK:
+            rank = PROBABLE_RANK
+        return rank
+
+    def _sweep(self, demoted: Dict[int, str], scope: int, fallback, use_feedback: bool):
+        """
+        Caps (ordinal -> rank) for nodes in `scope` (a bitset) under `demoted`.
+
+        Components are visited sources first.  `fallback(ordinal)` gives caps
+        outside the scope and the starting point inside it; since caps only
+        fall, iterating a cyclic component from there settles on its fixpoint.
+        """
+        caps: Dict[int, int] = {}
+
+        def lookup(node: int) -> int:
+            return caps[node] if node in caps else fallback(node)
+
+        for component in self.order:
+            members = [m for m in component if (scope >> m) & 1]
+            if not members:
+                continue
+            for m in members:
+                caps[m] = fallback(m)
+            changed = True
+            while changed:  # more than one pass only inside a cycle
+                changed = False
+                for m in members:
+                    cap = self._cap(m, lookup, demoted, use_feedback)
+                    if cap != caps[m]:
+                        caps[m] = cap
+                        changed = True
+        return caps
+
+    def single(self, anchor_id: str) -> Dict[int, int]:
+        """Memoised caps (ordinal -> rank) downstream of one demoted anchor."""
+        result = self._singles.get(anchor_id)
+        if result is None:
+            u = self.graph.ordinal[(ANCHOR, anchor_id)]
+            result = self._sweep(
+                {u: self.status},
+                self.graph.downstream_mask(anchor_id),
+                self.baseline.__getitem__,
+                self.feedback,
+            )
+            self._singles[anchor_id] = result
+        return result
+
+    def pair(self, first: str, second: str) -> Dict[int, int]:
+        """Caps with both anchors demoted; only their shared downstream is re-swept."""
+        a = self.graph.ordinal[(ANCHOR, first)]
+        b = self.graph.ordinal[(ANCHOR, second)]
+        mask_a = self.graph.downstream_mask(first)
+        mask_b = self.graph.downstream_mask(second)
+        single_a, single_b = self.single(first), self.single(second)
+
+        caps = {m: r for m, r in single_a.items() if not (mask_b >> m) & 1}
+        caps.update((m, r) for m, r in single_b.items() if not (mask_a >> m) & 1)
+        shared = self._sweep(
+            {a: self.status, b: self.status},
+            mask_a & mask_b,
+            lambda m: caps.get(m, self.baseline[m]),
+            self.feedback,
+        )
+        caps.update(shared)
+        return caps
+
+    def describe(self, caps: Dict[int, int]) -> Dict:
+        """Scenario cell: nodes whose cap falls below baseline, plus counts."""
+        nodes = self.graph.nodes
+        readings, anchors = {}, {}
+        demoted = 0
+        for m in sorted(caps):
+            if caps[m] >= self.baseline[m]:
+                continue
+            kind, node_id = nodes[m]
+            level = CONFIDENCE_LEVELS[caps[m]]
+            if kind == READING:
+                readings[node_id] = level
+                current = self.tracker.readings.get(node_id, {}).get("confidence")
+                if caps[m] < _rank(current):
+                    demoted += 1
+            else:
+                anchors[node_id] = level
+        return {
+            "readings_capped": len(readings),
+            "readings_demoted": demoted,
+            "anchors": anchors,
+            "readings": readings,
+        }
+
+    def matrix(self, pairwise: bool = False) -> Dict[str, Dict]:
+        """Scenario name -> cell, singles in registry order, then pairs."""
+        anchor_ids = [a for a in self.tracker.anchors if (ANCHOR, a) in self.graph.ordinal]
+        scenarios = {a: self.describe(self.single(a)) for a in anchor_ids}
+        if pairwise:
+            for first, second in combinations(anchor_ids, 2):
+                scenarios[f"{first}+{second}"] = self.describe(self.pair(first, second))
+        return scenarios
+
+    def baseline_caps(self) -> Dict[str, Dict[str, str]]:
+        out: Dict[str, Dict[str, str]] = {"anchors": {}, "readings": {}}
+        for m, (kind, node_id) in enumerate(self.graph.nodes):
+            key = "anchors" if kind == ANCHOR else "readings"
+            out[key][node_id] = CONFIDENCE_LEVELS[self.baseline[m]]
+        return out
+
+
+def diff_matrices(old: Dict, new: Dict) -> List[Tuple[str, str, Optional[str], Optional[str]]]:
+    """Changed cells between two saved matrices: (scenario, node, old cap, new cap)."""
+    changes = []
+    old_scenarios, new_scenarios = old.get("scenarios", {}), new.get("scenarios", {})
+    for scenario in sorted(set(old_scenarios) | set(new_scenarios)):
+        before = old_scenarios.get(scenario, {})
+        after = new_scenarios.get(scenario, {})
+        for key in ("anchors", "readings"):
+            was, now = before.get(key, {}), after.get(key, {})
+            for node_id in sorted(set(was) | set(now)):
+                if was.get(node_id) != now.get(node_id):
+                    changes.append((scenario, node_id, was.get(node_id), now.get(node_id)))
+    return changes
+
+
+def build_report(propagator: CapPropagator, pairwise: bool) -> Dict:
+    return {
+        "metadata": {
+            "tool": "anchor_scenarios.py",
+            "generated": datetime.now().isoformat(),
+            "status": propagator.status,
+            "feedback": propagator.feedback,
+            "pairwise": pairwise,
+            "anchors": len(propagator.tracker.anchors),
+            "readings": len(propagator.tracker.readings),
+        },
+        "baseline": propagator.baseline_caps(),
+        "scenarios": propagator.matrix(pairwise=pairwise),
+    }
+
+
+def print_report(report: Dict, top: int = 15):
+    """Print the most damaging scenarios and the most fragile readings."""
+    meta = report["metadata"]
+    scenarios = report["scenarios"]
+    print(f"\n{'=' * 70}")
+    print(f"ANCHOR DEMOTION SCENARIOS — every anchor {meta['status']}")
+    print(f"{'=' * 70}")
+    print(f"  Scenarios: {len(scenarios)} (pairwise: {'yes' if meta['pairwise'] else 'no'})")
+    print(f"  Feedback through supported anchors: {'yes' if meta['feedback'] else 'no'}")
+
+    ranked = sorted(
+        scenarios.items(), key=lambda kv: (-kv[1]["readings_demoted"], -kv[1]["readings_capped"])
+    )
+    print(f"\n  {'Scenario':<52s} {'Capped':>6s} {'Demoted':>7s}")
+    print(f"  {'-' * 67}")
+    for name, cell in ranked[:top]:
+        print(f"  {name[:52]:<52s} {cell['readings_capped']:6d} {cell['readings_demoted']:7d}")
+
+    fragility: Dict[str, int] = {}
+    for name, cell in scenarios.items():
+        if "+" in name:
+            continue
+        for reading_id in cell["readings"]:
+            fragility[reading_id] = fragility.get(reading_id, 0) + 1
+    if fragility:
+        print("\n  Readings capped by the most single-anchor scenarios:")
+        for reading_id, n in sorted(fragility.items(), key=lambda kv: (-kv[1], kv[0]))[:top]:
+            print(f"    {reading_id:<24s} {n}")
+    print(f"\n{'=' * 70}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Anchor Demotion Scenarios — confidence caps for every reading "
+        "under every anchor demotion"
+    )
+    parser.add_argument(
+        "--status",
+        choices=SCENARIO_STATUSES,
+        default="DEMOTED",
+        help="Status applied to the anchor(s) in each scenario (default: DEMOTED)",
+    )
+    parser.add_argument(
+        "--pairwise", action="store_true", help="Also simulate every pair of anchors"
+    )
+    parser.add_argument(
+        "--no-feedback",
+        action="store_true",
+        help="Do not question anchors whose supporting readings lose cap",
+    )
+    parser.add_argument("--top", type=int, default=15, help="Rows to print (default: 15)")
+    parser.add_argument("--output", type=str, help="Save the scenario matrix to JSON file")
+    parser.add_argument("--diff", type=str, help="Compare against a previously saved matrix")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("LINEAR A ANCHOR DEMOTION SCENARIOS")
+    print("=" * 70)
+
+    tracker = AnchorTracker()
+    if not tracker.load_data():
+        sys.exit(1)
+
+    propagator = CapPropagator(tracker, status=args.status, feedback=not args.no_feedback)
+    report = build_report(propagator, args.pairwise)
+    print_report(report, top=args.top)
+
+    if args.diff:
+        with open(args.diff, "r", encoding="utf-8") as f:
+            previous = json.load(f)
+        changes = diff_matrices(previous, report)
+        print(f"\nChanged cells vs {args.diff}: {len(changes)}")
+        for scenario, node_id, was, now in changes[: args.top * 4]:
+            print(f"  {scenario}: {node_id} {was or '-'} → {now or '-'}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False, sort_keys=True)
+        print(f"\nResults saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -26,6 +26,8 @@ Usage:
     # Other commands
     python tools/anchor_tracker.py --register SA-RA₂ --depends-on anchor_semitic_loan_layer
     python tools/anchor_tracker.py --validate
+    python tools/anchor_tracker.py --impact anchor_linear_b_comparison
+    python tools/anchor_tracker.py --impact-all --output data/anchor_impact.json
     python tools/anchor_tracker.py --graph
     python tools/anchor_tracker.py --reading KU-RO
 
@@ -47,11 +49,14 @@ import json
 import argparse
 import sys
 from pathlib import Path
-from collections import defaultdict, deque
+from collections import defaultdict
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 from dataclasses import dataclass
 
+from anchor_graph import AnchorGraph, compile_anchor_graph
+from reading_events import ReadingEvent, by_reading
+
 
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -133,6 +138,7 @@ class AnchorTracker:
         self.anchor_to_readings = defaultdict(set)  # anchor -> set of readings
         self.reading_to_anchors = defaultdict(set)  # reading -> set of anchors
         self.reading_supports = defaultdict(set)  # reading -> set of anchors it supports
+        self.graph: Optional[AnchorGraph] = None  # compiled reachability index
 
     def log(self, msg: str):
         if self.verbose:
@@ -159,6 +165,8 @@ class AnchorTracker:
                 for anchor_id in reading_data.get("supports", []):
                     self.reading_supports[reading_id].add(anchor_id)
 
+            self.graph = compile_anchor_graph(self.anchors, self.readings)
+
             print(f"Loaded {len(self.anchors)} anchors and {len(self.readings)} readings")
             return True
 
@@ -231,8 +239,9 @@ class AnchorTracker:
         """
         Compute cascade effects when an anchor's status changes.
 
-        Uses BFS to traverse the dependency graph and identify all
-        affected readings and downstream anchors.
+        The walk (direct readings, the anchors they support, and the
+        readings of those anchors for depth) is memoised per anchor in the
+        compiled graph, so repeated queries only apply the status rules.
 
         Args:
             anchor_id: The anchor being questioned/demoted/rejected
@@ -255,88 +264,61 @@ class AnchorTracker:
         affected_readings = []
         affected_anchors = []
         warnings = []
-        visited = set()
-        max_depth = 0
-
-        # BFS from the anchor
-        queue = deque([(anchor_id, 0, "anchor")])
-        visited.add(anchor_id)
+        frontier = self._graph().cascade_frontier(anchor_id)
+        max_depth = frontier.max_depth
 
-        while queue:
-            node_id, depth, node_type = queue.popleft()
-            max_depth = max(max_depth, depth)
-
-            if node_type == "anchor":
-                # Find all readings that depend on this anchor
-                for reading_id in self.anchor_to_readings.get(node_id, []):
-                    if reading_id in visited:
-                        continue
-                    visited.add(reading_id)
-
-                    reading = self.readings.get(reading_id, {})
-                    current_conf = reading.get("confidence", "SPECULATIVE")
-
-                    # Determine new confidence based on status change
-                    if new_status == "REJECTED":
-                        new_conf = "SPECULATIVE"
-                        action = "Demote to SPECULATIVE (anchor rejected)"
-                    elif new_status == "DEMOTED":
-                        # Cap at POSSIBLE
-                        if self.get_confidence_rank(current_conf) > self.get_confidence_rank(
-                            "POSSIBLE"
-                        ):
-                            new_conf = "POSSIBLE"
-                            action = "Cap at POSSIBLE (anchor demoted)"
-                        else:
-                            new_conf = current_conf
-                            action = "No change (already at or below POSSIBLE)"
-                    elif new_status == "QUESTIONED":
-                        # Flag for review, suggest one level down
-                        current_rank = self.get_confidence_rank(current_conf)
-                        if current_rank > 0:
-                            new_conf = CONFIDENCE_LEVELS[current_rank - 1]
-                            action = f"Suggest downgrade to {new_conf} (anchor questioned)"
-                        else:
-                            new_conf = current_conf
-                            action = "Already at minimum confidence"
-                    else:
-                        new_conf = current_conf
-                        action = "Unknown status - no change"
-
-                    affected_readings.append(
-                        {
-                            "reading_id": reading_id,
-                            "meaning": reading.get("meaning", "Unknown"),
-                            "current_confidence": current_conf,
-                            "new_confidence": new_conf,
-                            "action": action,
-                            "cascade_depth": depth + 1,
-                        }
-                    )
+        for reading_id, depth in frontier.readings:
+            reading = self.readings.get(reading_id, {})
+            current_conf = reading.get("confidence", "SPECULATIVE")
 
-                    # Check if this reading supports other anchors
-                    for supported_anchor in self.reading_supports.get(reading_id, []):
-                        if supported_anchor not in visited:
-                            queue.append((supported_anchor, depth + 1, "anchor_via_reading"))
+            # Determine new confidence based on status change
+            if new_status == "REJECTED":
+                new_conf = "SPECULATIVE"
+                action = "Demote to SPECULATIVE (anchor rejected)"
+            elif new_status == "DEMOTED":
+                # Cap at POSSIBLE
+                if self.get_confidence_rank(current_conf) > self.get_confidence_rank("POSSIBLE"):
+                    new_conf = "POSSIBLE"
+                    action = "Cap at POSSIBLE (anchor demoted)"
+                else:
+                    new_conf = current_conf
+                    action = "No change (already at or below POSSIBLE)"
+            elif new_status == "QUESTIONED":
+                # Flag for review, suggest one level down
+                current_rank = self.get_confidence_rank(current_conf)
+                if current_rank > 0:
+                    new_conf = CONFIDENCE_LEVELS[current_rank - 1]
+                    action = f"Suggest downgrade to {new_conf} (anchor questioned)"
+                else:
+                    new_conf = current_conf
+                    action = "Already at minimum confidence"
+            else:
+                new_conf = current_conf
+                action = "Unknown status - no change"
 
-            elif node_type == "anchor_via_reading":
-                # This anchor is supported by an affected reading
-                anchor = self.anchors.get(node_id, {})
-                affected_anchors.append(
-                    {
-                        "anchor_id": node_id,
-                        "name": anchor.get("name", "Unknown"),
-                        "current_confidence": anchor.get("confidence", "SPECULATIVE"),
-                        "note": "Supporting evidence weakened - review recommended",
-                        "cascade_depth": depth,
-                    }
-                )
+            affected_readings.append(
+                {
+                    "reading_id": reading_id,
+                    "meaning": reading.get("meaning", "Unknown"),
+                    "current_confidence": current_conf,
+                    "new_confidence": new_conf,
+                    "action": action,
+                    "cascade_depth": depth,
+                }
+            )
 
-                # Continue cascade through this anchor
-                for reading_id in self.anchor_to_readings.get(node_id, []):
-                    if reading_id not in visited:
-                        visited.add(reading_id)
-                        queue.append((reading_id, depth + 1, "reading"))
+        # Anchors supported by an affected reading
+        for supported_id, depth in frontier.anchors:
+            anchor = self.anchors.get(supported_id, {})
+            affected_anchors.append(
+                {
+                    "anchor_id": supported_id,
+                    "name": anchor.get("name", "Unknown"),
+                    "current_confidence": anchor.get("confidence", "SPECULATIVE"),
+                    "note": "Supporting evidence weakened - review recommended",
+                    "cascade_depth": depth,
+                }
+            )
 
         # Generate warnings
         if len(affected_readings) > 5:
@@ -358,6 +340,37 @@ class AnchorTracker:
             warnings=warnings,
         )
 
+    def _graph(self) -> AnchorGraph:
+        """Compiled graph, built from the current data if load_data() was bypassed."""
+        if self.graph is None:
+            self.graph = compile_anchor_graph(self.anchors, self.readings)
+        return self.graph
+
+    def impact_report(self, anchor_id: str) -> Dict:
+        """Everything transitively downstream of an anchor (readings and anchors)."""
+        downstream = self._graph().downstream(anchor_id)
+        return {
+            "anchor_id": anchor_id,
+            "readings": downstream["readings"],
+            "anchors": downstream["anchors"],
+            "total": len(downstream["readings"]) + len(downstream["anchors"]),
+        }
+
+    def impact_all(self) -> List[Dict]:
+        """impact_report() for every registered anchor, largest impact first."""
+        impact = self._graph().impact_all()
+        reports = [
+            {
+                "anchor_id": anchor_id,
+                "readings": impact[anchor_id]["readings"],
+                "anchors": impact[anchor_id]["anchors"],
+                "total": len(impact[anchor_id]["readings"]) + len(impact[anchor_id]["anchors"]),
+            }
+            for anchor_id in self.anchors
+        ]
+        reports.sort(key=lambda r: -r["total"])
+        return reports
+
     def auto_cascade_propagate(self, anchor_id: str, new_status: str) -> CascadeResult:
         """
         Automatically propagate confidence changes when an anchor is questioned.
@@ -644,6 +657,7 @@ class AnchorTracker:
         for anchor_id in depends_on:
             self.anchor_to_readings[anchor_id].add(reading_id)
             self.reading_to_anchors[reading_id].add(anchor_id)
+        self._graph().add_reading(reading_id, depends_on)
 
         print(f"Registered reading: {reading_id} = '{meaning}' [{confidence}]")
         print(f"  Depends on: {', '.join(depends_on)}")
@@ -651,6 +665,32 @@ class AnchorTracker:
 
         return True
 
+    def apply_reading_events(self, events: List[ReadingEvent]) -> List[Dict]:
+        """
+        reading_events.py subscriber: check recorded confidences against anchor caps.
+
+        Readings not yet tracked are added to the in-memory graph (not saved;
+        --register persists them).  Returns one entry per reading with the
+        words recorded above its maximum confidence.
+        """
+        checks = []
+        for reading_id, group in by_reading(events).items():
+            depends_on = group[-1].depends_on
+            if reading_id not in self.readings and depends_on:
+                self.readings[reading_id] = {"depends_on": depends_on, "supports": []}
+                for anchor_id in depends_on:
+                    self.anchor_to_readings[anchor_id].add(reading_id)
+                    self.reading_to_anchors[reading_id].add(anchor_id)
+                self._graph().add_reading(reading_id, depends_on)
+            max_conf = self.compute_max_confidence(reading_id)
+            over = [
+                event.word or reading_id
+                for event in group
+                if self.get_confidence_rank(event.confidence) > self.get_confidence_rank(max_conf)
+            ]
+            checks.append({"reading_id": reading_id, "max_confidence": max_conf, "over_cap": over})
+        return checks
+
     def validate_consistency(self) -> ValidationResult:
         """
         Validate dependencies for consistency.
@@ -700,42 +740,8 @@ class AnchorTracker:
                 )
                 is_valid = False
 
-        # Check for circular dependencies using DFS
-        def find_cycles():
-            WHITE, GRAY, BLACK = 0, 1, 2
-            color = defaultdict(int)
-            path = []
-            cycles = []
-
-            def dfs(node, node_type):
-                if color[node] == GRAY:
-                    # Found cycle
-                    cycle_start = path.index(node)
-                    cycles.append(path[cycle_start:] + [node])
-                    return
-                if color[node] == BLACK:
-                    return
-
-                color[node] = GRAY
-                path.append(node)
-
-                if node_type == "anchor":
-                    for reading in self.anchor_to_readings.get(node, []):
-                        dfs(reading, "reading")
-                elif node_type == "reading":
-                    for anchor in self.reading_supports.get(node, []):
-                        dfs(anchor, "anchor")
-
-                path.pop()
-                color[node] = BLACK
-
-            for anchor_id in self.anchors:
-                if color[anchor_id] == WHITE:
-                    dfs(anchor_id, "anchor")
-
-            return cycles
-
-        circular_deps = find_cycles()
+        # Check for circular dependencies (cyclic components of the compiled graph)
+        circular_deps = self._graph().cycle_paths()
         if circular_deps:
             for cycle in circular_deps:
                 warnings.append(f"Circular dependency: {' -> '.join(cycle)}")
@@ -942,6 +948,18 @@ def main():
         "--reading", type=str, metavar="READING_ID", help="Show info about a specific reading"
     )
     parser.add_argument("--list-anchors", "-l", action="store_true", help="List all anchors")
+    parser.add_argument(
+        "--impact",
+        type=str,
+        metavar="ANCHOR_ID",
+        help="List everything transitively downstream of an anchor",
+    )
+    parser.add_argument(
+        "--impact-all",
+        action="store_true",
+        help="Downstream impact of every anchor, largest first",
+    )
+    parser.add_argument("--output", type=str, help="Save --impact-all report to JSON file")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
 
     args = parser.parse_args()
@@ -1019,6 +1037,51 @@ def main():
         print(tracker.generate_graph_ascii())
         return 0
 
+    if args.impact:
+        if args.impact not in tracker.anchors:
+            print(f"Error: Unknown anchor: {args.impact}")
+            return 1
+        report = tracker.impact_report(args.impact)
+        print(f"\nDownstream of {args.impact}: {report['total']} nodes")
+        print(f"\n  Readings ({len(report['readings'])}):")
+        for reading_id in report["readings"]:
+            conf = tracker.readings.get(reading_id, {}).get("confidence", "?")
+            print(f"    {reading_id} [{conf}]")
+        if report["anchors"]:
+            print(f"\n  Anchors ({len(report['anchors'])}):")
+            for anchor_id in report["anchors"]:
+                print(f"    ◆ {anchor_id}")
+        return 0
+
+    if args.impact_all:
+        reports = tracker.impact_all()
+        print(f"\n{'Anchor':<40s} {'Readings':>8s} {'Anchors':>7s}")
+        print("-" * 57)
+        for report in reports:
+            print(
+                f"{report['anchor_id']:<40s} {len(report['readings']):8d} "
+                f"{len(report['anchors']):7d}"
+            )
+        cycles = tracker.graph.cycles()
+        if cycles:
+            print(f"\nCyclic components: {len(cycles)}")
+            for component in cycles:
+                print(f"  • {len(component)} nodes: " + ", ".join(n for _, n in component[:6]))
+        if args.output:
+            output = {
+                "metadata": {
+                    "tool": "anchor_tracker.py",
+                    "generated": datetime.now().isoformat(),
+                    "anchors": len(tracker.anchors),
+                    "readings": len(tracker.readings),
+                },
+                "impact": reports,
+            }
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(output, f, indent=2, ensure_ascii=False)
+            print(f"\nResults saved to: {args.output}")
+        return 0
+
     if args.reading:
         info = tracker.get_reading_info(args.reading)
         if "error" in info:
@@ -36,6 +36,7 @@ from pathlib import Path
 from collections import defaultdict
 from datetime import datetime
 from typing import List, Optional
+from corpus_index import compile_corpus
 from word_filter_contract import (
     CONTRACT_VERSION,
     is_hypothesis_eligible_word,
@@ -63,6 +64,7 @@ class BatchPipeline:
         self.verbose = verbose
         self.dry_run = dry_run
         self.corpus = None
+        self.compiled = None  # corpus_index.CompiledCorpus
         self.checkpoint = {}
 
         # Pipeline state
@@ -113,6 +115,7 @@ class BatchPipeline:
                 self.corpus = full_corpus
                 self.log(f"Loaded {len(full_corpus.get('inscriptions', {}))} inscriptions")
 
+            self.compiled = compile_corpus(self.corpus)
             self.stats["inscriptions_total"] = len(self.corpus.get("inscriptions", {}))
             return True
 
@@ -196,12 +199,9 @@ class BatchPipeline:
         )
 
         processed = 0
-        for insc_id, data in self.corpus.get("inscriptions", {}).items():
-            if "_parse_error" in data:
-                continue
-
+        for insc_id, layout in self.compiled.items():
             site = self._extract_site_code(insc_id)
-            words = data.get("transliteratedWords", [])
+            words = layout.tokens
 
             for idx, word in enumerate(words):
                 if not self._is_valid_word(word):
@@ -211,10 +211,10 @@ class BatchPipeline:
                 word_data[word_upper]["frequency"] += 1
                 word_data[word_upper]["sites"].add(site)
 
-                # Track position (simplified)
-                if idx == 0 or (idx > 0 and words[idx - 1] == "\n"):
+                # Track line position from the compiled layout
+                if layout.line_initial[idx]:
                     word_data[word_upper]["positions"]["initial"] += 1
-                elif idx == len(words) - 1 or (idx < len(words) - 1 and words[idx + 1] == "\n"):
+                elif layout.line_final[idx]:
                     word_data[word_upper]["positions"]["final"] += 1
                 else:
                     word_data[word_upper]["positions"]["medial"] += 1
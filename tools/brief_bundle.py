@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Indexed bundle of reading briefs.
+
+A bundle is two files written side by side:
+
+- ``<name>.jsonl``: one brief per line, in queue order, in the same
+  ``{"metadata", "brief"}`` shape that ``reading_pipeline.py --prepare
+  --output`` writes for a single tablet;
+- ``<name>.index.json``: queue order with each brief's byte offset and
+  length, plus a short summary (site, readiness, document type, link count)
+  so a queue can be listed without reading the briefs.
+
+Opening a bundle reads only the index; each brief is one seek and one line
+read.  Both files are written through a temporary file and ``os.replace``,
+and the index records the bundle size, so a bundle rewritten under an old
+index is reported rather than misread.
+
+Usage:
+    python3 tools/brief_bundle.py data/reading_briefs.jsonl
+    python3 tools/brief_bundle.py data/reading_briefs.jsonl --page 2 --page-size 25
+    python3 tools/brief_bundle.py data/reading_briefs.jsonl --show HT13
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+CONTRACT_VERSION = "2026-10-19.v1"
+
+DEFAULT_PAGE_SIZE = 20
+
+
+def index_path(bundle_path: Path) -> Path:
+    """Index file that belongs to a bundle (``briefs.jsonl`` -> ``briefs.index.json``)."""
+    bundle_path = Path(bundle_path)
+    return bundle_path.with_name(bundle_path.stem + ".index.json")
+
+
+def _summary(brief: Dict[str, Any]) -> Dict[str, Any]:
+    body = brief.get("brief", {})
+    return {
+        "site": body.get("site"),
+        "readiness_score": body.get("readiness_score"),
+        "document_type": body.get("document_type"),
+        "cross_tablet_links": len(body.get("cross_tablet_links") or []),
+    }
+
+
+def write_bundle(
+    bundle_path: Path,
+    briefs: Iterable[Tuple[str, Optional[Dict[str, Any]]]],
+    metadata: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Write ``(tablet_id, brief)`` pairs as a bundle; ``None`` briefs are listed as skipped.
+
+    Briefs are written as they arrive, so a generator of worker results
+    streams straight to disk.  Returns the index.
+    """
+    bundle_path = Path(bundle_path)
+    bundle_path.parent.mkdir(parents=True, exist_ok=True)
+    entries: List[Dict[str, Any]] = []
+    skipped: List[str] = []
+
+    tmp = bundle_path.with_suffix(bundle_path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        for tablet_id, brief in briefs:
+            if brief is None:
+                skipped.append(tablet_id)
+                continue
+            line = (json.dumps(brief, ensure_ascii=False) + "\n").encode("utf-8")
+            entries.append(
+                {"tablet_id": tablet_id, "offset": f.tell(), "length": len(line), **_summary(brief)}
+            )
+            f.write(line)
+        size = f.tell()
+
+    index = {
+        "contract_version": CONTRACT_VERSION,
+        "generated": datetime.now().isoformat(),
+        "bundle": bundle_path.name,
+        "bundle_size": size,
+        "metadata": metadata or {},
+        "briefs": entries,
+        "skipped": skipped,
+    }
+    tmp.replace(bundle_path)
+    idx = index_path(bundle_path)
+    idx_tmp = idx.with_suffix(idx.suffix + ".tmp")
+    with open(idx_tmp, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2, ensure_ascii=False)
+    idx_tmp.replace(idx)
+    return index
+
+
+class BriefBundle:
+    """Random and paged access to a bundle written by write_bundle."""
+
+    def __init__(self, bundle_path: Path):
+        self.path = Path(bundle_path)
+        with open(index_path(self.path), "r", encoding="utf-8") as f:
+            self.index = json.load(f)
+        if self.index.get("contract_version") != CONTRACT_VERSION:
+            raise ValueError(f"{index_path(self.path)}: unsupported bundle contract version")
+        if os.path.getsize(self.path) != self.index.get("bundle_size"):
+            raise ValueError(f"{self.path}: bundle does not match its index (regenerate it)")
+        self.entries: List[Dict[str, Any]] = self.index.get("briefs", [])
+        self._by_id = {entry["tablet_id"]: entry for entry in self.entries}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, tablet_id: str) -> bool:
+        return tablet_id in self._by_id
+
+    def ids(self) -> List[str]:
+        """Tablet ids in queue order."""
+        return [entry["tablet_id"] for entry in self.entries]
+
+    def get(self, tablet_id: str) -> Optional[Dict[str, Any]]:
+        """One brief, read by offset (None if the tablet is not in the bundle)."""
+        entry = self._by_id.get(tablet_id)
+        if entry is None:
+            return None
+        with open(self.path, "rb") as f:
+            f.seek(entry["offset"])
+            return json.loads(f.read(entry["length"]))
+
+    def page(self, number: int, size: int = DEFAULT_PAGE_SIZE) -> List[Dict[str, Any]]:
+        """Index entries of a 1-based page."""
+        start = max(number - 1, 0) * size
+        return self.entries[start : start + size]
+
+
+def print_page(bundle: BriefBundle, number: int, size: int):
+    """Print one page of the bundle index."""
+    pages = max((len(bundle) + size - 1) // size, 1)
+    print(f"\n{'=' * 70}")
+    print(f"READING BRIEF BUNDLE: {bundle.path.name} ({len(bundle)} briefs)")
+    print(f"{'=' * 70}")
+    print(f"  Generated: {bundle.index.get('generated', '?')}")
+    print(f"  Page {number} of {pages}")
+    print(f"\n  {'#':>4s}  {'Tablet':<12s} {'Site':<6s} {'Ready':>6s} {'Links':>5s}  Type")
+    print(f"  {'-' * 60}")
+    first = (max(number, 1) - 1) * size
+    for i, entry in enumerate(bundle.page(number, size), first + 1):
+        score = entry.get("readiness_score") or 0.0
+        print(
+            f"  {i:4d}  {entry['tablet_id']:<12s} {entry.get('site') or '':<6s} "
+            f"{score:6.3f} {entry.get('cross_tablet_links', 0):5d}  "
+            f"{entry.get('document_type') or ''}"
+        )
+    skipped = bundle.index.get("skipped", [])
+    if skipped:
+        print(f"\n  Skipped (no brief): {', '.join(skipped)}")
+    print(f"\n{'=' * 70}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Page through an indexed reading brief bundle")
+    parser.add_argument("bundle", type=str, help="Bundle file (.jsonl) written by reading_pipeline")
+    parser.add_argument("--page", type=int, default=1, help="Page to list (default: 1)")
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=DEFAULT_PAGE_SIZE,
+        help=f"Briefs per page (default: {DEFAULT_PAGE_SIZE})",
+    )
+    parser.add_argument("--show", type=str, metavar="TABLET_ID", help="Print one brief as JSON")
+    args = parser.parse_args()
+
+    try:
+        bundle = BriefBundle(Path(args.bundle))
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    if args.show:
+        brief = bundle.get(args.show)
+        if brief is None:
+            print(f"Error: {args.show} is not in {bundle.path.name}")
+            sys.exit(1)
+        print(json.dumps(brief, indent=2, ensure_ascii=False))
+    else:
+        print_page(bundle, args.page, args.page_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,9 @@ Usage:
     python3 tools/cascade_opportunity_detector.py --word NI --confidence HIGH --threshold 0.5
     python3 tools/cascade_opportunity_detector.py --all-anchors
     python3 tools/cascade_opportunity_detector.py --all-anchors --threshold 0.6
+    python3 tools/cascade_opportunity_detector.py --what-if --output data/cascade_what_if.json
+    python3 tools/cascade_opportunity_detector.py --rank-all --site HT --top 40
+    python3 tools/cascade_opportunity_detector.py --rank-all --doc-type administrative --depth 2
     python3 tools/cascade_opportunity_detector.py --output data/cascade_opportunities.json
 
 Attribution:
@@ -25,15 +28,17 @@ Attribution:
 
 import json
 import argparse
-import math
 import re
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
 from dataclasses import dataclass, asdict
-from collections import defaultdict
+from collections import defaultdict, deque
 from datetime import datetime
 
+from reading_events import EventJournal, ReadingEvent, words_of
+from readiness_store import ARITHMETIC_STATUS_SCORES, composite_readiness
+
 
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -199,6 +204,182 @@ def _extract_site(tablet_id: str) -> str:
     return match.group(1) if match else "UNKNOWN"
 
 
+# ---------------------------------------------------------------------------
+# Incremental readiness state
+# ---------------------------------------------------------------------------
+
+
+class ReadinessState:
+    """
+    Per-tablet readiness counters for what-if analysis.
+
+    Structural counts, arithmetic component and the baseline unknown count
+    are computed once per tablet.  Unknown tokens are posted under their
+    upper-cased form, so assuming a word identified touches only the tablets
+    that contain it.  Assumptions stack and are undone with rollback().
+    """
+
+    def __init__(self, detector: "CascadeOpportunityDetector"):
+        self.syllabic = detector.tablet_syllabic_words
+        self.total: Dict[str, int] = {}
+        self.structural: Dict[str, int] = {}
+        self.arith: Dict[str, float] = {}
+        self.unknown: Dict[str, int] = {}
+        self.baseline: Dict[str, float] = {}  # tablet_id -> score with no assumptions
+        self.postings: Dict[str, Dict[str, int]] = defaultdict(dict)  # key -> tablet -> count
+        self.unknown_literals: Set[str] = set()
+        self.unknown_tokens: Dict[str, List[Tuple[str, str]]] = {}  # tablet -> (word, key)
+        self.marked: Set[str] = set()
+        self._journal: List[Optional[str]] = []
+        self._scores: Dict[Tuple[str, int], float] = {}  # (tablet_id, unknown) -> score
+
+        known: Dict[str, bool] = {}
+        for tablet_id, syllabic in self.syllabic.items():
+            if not syllabic:
+                continue
+            tokens = detector.inscriptions.get(tablet_id, {}).get("transliteratedWords", [])
+            self.total[tablet_id] = len(syllabic)
+            self.structural[tablet_id] = sum(1 for t in tokens if _is_logogram(t) or _is_number(t))
+            arith_status = detector.readiness_details.get(tablet_id, {}).get(
+                "arithmetic_status", ""
+            )
+            if arith_status in ARITHMETIC_STATUS_SCORES:
+                self.arith[tablet_id] = ARITHMETIC_STATUS_SCORES[arith_status]
+            else:
+                self.arith[tablet_id] = 0.2 if "KU-RO" in syllabic else 0.0
+
+            unknown_tokens = []
+            for w in syllabic:
+                if w not in known:
+                    known[w] = detector._is_word_identified(w)
+                    if not known[w]:
+                        self.unknown_literals.add(w)
+                if not known[w]:
+                    key = w.upper()
+                    unknown_tokens.append((w, key))
+                    counts = self.postings[key]
+                    counts[tablet_id] = counts.get(tablet_id, 0) + 1
+            self.unknown_tokens[tablet_id] = unknown_tokens
+            self.unknown[tablet_id] = len(unknown_tokens)
+            self.baseline[tablet_id] = self.score(tablet_id)[0]
+
+    def identify(self, word: str) -> List[str]:
+        """Assume `word` identified; returns the tablets whose counters changed."""
+        key = word.upper()
+        if key in self.marked:
+            self._journal.append(None)
+            return []
+        self.marked.add(key)
+        self._journal.append(key)
+        counts = self.postings.get(key, {})
+        for tablet_id, n in counts.items():
+            self.unknown[tablet_id] -= n
+        return list(counts)
+
+    def rollback(self):
+        """Undo the most recent identify()."""
+        key = self._journal.pop()
+        if key is None:
+            return
+        self.marked.discard(key)
+        for tablet_id, n in self.postings.get(key, {}).items():
+            self.unknown[tablet_id] += n
+
+    def score(self, tablet_id: str) -> Tuple[float, int, int]:
+        """Return (score, total_syllabic, unknown_count) under current assumptions."""
+        total = self.total.get(tablet_id, 0)
+        if not total:
+            return (0.0, 0, 0)
+        unknown = self.unknown[tablet_id]
+        score = self._scores.get((tablet_id, unknown))
+        if score is None:
+            score = composite_readiness(
+                total, unknown, self.arith[tablet_id], self.structural[tablet_id]
+            )
+            self._scores[(tablet_id, unknown)] = score
+        return (score, total, unknown)
+
+    def unknown_words(self, tablet_id: str) -> List[str]:
+        """Syllabic words on the tablet still unknown under current assumptions."""
+        marked = self.marked
+        return [w for w, key in self.unknown_tokens.get(tablet_id, ()) if key not in marked]
+
+    def commit(self) -> Set[str]:
+        """
+        Make the current assumptions permanent.
+
+        Baselines are re-scored for the tablets the assumed words touch and
+        nothing else; the words stop being candidates.  Returns those tablets.
+        """
+        touched: Set[str] = set()
+        for key in self.marked:
+            counts = self.postings.pop(key, {})
+            touched.update(counts)
+        for tablet_id in touched:
+            self.unknown_tokens[tablet_id] = [
+                (w, key) for w, key in self.unknown_tokens[tablet_id] if key not in self.marked
+            ]
+            self.baseline[tablet_id] = self.score(tablet_id)[0]
+        self.unknown_literals = {w for w in self.unknown_literals if w.upper() not in self.marked}
+        self.marked = set()
+        self._journal = []
+        return touched
+
+    def newly_identified(self, tablet_id: str) -> List[str]:
+        """Distinct words on the tablet identified only by current assumptions."""
+        return [
+            w
+            for w in set(self.syllabic.get(tablet_id, []))
+            if w in self.unknown_literals and w.upper() in self.marked
+        ]
+
+
+class IncidenceMatrix:
+    """
+    Word x tablet incidence with each row stored as a Python-int bitset.
+
+    Bit i stands for the i-th tablet in sorted id order, so decoding a row
+    yields tablet ids already sorted.  Rows are looked up the way
+    find_tablets_with_word() does: the word itself or its upper-case form.
+    """
+
+    def __init__(self, tablet_ids, word_to_tablets: Dict[str, Set[str]]):
+        self.tablets: List[str] = sorted(tablet_ids)
+        self.ordinal: Dict[str, int] = {t: i for i, t in enumerate(self.tablets)}
+        self.rows: Dict[str, int] = {}
+        for word, tablets in word_to_tablets.items():
+            bits = 0
+            for tablet_id in tablets:
+                bits |= 1 << self.ordinal[tablet_id]
+            self.rows[word] = bits
+        self._lookup: Dict[str, int] = {}
+
+    def word_bits(self, word: str) -> int:
+        """Tablets containing `word` (or its upper-case form) as a bitset."""
+        bits = self._lookup.get(word)
+        if bits is None:
+            bits = self.rows.get(word, 0) | self.rows.get(word.upper(), 0)
+            self._lookup[word] = bits
+        return bits
+
+    def mask(self, tablet_ids) -> int:
+        """Bitset of the given tablets."""
+        bits = 0
+        for tablet_id in tablet_ids:
+            if tablet_id in self.ordinal:
+                bits |= 1 << self.ordinal[tablet_id]
+        return bits
+
+    def tablet_ids(self, bits: int) -> List[str]:
+        """Decode a bitset into sorted tablet ids."""
+        out = []
+        while bits:
+            low = bits & -bits
+            out.append(self.tablets[low.bit_length() - 1])
+            bits ^= low
+        return out
+
+
 # ---------------------------------------------------------------------------
 # Main detector class
 # ---------------------------------------------------------------------------
@@ -212,8 +393,9 @@ class CascadeOpportunityDetector:
     Works in the forward direction of the anchor dependency DAG.
     """
 
-    def __init__(self, threshold: float = 0.5):
+    def __init__(self, threshold: float = 0.5, max_depth: int = 3):
         self.threshold = threshold  # Readiness threshold for "crossable"
+        self.max_depth = max_depth  # Limit on transitive cascade hops
 
         # Data stores
         self.inscriptions: Dict = {}
@@ -227,6 +409,8 @@ class CascadeOpportunityDetector:
         self.word_to_tablets: Dict[str, Set[str]] = defaultdict(set)
         self.tablet_syllabic_words: Dict[str, List[str]] = {}  # tablet_id -> list of syllabic words
         self.identified_words: Set[str] = set()  # all words with some identification
+        self._state: Optional[ReadinessState] = None
+        self._incidence: Optional[IncidenceMatrix] = None
 
     def load_data(self) -> bool:
         """Load all required data files."""
@@ -304,6 +488,8 @@ class CascadeOpportunityDetector:
 
         # --- Build identified-words set ---
         self._build_identified_words()
+        self._state = None
+        self._incidence = None
 
         return True
 
@@ -319,6 +505,9 @@ class CascadeOpportunityDetector:
         # Known personal names
         self.identified_words.update(self.known_names)
 
+        # Words identified by recorded readings (reading_events.py journal)
+        self.identified_words.update(words_of(EventJournal().events()))
+
         # Words from readiness details with non-unknown categories
         for tablet_id, details in self.readiness_details.items():
             for wd in details.get("word_detail", []):
@@ -344,8 +533,8 @@ class CascadeOpportunityDetector:
 
         Returns (score, total_syllabic, unknown_count, unknown_words).
 
-        This mirrors the logic in reading_readiness_scorer.py but is
-        self-contained to avoid import issues.
+        Word identification is the detector's own; the composite is the
+        shared one from readiness_store.py.
         """
         syllabic = self.tablet_syllabic_words.get(tablet_id, [])
         if not syllabic:
@@ -365,10 +554,6 @@ class CascadeOpportunityDetector:
                 unknown_words.append(w)
 
         unknown = len(unknown_words)
-        identified = total_words - unknown
-
-        # Coverage component (0-1)
-        coverage = identified / total_words if total_words > 0 else 0
 
         # Arithmetic component — check for KU-RO
         has_kuro = "KU-RO" in set(syllabic)
@@ -376,49 +561,66 @@ class CascadeOpportunityDetector:
         # Use cached status if available
         details = self.readiness_details.get(tablet_id, {})
         arith_status = details.get("arithmetic_status", "")
-        arith_scores = {
-            "VERIFIED": 1.0,
-            "PARTIAL": 0.7,
-            "MISMATCH": 0.3,
-            "INCOMPLETE": 0.1,
-            "NO_KURO": 0.2,
-            "NOT_AUDITED": 0.15,
-            "NO_DATA": 0.0,
-        }
-        if arith_status in arith_scores:
-            arith = arith_scores[arith_status]
-
-        # Structural richness
-        total_structural = logogram_count + number_count
-        total_all = total_words + total_structural
-        structural = min(total_structural / max(total_all, 1), 1.0)
-
-        # Size bonus
-        size_bonus = min(math.log2(max(total_words, 1)) / 5.0, 1.0)
-
-        # Unknown penalty
-        unknown_ratio = unknown / total_words if total_words > 0 else 1.0
-        unknown_penalty = 1.0 - unknown_ratio
-
-        # Weighted composite (same weights as reading_readiness_scorer.py)
-        score = (
-            0.40 * coverage
-            + 0.25 * arith
-            + 0.15 * structural
-            + 0.10 * size_bonus
-            + 0.10 * unknown_penalty
-        )
-        score = min(max(score, 0.0), 1.0)
+        if arith_status in ARITHMETIC_STATUS_SCORES:
+            arith = ARITHMETIC_STATUS_SCORES[arith_status]
+
+        score = composite_readiness(total_words, unknown, arith, logogram_count + number_count)
+        return (score, total_words, unknown, unknown_words)
+
+    def readiness_state(self) -> ReadinessState:
+        """Incremental readiness state, built on first use after load_data()."""
+        if self._state is None:
+            self._state = ReadinessState(self)
+        return self._state
+
+    def incidence(self) -> IncidenceMatrix:
+        """Word x tablet bitset matrix, built on first use after load_data()."""
+        if self._incidence is None:
+            self._incidence = IncidenceMatrix(self.tablet_syllabic_words, self.word_to_tablets)
+        return self._incidence
+
+    def get_document_type(self, tablet_id: str) -> str:
+        """Document type from readiness data, else inferred from content."""
+        details = self.readiness_details.get(tablet_id)
+        if details and details.get("document_type"):
+            return details["document_type"]
+
+        words = set(self.inscriptions.get(tablet_id, {}).get("transliteratedWords", []))
+        libation_markers = {"JA-SA-SA-RA-ME", "A-TA-I-*301-WA-JA", "I-DA-MA-TE"}
+        if words & libation_markers:
+            return "religious/libation"
+        if "KU-RO" in words:
+            return "administrative/list"
+        if any(_is_logogram(w) for w in words) and any(_is_number(w) for w in words):
+            return "administrative/commodity"
+        return "administrative"
+
+    def mark_identified(self, words) -> Set[str]:
+        """
+        Record words as identified (e.g. after a reading is recorded).
 
-        return (round(score, 3), total_words, unknown, unknown_words)
+        Only tablets containing the words are re-scored; their precomputed
+        scores are dropped in favour of the re-scored baseline.
+        """
+        state = self.readiness_state()
+        for word in words:
+            state.identify(word)
+        touched = state.commit()
+        self.identified_words.update(words)
+        for tablet_id in touched:
+            self.readiness_cache.pop(tablet_id, None)
+        return touched
+
+    def apply_reading_events(self, events: List[ReadingEvent]) -> Set[str]:
+        """reading_events.py subscriber: mark recorded words identified."""
+        return self.mark_identified(words_of(events))
 
     def get_current_readiness(self, tablet_id: str) -> float:
         """Get the current readiness score for a tablet."""
         if tablet_id in self.readiness_cache:
             return self.readiness_cache[tablet_id]
         # Compute inline
-        score, _, _, _ = self._compute_readiness_inline(tablet_id)
-        return score
+        return self.readiness_state().baseline.get(tablet_id, 0.0)
 
     def find_tablets_with_word(self, word: str) -> Set[str]:
         """Find all tablets containing a given word."""
@@ -445,143 +647,155 @@ class CascadeOpportunityDetector:
         Returns:
             CascadeReport with all opportunities ranked by delta
         """
-        # Track what we're adding as newly identified
-        newly_confirmed = {word, word.upper()}
-
-        # --- Phase 1: Direct tablets ---
-        direct_tablet_ids = self.find_tablets_with_word(word)
-        direct_opportunities = []
-        transitive_chains = []
-
-        # Track new name links discovered from newly-readable tablets
-        new_name_links: Dict[str, Set[str]] = defaultdict(set)  # name -> tablets it appears on
-
-        for tablet_id in sorted(direct_tablet_ids):
+        state = self.readiness_state()
+        state.identify(word)
+        try:
+            return self._cascade_with_state(state, word, new_confidence)
+        finally:
+            state.rollback()
+
+    def _direct_opportunities(
+        self, state: ReadinessState, tablet_ids: Set[str]
+    ) -> List[CascadeOpportunity]:
+        """Depth-0 opportunities under the state's current assumptions."""
+        opportunities = []
+        for tablet_id in sorted(tablet_ids):
             current_score = self.get_current_readiness(tablet_id)
-            new_score, total_words, new_unknown, unknown_words = self._compute_readiness_inline(
-                tablet_id, extra_identified=newly_confirmed
+            new_score, _, new_unknown = state.score(tablet_id)
+            opportunities.append(
+                CascadeOpportunity(
+                    tablet_id=tablet_id,
+                    current_readiness=current_score,
+                    new_readiness=new_score,
+                    readiness_delta=round(new_score - current_score, 3),
+                    newly_identified_words=state.newly_identified(tablet_id),
+                    remaining_unknowns=new_unknown,
+                    site=_extract_site(tablet_id),
+                    cascade_depth=0,
+                )
             )
+        return opportunities
 
-            delta = round(new_score - current_score, 3)
+    def _opportunity(
+        self,
+        state: ReadinessState,
+        tablet_id: str,
+        depth: int,
+        current_score: float,
+        new_score: float,
+        delta: float,
+        new_unknown: int,
+    ) -> CascadeOpportunity:
+        return CascadeOpportunity(
+            tablet_id=tablet_id,
+            current_readiness=current_score,
+            new_readiness=new_score,
+            readiness_delta=delta,
+            newly_identified_words=state.newly_identified(tablet_id),
+            remaining_unknowns=new_unknown,
+            site=_extract_site(tablet_id),
+            cascade_depth=depth,
+        )
 
-            # What words did we newly identify on this tablet?
-            syllabic = self.tablet_syllabic_words.get(tablet_id, [])
-            newly_id = [
-                w
-                for w in set(syllabic)
-                if (w in newly_confirmed or w.upper() in newly_confirmed)
-                and not self._is_word_identified(w)
-            ]
+    def _walk_cascade(
+        self,
+        state: ReadinessState,
+        word: str,
+        mask: int = -1,
+        on_chain: Optional[Callable[[str, str, int, int], None]] = None,
+    ) -> Iterator[Tuple[str, int, float, float, float, int]]:
+        """
+        Walk the cascade of `word`, which must already be assumed in `state`.
 
-            site = _extract_site(tablet_id)
-
-            opp = CascadeOpportunity(
-                tablet_id=tablet_id,
-                current_readiness=current_score,
-                new_readiness=new_score,
-                readiness_delta=delta,
-                newly_identified_words=newly_id,
-                remaining_unknowns=new_unknown,
-                site=site,
-                cascade_depth=0,
-            )
-            direct_opportunities.append(opp)
+        Yields (tablet_id, depth, current, new, delta, remaining_unknowns) for
+        every direct tablet and for every transitive tablet with a positive
+        delta.  Link words are assumed in `state` while their tablets are
+        yielded.  on_chain(source_word, link_word, tablet_bits, depth) is
+        called for each name link queued.  Only tablets in `mask` are visited.
+        """
+        matrix = self.incidence()
+        ordinal = matrix.ordinal
+
+        # --- Phase 1: Direct tablets ---
+        direct_bits = matrix.word_bits(word) & mask
+        new_name_links: Dict[str, int] = {}  # name -> tablets it appears on
+        for tablet_id in matrix.tablet_ids(direct_bits):
+            current_score = self.get_current_readiness(tablet_id)
+            new_score, _, new_unknown = state.score(tablet_id)
+            delta = round(new_score - current_score, 3)
+            yield (tablet_id, 0, current_score, new_score, delta, new_unknown)
 
-            # If tablet crosses threshold, check for transitive effects
+            # If tablet crosses threshold, its unknown words may link to other tablets
             if new_score >= self.threshold and current_score < self.threshold:
-                # This tablet is newly "readable" — check for name links
-                for unk_word in unknown_words:
-                    if unk_word in newly_confirmed:
-                        continue
-                    # Check if this unknown word appears on other tablets
-                    other_tablets = self.find_tablets_with_word(unk_word)
-                    other_tablets.discard(tablet_id)
-                    if other_tablets:
-                        new_name_links[unk_word] = other_tablets
+                others = mask & ~(1 << ordinal[tablet_id])
+                for unk_word in state.unknown_words(tablet_id):
+                    other_bits = matrix.word_bits(unk_word) & others
+                    if other_bits:
+                        new_name_links[unk_word] = other_bits
+
+        # --- Phase 2: Transitive cascades (BFS, depth-limited) ---
+        visited = direct_bits
+        queue: deque = deque()
+        for name_word, linked_bits in new_name_links.items():
+            queue.append((name_word, linked_bits, 1))
+            if on_chain:
+                on_chain(word, name_word, linked_bits, 1)
+
+        while queue:
+            link_word, link_bits, depth = queue.popleft()
+            remaining = link_bits & ~visited
+            if depth > self.max_depth or not remaining:
+                continue
 
-        # --- Phase 2: Transitive cascades ---
+            # Add link_word as a "contextually identified" word
+            state.identify(link_word)
+            try:
+                for tablet_id in matrix.tablet_ids(remaining):
+                    visited |= 1 << ordinal[tablet_id]
+
+                    current_score = self.get_current_readiness(tablet_id)
+                    new_score, _, new_unknown = state.score(tablet_id)
+                    delta = round(new_score - current_score, 3)
+                    if delta <= 0:
+                        continue
+                    yield (tablet_id, depth, current_score, new_score, delta, new_unknown)
+
+                    # Check for further transitive effects
+                    if depth < self.max_depth and new_score >= self.threshold:
+                        for unk_word in state.unknown_words(tablet_id):
+                            further_bits = matrix.word_bits(unk_word) & mask & ~visited
+                            if further_bits:
+                                queue.append((unk_word, further_bits, depth + 1))
+                                if on_chain:
+                                    on_chain(link_word, unk_word, further_bits, depth + 1)
+            finally:
+                state.rollback()
+
+    def _cascade_with_state(
+        self, state: ReadinessState, word: str, new_confidence: str
+    ) -> CascadeReport:
+        """Body of compute_cascade_from_word with `word` already assumed in `state`."""
+        matrix = self.incidence()
+        direct_opportunities = []
         transitive_opportunities = []
-        visited_tablets = set(direct_tablet_ids)
-        cascade_queue: List[Tuple[str, Set[str], int]] = []  # (word, tablets, depth)
+        transitive_chains = []
 
-        # Seed with name links from Phase 1
-        for name_word, linked_tablets in new_name_links.items():
-            cascade_queue.append((name_word, linked_tablets, 1))
+        def record_chain(source_word: str, link_word: str, bits: int, depth: int):
             transitive_chains.append(
                 {
-                    "source_word": word,
-                    "link_word": name_word,
-                    "linked_tablets": sorted(linked_tablets),
-                    "depth": 1,
+                    "source_word": source_word,
+                    "link_word": link_word,
+                    "linked_tablets": matrix.tablet_ids(bits),
+                    "depth": depth,
                 }
             )
 
-        # BFS through transitive cascades (limit depth to prevent runaway)
-        max_cascade_depth = 3
-        while cascade_queue:
-            link_word, link_tablets, depth = cascade_queue.pop(0)
-            if depth > max_cascade_depth:
-                continue
-
-            # Add link_word as a "contextually identified" word
-            transitive_identified = newly_confirmed | {link_word, link_word.upper()}
-
-            for tablet_id in sorted(link_tablets):
-                if tablet_id in visited_tablets:
-                    continue
-                visited_tablets.add(tablet_id)
-
-                current_score = self.get_current_readiness(tablet_id)
-                (new_score, total_words, new_unknown, unknown_words) = (
-                    self._compute_readiness_inline(
-                        tablet_id,
-                        extra_identified=transitive_identified,
-                    )
-                )
-                delta = round(new_score - current_score, 3)
-
-                if delta <= 0:
-                    continue
-
-                syllabic = self.tablet_syllabic_words.get(tablet_id, [])
-                newly_id = [
-                    w
-                    for w in set(syllabic)
-                    if (w in transitive_identified or w.upper() in transitive_identified)
-                    and not self._is_word_identified(w)
-                ]
-
-                site = _extract_site(tablet_id)
-
-                opp = CascadeOpportunity(
-                    tablet_id=tablet_id,
-                    current_readiness=current_score,
-                    new_readiness=new_score,
-                    readiness_delta=delta,
-                    newly_identified_words=newly_id,
-                    remaining_unknowns=new_unknown,
-                    site=site,
-                    cascade_depth=depth,
-                )
+        for step in self._walk_cascade(state, word, on_chain=record_chain):
+            opp = self._opportunity(state, *step)
+            if opp.cascade_depth:
                 transitive_opportunities.append(opp)
-
-                # Check for further transitive effects
-                if depth < max_cascade_depth and new_score >= self.threshold:
-                    for unk_word in unknown_words:
-                        if unk_word in transitive_identified:
-                            continue
-                        further_tablets = self.find_tablets_with_word(unk_word)
-                        further_tablets -= visited_tablets
-                        if further_tablets:
-                            cascade_queue.append((unk_word, further_tablets, depth + 1))
-                            transitive_chains.append(
-                                {
-                                    "source_word": link_word,
-                                    "link_word": unk_word,
-                                    "linked_tablets": sorted(further_tablets),
-                                    "depth": depth + 1,
-                                }
-                            )
+            else:
+                direct_opportunities.append(opp)
 
         # --- Combine and rank ---
         all_opportunities = direct_opportunities + transitive_opportunities
@@ -591,12 +805,72 @@ class CascadeOpportunityDetector:
         return CascadeReport(
             trigger_word=word,
             trigger_confidence=new_confidence,
-            direct_tablets=len(direct_tablet_ids),
+            direct_tablets=len(direct_opportunities),
             cascade_tablets=len(transitive_opportunities),
             opportunities=all_opportunities,
             transitive_chains=transitive_chains,
         )
 
+    def rank_all_words(
+        self, site: Optional[str] = None, doc_type: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Leaderboard of cascade impact for every currently unknown word.
+
+        Runs the same walk as compute_cascade_from_word (transitive links up
+        to max_depth) without materialising opportunities or chains.  `site`
+        (e.g. "HT") and `doc_type` (prefix, e.g. "administrative") restrict
+        the tablets a cascade may reach.
+        """
+        state = self.readiness_state()
+        matrix = self.incidence()
+        mask = -1
+        if site or doc_type:
+            mask = matrix.mask(
+                t
+                for t in matrix.tablets
+                if (not site or _extract_site(t) == site.upper())
+                and (not doc_type or self.get_document_type(t).startswith(doc_type))
+            )
+
+        rankings = []
+        for word in sorted(state.unknown_literals):
+            if not matrix.word_bits(word) & mask:
+                continue
+            direct = cascade = improved = crossers = 0
+            total_delta = 0.0
+            state.identify(word)
+            try:
+                for _, depth, current, new, delta, _ in self._walk_cascade(state, word, mask):
+                    if depth:
+                        cascade += 1
+                    else:
+                        direct += 1
+                    if delta > 0:
+                        improved += 1
+                        total_delta += delta
+                    if current < self.threshold and new >= self.threshold:
+                        crossers += 1
+            finally:
+                state.rollback()
+            if improved:
+                rankings.append(
+                    {
+                        "word": word,
+                        "direct_tablets": direct,
+                        "cascade_tablets": cascade,
+                        "tablets_improved": improved,
+                        "threshold_crossers": crossers,
+                        "total_readiness_delta": round(total_delta, 3),
+                        "efficiency": round(total_delta / max(direct, 1), 3),
+                    }
+                )
+
+        rankings.sort(
+            key=lambda r: (-r["total_readiness_delta"], -r["threshold_crossers"], r["word"])
+        )
+        return rankings
+
     def compute_all_anchors(self) -> List[CascadeReport]:
         """
         Compute cascade reports for all anchor words in reading_dependencies.
@@ -642,6 +916,43 @@ class CascadeOpportunityDetector:
 
         return reports
 
+    def compute_what_if_all(self, confidence: str = "HIGH") -> List[CascadeReport]:
+        """
+        Direct readiness gains of assuming each currently unknown word identified.
+
+        All candidates share one ReadinessState: each word is identified,
+        the tablets it appears on are re-scored from their counters, and
+        the assumption is rolled back before the next word.
+
+        Returns reports sorted like compute_all_anchors().
+        """
+        state = self.readiness_state()
+        reports = []
+        for word in sorted(state.unknown_literals):
+            tablet_ids = self.find_tablets_with_word(word)
+            state.identify(word)
+            try:
+                opportunities = self._direct_opportunities(state, tablet_ids)
+            finally:
+                state.rollback()
+            opportunities.sort(key=lambda o: (-o.readiness_delta, -o.new_readiness))
+            reports.append(
+                CascadeReport(
+                    trigger_word=word,
+                    trigger_confidence=confidence,
+                    direct_tablets=len(tablet_ids),
+                    cascade_tablets=0,
+                    opportunities=opportunities,
+                    transitive_chains=[],
+                )
+            )
+
+        reports.sort(
+            key=lambda r: sum(1 for o in r.opportunities if o.readiness_delta > 0),
+            reverse=True,
+        )
+        return reports
+
     # ------------------------------------------------------------------
     # Output formatting
     # ------------------------------------------------------------------
@@ -732,18 +1043,18 @@ class CascadeOpportunityDetector:
 
         print(f"\n{'=' * 70}")
 
-    def print_all_anchors_summary(self, reports: List[CascadeReport]):
-        """Print summary of cascade potential across all anchor words."""
+    def print_all_anchors_summary(self, reports: List[CascadeReport], label: str = "anchor"):
+        """Print summary of cascade potential across all anchor (or candidate) words."""
         print(f"\n{'=' * 70}")
-        print("CASCADE OPPORTUNITY SUMMARY — ALL ANCHORS")
+        print(f"CASCADE OPPORTUNITY SUMMARY — ALL {label.upper()}S")
         print(f"{'=' * 70}")
         print(f"  Threshold: {self.threshold}")
-        print(f"  Anchor words analyzed: {len(reports)}")
+        print(f"  {label.capitalize()} words analyzed: {len(reports)}")
 
         # Filter to only reports with positive impact
         impactful = [r for r in reports if any(o.readiness_delta > 0 for o in r.opportunities)]
 
-        print(f"  Anchors with cascade potential: {len(impactful)}")
+        print(f"  {label.capitalize()}s with cascade potential: {len(impactful)}")
 
         if impactful:
             print(
@@ -822,6 +1133,64 @@ class CascadeOpportunityDetector:
 
         print(f"\n{'=' * 70}")
 
+    def print_leaderboard(
+        self,
+        rankings: List[Dict],
+        top: int = 30,
+        site: Optional[str] = None,
+        doc_type: Optional[str] = None,
+    ):
+        """Print the cascade leaderboard produced by rank_all_words()."""
+        print(f"\n{'=' * 70}")
+        print("CASCADE LEADERBOARD — ALL UNREAD WORDS")
+        print(f"{'=' * 70}")
+        print(f"  Threshold: {self.threshold}   Max depth: {self.max_depth}")
+        if site or doc_type:
+            print(f"  Restricted to: site={site or 'any'} doc_type={doc_type or 'any'}")
+        print(f"  Words with readiness gain: {len(rankings)}")
+
+        if rankings:
+            print(
+                f"\n  {'Rank':>4s}  {'Word':<20s} {'Total Δ':>8s} {'Direct':>6s} "
+                f"{'Trans':>5s} {'Gains':>5s} {'Cross':>5s} {'Effic':>7s}"
+            )
+            print(f"  {'-' * 66}")
+            for i, row in enumerate(rankings[:top], 1):
+                print(
+                    f"  {i:4d}  {row['word']:<20s} {row['total_readiness_delta']:+8.3f} "
+                    f"{row['direct_tablets']:6d} {row['cascade_tablets']:5d} "
+                    f"{row['tablets_improved']:5d} {row['threshold_crossers']:5d} "
+                    f"{row['efficiency']:7.3f}"
+                )
+            if len(rankings) > top:
+                print(f"\n  ... and {len(rankings) - top} more")
+
+        print(f"\n{'=' * 70}")
+
+    def save_leaderboard(
+        self,
+        rankings: List[Dict],
+        output_path: str,
+        site: Optional[str] = None,
+        doc_type: Optional[str] = None,
+    ):
+        """Save the rank_all_words() leaderboard to JSON."""
+        output = {
+            "metadata": {
+                "tool": "cascade_opportunity_detector.py",
+                "generated": datetime.now().isoformat(),
+                "threshold": self.threshold,
+                "max_depth": self.max_depth,
+                "site": site,
+                "doc_type": doc_type,
+                "words_ranked": len(rankings),
+            },
+            "word_rankings": rankings,
+        }
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(output, f, indent=2, ensure_ascii=False)
+        print(f"\nResults saved to: {output_path}")
+
     def save_results(
         self,
         reports: List[CascadeReport],
@@ -917,12 +1286,37 @@ def main():
     parser.add_argument(
         "--all-anchors", action="store_true", help="Compute cascade potential for all anchor words"
     )
+    parser.add_argument(
+        "--what-if",
+        action="store_true",
+        help="Rank the direct readiness gain of every currently unknown word",
+    )
+    parser.add_argument(
+        "--rank-all",
+        action="store_true",
+        help="Leaderboard of direct and transitive cascade impact for every unread word",
+    )
+    parser.add_argument("--site", type=str, help="With --rank-all: only tablets from this site")
+    parser.add_argument(
+        "--doc-type",
+        type=str,
+        help="With --rank-all: only tablets whose document type starts with this",
+    )
+    parser.add_argument(
+        "--top", type=int, default=30, help="With --rank-all: rows to print (default: 30)"
+    )
     parser.add_argument(
         "--threshold",
         type=float,
         default=0.5,
         help="Readiness threshold for 'readable' (default: 0.5)",
     )
+    parser.add_argument(
+        "--depth",
+        type=int,
+        default=3,
+        help="Maximum transitive cascade depth (default: 3)",
+    )
     parser.add_argument("--output", type=str, help="Save results to JSON file")
     parser.add_argument(
         "--verbose", action="store_true", help="Show all opportunities (not just top 20)"
@@ -930,16 +1324,16 @@ def main():
 
     args = parser.parse_args()
 
-    if not args.word and not args.all_anchors:
+    if not (args.word or args.all_anchors or args.what_if or args.rank_all):
         parser.print_help()
-        print("\nError: Must specify --word or --all-anchors")
+        print("\nError: Must specify --word, --all-anchors, --what-if or --rank-all")
         sys.exit(1)
 
     print("=" * 70)
     print("LINEAR A CASCADE OPPORTUNITY DETECTOR")
     print("=" * 70)
 
-    detector = CascadeOpportunityDetector(threshold=args.threshold)
+    detector = CascadeOpportunityDetector(threshold=args.threshold, max_depth=args.depth)
     if not detector.load_data():
         sys.exit(1)
 
@@ -957,6 +1351,20 @@ def main():
         if args.output:
             detector.save_results(reports, args.output, single_word=False)
 
+    elif args.what_if:
+        reports = detector.compute_what_if_all(args.confidence)
+        detector.print_all_anchors_summary(reports, label="candidate")
+
+        if args.output:
+            detector.save_results(reports, args.output, single_word=False)
+
+    elif args.rank_all:
+        rankings = detector.rank_all_words(site=args.site, doc_type=args.doc_type)
+        detector.print_leaderboard(rankings, args.top, site=args.site, doc_type=args.doc_type)
+
+        if args.output:
+            detector.save_leaderboard(rankings, args.output, site=args.site, doc_type=args.doc_type)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Sign-level approximate-match index for Linear A <-> Linear B cognates.
+
+Words are compared as sequences of sign ids: the AB number when the shared
+sign registry knows the reading (so RA₂ and ra2 are the same sign), the
+normalized reading otherwise. Distance is Levenshtein distance over those
+sequences, so "one sign substituted", "a vowel alternation" and "a dropped
+final syllable" are all distance 1.
+
+The index is a symmetric-deletion dictionary (as in SymSpell): every
+indexed word is stored under each sequence obtained by deleting up to
+``max_distance`` of its signs. A query generates its own deletions, looks
+them up and verifies the few candidates with an exact distance, so "all
+Linear B words within distance k" costs a handful of hash probes instead of
+a scan over the vocabulary.
+
+Each match carries its edit script with vowel alternations (same consonant,
+different vowel) and final-syllable drops labelled, for cognate review.
+
+Usage:
+    python tools/cognate_index.py --word KU-RO
+    python tools/cognate_index.py --word A-TA-NA-TE --max-distance 2
+    python tools/cognate_index.py --batch --min-freq 3 --output data/linear_b/near_cognates.json
+
+Attribution:
+    Part of Linear A Decipherment Project
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from itertools import combinations
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sign_registry import SignRegistry, base_value, normalize_sign
+from word_filter_contract import is_hypothesis_eligible_word, normalize_word_token
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DATA_DIR = PROJECT_ROOT / "data"
+CORPUS_FILE = DATA_DIR / "corpus.json"
+
+DEFAULT_MAX_DISTANCE = 2
+DEFAULT_MIN_FREQ = 2
+
+SOURCE_VOCABULARY = "damos_vocabulary"
+SOURCE_COGNATES = "cognates_json"
+
+VOWELS = "aeiou"
+
+
+def split_signs(word: str) -> List[str]:
+    """Signs of a transliterated word ("KU-RO", "ku_ro" -> ["KU", "RO"])."""
+    return [s for s in word.strip().replace("_", "-").split("-") if s]
+
+
+def sign_distance(a: Sequence, b: Sequence, limit: Optional[int] = None) -> int:
+    """
+    Levenshtein distance between two sign sequences.
+
+    With ``limit``, returns ``limit + 1`` as soon as the distance is known
+    to exceed it.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, x in enumerate(a, 1):
+        current = [i]
+        for j, y in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (x != y)))
+        if limit is not None and min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def _consonant_vowel(reading: str) -> Tuple[str, str]:
+    base = base_value(reading)
+    if base and base[-1] in VOWELS:
+        return base[:-1], base[-1]
+    return base, ""
+
+
+def edit_script(
+    source: Sequence[str], target: Sequence[str], source_ids: Sequence, target_ids: Sequence
+) -> List[Dict[str, Any]]:
+    """
+    Minimal edits turning ``source`` into ``target`` (readings, compared by id).
+
+    Edit types: substitution, vowel_alternation, deletion, insertion,
+    final_deletion, final_insertion.
+    """
+    n, m = len(source_ids), len(target_ids)
+    dist = [[0] * (m + 1) for _ in range(n + 1)]
+    for i in range(n + 1):
+        dist[i][0] = i
+    for j in range(m + 1):
+        dist[0][j] = j
+    for i in range(1, n + 1):
+        for j in range(1, m + 1):
+            dist[i][j] = min(
+                dist[i - 1][j] + 1,
+                dist[i][j - 1] + 1,
+                dist[i - 1][j - 1] + (source_ids[i - 1] != target_ids[j - 1]),
+            )
+
+    edits: List[Dict[str, Any]] = []
+    i, j = n, m
+    while i or j:
+        if i and j and dist[i][j] == dist[i - 1][j - 1] + (source_ids[i - 1] != target_ids[j - 1]):
+            if source_ids[i - 1] != target_ids[j - 1]:
+                src_cv, tgt_cv = _consonant_vowel(source[i - 1]), _consonant_vowel(target[j - 1])
+                same_consonant = src_cv[0] == tgt_cv[0] and bool(src_cv[1] and tgt_cv[1])
+                edits.append(
+                    {
+                        "type": "vowel_alternation" if same_consonant else "substitution",
+                        "position": i - 1,
+                        "from": source[i - 1],
+                        "to": target[j - 1],
+                    }
+                )
+            i, j = i - 1, j - 1
+        elif i and dist[i][j] == dist[i - 1][j] + 1:
+            final = i == n and j == m
+            edits.append(
+                {
+                    "type": "final_deletion" if final else "deletion",
+                    "position": i - 1,
+                    "from": source[i - 1],
+                }
+            )
+            i -= 1
+        else:
+            final = i == n and j == m
+            edits.append(
+                {
+                    "type": "final_insertion" if final else "insertion",
+                    "position": i,
+                    "to": target[j - 1],
+                }
+            )
+            j -= 1
+    edits.reverse()
+    return edits
+
+
+@dataclass
+class CognateMatch:
+    """A Linear B form within the query distance of a Linear A word."""
+
+    word: str
+    distance: int
+    sources: List[str]
+    edits: List[Dict[str, Any]] = field(default_factory=list)
+    meaning: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class CognateIndex:
+    """
+    Symmetric-deletion index over Linear B forms keyed by sign-id sequences.
+
+    Args:
+        max_distance: Largest distance queries may ask for
+        registry: Sign registry used to map readings to sign ids
+    """
+
+    def __init__(self, max_distance: int = DEFAULT_MAX_DISTANCE, registry: SignRegistry = None):
+        self.max_distance = max_distance
+        self.registry = registry or SignRegistry.from_reference()
+        self._sign_ids: Dict[str, Any] = {}
+        self._entries: Dict[Tuple, Dict[str, Any]] = {}
+        self._deletes: Dict[Tuple, Set[Tuple]] = {}
+        self._memo: Dict[Tuple[Tuple, int], List[Tuple[Tuple, int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def sign_id(self, sign: str):
+        """AB number for a known reading, else the normalized reading."""
+        if sign not in self._sign_ids:
+            self._sign_ids[sign] = self.registry.ab_for_value(sign) or normalize_sign(sign)
+        return self._sign_ids[sign]
+
+    def key(self, word: str) -> Tuple:
+        return tuple(self.sign_id(s) for s in split_signs(word))
+
+    def _deletions(self, key: Tuple, depth: int) -> Set[Tuple]:
+        found = {key}
+        for k in range(1, min(depth, len(key)) + 1):
+            for drop in combinations(range(len(key)), k):
+                found.add(tuple(s for i, s in enumerate(key) if i not in drop))
+        return found
+
+    def add(self, word: str, source: str, meaning: str = "") -> None:
+        """Index a Linear B form (repeat calls merge sources)."""
+        key = self.key(word)
+        if not key:
+            return
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = {"word": word, "sources": [], "meaning": meaning}
+            for deleted in self._deletions(key, self.max_distance):
+                self._deletes.setdefault(deleted, set()).add(key)
+            self._memo.clear()
+        if source not in entry["sources"]:
+            entry["sources"].append(source)
+        if meaning and not entry["meaning"]:
+            entry["meaning"] = meaning
+
+    def add_vocabulary(self, vocabulary: Dict[str, Dict]) -> None:
+        for word, data in vocabulary.items():
+            self.add(word, SOURCE_VOCABULARY, data.get("meaning", ""))
+
+    def add_cognates(self, cognates: Dict[str, Any]) -> None:
+        for word in cognates.get("identicalWords", {}):
+            self.add(word, SOURCE_COGNATES)
+
+    def _candidates(self, key: Tuple, max_distance: int) -> List[Tuple[Tuple, int]]:
+        memo_key = (key, max_distance)
+        if memo_key not in self._memo:
+            keys: Set[Tuple] = set()
+            for deleted in self._deletions(key, max_distance):
+                keys.update(self._deletes.get(deleted, ()))
+            verified = []
+            for other in keys:
+                distance = sign_distance(key, other, limit=max_distance)
+                if distance <= max_distance:
+                    verified.append((other, distance))
+            self._memo[memo_key] = verified
+        return self._memo[memo_key]
+
+    def near(self, word: str, max_distance: int = 1) -> List[CognateMatch]:
+        """Linear B forms within ``max_distance`` signs of ``word``, closest first."""
+        if max_distance > self.max_distance:
+            raise ValueError(
+                f"max_distance {max_distance} exceeds the index limit {self.max_distance}"
+            )
+        signs = split_signs(word)
+        key = tuple(self.sign_id(s) for s in signs)
+        if not key:
+            return []
+        matches = []
+        for other, distance in self._candidates(key, max_distance):
+            entry = self._entries[other]
+            matches.append(
+                CognateMatch(
+                    word=entry["word"],
+                    distance=distance,
+                    sources=list(entry["sources"]),
+                    edits=edit_script(signs, split_signs(entry["word"]), key, other),
+                    meaning=entry["meaning"],
+                )
+            )
+        matches.sort(key=lambda m: (m.distance, m.word))
+        return matches
+
+    def near_many(self, words: Iterable[str], max_distance: int = 1) -> Dict[str, List[Dict]]:
+        """Batch form of ``near``; each distinct word is resolved once."""
+        return {
+            word: [m.to_dict() for m in self.near(word, max_distance)]
+            for word in dict.fromkeys(words)
+        }
+
+
+def build_index(
+    vocabulary: Optional[Dict[str, Dict]] = None,
+    cognates: Optional[Dict[str, Any]] = None,
+    max_distance: int = DEFAULT_MAX_DISTANCE,
+) -> CognateIndex:
+    """Index the Linear B vocabulary and cognates.json identical words."""
+    index = CognateIndex(max_distance)
+    index.add_vocabulary(vocabulary or {})
+    index.add_cognates(cognates or {})
+    return index
+
+
+def corpus_word_frequencies(corpus: Dict[str, Any]) -> Counter:
+    """Frequencies of hypothesis-eligible words in a corpus.json document."""
+    freqs: Counter = Counter()
+    for data in corpus.get("inscriptions", {}).values():
+        if "_parse_error" in data:
+            continue
+        for word in data.get("transliteratedWords", []):
+            if is_hypothesis_eligible_word(word):
+                freqs[normalize_word_token(word)] += 1
+    return freqs
+
+
+def batch_near_matches(
+    index: CognateIndex,
+    word_freqs: Dict[str, int],
+    min_freq: int = DEFAULT_MIN_FREQ,
+    max_distance: int = 1,
+) -> Dict[str, Any]:
+    """Near matches for every Linear A word with frequency >= min_freq."""
+    words = sorted(
+        (w for w, f in word_freqs.items() if f >= min_freq), key=lambda w: -word_freqs[w]
+    )
+    results = {}
+    for word in words:
+        matches = index.near(word, max_distance)
+        if matches:
+            results[word] = {
+                "frequency": word_freqs[word],
+                "matches": [m.to_dict() for m in matches],
+            }
+    return {
+        "generated": datetime.now().isoformat(),
+        "parameters": {
+            "min_freq": min_freq,
+            "max_distance": max_distance,
+            "indexed_forms": len(index),
+        },
+        "words_checked": len(words),
+        "words_with_matches": len(results),
+        "results": results,
+    }
+
+
+def _load_json(path: Path) -> Dict[str, Any]:
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _print_matches(word: str, matches: List[CognateMatch]):
+    print(f"\n{word}: {len(matches)} Linear B form(s)")
+    for m in matches:
+        edits = ", ".join(
+            f"{e['type']} {e.get('from', '')}->{e.get('to', '')}".replace(" ->", " -")
+            for e in m.edits
+        )
+        meaning = f" '{m.meaning}'" if m.meaning else ""
+        print(f"  d={m.distance}  {m.word}{meaning}  [{', '.join(m.sources)}]  {edits}")
+
+
+def main():
+    from damos_connector import DAMOSConnector
+
+    parser = argparse.ArgumentParser(
+        description="Find Linear B forms within k signs of Linear A words"
+    )
+    parser.add_argument("--word", "-w", action="append", help="Linear A word (repeatable)")
+    parser.add_argument("--batch", action="store_true", help="Check every corpus word")
+    parser.add_argument(
+        "--min-freq",
+        type=int,
+        default=DEFAULT_MIN_FREQ,
+        help=f"Batch: minimum corpus frequency (default: {DEFAULT_MIN_FREQ})",
+    )
+    parser.add_argument(
+        "--max-distance",
+        "-k",
+        type=int,
+        default=1,
+        help=f"Maximum sign edits (default: 1, at most {DEFAULT_MAX_DISTANCE})",
+    )
+    parser.add_argument("--output", "-o", type=str, help="Write batch results to JSON")
+    args = parser.parse_args()
+
+    if not args.word and not args.batch:
+        parser.print_help()
+        return 1
+    if not 0 <= args.max_distance <= DEFAULT_MAX_DISTANCE:
+        parser.error(f"--max-distance must be between 0 and {DEFAULT_MAX_DISTANCE}")
+
+    connector = DAMOSConnector()
+    index = connector.cognate_index
+    print(f"Indexed {len(index)} Linear B forms")
+
+    for word in args.word or []:
+        _print_matches(word, index.near(word, args.max_distance))
+
+    if args.batch:
+        corpus = _load_json(CORPUS_FILE)
+        if not corpus:
+            print(f"Corpus not found: {CORPUS_FILE}")
+            return 1
+        report = batch_near_matches(
+            index, corpus_word_frequencies(corpus), args.min_freq, args.max_distance
+        )
+        print(
+            f"\nChecked {report['words_checked']} words (freq >= {args.min_freq}); "
+            f"{report['words_with_matches']} have Linear B forms within {args.max_distance}"
+        )
+        if args.output:
+            out = Path(args.output)
+            out.parent.mkdir(parents=True, exist_ok=True)
+            with open(out, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            print(f"Saved to {out}")
+        else:
+            for word, row in list(report["results"].items())[:20]:
+                _print_matches(
+                    f"{word} (x{row['frequency']})", [CognateMatch(**m) for m in row["matches"]]
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
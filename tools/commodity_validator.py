@@ -30,6 +30,8 @@ from collections import defaultdict, Counter
 from typing import Dict, List, Optional
 from dataclasses import dataclass, asdict
 
+from corpus_index import compile_corpus
+
 
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -109,6 +111,8 @@ class CommodityValidator:
     def __init__(self, threshold: float = 0.8):
         self.corpus = {}
         self.inscriptions = {}
+        self.compiled = None  # corpus_index.CompiledCorpus
+        self._line_cache: Dict[str, List[List[str]]] = {}
         self.threshold = threshold
 
     def load_corpus(self) -> bool:
@@ -116,6 +120,8 @@ class CommodityValidator:
             with open(CORPUS_FILE, "r", encoding="utf-8") as f:
                 self.corpus = json.load(f)
             self.inscriptions = self.corpus.get("inscriptions", {})
+            self.compiled = compile_corpus(self.corpus)
+            self._line_cache = {}
             print(f"Loaded {len(self.inscriptions)} inscriptions")
             return True
         except Exception as e:
@@ -161,19 +167,13 @@ class CommodityValidator:
         match = re.match(r"^([A-Z]+)", tablet_id)
         return match.group(1) if match else "UNKNOWN"
 
-    def _build_line_index(self, words: List[str]) -> List[List[str]]:
-        """Split words into lines."""
-        lines = []
-        current = []
-        for w in words:
-            if w == "\n":
-                if current:
-                    lines.append(current)
-                current = []
-            else:
-                current.append(w)
-        if current:
-            lines.append(current)
+    def _lines_for(self, tablet_id: str) -> List[List[str]]:
+        """Split a tablet into lines, memoized from the compiled corpus layout."""
+        lines = self._line_cache.get(tablet_id)
+        if lines is None:
+            layout = self.compiled.layout(tablet_id) if self.compiled else None
+            lines = layout.lines() if layout else []
+            self._line_cache[tablet_id] = lines
         return lines
 
     def validate_word(self, target_word: str) -> Optional[CommodityMapping]:
@@ -194,7 +194,7 @@ class CommodityValidator:
             site = self._extract_site(tablet_id)
             site_counter[site] += 1
 
-            lines = self._build_line_index(words)
+            lines = self._lines_for(tablet_id)
 
             for line in lines:
                 if target_word not in line:
@@ -308,9 +308,8 @@ class CommodityValidator:
         word_commodity_counts = defaultdict(lambda: defaultdict(int))
         word_total_counts = Counter()
 
-        for tablet_id, data in self.inscriptions.items():
-            words = data.get("transliteratedWords", [])
-            lines = self._build_line_index(words)
+        for tablet_id in self.inscriptions:
+            lines = self._lines_for(tablet_id)
 
             for line in lines:
                 commodities = [self._get_base_commodity(w) for w in line if self._is_logogram(w)]
@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""
+Sharded, append-only cache for comparative lexicon records.
+
+Each source (``akkadian``, ``luwian``, ...) is split across a fixed number
+of shard files, ``<cache_dir>/<source>/<NN>.jsonl``, chosen by a CRC of the
+term. A shard is a log of ``{"t": term, "n": seq, "r": record}`` lines; the
+last line for a term wins, and ``seq`` (a nanosecond clock stamped at first
+write) keeps terms in the order they were first cached across shards.
+
+- Updates append only the changed terms, one locked write per shard, instead
+  of rewriting whole files.
+- ``compact`` rewrites a shard without superseded lines through a temporary
+  file and ``os.replace``, so readers see the old or the new file, never a
+  torn one.
+- Writers serialize on a per-shard ``.lock`` file (``flock``). Readers take
+  no lock: they index complete lines only and notice compaction by inode.
+- Lookups go through a size-bounded in-memory LRU, which also remembers
+  absent terms; a miss reads one line by offset. ``stats()`` reports hits,
+  misses, evictions and hit rate.
+
+Records cached in memory are not revalidated against other processes'
+writes; call ``invalidate()`` to pick them up.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX: in-process locking only
+    fcntl = None
+
+
+DEFAULT_SHARDS = 16
+DEFAULT_MAX_ENTRIES = 4096
+
+_MISSING = object()
+_STALE = object()
+
+
+def _encode(term: str, seq: int, record: Any) -> bytes:
+    line = json.dumps({"t": term, "n": seq, "r": record}, ensure_ascii=False, separators=(",", ":"))
+    return (line + "\n").encode("utf-8")
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    disk_reads: int = 0
+    appended: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["hit_rate"] = round(self.hit_rate, 4)
+        return data
+
+
+class _ShardIndex:
+    """Byte offsets of the latest line, and first-write seq, per term in one shard file."""
+
+    __slots__ = ("inode", "position", "offsets", "born")
+
+    def __init__(self):
+        self.inode = None
+        self.position = 0
+        self.offsets: Dict[str, Tuple[int, int]] = {}
+        self.born: Dict[str, int] = {}
+
+
+class ComparativeCache:
+    """
+    Per-source sharded record cache with an in-memory LRU.
+
+    Args:
+        cache_dir: Root directory; each source gets a subdirectory
+        shards: Shard files per source (fixed for the life of the cache)
+        max_entries: Records kept in the in-memory LRU
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        shards: int = DEFAULT_SHARDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.shards = shards
+        self.max_entries = max_entries
+        self._lru: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._indexes: Dict[Path, _ShardIndex] = {}
+        self._lock = threading.RLock()
+        self.metrics = CacheStats()
+
+    # ── Layout ───────────────────────────────────────────────────────
+
+    def shard_for(self, term: str) -> int:
+        return zlib.crc32(term.encode("utf-8")) % self.shards
+
+    def shard_path(self, source: str, shard: int) -> Path:
+        return self.cache_dir / source / f"{shard:02d}.jsonl"
+
+    def shard_paths(self, source: str) -> List[Path]:
+        return [self.shard_path(source, shard) for shard in range(self.shards)]
+
+    def sources(self) -> List[str]:
+        if not self.cache_dir.exists():
+            return []
+        return sorted(p.name for p in self.cache_dir.iterdir() if p.is_dir())
+
+    def fingerprint(self, source: str) -> str:
+        """Identity of a source's shard files (inode, size, mtime); no content is read."""
+        parts = []
+        for path in self.shard_paths(source):
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            parts.append(f"{path.name}:{st.st_ino}:{st.st_size}:{st.st_mtime_ns}")
+        return "|".join(parts)
+
+    # ── Shard indexing (readers) ─────────────────────────────────────
+
+    def _refresh(self, path: Path) -> _ShardIndex:
+        """Index lines appended (or the whole file, after compaction) since last seen."""
+        index = self._indexes.get(path)
+        if index is None:
+            index = self._indexes[path] = _ShardIndex()
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
+            index.inode, index.position, index.offsets, index.born = None, 0, {}, {}
+            return index
+
+        with f:
+            st = os.fstat(f.fileno())
+            if st.st_ino != index.inode or st.st_size < index.position:
+                index.inode, index.position, index.offsets, index.born = st.st_ino, 0, {}, {}
+            if st.st_size == index.position:
+                return index
+            f.seek(index.position)
+            chunk = f.read(st.st_size - index.position)
+
+        # A trailing partial line belongs to a write still in progress
+        end = chunk.rfind(b"\n") + 1
+        start = 0
+        while start < end:
+            stop = chunk.index(b"\n", start) + 1
+            try:
+                entry = json.loads(chunk[start:stop])
+                term = entry["t"]
+            except (ValueError, KeyError, TypeError):
+                term = None
+            if isinstance(term, str):
+                index.offsets[term] = (index.position + start, stop - start)
+                index.born.setdefault(term, entry.get("n", 0))
+            start = stop
+        index.position += end
+        return index
+
+    def _read_record(self, path: Path, index: _ShardIndex, term: str) -> Any:
+        location = index.offsets.get(term)
+        if location is None:
+            return _MISSING
+        offset, length = location
+        try:
+            with open(path, "rb") as f:
+                if os.fstat(f.fileno()).st_ino != index.inode:
+                    return _STALE  # compacted since indexed
+                f.seek(offset)
+                line = f.read(length)
+        except FileNotFoundError:
+            return _STALE
+        self.metrics.disk_reads += 1
+        return json.loads(line)["r"]
+
+    def _disk_get(self, source: str, term: str) -> Any:
+        """Latest on-disk record (bypassing the LRU), or _MISSING."""
+        path = self.shard_path(source, self.shard_for(term))
+        record = self._read_record(path, self._refresh(path), term)
+        if record is _STALE:
+            record = self._read_record(path, self._refresh(path), term)
+        return _MISSING if record is _STALE else record
+
+    # ── LRU ──────────────────────────────────────────────────────────
+
+    def _remember(self, key: Tuple[str, str], record: Any) -> None:
+        self._lru[key] = record
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+            self.metrics.evictions += 1
+
+    def invalidate(self, source: Optional[str] = None) -> None:
+        """Drop in-memory records (all, or one source's) so the next read hits disk."""
+        with self._lock:
+            if source is None:
+                self._lru.clear()
+                self._indexes.clear()
+                return
+            for key in [k for k in self._lru if k[0] == source]:
+                del self._lru[key]
+            for path in self.shard_paths(source):
+                self._indexes.pop(path, None)
+
+    # ── Reads ────────────────────────────────────────────────────────
+
+    def get(self, source: str, term: str, default: Any = None) -> Any:
+        """Latest record for ``term``, or ``default``."""
+        key = (source, term)
+        with self._lock:
+            if key in self._lru:
+                self._lru.move_to_end(key)
+                self.metrics.hits += 1
+                record = self._lru[key]
+            else:
+                self.metrics.misses += 1
+                record = self._disk_get(source, term)
+                self._remember(key, record)
+            return default if record is _MISSING else record
+
+    def get_many(self, source: str, terms: Iterable[str]) -> Dict[str, Any]:
+        """Records for the terms present in the cache."""
+        found = {}
+        for term in terms:
+            record = self.get(source, term, _MISSING)
+            if record is not _MISSING:
+                found[term] = record
+        return found
+
+    def terms(self, source: str) -> List[str]:
+        """Cached terms in first-written order."""
+        with self._lock:
+            born: Dict[str, int] = {}
+            for path in self.shard_paths(source):
+                born.update(self._refresh(path).born)
+        return sorted(born, key=born.__getitem__)
+
+    def items(self, source: str) -> Iterator[Tuple[str, Any]]:
+        """``(term, record)`` pairs in first-written order, bypassing the LRU."""
+        latest: Dict[str, Tuple[int, Any]] = {}
+        for path in self.shard_paths(source):
+            try:
+                latest.update(self._shard_latest(path))
+            except FileNotFoundError:
+                continue
+        for term in sorted(latest, key=lambda t: latest[t][0]):
+            yield term, latest[term][1]
+
+    # ── Writes ───────────────────────────────────────────────────────
+
+    def _locked(self, path: Path):
+        return _ShardLock(path.with_suffix(".lock"))
+
+    def update(self, source: str, records: Mapping[str, Any], only_changed: bool = True) -> int:
+        """
+        Append records, one locked write per touched shard.
+
+        With ``only_changed``, terms whose cached record is already equal are
+        skipped. Returns the number of records appended.
+        """
+        by_shard: Dict[int, List[Tuple[str, Any]]] = {}
+        for term, record in records.items():
+            by_shard.setdefault(self.shard_for(term), []).append((term, record))
+        start = time.time_ns()
+        seq = {term: start + i for i, term in enumerate(records)}
+
+        appended = 0
+        with self._lock:
+            for shard, entries in sorted(by_shard.items()):
+                path = self.shard_path(source, shard)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with self._locked(path):
+                    born = self._refresh(path).born
+                    if only_changed and any(term in born for term, _ in entries):
+                        current = self._shard_latest(path)
+                        entries = [
+                            (t, r) for t, r in entries if current.get(t, (0, _MISSING))[1] != r
+                        ]
+                    if not entries:
+                        continue
+                    payload = b"".join(
+                        _encode(term, born.get(term, seq[term]), record) for term, record in entries
+                    )
+                    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                    try:
+                        os.write(fd, payload)
+                    finally:
+                        os.close(fd)
+                for term, record in entries:
+                    self._remember((source, term), record)
+                appended += len(entries)
+            self.metrics.appended += appended
+        return appended
+
+    def put(self, source: str, term: str, record: Any) -> bool:
+        """Append one record; False if the cached record was already equal."""
+        return self.update(source, {term: record}) == 1
+
+    def compact(self, source: str) -> int:
+        """Rewrite each shard with only its latest lines; returns bytes reclaimed."""
+        reclaimed = 0
+        with self._lock:
+            for path in self.shard_paths(source):
+                if not path.exists():
+                    continue
+                with self._locked(path):
+                    before = path.stat().st_size
+                    latest = self._shard_latest(path)
+                    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+                    try:
+                        with open(tmp, "wb") as f:
+                            for term, (seq, record) in latest.items():
+                                f.write(_encode(term, seq, record))
+                            f.flush()
+                            os.fsync(f.fileno())
+                        os.replace(tmp, path)
+                    finally:
+                        tmp.unlink(missing_ok=True)
+                    reclaimed += before - path.stat().st_size
+                self._indexes.pop(path, None)
+        return reclaimed
+
+    @staticmethod
+    def _shard_latest(path: Path) -> Dict[str, Tuple[int, Any]]:
+        """Term -> (first-write seq, latest record) over a shard's complete lines."""
+        latest: Dict[str, Tuple[int, Any]] = {}
+        with open(path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # write in progress
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                term = entry["t"]
+                seq = latest[term][0] if term in latest else entry.get("n", 0)
+                latest[term] = (seq, entry["r"])
+        return latest
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            data = self.metrics.to_dict()
+            data["entries"] = sum(1 for r in self._lru.values() if r is not _MISSING)
+            data["max_entries"] = self.max_entries
+        return data
+
+
+class _ShardLock:
+    """Exclusive writer lock on a shard's sidecar ``.lock`` file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._fd = None
+
+    def __enter__(self):
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+        self._fd = None
+
+
+class LexiconView(Mapping):
+    """
+    Read-through mapping over a base lexicon overlaid by one cache source.
+
+    Cached records override base records of the same term; cache-only terms
+    follow the base terms. Assignments append to the cache and never touch
+    ``base``.
+    """
+
+    def __init__(self, base: Mapping[str, Any], cache: ComparativeCache, source: str):
+        self.base = base
+        self.cache = cache
+        self.source = source
+
+    def __getitem__(self, term: str) -> Any:
+        record = self.cache.get(self.source, term, _MISSING)
+        if record is not _MISSING:
+            return record
+        return self.base[term]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.base
+        for term in self.cache.terms(self.source):
+            if term not in self.base:
+                yield term
+
+    def __len__(self) -> int:
+        return len(self.base) + sum(
+            1 for term in self.cache.terms(self.source) if term not in self.base
+        )
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """All ``(term, record)`` pairs in view order, reading each shard once (bulk export)."""
+        cached = dict(self.cache.items(self.source))
+        for term, record in self.base.items():
+            yield term, cached.pop(term, record)
+        yield from cached.items()
+
+    def scan(self) -> Iterator[Tuple[str, Any]]:
+        """
+        ``(term, record)`` pairs in view order for repeated queries.
+
+        The shard index says which terms are cached; only those are read
+        (by offset, through the LRU), and base records come from memory.
+        """
+        cached = self.cache.terms(self.source)
+        overridden = set(cached)
+        for term, record in self.base.items():
+            if term in overridden:
+                record = self.cache.get(self.source, term, record)
+            yield term, record
+        for term in cached:
+            if term not in self.base:
+                yield term, self.cache.get(self.source, term)
+
+    def overlay(self) -> Dict[str, Any]:
+        """Cached records that differ from the base lexicon."""
+        return {
+            term: record
+            for term, record in self.cache.items(self.source)
+            if self.base.get(term, _MISSING) != record
+        }
+
+    def __setitem__(self, term: str, record: Any) -> None:
+        self.cache.put(self.source, term, record)
+
+    def update(self, records: Mapping[str, Any]) -> int:
+        return self.cache.update(self.source, records)
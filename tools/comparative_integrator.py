@@ -16,6 +16,7 @@ Usage:
     python tools/comparative_integrator.py --query kull
     python tools/comparative_integrator.py --validate "KU-RO = total" --hypothesis semitic
     python tools/comparative_integrator.py --update-cache
+    python tools/comparative_integrator.py --cache-stats
 
 Attribution:
     Part of Linear A Decipherment Project (OPERATION MINOS II)
@@ -26,18 +27,31 @@ import argparse
 import sys
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 from dataclasses import dataclass
 
+from comparative_cache import DEFAULT_MAX_ENTRIES, ComparativeCache, LexiconView
+from vocabulary_store import DEFAULT_DB_FILE, open_store, records_fingerprint
+
 
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 COMPARATIVE_DIR = DATA_DIR / "comparative"
+# Sharded comparative cache (comparative_cache.py); one subdirectory per source
+SHARD_DIR = COMPARATIVE_DIR / "shards"
+AKKADIAN_SOURCE = "akkadian"
+LUWIAN_SOURCE = "luwian"
+# Whole-file caches from before sharding; imported once into empty shards
 AKKADIAN_FILE = COMPARATIVE_DIR / "akkadian_admin_terms.json"
 LUWIAN_FILE = COMPARATIVE_DIR / "luwian_morphology.json"
 UGARITIC_FILE = COMPARATIVE_DIR / "ugaritic_trade.json"
 
+# Lexicon names in the shared vocabulary store (vocabulary_store.py).
+AKKADIAN_LEXICON = "akkadian_admin"
+LUWIAN_LEXICON = "luwian_morphology"
+UGARITIC_LEXICON = "ugaritic_trade"
+
 
 # Embedded reference data (can be expanded via external sources)
 # This is a curated subset based on published Assyriology literature
@@ -327,12 +341,21 @@ class ComparativeIntegrator:
     Integrates comparative Bronze Age data for Linear A validation.
     """
 
-    def __init__(self, verbose: bool = False):
+    def __init__(
+        self,
+        verbose: bool = False,
+        store_path: Optional[Path] = None,
+        cache_dir: Optional[Path] = None,
+        cache_size: int = DEFAULT_MAX_ENTRIES,
+    ):
         self.verbose = verbose
-        self.akkadian = AKKADIAN_ADMIN_VOCABULARY
-        self.luwian = LUWIAN_MORPHOLOGY
+        self.cache = ComparativeCache(cache_dir or SHARD_DIR, max_entries=cache_size)
+        self.akkadian = LexiconView(AKKADIAN_ADMIN_VOCABULARY, self.cache, AKKADIAN_SOURCE)
+        self.luwian = LexiconView(LUWIAN_MORPHOLOGY, self.cache, LUWIAN_SOURCE)
         self.ugaritic = UGARITIC_TRADE
         self._load_cache()
+        self.store = open_store(store_path or DEFAULT_DB_FILE)
+        self._sync_store()
 
     def log(self, message: str):
         """Print if verbose mode."""
@@ -340,72 +363,81 @@ class ComparativeIntegrator:
             print(f"  {message}")
 
     def _load_cache(self):
-        """Load cached comparative data if available."""
-        COMPARATIVE_DIR.mkdir(parents=True, exist_ok=True)
+        """
+        Import pre-sharding cache files into empty shards.
 
-        # Load additional data from files if they exist
-        if AKKADIAN_FILE.exists():
+        Cached records are otherwise read on demand through ``self.cache``.
+        """
+        for source, path, key in (
+            (AKKADIAN_SOURCE, AKKADIAN_FILE, "terms"),
+            (LUWIAN_SOURCE, LUWIAN_FILE, "morphemes"),
+        ):
+            if not path.exists() or self.cache.fingerprint(source):
+                continue
             try:
-                with open(AKKADIAN_FILE, "r", encoding="utf-8") as f:
+                with open(path, "r", encoding="utf-8") as f:
                     cached = json.load(f)
-                    self.akkadian.update(cached.get("terms", {}))
-                self.log("Loaded cached Akkadian data")
+                added = self.cache.update(source, cached.get(key, {}))
+                self.log(f"Imported {added} {source} records from {path.name}")
             except Exception as e:
-                self.log(f"Error loading Akkadian cache: {e}")
+                self.log(f"Error importing {source} cache: {e}")
 
-        if LUWIAN_FILE.exists():
-            try:
-                with open(LUWIAN_FILE, "r", encoding="utf-8") as f:
-                    cached = json.load(f)
-                    self.luwian.update(cached.get("morphemes", {}))
-                self.log("Loaded cached Luwian data")
-            except Exception as e:
-                self.log(f"Error loading Luwian cache: {e}")
+    def _sync_store(self):
+        """
+        Persist the reference vocabularies into the indexed store.
+
+        Cached lexicons are fingerprinted by their shard files, so an
+        unchanged cache is not read at all.
+        """
+        for lexicon, records, source in (
+            (AKKADIAN_LEXICON, self.akkadian, AKKADIAN_SOURCE),
+            (LUWIAN_LEXICON, self.luwian, LUWIAN_SOURCE),
+            (UGARITIC_LEXICON, self.ugaritic, None),
+        ):
+            fingerprint = None
+            if source is not None:
+                fingerprint = (
+                    f"{records_fingerprint(records.base)}+{self.cache.fingerprint(source)}"
+                )
+            if self.store.sync(lexicon, records, fingerprint=fingerprint):
+                self.log(f"Indexed {len(records)} {lexicon} entries")
 
     def save_cache(self):
-        """Save current data to cache files."""
-        COMPARATIVE_DIR.mkdir(parents=True, exist_ok=True)
+        """
+        Save current data to the cache shards.
 
-        akkadian_data = {
-            "generated": datetime.now().isoformat(),
-            "source": "ORACC + CAD",
-            "terms": self.akkadian,
-        }
-        with open(AKKADIAN_FILE, "w", encoding="utf-8") as f:
-            json.dump(akkadian_data, f, ensure_ascii=False, indent=2)
+        Only the overlay (records that differ from the embedded lexicons) is
+        persisted, and only where it differs from the cached copy; shards are
+        then compacted (atomic rewrite) to drop superseded lines.
+        """
+        for source, records in (
+            (AKKADIAN_SOURCE, self.akkadian),
+            (LUWIAN_SOURCE, self.luwian),
+        ):
+            added = self.cache.update(source, records.overlay())
+            reclaimed = self.cache.compact(source)
+            self.log(f"{source}: {added} records appended, {reclaimed} bytes compacted")
 
-        luwian_data = {
-            "generated": datetime.now().isoformat(),
-            "source": "Melchert DLL + Yakubovich",
-            "morphemes": self.luwian,
-        }
-        with open(LUWIAN_FILE, "w", encoding="utf-8") as f:
-            json.dump(luwian_data, f, ensure_ascii=False, indent=2)
+        print(f"Cache saved to {self.cache.cache_dir}")
 
-        print(f"Cache saved to {COMPARATIVE_DIR}")
+    def cache_stats(self) -> Dict:
+        """LRU hit/miss/eviction counters for the comparative cache."""
+        return self.cache.stats()
 
     def query_akkadian(self, term: str) -> List[ComparativeMatch]:
-        """Query Akkadian vocabulary for a term."""
-        matches = []
-        term_lower = term.lower()
+        """Query Akkadian vocabulary for a term.
 
-        for akk_term, data in self.akkadian.items():
-            # Direct match
-            if term_lower in akk_term.lower():
-                relevance = 1.0
-            # Root match
-            elif term_lower.upper() in data.get("root", ""):
-                relevance = 0.8
-            # Meaning match
-            elif term_lower in data.get("meaning", "").lower():
-                relevance = 0.6
-            else:
-                continue
+        Term (1.0), root (0.8) and meaning (0.6) substring matches are
+        answered by the vocabulary store's indexes, best first.
+        """
+        matches = []
 
+        for hit in self.store.search(AKKADIAN_LEXICON, term.lower()):
+            data = hit.data
             matches.append(
                 ComparativeMatch(
                     source_corpus="ORACC/CAD",
-                    term=akk_term,
+                    term=hit.term,
                     meaning=data.get("meaning", ""),
                     root=data.get("root", ""),
                     usage=data.get("usage", ""),
@@ -413,18 +445,18 @@ class ComparativeIntegrator:
                     examples=data.get("examples", []),
                     source_citation=data.get("source", ""),
                     confidence=data.get("confidence", "MEDIUM"),
-                    relevance_score=relevance,
+                    relevance_score=hit.relevance,
                 )
             )
 
-        return sorted(matches, key=lambda m: -m.relevance_score)
+        return matches
 
     def query_luwian(self, morpheme: str) -> List[ComparativeMatch]:
         """Query Luwian morphology data."""
         matches = []
         morpheme_clean = morpheme.lstrip("-").lower()
 
-        for luw_morph, data in self.luwian.items():
+        for luw_morph, data in self.luwian.scan():
             luw_clean = luw_morph.lstrip("-").lower()
 
             # Direct match
@@ -649,6 +681,15 @@ def main():
     parser.add_argument(
         "--update-cache", action="store_true", help="Save current data to cache files"
     )
+    parser.add_argument(
+        "--cache-stats", action="store_true", help="Show comparative cache counters"
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_MAX_ENTRIES,
+        help=f"Records kept in memory (default: {DEFAULT_MAX_ENTRIES})",
+    )
     parser.add_argument("--verbose", "-v", action="store_true", help="Show detailed output")
 
     args = parser.parse_args()
@@ -658,7 +699,7 @@ def main():
     print("=" * 60)
     print("Validating readings against Bronze Age corpora\n")
 
-    integrator = ComparativeIntegrator(verbose=args.verbose)
+    integrator = ComparativeIntegrator(verbose=args.verbose, cache_size=args.cache_size)
 
     if args.update_cache:
         integrator.save_cache()
@@ -688,16 +729,29 @@ def main():
         result = integrator.validate_reading(word, reading, args.hypothesis)
         integrator.print_validation_result(result)
 
-    else:
+    elif not args.cache_stats:
         print("Usage:")
         print("  --query TERM      Query comparative corpora")
         print('  --validate "WORD = meaning"  Validate a reading')
         print("  --update-cache    Save data to cache files")
+        print("  --cache-stats     Show cache hit/miss counters")
         print("\nExamples:")
         print("  python comparative_integrator.py --query kull")
         print('  python comparative_integrator.py --validate "KU-RO = total"')
         print("  python comparative_integrator.py --query -iya --corpus luwian")
 
+    if args.cache_stats:
+        stats = integrator.cache_stats()
+        print(f"\nComparative cache ({integrator.cache.cache_dir}):")
+        print(
+            f"  {stats['hits']} hits, {stats['misses']} misses "
+            f"(hit rate {stats['hit_rate']:.1%}), {stats['evictions']} evictions"
+        )
+        print(
+            f"  {stats['entries']}/{stats['max_entries']} records in memory, "
+            f"{stats['disk_reads']} shard reads, {stats['appended']} appended"
+        )
+
     return 0
 
 
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Confirmation Optimizer for Linear A
+
+Answers "which K words should we confirm next?" for sprint planning.
+Where cascade_opportunity_detector.py reports one trigger word at a time,
+this tool picks the set of K currently unknown words whose joint
+confirmation makes the most tablets cross the readiness threshold.
+
+Model:
+    Readiness (the reading_readiness_scorer.py composite) of a tablet depends
+    only on how many of its syllabic tokens are still unknown, so each
+    tablet below threshold needs some number of its unknown tokens
+    identified before it crosses.  Greedy selection ranks words by the
+    crossings they complete, breaking ties by progress towards crossing
+    (sum over tablets of tokens gained / tokens needed, a truncated
+    coverage term).
+
+    Crossing counts are not submodular (a tablet may need two words
+    together), so classic lazy-greedy bounds would be unsafe.  Instead each
+    word's marginal gain is cached in a heap and refreshed only when a pick
+    touches one of its tablets, which changes its gain; the rest are reused.
+
+    --site-balanced divides each tablet's weight by 1 + tablets already
+    crossed at its site, the optimisation counterpart of
+    SelectStage.site_balance in reading_pipeline.py.
+
+Usage:
+    python3 tools/confirmation_optimizer.py --k 10
+    python3 tools/confirmation_optimizer.py --k 10 --site-balanced --threshold 0.45
+    python3 tools/confirmation_optimizer.py --k 20 --output data/confirmation_plan.json
+
+Attribution:
+    Part of Linear A Decipherment Project
+    Sprint planning on top of cascade_opportunity_detector.py
+"""
+
+import argparse
+import heapq
+import json
+import sys
+from collections import Counter, defaultdict
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+from cascade_opportunity_detector import CascadeOpportunityDetector, _extract_site
+from readiness_store import composite_readiness
+
+
+@dataclass
+class WordPick:
+    """One word chosen by the optimizer, in selection order."""
+
+    word: str
+    gain: float  # progress towards crossing (tokens gained / needed) when picked
+    new_crossings: int
+    cumulative_crossings: int
+    crossed_tablets: List[str] = field(default_factory=list)
+
+
+class ConfirmationOptimizer:
+    """Greedy selection of K words, with cached marginal gains, over a loaded detector."""
+
+    def __init__(self, detector: CascadeOpportunityDetector, site_balanced: bool = False):
+        self.detector = detector
+        self.site_balanced = site_balanced
+        self.state = detector.readiness_state()
+
+        # Tablets below threshold that can still cross: tablet -> tokens needed
+        self.need: Dict[str, int] = {}
+        for tablet_id, unknown in self.state.unknown.items():
+            needed = self._tokens_needed(tablet_id, unknown)
+            if needed:
+                self.need[tablet_id] = needed
+        self.site = {t: _extract_site(t) for t in self.need}
+
+        # Candidate word -> {tablet: unknown tokens it would identify}, reachable tablets only
+        self.postings: Dict[str, Dict[str, int]] = {}
+        for key, counts in self.state.postings.items():
+            reach = {t: n for t, n in counts.items() if t in self.need}
+            if reach:
+                self.postings[key] = reach
+
+    def _tokens_needed(self, tablet_id: str, unknown: int) -> Optional[int]:
+        """
+        Fewest unknown tokens to identify for the tablet to reach threshold.
+
+        0 if it is already there, None if identifying every token is not enough.
+        The same composite scores the baseline and each step, so the two agree.
+        """
+        state = self.state
+        total, arith = state.total[tablet_id], state.arith[tablet_id]
+        structural = state.structural[tablet_id]
+        for removed in range(unknown + 1):
+            score = composite_readiness(total, unknown - removed, arith, structural)
+            if score >= self.detector.threshold:
+                return removed
+        return None
+
+    def _gain(
+        self, word: str, removed: Dict[str, int], crossed_by_site: Counter
+    ) -> Tuple[float, float]:
+        """Marginal (crossings, progress) of adding `word` to the current picks."""
+        crossings = progress = 0.0
+        for tablet_id, n in self.postings[word].items():
+            need = self.need[tablet_id]
+            have = removed.get(tablet_id, 0)
+            if have >= need:
+                continue
+            weight = 1.0
+            if self.site_balanced:
+                weight /= 1 + crossed_by_site[self.site[tablet_id]]
+            if have + n >= need:
+                crossings += weight
+            progress += weight * (min(have + n, need) - have) / need
+        return (crossings, progress)
+
+    def optimize(self, k: int) -> List[WordPick]:
+        """Pick up to k words; stops early once no word adds any progress."""
+        removed: Dict[str, int] = defaultdict(int)
+        crossed_by_site: Counter = Counter()
+        crossings = 0
+
+        words_on_tablet: Dict[str, List[str]] = defaultdict(list)
+        for word, counts in self.postings.items():
+            for tablet_id in counts:
+                words_on_tablet[tablet_id].append(word)
+        words_at_site: Dict[str, Set[str]] = defaultdict(set)
+        if self.site_balanced:
+            for tablet_id, words in words_on_tablet.items():
+                words_at_site[self.site[tablet_id]].update(words)
+
+        # Heap of cached marginal gains; an entry is live while its version is current
+        version = dict.fromkeys(self.postings, 0)
+
+        def entry(word):
+            crossing_gain, progress = self._gain(word, removed, crossed_by_site)
+            return (-crossing_gain, -progress, word, version[word])
+
+        heap = [entry(w) for w in self.postings]
+        heapq.heapify(heap)
+
+        picks: List[WordPick] = []
+        while heap and len(picks) < k:
+            neg_cross, neg_progress, word, stamp = heapq.heappop(heap)
+            if version.get(word) != stamp:
+                continue
+            if neg_progress >= 0:
+                break
+            del version[word]
+
+            crossed = []
+            stale = set()
+            for tablet_id, n in self.postings[word].items():
+                before = removed[tablet_id]
+                if before >= self.need[tablet_id]:
+                    continue
+                removed[tablet_id] = before + n
+                stale.update(words_on_tablet[tablet_id])
+                if before + n >= self.need[tablet_id]:
+                    crossed.append(tablet_id)
+            for tablet_id in crossed:
+                site = self.site[tablet_id]
+                crossed_by_site[site] += 1
+                stale.update(words_at_site[site])
+
+            # Refresh cached gains only for words sharing a tablet (or site) with the pick
+            for other in stale:
+                if other in version:
+                    version[other] += 1
+                    heapq.heappush(heap, entry(other))
+
+            crossings += len(crossed)
+            picks.append(
+                WordPick(
+                    word=word,
+                    gain=round(-neg_progress, 4),
+                    new_crossings=len(crossed),
+                    cumulative_crossings=crossings,
+                    crossed_tablets=sorted(crossed),
+                )
+            )
+        return picks
+
+    def verify(self, words: List[str]) -> List[str]:
+        """Tablets that cross the threshold when `words` are jointly identified."""
+        detector = self.detector
+        touched = set()
+        for word in words:
+            touched.update(self.state.identify(word))
+        try:
+            return sorted(
+                t
+                for t in touched
+                if self.state.baseline.get(t, 0.0) < detector.threshold
+                and self.state.score(t)[0] >= detector.threshold
+            )
+        finally:
+            for _ in words:
+                self.state.rollback()
+
+
+def print_plan(optimizer: ConfirmationOptimizer, picks: List[WordPick]):
+    """Print the selected words with their marginal and cumulative crossings."""
+    detector = optimizer.detector
+    print(f"\n{'=' * 70}")
+    print("CONFIRMATION PLAN — WORDS TO CONFIRM NEXT")
+    print(f"{'=' * 70}")
+    print(f"  Threshold: {detector.threshold}")
+    print(f"  Site-balanced: {'yes' if optimizer.site_balanced else 'no'}")
+    print(f"  Candidate words: {len(optimizer.postings)}")
+    print(f"  Tablets that can still cross: {len(optimizer.need)}")
+
+    if picks:
+        print(f"\n  {'#':>3s}  {'Word':<20s} {'Gain':>7s} {'New':>4s} {'Total':>5s}  Crossed")
+        print(f"  {'-' * 66}")
+        for i, pick in enumerate(picks, 1):
+            crossed = ", ".join(pick.crossed_tablets[:4])
+            if len(pick.crossed_tablets) > 4:
+                crossed += f" (+{len(pick.crossed_tablets) - 4})"
+            print(
+                f"  {i:3d}  {pick.word:<20s} {pick.gain:7.3f} {pick.new_crossings:4d} "
+                f"{pick.cumulative_crossings:5d}  {crossed}"
+            )
+    else:
+        print("\n  No word brings any tablet closer to the threshold.")
+
+    print(f"\n{'=' * 70}")
+
+
+def save_plan(optimizer: ConfirmationOptimizer, picks: List[WordPick], output_path: str):
+    """Save the plan to JSON."""
+    output = {
+        "metadata": {
+            "tool": "confirmation_optimizer.py",
+            "generated": datetime.now().isoformat(),
+            "threshold": optimizer.detector.threshold,
+            "site_balanced": optimizer.site_balanced,
+            "candidate_words": len(optimizer.postings),
+            "reachable_tablets": len(optimizer.need),
+        },
+        "total_crossings": picks[-1].cumulative_crossings if picks else 0,
+        "picks": [asdict(p) for p in picks],
+    }
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(output, f, indent=2, ensure_ascii=False)
+    print(f"\nResults saved to: {output_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Confirmation Optimizer — choose the K words whose joint "
+        "confirmation makes the most tablets readable"
+    )
+    parser.add_argument("--k", type=int, default=10, help="Number of words to pick (default: 10)")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.5,
+        help="Readiness threshold for 'readable' (default: 0.5)",
+    )
+    parser.add_argument(
+        "--site-balanced",
+        action="store_true",
+        help="Discount tablets from sites that already have crossings",
+    )
+    parser.add_argument("--output", type=str, help="Save the plan to JSON file")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("LINEAR A CONFIRMATION OPTIMIZER")
+    print("=" * 70)
+
+    detector = CascadeOpportunityDetector(threshold=args.threshold)
+    if not detector.load_data():
+        sys.exit(1)
+
+    optimizer = ConfirmationOptimizer(detector, site_balanced=args.site_balanced)
+    picks = optimizer.optimize(args.k)
+    print_plan(optimizer, picks)
+
+    if args.output:
+        save_plan(optimizer, picks, args.output)
+
+
+if __name__ == "__main__":
+    main()
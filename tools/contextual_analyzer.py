@@ -114,6 +114,9 @@ class ContextualAnalyzer:
             "has_total": False,
             "total_word": None,
             "structure_type": "unknown",
+            # Document slot sequence, consecutive repeats collapsed
+            # (HEADER_WORD, LEXICAL_ITEM, COMMODITY_LOGOGRAM, NUMERAL, TOTAL, DEFICIT)
+            "slots": [],
         }
 
         current_line = []
@@ -137,18 +140,26 @@ class ContextualAnalyzer:
 
             current_line.append(word)
 
+            slot = None
             if self._is_numeral(word):
                 elements["numerals"].append({"word": word, "line": line_num})
+                slot = "NUMERAL"
             elif self._is_logogram(word):
                 elements["logograms"].append({"word": word, "line": line_num})
+                slot = "COMMODITY_LOGOGRAM"
             elif self._is_syllabic(word):
                 elements["syllabic_words"].append({"word": word, "line": line_num})
+                slot = "LEXICAL_ITEM" if elements["slots"] else "HEADER_WORD"
 
                 # Check for totaling words
                 word_upper = word.upper()
                 if word_upper in ["KU-RO", "PO-TO-KU-RO", "KI-RO"]:
                     elements["has_total"] = True
                     elements["total_word"] = word
+                    slot = "DEFICIT" if word_upper == "KI-RO" else "TOTAL"
+
+            if slot and (not elements["slots"] or elements["slots"][-1] != slot):
+                elements["slots"].append(slot)
 
         # Add final line
         if current_line:
@@ -433,6 +444,7 @@ class ContextualAnalyzer:
                         "line_count": len(elements["lines"]),
                         "logogram_count": len(elements["logograms"]),
                         "numeral_count": len(elements["numerals"]),
+                        "slots": elements["slots"],
                     }
                 )
             elif self._is_religious_text(elements):
@@ -511,14 +523,19 @@ class ContextualAnalyzer:
         return match.group(1) if match else ""
 
     def _extract_commodity_templates(self, commodity_docs: list) -> list:
-        """Extract common templates from commodity lists."""
+        """
+        Extract common templates from commodity lists.
+
+        Each template carries its documents' slot sequences ("documents"),
+        which admin_isomorphism_scorer.py aligns against Akkadian templates.
+        """
         templates = []
 
         # Template 1: Header + Entries + ku-ro Total
         header_entry_total = []
         for doc in commodity_docs:
             if doc["total_word"] and doc["total_word"].upper() == "KU-RO":
-                header_entry_total.append(doc["inscription"])
+                header_entry_total.append(doc)
 
         if header_entry_total:
             templates.append(
@@ -526,13 +543,14 @@ class ContextualAnalyzer:
                     "name": "Standard Commodity List (ku-ro)",
                     "pattern": "[Header?] → [Entry + Logogram + Numeral]* → ku-ro + Total",
                     "count": len(header_entry_total),
-                    "examples": header_entry_total[:5],
+                    "examples": [doc["inscription"] for doc in header_entry_total[:5]],
+                    "documents": {doc["inscription"]: doc["slots"] for doc in header_entry_total},
                 }
             )
 
         # Template 2: ki-ro deficit lists
         deficit_lists = [
-            doc["inscription"]
+            doc
             for doc in commodity_docs
             if doc["total_word"] and "KI-RO" in doc["total_word"].upper()
         ]
@@ -542,7 +560,8 @@ class ContextualAnalyzer:
                     "name": "Deficit List (ki-ro)",
                     "pattern": "[Entries] → ki-ro + Deficit Amount",
                     "count": len(deficit_lists),
-                    "examples": deficit_lists[:5],
+                    "examples": [doc["inscription"] for doc in deficit_lists[:5]],
+                    "documents": {doc["inscription"]: doc["slots"] for doc in deficit_lists},
                 }
             )
 
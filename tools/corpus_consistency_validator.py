@@ -15,6 +15,7 @@ Usage:
     python tools/corpus_consistency_validator.py --word KU-RO
     python tools/corpus_consistency_validator.py --word KU-RO --reading "total"
     python tools/corpus_consistency_validator.py --all --min-freq 5
+    python tools/corpus_consistency_validator.py --all --min-freq 5 --workers 4
 
 Attribution:
     Part of Linear A Decipherment Project (OPERATION MINOS II)
@@ -24,12 +25,16 @@ import json
 import argparse
 import sys
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 from collections import Counter
 from dataclasses import dataclass, asdict
 
+from corpus_index import compile_corpus
 from site_normalization import normalize_site
 
 
@@ -39,6 +44,9 @@ DATA_DIR = PROJECT_ROOT / "data"
 CORPUS_FILE = DATA_DIR / "corpus.json"
 VALIDATION_RESULTS_FILE = DATA_DIR / "consistency_validation.json"
 
+LOGOGRAM_AFTER_RE = re.compile(r"^[A-Z]+$")
+NUMBER_AFTER_RE = re.compile(r"^[\d\s.¹²³⁴⁵⁶⁷⁸⁹⁰/₀₁₂₃₄₅₆₇₈○◎—|]+$")
+
 
 @dataclass
 class Occurrence:
@@ -88,6 +96,178 @@ class ConsistencyReport:
     generated: str
 
 
+def build_report(
+    word: str,
+    occurrences: List[Occurrence],
+    proposed_reading: Optional[str],
+    major_sites: List[str],
+    inscription_count: int,
+) -> ConsistencyReport:
+    """
+    Consistency report for a word from its occurrences.
+
+    Module-level (and free of validator state) so that batch validation can
+    run it in worker processes.
+    """
+    if not occurrences:
+        return ConsistencyReport(
+            word=word,
+            total_occurrences=0,
+            sites_found=[],
+            sites_missing=major_sites,
+            periods_found=[],
+            positional_consistency=0.0,
+            contextual_consistency=0.0,
+            functional_consistency=0.0,
+            position_distribution={},
+            context_distribution={},
+            site_distribution={},
+            anomalies=[{"type": "not_found", "message": f"{word} not found in corpus"}],
+            reading_validated=False,
+            reading_issues=["Word not found in corpus"],
+            generated=datetime.now().isoformat(),
+        )
+
+    # Analyze distributions
+    sites_found = sorted(set(o.site for o in occurrences))
+    sites_missing = [s for s in major_sites if s not in sites_found]
+    periods_found = sorted(set(o.period for o in occurrences))
+
+    # Position distribution
+    position_dist = Counter(o.line_position for o in occurrences)
+
+    # Context distribution (what follows the word)
+    context_types = []
+    for o in occurrences:
+        if o.has_logogram and o.has_number:
+            context_types.append("logogram+number")
+        elif o.has_logogram:
+            context_types.append("logogram")
+        elif o.has_number:
+            context_types.append("number")
+        else:
+            context_types.append("other")
+    context_dist = Counter(context_types)
+
+    # Site distribution
+    site_dist = Counter(o.site for o in occurrences)
+
+    # Calculate consistency metrics
+    # Position consistency: high if word appears in same position most of the time
+    most_common_pos = position_dist.most_common(1)[0][1] if position_dist else 0
+    positional_consistency = most_common_pos / len(occurrences) if occurrences else 0
+
+    # Context consistency: high if word appears in same context
+    most_common_ctx = context_dist.most_common(1)[0][1] if context_dist else 0
+    contextual_consistency = most_common_ctx / len(occurrences) if occurrences else 0
+
+    # Functional consistency (combination of position + context)
+    functional_consistency = (positional_consistency + contextual_consistency) / 2
+
+    # Detect anomalies
+    anomalies = []
+
+    # Anomaly: appears at only one site when other sites have inscriptions
+    if len(sites_found) == 1 and len(occurrences) > 5:
+        concentration = len(occurrences) / inscription_count
+        if concentration > 0.01:  # More than 1% of corpus
+            anomalies.append(
+                {
+                    "type": "site_concentration",
+                    "message": (
+                        f"{word} appears at only {sites_found[0]} ({len(occurrences)} times)"
+                    ),
+                    "severity": "HIGH" if len(occurrences) > 20 else "MEDIUM",
+                    "implication": "May be site-specific term or regional dialect",
+                }
+            )
+
+    # Anomaly: inconsistent contexts
+    if len(context_dist) > 2 and max(context_dist.values()) < len(occurrences) * 0.5:
+        anomalies.append(
+            {
+                "type": "context_inconsistency",
+                "message": f"{word} appears in varied contexts: {dict(context_dist)}",
+                "severity": "MEDIUM",
+                "implication": "May have multiple functions or be a common word",
+            }
+        )
+
+    # Anomaly: appears with and without numbers
+    if "number" in context_dist and "other" in context_dist:
+        num_pct = context_dist.get("number", 0) / len(occurrences)
+        if 0.2 < num_pct < 0.8:
+            anomalies.append(
+                {
+                    "type": "mixed_numerical_context",
+                    "message": f"{word} followed by number {num_pct * 100:.1f}% of time",
+                    "severity": "LOW",
+                    "implication": "May have both administrative and non-administrative uses",
+                }
+            )
+
+    # Validate proposed reading
+    reading_validated = True
+    reading_issues = []
+
+    if proposed_reading:
+        reading_lower = proposed_reading.lower()
+
+        # Total/sum reading should appear at totaling positions
+        if "total" in reading_lower or "sum" in reading_lower or "all" in reading_lower:
+            total_positions = position_dist.get("total_position", 0) + position_dist.get("end", 0)
+            if total_positions < len(occurrences) * 0.5:
+                reading_issues.append(
+                    f"Reading '{proposed_reading}' expects"
+                    f" totaling position, but only"
+                    f" {total_positions}/{len(occurrences)}"
+                    f" occurrences are at end/total position"
+                )
+                reading_validated = False
+
+        # Deficit reading should have special marking or context
+        if "deficit" in reading_lower or "lacking" in reading_lower:
+            # Check if it co-occurs with KU-RO or similar
+            has_kuro = any(
+                "KU-RO" in str(o.context_before + o.context_after).upper() for o in occurrences
+            )
+            if not has_kuro and len(occurrences) > 3:
+                reading_issues.append(
+                    f"Reading '{proposed_reading}' might expect co-occurrence with total term, "
+                    f"but KU-RO not commonly found in context"
+                )
+
+        # If reading implies commodity, should appear with logograms
+        commodity_terms = ["wine", "oil", "grain", "olive", "fig"]
+        if any(term in reading_lower for term in commodity_terms):
+            log_pct = (
+                context_dist.get("logogram", 0) + context_dist.get("logogram+number", 0)
+            ) / len(occurrences)
+            if log_pct < 0.3:
+                reading_issues.append(
+                    f"Reading '{proposed_reading}' implies commodity, but only "
+                    f"{log_pct * 100:.1f}% of occurrences are followed by logograms"
+                )
+
+    return ConsistencyReport(
+        word=word,
+        total_occurrences=len(occurrences),
+        sites_found=sites_found,
+        sites_missing=sites_missing,
+        periods_found=periods_found,
+        positional_consistency=positional_consistency,
+        contextual_consistency=contextual_consistency,
+        functional_consistency=functional_consistency,
+        position_distribution=dict(position_dist),
+        context_distribution=dict(context_dist),
+        site_distribution=dict(site_dist),
+        anomalies=anomalies,
+        reading_validated=reading_validated,
+        reading_issues=reading_issues,
+        generated=datetime.now().isoformat(),
+    )
+
+
 class CorpusConsistencyValidator:
     """
     Validates readings across the entire Linear A corpus.
@@ -98,6 +278,7 @@ class CorpusConsistencyValidator:
     def __init__(self, verbose: bool = False):
         self.verbose = verbose
         self.corpus = None
+        self.compiled = None  # corpus_index.CompiledCorpus
         self.statistics = None
         self.major_sites = ["HT", "KH", "ZA", "PH", "KN", "MA", "TY", "PK"]
         self.site_name_map = {}
@@ -112,6 +293,7 @@ class CorpusConsistencyValidator:
         try:
             with open(CORPUS_FILE, "r", encoding="utf-8") as f:
                 self.corpus = json.load(f)
+            self.compiled = compile_corpus(self.corpus)
 
             stats_file = DATA_DIR / "statistics.json"
             if stats_file.exists():
@@ -125,250 +307,132 @@ class CorpusConsistencyValidator:
             print(f"Error loading corpus: {e}")
             return False
 
+    def _inscription_info(self, insc_id: str) -> tuple:
+        """(site code, site name, raw site, period, support) for an inscription."""
+        data = self.corpus["inscriptions"][insc_id]
+        site_code, site_name = normalize_site(
+            site_value=data.get("site"),
+            inscription_id=insc_id,
+        )
+        return (
+            site_code,
+            site_name,
+            str(data.get("site", "") or ""),
+            data.get("context", "UNKNOWN"),
+            data.get("support", "UNKNOWN"),
+        )
+
+    @staticmethod
+    def _occurrence(insc_id: str, layout, i: int, info: tuple) -> Occurrence:
+        """Occurrence record for the token at position ``i``."""
+        words = layout.tokens
+
+        # Extract context
+        context_before = [words[j] for j in range(max(0, i - 3), i) if words[j]]
+        context_after = [words[j] for j in range(i + 1, min(len(words), i + 4)) if words[j]]
+
+        # Determine position characteristics
+        has_logogram = any(
+            LOGOGRAM_AFTER_RE.match(w_after) and len(w_after) >= 2 and w_after not in ["VIR", "MUL"]
+            for w_after in context_after
+        )
+        has_number = any(NUMBER_AFTER_RE.match(w_after) for w_after in context_after)
+
+        # Determine line position from the compiled layout
+        if layout.line_initial[i]:
+            line_pos = "start"
+        elif layout.line_final[i]:
+            line_pos = "end"
+        elif "total" in str(context_before).lower() or has_number:
+            line_pos = "total_position"
+        else:
+            line_pos = "middle"
+
+        site_code, site_name, site_raw, period, support = info
+        return Occurrence(
+            inscription_id=insc_id,
+            site=site_code,
+            site_full=site_name,
+            site_raw=site_raw,
+            period=period,
+            support=support,
+            position=i,
+            context_before=context_before,
+            context_after=context_after,
+            has_logogram=has_logogram,
+            has_number=has_number,
+            line_position=line_pos,
+        )
+
     def find_occurrences(self, word: str) -> List[Occurrence]:
         """
         Find all occurrences of a word in the corpus.
 
         Returns detailed occurrence data including context.
         """
-        word_upper = word.upper()
-        occurrences = []
-
-        for insc_id, data in self.corpus.get("inscriptions", {}).items():
-            if "_parse_error" in data:
-                continue
+        return self.find_occurrences_many([word])[word]
 
-            words = data.get("transliteratedWords", [])
+    def find_occurrences_many(self, words: Iterable[str]) -> Dict[str, List[Occurrence]]:
+        """
+        Occurrences of many words in a single pass over the corpus.
 
-            for i, w in enumerate(words):
+        Tokens are matched case-insensitively against a hash of all target
+        words, so the cost is one corpus scan however many words are asked
+        for. Keys are the words as given.
+        """
+        words = list(words)
+        found: Dict[str, List[Occurrence]] = {}
+        for word in words:
+            found.setdefault(word.upper(), [])
+
+        for insc_id, layout in self.compiled.items():
+            info = None
+            for i, w in enumerate(layout.tokens):
                 if not w:
                     continue
-
-                # Match word (case-insensitive, handle subscripts)
-                w_normalized = w.upper()
-                if w_normalized == word_upper or w.upper() == word_upper:
-                    # Extract context
-                    context_before = [words[j] for j in range(max(0, i - 3), i) if words[j]]
-                    context_after = [
-                        words[j] for j in range(i + 1, min(len(words), i + 4)) if words[j]
-                    ]
-
-                    # Determine position characteristics
-                    has_logogram = any(
-                        re.match(r"^[A-Z]+$", w_after)
-                        and len(w_after) >= 2
-                        and w_after not in ["VIR", "MUL"]
-                        for w_after in context_after
-                    )
-                    has_number = any(
-                        re.match(r"^[\d\s.¹²³⁴⁵⁶⁷⁸⁹⁰/₀₁₂₃₄₅₆₇₈○◎—|]+$", w_after)
-                        for w_after in context_after
-                    )
-
-                    # Determine line position
-                    if i == 0:
-                        line_pos = "start"
-                    elif i == len(words) - 1:
-                        line_pos = "end"
-                    elif "total" in str(context_before).lower() or has_number:
-                        line_pos = "total_position"
-                    else:
-                        line_pos = "middle"
-
-                    site_code, site_name = normalize_site(
-                        site_value=data.get("site"),
-                        inscription_id=insc_id,
-                    )
-
-                    occ = Occurrence(
-                        inscription_id=insc_id,
-                        site=site_code,
-                        site_full=site_name,
-                        site_raw=str(data.get("site", "") or ""),
-                        period=data.get("context", "UNKNOWN"),
-                        support=data.get("support", "UNKNOWN"),
-                        position=i,
-                        context_before=context_before,
-                        context_after=context_after,
-                        has_logogram=has_logogram,
-                        has_number=has_number,
-                        line_position=line_pos,
-                    )
-                    occurrences.append(occ)
-
-        return occurrences
-
-    def validate_word(self, word: str, proposed_reading: Optional[str] = None) -> ConsistencyReport:
+                hits = found.get(w.upper())
+                if hits is None:
+                    continue
+                if info is None:
+                    info = self._inscription_info(insc_id)
+                hits.append(self._occurrence(insc_id, layout, i, info))
+
+        return {word: list(found[word.upper()]) for word in words}
+
+    def validate_word(
+        self,
+        word: str,
+        proposed_reading: Optional[str] = None,
+        occurrences: Optional[List[Occurrence]] = None,
+    ) -> ConsistencyReport:
         """
         Validate a word's consistency across the corpus.
 
         If a proposed_reading is provided, checks if the reading
         makes sense in all contexts where the word appears.
+        Precomputed ``occurrences`` (from find_occurrences_many) skip the
+        corpus scan.
         """
-        occurrences = self.find_occurrences(word)
-
-        if not occurrences:
-            return ConsistencyReport(
-                word=word,
-                total_occurrences=0,
-                sites_found=[],
-                sites_missing=self.major_sites,
-                periods_found=[],
-                positional_consistency=0.0,
-                contextual_consistency=0.0,
-                functional_consistency=0.0,
-                position_distribution={},
-                context_distribution={},
-                site_distribution={},
-                anomalies=[{"type": "not_found", "message": f"{word} not found in corpus"}],
-                reading_validated=False,
-                reading_issues=["Word not found in corpus"],
-                generated=datetime.now().isoformat(),
-            )
-
-        # Analyze distributions
-        sites_found = sorted(set(o.site for o in occurrences))
-        sites_missing = [s for s in self.major_sites if s not in sites_found]
-        periods_found = sorted(set(o.period for o in occurrences))
-
-        # Position distribution
-        position_dist = Counter(o.line_position for o in occurrences)
-
-        # Context distribution (what follows the word)
-        context_types = []
-        for o in occurrences:
-            if o.has_logogram and o.has_number:
-                context_types.append("logogram+number")
-            elif o.has_logogram:
-                context_types.append("logogram")
-            elif o.has_number:
-                context_types.append("number")
-            else:
-                context_types.append("other")
-        context_dist = Counter(context_types)
-
-        # Site distribution
-        site_dist = Counter(o.site for o in occurrences)
-
-        # Calculate consistency metrics
-        # Position consistency: high if word appears in same position most of the time
-        most_common_pos = position_dist.most_common(1)[0][1] if position_dist else 0
-        positional_consistency = most_common_pos / len(occurrences) if occurrences else 0
-
-        # Context consistency: high if word appears in same context
-        most_common_ctx = context_dist.most_common(1)[0][1] if context_dist else 0
-        contextual_consistency = most_common_ctx / len(occurrences) if occurrences else 0
-
-        # Functional consistency (combination of position + context)
-        functional_consistency = (positional_consistency + contextual_consistency) / 2
-
-        # Detect anomalies
-        anomalies = []
-
-        # Anomaly: appears at only one site when other sites have inscriptions
-        if len(sites_found) == 1 and len(occurrences) > 5:
-            concentration = len(occurrences) / len(self.corpus.get("inscriptions", {}))
-            if concentration > 0.01:  # More than 1% of corpus
-                anomalies.append(
-                    {
-                        "type": "site_concentration",
-                        "message": (
-                            f"{word} appears at only {sites_found[0]} ({len(occurrences)} times)"
-                        ),
-                        "severity": "HIGH" if len(occurrences) > 20 else "MEDIUM",
-                        "implication": "May be site-specific term or regional dialect",
-                    }
-                )
-
-        # Anomaly: inconsistent contexts
-        if len(context_dist) > 2 and max(context_dist.values()) < len(occurrences) * 0.5:
-            anomalies.append(
-                {
-                    "type": "context_inconsistency",
-                    "message": f"{word} appears in varied contexts: {dict(context_dist)}",
-                    "severity": "MEDIUM",
-                    "implication": "May have multiple functions or be a common word",
-                }
-            )
-
-        # Anomaly: appears with and without numbers
-        if "number" in context_dist and "other" in context_dist:
-            num_pct = context_dist.get("number", 0) / len(occurrences)
-            if 0.2 < num_pct < 0.8:
-                anomalies.append(
-                    {
-                        "type": "mixed_numerical_context",
-                        "message": f"{word} followed by number {num_pct * 100:.1f}% of time",
-                        "severity": "LOW",
-                        "implication": "May have both administrative and non-administrative uses",
-                    }
-                )
-
-        # Validate proposed reading
-        reading_validated = True
-        reading_issues = []
-
-        if proposed_reading:
-            reading_lower = proposed_reading.lower()
-
-            # Total/sum reading should appear at totaling positions
-            if "total" in reading_lower or "sum" in reading_lower or "all" in reading_lower:
-                total_positions = position_dist.get("total_position", 0) + position_dist.get(
-                    "end", 0
-                )
-                if total_positions < len(occurrences) * 0.5:
-                    reading_issues.append(
-                        f"Reading '{proposed_reading}' expects"
-                        f" totaling position, but only"
-                        f" {total_positions}/{len(occurrences)}"
-                        f" occurrences are at end/total position"
-                    )
-                    reading_validated = False
-
-            # Deficit reading should have special marking or context
-            if "deficit" in reading_lower or "lacking" in reading_lower:
-                # Check if it co-occurs with KU-RO or similar
-                has_kuro = any(
-                    "KU-RO" in str(o.context_before + o.context_after).upper() for o in occurrences
-                )
-                if not has_kuro and len(occurrences) > 3:
-                    reading_issues.append(
-                        f"Reading '{proposed_reading}' might expect co-occurrence with total term, "
-                        f"but KU-RO not commonly found in context"
-                    )
-
-            # If reading implies commodity, should appear with logograms
-            commodity_terms = ["wine", "oil", "grain", "olive", "fig"]
-            if any(term in reading_lower for term in commodity_terms):
-                log_pct = (
-                    context_dist.get("logogram", 0) + context_dist.get("logogram+number", 0)
-                ) / len(occurrences)
-                if log_pct < 0.3:
-                    reading_issues.append(
-                        f"Reading '{proposed_reading}' implies commodity, but only "
-                        f"{log_pct * 100:.1f}% of occurrences are followed by logograms"
-                    )
-
-        return ConsistencyReport(
-            word=word,
-            total_occurrences=len(occurrences),
-            sites_found=sites_found,
-            sites_missing=sites_missing,
-            periods_found=periods_found,
-            positional_consistency=positional_consistency,
-            contextual_consistency=contextual_consistency,
-            functional_consistency=functional_consistency,
-            position_distribution=dict(position_dist),
-            context_distribution=dict(context_dist),
-            site_distribution=dict(site_dist),
-            anomalies=anomalies,
-            reading_validated=reading_validated,
-            reading_issues=reading_issues,
-            generated=datetime.now().isoformat(),
+        if occurrences is None:
+            occurrences = self.find_occurrences(word)
+        return build_report(
+            word,
+            occurrences,
+            proposed_reading,
+            self.major_sites,
+            len(self.corpus.get("inscriptions", {})),
         )
 
-    def validate_multiple_words(self, min_frequency: int = 5) -> Dict[str, ConsistencyReport]:
-        """Validate all words above frequency threshold."""
+    def validate_multiple_words(
+        self, min_frequency: int = 5, workers: int = 1
+    ) -> Dict[str, ConsistencyReport]:
+        """
+        Validate all words above frequency threshold.
+
+        Occurrences for every word are extracted in one corpus pass; the
+        per-word reports are then built in ``workers`` processes (in this
+        process when workers <= 1).
+        """
         results = {}
 
         # Get word frequencies from statistics
@@ -380,13 +444,34 @@ class CorpusConsistencyValidator:
 
         self.log(f"Validating {len(words_to_check)} words with frequency >= {min_frequency}")
 
-        for word in words_to_check:
-            report = self.validate_word(word)
+        started = time.perf_counter()
+        occurrences = self.find_occurrences_many(words_to_check)
+        scanned = time.perf_counter()
+
+        args = (
+            words_to_check,
+            [occurrences[word] for word in words_to_check],
+            repeat(None),
+            repeat(self.major_sites),
+            repeat(len(self.corpus.get("inscriptions", {}))),
+        )
+        if workers > 1 and len(words_to_check) > 1:
+            chunksize = max(1, len(words_to_check) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                reports = list(pool.map(build_report, *args, chunksize=chunksize))
+        else:
+            reports = list(map(build_report, *args))
+
+        for word, report in zip(words_to_check, reports):
             results[word] = report
 
             if report.anomalies:
                 self.log(f"{word}: {len(report.anomalies)} anomalies detected")
 
+        self.log(
+            f"Occurrence scan {(scanned - started) * 1000:.0f} ms, "
+            f"reports {(time.perf_counter() - scanned) * 1000:.0f} ms ({max(workers, 1)} workers)"
+        )
         return results
 
     def save_results(self, results: Dict[str, ConsistencyReport], output_path: Path = None):
@@ -469,6 +554,12 @@ def main():
         default=5,
         help="Minimum frequency for --all mode (default: 5)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for --all report building (default: 1)",
+    )
     parser.add_argument("--output", "-o", type=str, help="Output file for results")
     parser.add_argument("--verbose", "-v", action="store_true", help="Show detailed output")
 
@@ -492,7 +583,9 @@ def main():
             validator.save_results({args.word: report}, Path(args.output))
 
     elif args.all:
-        results = validator.validate_multiple_words(min_frequency=args.min_freq)
+        results = validator.validate_multiple_words(
+            min_frequency=args.min_freq, workers=args.workers
+        )
 
         # Print summary
         print(f"\nValidated {len(results)} words")
@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+Shared compiled corpus layout for corpus-facing tools.
+
+Each inscription's ``transliteratedWords`` list is compiled once into
+parallel per-position arrays, so line and adjacency questions become
+array reads instead of rescans from position 0:
+
+- line number (1-based) and index within the line
+- line-initial / line-final flags
+- offset to the next logogram and the next numeral on the same line
+
+On demand it also builds postings (word, sign and logogram -> positions)
+and inscription-level bitsets (Python ints keyed by inscription ordinal) for
+sites, periods, signs, logograms and words, so query planners can intersect
+the most selective sets before touching any tokens.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sign_registry import SignRegistry
+from site_normalization import extract_site_code
+
+
+CONTRACT_VERSION = "2026-10-19.v1"
+
+LINE_BREAK = "\n"
+
+# Adjacency classification (historically inlined in corpus_lookup.py).
+# Numerals are tested first so bare digits are never reported as logograms;
+# hyphen-free upper-case tokens are logograms unless the sign registry knows
+# them as a syllabogram (single-sign words such as A or TE).
+LOGOGRAM_TOKEN_RE = re.compile(r"^[A-Z*\d+\[\]]+$")
+NUMERAL_TOKEN_RE = re.compile(r"^[\d\s.¹²³⁴⁵⁶⁷⁸⁹⁰/₀₁₂₃₄₅₆₇₈○◎—|≈]+$")
+
+KIND_EMPTY = 0
+KIND_LINE_BREAK = 1
+KIND_WORD = 2
+KIND_LOGOGRAM = 3
+KIND_NUMERAL = 4
+
+# Offset value meaning "no such element later on this line".
+NO_OFFSET = -1
+
+# Adjacency window used by corpus_lookup.py (tokens after the target).
+DEFAULT_ADJACENCY_WINDOW = 2
+
+SUBSCRIPT_RE = re.compile(r"[₀₁₂₃₄₅₆₇₈₉]")
+
+UNICODE_FRACTIONS = {
+    "½": 0.5,
+    "¼": 0.25,
+    "¾": 0.75,
+    "⅓": 1 / 3,
+    "⅔": 2 / 3,
+    "⅛": 0.125,
+    "⅜": 0.375,
+}
+
+
+@lru_cache(maxsize=1)
+def _sign_registry() -> SignRegistry:
+    return SignRegistry.from_reference()
+
+
+def is_syllabogram(token: str) -> bool:
+    """True if the registry lists ``token`` as the phonetic value of a syllabogram."""
+    registry = _sign_registry()
+    ab = registry.ab_for_value(token)
+    return ab is not None and registry.signs[ab].get("sign_type") == "syllabogram"
+
+
+def classify_token(token: Any) -> int:
+    """Return the KIND_* code for a raw corpus token."""
+    if token == LINE_BREAK:
+        return KIND_LINE_BREAK
+    if not token or not isinstance(token, str):
+        return KIND_EMPTY
+    if NUMERAL_TOKEN_RE.match(token):
+        return KIND_NUMERAL
+    if "-" not in token and LOGOGRAM_TOKEN_RE.match(token) and not is_syllabogram(token):
+        return KIND_LOGOGRAM
+    return KIND_WORD
+
+
+def normalize_sign(sign: str) -> str:
+    """Uppercase a syllabogram and drop subscript digits (RA₂ -> RA)."""
+    return SUBSCRIPT_RE.sub("", sign).upper()
+
+
+def split_signs(token: str) -> List[str]:
+    """Normalized signs of a word token (empty parts dropped; one sign if unhyphenated)."""
+    return [sign for sign in (normalize_sign(part) for part in token.split("-")) if sign]
+
+
+def logogram_base(token: str) -> str:
+    """Base logogram of a ligature (OLE+KI -> OLE)."""
+    return token.split("+")[0].upper()
+
+
+def numeral_value(token: str) -> Optional[float]:
+    """Best-effort numeric value of a numeral token, or None if not countable."""
+    text = token.strip()
+    if not text:
+        return None
+    if text.isdigit():
+        return float(int(text))
+    if text in UNICODE_FRACTIONS:
+        return UNICODE_FRACTIONS[text]
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def bit_ordinals(bits: int) -> Iterator[int]:
+    """Yield the set bit positions of a Python int bitset in ascending order."""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+def _empty_adjacent() -> dict:
+    return {
+        "preceding_logogram": None,
+        "following_logogram": None,
+        "following_numeral": None,
+        "line_number": 0,
+    }
+
+
+@dataclass
+class InscriptionLayout:
+    """Parallel per-position arrays for one inscription."""
+
+    inscription_id: str
+    tokens: List[str]
+    kinds: List[int]
+    line_number: List[int]
+    line_index: List[int]
+    line_initial: List[bool]
+    line_final: List[bool]
+    next_logogram: List[int]  # offset to next logogram on the line, or NO_OFFSET
+    next_numeral: List[int]  # offset to next numeral on the line, or NO_OFFSET
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    @property
+    def line_count(self) -> int:
+        return self.line_number[-1] if self.line_number else 0
+
+    def lines(self) -> List[List[str]]:
+        """Return non-empty lines as token lists (line breaks removed)."""
+        lines: List[List[str]] = []
+        current: List[str] = []
+        for token, kind in zip(self.tokens, self.kinds):
+            if kind == KIND_LINE_BREAK:
+                if current:
+                    lines.append(current)
+                current = []
+            else:
+                current.append(token)
+        if current:
+            lines.append(current)
+        return lines
+
+    def following_logogram(
+        self, position: int, window: int = DEFAULT_ADJACENCY_WINDOW
+    ) -> Optional[str]:
+        """Logogram within ``window`` tokens after ``position`` on the same line."""
+        offset = self.next_logogram[position]
+        if offset == NO_OFFSET or offset > window:
+            return None
+        return self.tokens[position + offset]
+
+    def following_numeral(
+        self, position: int, window: int = DEFAULT_ADJACENCY_WINDOW
+    ) -> Optional[str]:
+        """Numeral within ``window`` tokens after ``position`` on the same line."""
+        offset = self.next_numeral[position]
+        if offset == NO_OFFSET or offset > window:
+            return None
+        return self.tokens[position + offset]
+
+    def preceding_logogram(self, position: int) -> Optional[str]:
+        """Logogram immediately before ``position``, if any."""
+        if position > 0 and self.kinds[position - 1] == KIND_LOGOGRAM:
+            return self.tokens[position - 1]
+        return None
+
+    def adjacent(self, position: int, window: int = DEFAULT_ADJACENCY_WINDOW) -> dict:
+        """Adjacent-element summary in the corpus_lookup.py result shape."""
+        if not 0 <= position < len(self.tokens):
+            return _empty_adjacent()
+        return {
+            "preceding_logogram": self.preceding_logogram(position),
+            "following_logogram": self.following_logogram(position, window),
+            "following_numeral": self.following_numeral(position, window),
+            "line_number": self.line_number[position],
+        }
+
+
+def compile_inscription(inscription_id: str, words: List[Any]) -> InscriptionLayout:
+    """Compile one inscription's token list into an InscriptionLayout."""
+    tokens = [w if isinstance(w, str) else ("" if w is None else str(w)) for w in words]
+    n = len(tokens)
+    kinds = [classify_token(t) for t in tokens]
+
+    line_number = [0] * n
+    line_index = [0] * n
+    line_initial = [False] * n
+    line_final = [False] * n
+
+    line = 1
+    idx_in_line = 0
+    for i, kind in enumerate(kinds):
+        line_number[i] = line
+        if kind == KIND_LINE_BREAK:
+            line += 1
+            idx_in_line = 0
+            continue
+        line_index[i] = idx_in_line
+        idx_in_line += 1
+        line_initial[i] = i == 0 or kinds[i - 1] == KIND_LINE_BREAK
+        line_final[i] = i == n - 1 or kinds[i + 1] == KIND_LINE_BREAK
+
+    # Reverse sweep: nearest logogram/numeral strictly after i on the same line.
+    next_logogram = [NO_OFFSET] * n
+    next_numeral = [NO_OFFSET] * n
+    last_logogram = -1
+    last_numeral = -1
+    for i in range(n - 1, -1, -1):
+        kind = kinds[i]
+        if kind == KIND_LINE_BREAK:
+            last_logogram = -1
+            last_numeral = -1
+            continue
+        if last_logogram >= 0:
+            next_logogram[i] = last_logogram - i
+        if last_numeral >= 0:
+            next_numeral[i] = last_numeral - i
+        if kind == KIND_LOGOGRAM:
+            last_logogram = i
+        elif kind == KIND_NUMERAL:
+            last_numeral = i
+
+    return InscriptionLayout(
+        inscription_id=inscription_id,
+        tokens=tokens,
+        kinds=kinds,
+        line_number=line_number,
+        line_index=line_index,
+        line_initial=line_initial,
+        line_final=line_final,
+        next_logogram=next_logogram,
+        next_numeral=next_numeral,
+    )
+
+
+class CompiledCorpus:
+    """
+    Per-inscription layouts plus the metadata corpus tools filter on.
+
+    Layouts may be supplied compiled or as raw token lists (``sources``);
+    raw inscriptions are compiled on first access, so a loader that only
+    needs a few inscriptions never pays for the rest.  Deferred compilation
+    is locked, so threads sharing one corpus never see a half-moved entry.
+    """
+
+    def __init__(
+        self,
+        layouts: Dict[str, InscriptionLayout],
+        metadata: Dict[str, dict],
+        sources: Optional[Dict[str, List[Any]]] = None,
+    ):
+        self._layouts = layouts
+        self._sources = dict(sources or {})
+        self._compile_lock = threading.RLock()
+        self.metadata = metadata
+        self.inscription_ids = list(metadata)
+        self.ordinals = {insc_id: i for i, insc_id in enumerate(self.inscription_ids)}
+        self._postings: Optional["CorpusPostings"] = None
+
+    @staticmethod
+    def inscription_metadata(insc_id: str, data: Dict[str, Any]) -> dict:
+        return {
+            "site": data.get("site", ""),
+            "period": data.get("context", ""),
+            "support": data.get("support", ""),
+            "site_code": extract_site_code(insc_id),
+            "parse_error": "_parse_error" in data,
+        }
+
+    @classmethod
+    def from_corpus(cls, corpus: Dict[str, Any], lazy: bool = False) -> "CompiledCorpus":
+        """Compile a loaded corpus.json payload (deferred per inscription if lazy)."""
+        metadata: Dict[str, dict] = {}
+        sources: Dict[str, List[Any]] = {}
+        for insc_id, data in corpus.get("inscriptions", {}).items():
+            metadata[insc_id] = cls.inscription_metadata(insc_id, data)
+            sources[insc_id] = data.get("transliteratedWords", [])
+        compiled = cls({}, metadata, sources)
+        if not lazy:
+            compiled.ensure_layouts()
+        return compiled
+
+    @property
+    def layouts(self) -> Dict[str, InscriptionLayout]:
+        """All layouts in corpus order (compiles any deferred inscriptions)."""
+        return self.ensure_layouts()
+
+    def ensure_layouts(self) -> Dict[str, InscriptionLayout]:
+        """Compile every deferred inscription now and return the layouts in corpus order."""
+        if self._sources or len(self._layouts) != len(self.inscription_ids):
+            with self._compile_lock:
+                layouts = {insc_id: self.layout(insc_id) for insc_id in self.inscription_ids}
+                self._layouts = layouts
+        return self._layouts
+
+    def __len__(self) -> int:
+        return len(self.inscription_ids)
+
+    def __contains__(self, inscription_id: str) -> bool:
+        return inscription_id in self.metadata
+
+    def layout(self, inscription_id: str) -> Optional[InscriptionLayout]:
+        layout = self._layouts.get(inscription_id)
+        if layout is None and inscription_id in self.metadata:
+            with self._compile_lock:
+                layout = self._layouts.get(inscription_id)
+                if layout is None and inscription_id in self._sources:
+                    # Store before dropping the source: the id is never in neither dict
+                    layout = compile_inscription(inscription_id, self._sources[inscription_id])
+                    self._layouts[inscription_id] = layout
+                    del self._sources[inscription_id]
+        return layout
+
+    def items(self, include_errors: bool = False) -> Iterator[Tuple[str, InscriptionLayout]]:
+        """Iterate (inscription_id, layout), skipping parse errors by default."""
+        for insc_id in self.inscription_ids:
+            if not include_errors and self.metadata[insc_id]["parse_error"]:
+                continue
+            yield insc_id, self.layout(insc_id)
+
+    def adjacent(self, inscription_id: str, position: int) -> dict:
+        """Adjacent-element summary for one token position."""
+        layout = self.layout(inscription_id)
+        if layout is None:
+            return _empty_adjacent()
+        return layout.adjacent(position)
+
+    @property
+    def postings(self) -> "CorpusPostings":
+        """Word/sign/logogram postings and bitsets, built on first access."""
+        if self._postings is None:
+            self._postings = CorpusPostings.build(self)
+        return self._postings
+
+
+class CorpusPostings:
+    """
+    Inverted indexes over a CompiledCorpus.
+
+    Postings are lists of tuples that start with the inscription ordinal and
+    token position; bitsets set bit ``ordinal`` for every inscription that
+    contains the key. Parse-error inscriptions are never indexed.
+    """
+
+    def __init__(self, inscription_count: int):
+        self.inscription_count = inscription_count
+        self.all_bits = 0
+        self.word_postings: Dict[str, List[Tuple[int, int]]] = {}
+        self.sign_postings: Dict[str, List[Tuple[int, int, int]]] = {}
+        self.logogram_postings: Dict[str, List[Tuple[int, int]]] = {}
+        self.word_bits: Dict[str, int] = {}
+        self.sign_bits: Dict[str, int] = {}
+        self.logogram_bits: Dict[str, int] = {}
+        self.site_bits: Dict[str, int] = {}
+        self.period_bits: Dict[str, int] = {}
+
+    @classmethod
+    def build(cls, compiled: CompiledCorpus) -> "CorpusPostings":
+        postings = cls(len(compiled.inscription_ids))
+        for insc_id, layout in compiled.items():
+            ordinal = compiled.ordinals[insc_id]
+            bit = 1 << ordinal
+            meta = compiled.metadata[insc_id]
+            postings.all_bits |= bit
+            postings._set_bit(postings.site_bits, meta["site_code"], bit)
+            postings._set_bit(postings.period_bits, meta["period"], bit)
+
+            for pos, (token, kind) in enumerate(zip(layout.tokens, layout.kinds)):
+                if kind == KIND_WORD:
+                    word = token.upper()
+                    postings.word_postings.setdefault(word, []).append((ordinal, pos))
+                    postings._set_bit(postings.word_bits, word, bit)
+                    for sign_idx, sign in enumerate(split_signs(token)):
+                        postings.sign_postings.setdefault(sign, []).append((ordinal, pos, sign_idx))
+                        postings._set_bit(postings.sign_bits, sign, bit)
+                elif kind == KIND_LOGOGRAM:
+                    base = logogram_base(token)
+                    postings.logogram_postings.setdefault(base, []).append((ordinal, pos))
+                    postings._set_bit(postings.logogram_bits, base, bit)
+        return postings
+
+    @staticmethod
+    def _set_bit(table: Dict[str, int], key: str, bit: int) -> None:
+        if key:
+            table[key] = table.get(key, 0) | bit
+
+    def sites_mask(self, site_codes: Iterable[str]) -> int:
+        """Bitset of inscriptions whose site code starts with any given code."""
+        wanted = [code.upper() for code in site_codes]
+        mask = 0
+        for code, bits in self.site_bits.items():
+            if any(code.startswith(w) for w in wanted):
+                mask |= bits
+        return mask
+
+    def periods_mask(self, periods: Iterable[str]) -> int:
+        mask = 0
+        for period in periods:
+            mask |= self.period_bits.get(period, 0)
+        return mask
+
+
+def compile_corpus(corpus: Dict[str, Any], lazy: bool = False) -> CompiledCorpus:
+    """Convenience wrapper for CompiledCorpus.from_corpus."""
+    return CompiledCorpus.from_corpus(corpus, lazy=lazy)
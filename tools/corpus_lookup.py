@@ -29,6 +29,17 @@ Options:
     --period PERIOD   Filter by chronological period (e.g., LMIB)
     --output, -o FILE Write results to JSON file
     --verbose, -v     Show detailed output
+    --batch FILE      Run many queries from a JSONL file ("-" for stdin)
+    --workers N       Thread pool size for --batch (default: 4)
+
+Batch mode:
+    Each input line is a JSON object with a "type" (exact, wildcard, regex,
+    sign, verify, report) and a "pattern"; optional keys are "id", "site",
+    "period" and "context". The corpus and index are loaded once and one
+    JSON result per query is streamed in input order:
+
+    python tools/corpus_lookup.py --batch queries.jsonl --output results.jsonl
+    echo '{"type": "verify", "pattern": "KU-RO"}' | python tools/corpus_lookup.py --batch -
 
 Attribution:
     Part of Linear A Decipherment Project
@@ -40,14 +51,62 @@ import argparse
 import sys
 import re
 import fnmatch
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
 from pathlib import Path
 from collections import defaultdict
-from typing import List
+from collections.abc import Mapping
+from typing import Callable, Iterable, Iterator, List, Optional
+
+import corpus_index
+from corpus_index import CompiledCorpus, compile_corpus
+from index_snapshot import SnapshotError, file_fingerprint, is_fresh, read_snapshot
+from index_snapshot import StringTable, write_snapshot
 
 
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
+CORPUS_FILE = DATA_DIR / "corpus.json"
+# Derived index snapshot; rebuilt automatically when corpus.json changes.
+SNAPSHOT_FILE = DATA_DIR / "cache" / "corpus_lookup.idx"
+# Bump when the word/sign index layout or its entry fields change.
+SNAPSHOT_FORMAT = 1
+
+PARSE_ERROR_FLAG = 1
+
+BATCH_QUERY_TYPES = ("exact", "wildcard", "regex", "sign", "verify", "report")
+DEFAULT_BATCH_WORKERS = 4
+
+
+class _LazyPostings(Mapping):
+    """Read-only word/sign index backed by snapshot arrays.
+
+    Entry lists are materialized on first access to a key, so a cold start
+    only decodes the key table.
+    """
+
+    def __init__(self, keys: List[str], build: Callable[[int], List[dict]]):
+        self._slots = {key: slot for slot, key in enumerate(keys)}
+        self._build = build
+        self._cache = {}
+
+    def __getitem__(self, key):
+        entries = self._cache.get(key)
+        if entries is None:
+            entries = self._build(self._slots[key])
+            self._cache[key] = entries
+        return entries
+
+    def __contains__(self, key):
+        return key in self._slots
+
+    def __iter__(self):
+        return iter(self._slots)
+
+    def __len__(self):
+        return len(self._slots)
 
 
 class CorpusLookup:
@@ -65,7 +124,9 @@ class CorpusLookup:
     def __init__(self, verbose=False):
         self.verbose = verbose
         self.corpus = None
+        self.compiled = None  # corpus_index.CompiledCorpus
         self.word_index = {}  # word -> [(inscription_id, position, context)]
+        self.word_index_upper = {}  # WORD -> [word spellings in word_index]
         self.sign_index = {}  # sign -> [(inscription_id, position)]
 
     def log(self, message: str):
@@ -73,20 +134,190 @@ class CorpusLookup:
         if self.verbose:
             print(f"  {message}")
 
-    def load_corpus(self) -> bool:
-        """Load and index corpus data."""
+    def load_corpus(
+        self,
+        corpus_path: Optional[Path] = None,
+        snapshot_path: Optional[Path] = SNAPSHOT_FILE,
+    ) -> bool:
+        """Load and index corpus data.
+
+        With a snapshot path, a snapshot matching the corpus fingerprint is
+        mapped instead of re-parsing corpus.json; a missing or stale one is
+        rebuilt from the corpus and rewritten. Pass ``snapshot_path=None``
+        to always index from JSON.
+        """
+        corpus_path = Path(corpus_path or CORPUS_FILE)
+        if snapshot_path is not None and self.load_snapshot(snapshot_path, corpus_path):
+            return True
         try:
-            corpus_path = DATA_DIR / "corpus.json"
             with open(corpus_path, "r", encoding="utf-8") as f:
                 self.corpus = json.load(f)
 
+            self.compiled = compile_corpus(self.corpus, lazy=True)
+            self.word_index, self.word_index_upper, self.sign_index = {}, {}, {}
             self._build_index()
-            return True
-
         except Exception as e:
             print(f"Error loading corpus: {e}")
             return False
 
+        if snapshot_path is not None:
+            try:
+                self.save_snapshot(snapshot_path, corpus_path)
+                self.log(f"Wrote index snapshot: {snapshot_path}")
+            except (OSError, ValueError) as e:
+                self.log(f"Could not write index snapshot: {e}")
+        return True
+
+    @staticmethod
+    def _snapshot_expectations() -> dict:
+        return {
+            "snapshot_format": SNAPSHOT_FORMAT,
+            "corpus_index_contract": corpus_index.CONTRACT_VERSION,
+        }
+
+    def save_snapshot(self, snapshot_path: Path, corpus_path: Path) -> None:
+        """Serialize the corpus tokens and word/sign indexes for fast reloads."""
+        strings = StringTable()
+        inscriptions = self.corpus["inscriptions"]
+        ordinals = {}
+        columns = {
+            name: array("i")
+            for name in ("insc_id", "insc_site", "insc_period", "insc_support", "insc_site_code")
+        }
+        insc_flags = array("i")
+        token_offsets = array("i", [0])
+        tokens = array("i")
+        for ordinal, (insc_id, data) in enumerate(inscriptions.items()):
+            ordinals[insc_id] = ordinal
+            columns["insc_id"].append(strings.intern(insc_id))
+            columns["insc_site"].append(strings.intern(data.get("site", "")))
+            columns["insc_period"].append(strings.intern(data.get("context", "")))
+            columns["insc_support"].append(strings.intern(data.get("support", "")))
+            columns["insc_site_code"].append(strings.intern(self._extract_site_code(insc_id)))
+            insc_flags.append(PARSE_ERROR_FLAG if "_parse_error" in data else 0)
+            tokens.extend(
+                strings.intern(word or "") for word in data.get("transliteratedWords", [])
+            )
+            token_offsets.append(len(tokens))
+
+        def postings(index, fields):
+            keys, offsets = array("i"), array("i", [0])
+            cols = {field: array("i") for field in fields}
+            for key, entries in index.items():
+                keys.append(strings.intern(key))
+                for entry in entries:
+                    cols["insc"].append(ordinals[entry["inscription"]])
+                    cols["pos"].append(entry["position"])
+                    if "word" in cols:
+                        cols["word"].append(strings.intern(entry["word"]))
+                offsets.append(len(cols["pos"]))
+            return keys, offsets, cols
+
+        word_keys, word_offsets, word_cols = postings(self.word_index, ("insc", "pos"))
+        sign_keys, sign_offsets, sign_cols = postings(self.sign_index, ("insc", "pos", "word"))
+
+        arrays = dict(columns)
+        arrays.update(
+            insc_flags=insc_flags,
+            token_offsets=token_offsets,
+            tokens=tokens,
+            word_keys=word_keys,
+            word_offsets=word_offsets,
+            word_insc=word_cols["insc"],
+            word_pos=word_cols["pos"],
+            sign_keys=sign_keys,
+            sign_offsets=sign_offsets,
+            sign_insc=sign_cols["insc"],
+            sign_pos=sign_cols["pos"],
+            sign_word=sign_cols["word"],
+        )
+        meta = dict(self._snapshot_expectations(), source=file_fingerprint(corpus_path))
+        write_snapshot(snapshot_path, meta, strings.strings, arrays)
+
+    def load_snapshot(self, snapshot_path: Path, corpus_path: Optional[Path] = None) -> bool:
+        """Map a fresh index snapshot; returns False if missing or stale."""
+        corpus_path = Path(corpus_path or CORPUS_FILE)
+        try:
+            snap = read_snapshot(snapshot_path)
+        except SnapshotError as e:
+            self.log(str(e))
+            return False
+        if not is_fresh(snap.meta, corpus_path, self._snapshot_expectations()):
+            self.log(f"Index snapshot is stale, rebuilding: {snapshot_path}")
+            return False
+
+        strings = snap.strings
+        ids = snap.text("insc_id")
+        sites = snap.text("insc_site")
+        periods = snap.text("insc_period")
+        supports = snap.text("insc_support")
+        site_codes = snap.text("insc_site_code")
+        flags = snap["insc_flags"]
+        offsets = snap["token_offsets"]
+        tokens = snap.text("tokens")
+
+        inscriptions = {}
+        for ordinal, insc_id in enumerate(ids):
+            data = {
+                "site": sites[ordinal],
+                "context": periods[ordinal],
+                "support": supports[ordinal],
+            }
+            if flags[ordinal] & PARSE_ERROR_FLAG:
+                data["_parse_error"] = "snapshot"
+            else:
+                data["transliteratedWords"] = tokens[offsets[ordinal] : offsets[ordinal + 1]]
+            inscriptions[insc_id] = data
+        self.corpus = {"inscriptions": inscriptions}
+        self.compiled = CompiledCorpus(
+            {},
+            {i: CompiledCorpus.inscription_metadata(i, d) for i, d in inscriptions.items()},
+            {i: d.get("transliteratedWords", []) for i, d in inscriptions.items()},
+        )
+
+        word_offsets, word_insc, word_pos = (
+            snap["word_offsets"],
+            snap["word_insc"],
+            snap["word_pos"],
+        )
+
+        def word_entries(slot: int) -> List[dict]:
+            lo, hi = word_offsets[slot], word_offsets[slot + 1]
+            return [
+                {
+                    "inscription": ids[o],
+                    "position": p,
+                    "site": sites[o],
+                    "site_code": site_codes[o],
+                    "period": periods[o],
+                    "support": supports[o],
+                }
+                for o, p in zip(word_insc[lo:hi], word_pos[lo:hi])
+            ]
+
+        sign_offsets, sign_insc = snap["sign_offsets"], snap["sign_insc"]
+        sign_pos, sign_word = snap["sign_pos"], snap["sign_word"]
+
+        def sign_entries(slot: int) -> List[dict]:
+            lo, hi = sign_offsets[slot], sign_offsets[slot + 1]
+            return [
+                {"inscription": ids[o], "position": p, "word": strings[w]}
+                for o, p, w in zip(sign_insc[lo:hi], sign_pos[lo:hi], sign_word[lo:hi])
+            ]
+
+        word_keys = snap.text("word_keys")
+        self.word_index = _LazyPostings(word_keys, word_entries)
+        self.sign_index = _LazyPostings(snap.text("sign_keys"), sign_entries)
+        self.word_index_upper = {}
+        for word in word_keys:
+            self.word_index_upper.setdefault(word.upper(), []).append(word)
+
+        print(
+            f"Loaded index snapshot: {len(self.word_index)} unique words, "
+            f"{len(self.sign_index)} unique signs"
+        )
+        return True
+
     def _build_index(self):
         """Build search indexes for fast lookup."""
         print("Building search index...")
@@ -104,6 +335,7 @@ class CorpusLookup:
                 # Index the word
                 if word not in self.word_index:
                     self.word_index[word] = []
+                    self.word_index_upper.setdefault(word.upper(), []).append(word)
 
                 self.word_index[word].append(
                     {
@@ -166,45 +398,12 @@ class CorpusLookup:
         }
 
     def _identify_adjacent_elements(self, inscription_id: str, position: int) -> dict:
-        """Identify logograms, numerals, and other elements near the word."""
-        data = self.corpus["inscriptions"].get(inscription_id, {})
-        words = data.get("transliteratedWords", [])
-
-        result = {
-            "preceding_logogram": None,
-            "following_logogram": None,
-            "following_numeral": None,
-            "line_number": 0,
-        }
+        """Identify logograms, numerals, and line number near the word.
 
-        # Count newlines to determine line number
-        line_num = 1
-        for i in range(position):
-            if i < len(words) and words[i] == "\n":
-                line_num += 1
-        result["line_number"] = line_num
-
-        # Check preceding word
-        if position > 0:
-            prev = words[position - 1] if position - 1 < len(words) else ""
-            if prev and re.match(r"^[A-Z*\d+\[\]]+$", prev) and "-" not in prev:
-                result["preceding_logogram"] = prev
-
-        # Check following words
-        for i in range(position + 1, min(position + 3, len(words))):
-            w = words[i] if i < len(words) else ""
-            if w == "\n":
-                break
-            # Check if logogram
-            if w and re.match(r"^[A-Z*\d+\[\]]+$", w) and "-" not in w:
-                if not result["following_logogram"]:
-                    result["following_logogram"] = w
-            # Check if numeral
-            if w and re.match(r"^[\d\s.¹²³⁴⁵⁶⁷⁸⁹⁰/₀₁₂₃₄₅₆₇₈○◎—|≈]+$", w):
-                if not result["following_numeral"]:
-                    result["following_numeral"] = w
-
-        return result
+        Reads the precomputed per-position arrays from corpus_index, so the
+        cost is constant regardless of where the word sits in the inscription.
+        """
+        return self.compiled.adjacent(inscription_id, position)
 
     def search_exact(
         self, query: str, site_filter: str = None, period_filter: str = None, context_size: int = 0
@@ -215,9 +414,8 @@ class CorpusLookup:
         # Case-insensitive search: normalize query and search all matching keys
         query_upper = query.upper()
         matches = []
-        for indexed_word, entries in self.word_index.items():
-            if indexed_word.upper() == query_upper:
-                matches.extend(entries)
+        for indexed_word in self.word_index_upper.get(query_upper, []):
+            matches.extend(self.word_index[indexed_word])
 
         for match in matches:
             # Apply filters
@@ -443,6 +641,153 @@ class CorpusLookup:
 
         return "\n".join(report)
 
+    def run_query(self, query: dict) -> dict:
+        """
+        Execute one batch query record.
+
+        Returns a JSON-serializable dict; malformed queries produce an
+        "error" key instead of raising, so one bad line does not stop a sweep.
+        """
+        query_type = query.get("type", "exact")
+        pattern = query.get("pattern")
+        record = {"id": query.get("id"), "type": query_type, "pattern": pattern}
+
+        if "error" in query:
+            record["error"] = query["error"]
+            return record
+        if query_type not in BATCH_QUERY_TYPES:
+            record["error"] = f"Unknown query type: {query_type}"
+            return record
+        if not pattern or not isinstance(pattern, str):
+            record["error"] = "Missing pattern"
+            return record
+
+        site = query.get("site")
+        period = query.get("period")
+        context_size = query.get("context", 2)
+        for key, value in (("site", site), ("period", period)):
+            if value is not None and not isinstance(value, str):
+                record["error"] = f"Invalid {key}: expected a string"
+                return record
+        if isinstance(context_size, bool) or not isinstance(context_size, int) or context_size < 0:
+            record["error"] = f"Invalid context: expected a non-negative integer ({context_size!r})"
+            return record
+
+        if query_type == "verify":
+            record["verification"] = self.verify_reading_consistency(pattern)
+            return record
+        if query_type == "report":
+            record["report"] = self.generate_attestation_report(pattern)
+            return record
+
+        if query_type == "regex":
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                record["error"] = f"Invalid regex pattern: {e}"
+                return record
+            results = self.search_regex(pattern, site, period, context_size)
+        elif query_type == "wildcard":
+            results = self.search_wildcard(pattern, site, period, context_size)
+        elif query_type == "sign":
+            results = self.search_sign(pattern, site, period)
+        else:
+            results = self.search_exact(pattern, site, period, context_size)
+
+        record["total_results"] = len(results)
+        record["results"] = results
+        return record
+
+    def run_batch(
+        self, queries: Iterable[dict], workers: int = DEFAULT_BATCH_WORKERS
+    ) -> Iterator[dict]:
+        """
+        Run many queries against the already-built index.
+
+        Queries are independent and read-only, so they are dispatched to a
+        thread pool; results are yielded in input order as they complete.
+        """
+        if workers <= 1:
+            for query in queries:
+                yield self._run_query_safely(query)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(self._run_query_safely, queries)
+
+    def _run_query_safely(self, query: dict) -> dict:
+        """run_query, with any unexpected failure turned into an error record."""
+        try:
+            return self.run_query(query)
+        except Exception as e:  # noqa: BLE001 - one bad query must not abort the sweep
+            return {
+                "id": query.get("id"),
+                "type": query.get("type", "exact"),
+                "pattern": query.get("pattern"),
+                "error": f"{type(e).__name__}: {e}",
+            }
+
+
+def read_batch_queries(path: str) -> List[dict]:
+    """Read JSONL queries from a file path or "-" for stdin.
+
+    Blank lines are skipped; lines that are not JSON objects are kept as
+    error records so the output stays aligned with the input.
+    """
+    handle = sys.stdin if path == "-" else open(path, "r", encoding="utf-8")
+    queries = []
+    try:
+        for line_no, line in enumerate(handle, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                query = json.loads(line)
+            except json.JSONDecodeError as e:
+                query = {"id": line_no, "error": f"Invalid JSON: {e}"}
+            if not isinstance(query, dict):
+                query = {"id": line_no, "error": "Query must be a JSON object"}
+            query.setdefault("id", line_no)
+            queries.append(query)
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+    return queries
+
+
+def snapshot_path(args) -> Optional[Path]:
+    """Snapshot location for CLI runs (None disables the snapshot)."""
+    return None if args.no_snapshot else SNAPSHOT_FILE
+
+
+def run_batch_mode(args) -> int:
+    """Handle --batch: load once, stream JSONL results."""
+    try:
+        queries = read_batch_queries(args.batch)
+    except OSError as e:
+        print(f"Error reading batch file: {e}", file=sys.stderr)
+        return 1
+
+    lookup = CorpusLookup(verbose=args.verbose)
+    # Keep stdout clean for JSONL: loader progress goes to stderr.
+    with redirect_stdout(sys.stderr):
+        if not lookup.load_corpus(snapshot_path=snapshot_path(args)):
+            return 1
+
+    output_path = PROJECT_ROOT / args.output if args.output else None
+    out = open(output_path, "w", encoding="utf-8") if output_path else sys.stdout
+    try:
+        for record in lookup.run_batch(queries, workers=args.workers):
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    if output_path:
+        print(f"Wrote {len(queries)} batch results to: {output_path}", file=sys.stderr)
+    return 0
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -474,16 +819,33 @@ def main():
     )
     parser.add_argument("--output", "-o", type=str, help="Write results to JSON file")
     parser.add_argument("--verbose", "-v", action="store_true", help="Show detailed output")
+    parser.add_argument(
+        "--batch", type=str, help='Run JSONL queries from FILE ("-" for stdin), emit JSONL'
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_BATCH_WORKERS,
+        help=f"Thread pool size for --batch (default: {DEFAULT_BATCH_WORKERS})",
+    )
+    parser.add_argument(
+        "--no-snapshot",
+        action="store_true",
+        help="Index corpus.json directly; do not read or write the index snapshot",
+    )
 
     args = parser.parse_args()
 
+    if args.batch:
+        return run_batch_mode(args)
+
     if not args.pattern:
         parser.print_help()
         return 0
 
     lookup = CorpusLookup(verbose=args.verbose)
 
-    if not lookup.load_corpus():
+    if not lookup.load_corpus(snapshot_path=snapshot_path(args)):
         return 1
 
     # Perform search
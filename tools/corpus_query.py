@@ -0,0 +1,1073 @@
+#!/usr/bin/env python3
+"""
+Linear A Structural Corpus Query Engine
+
+Constraint search over the compiled token stream (corpus_index.py):
+- Sign sequences inside a word or, optionally, across adjacent words
+- Following logogram within N tokens (ligatures match on their base)
+- Numeral after the logogram (or the sequence) with min/max value
+- Line-initial / line-final anchoring, whole-word matching
+- Site and period filters
+
+A planner intersects inscription-level bitsets (sign, logogram, site,
+period) in order of selectivity, then drives verification from the
+rarest sign's posting list, so only plausible positions are inspected.
+
+Declarative pattern queries (--query, or the Query builder in Python)
+match one content token per element, capture slots, filter by numeric
+predicates and aggregate with GROUP BY / SUM. Word and logogram elements
+with literal values are pushed down to postings the same way.
+
+Usage:
+    python tools/corpus_query.py --signs SI-RU [constraints]
+    python tools/corpus_query.py --query "FIND ... [WHERE ...] [GROUP BY ...]"
+
+Examples:
+    python tools/corpus_query.py --signs KU-RO --line-initial
+    python tools/corpus_query.py --signs SI-RU --logogram VIN --logogram-within 2 \\
+        --numeral-min 10 --line-initial --site "HT|KH"
+    python tools/corpus_query.py --signs RO-KU --cross-words --explain
+    python tools/corpus_query.py -q "FIND word AS x, logogram AS commodity, numeral AS qty \
+        GROUP BY site, commodity SUM qty"
+    python tools/corpus_query.py -q "FIND ^ word \"KU-RO\", numeral >= 100 WHERE site = HT"
+
+Attribution:
+    Part of Linear A Decipherment Project
+    Supports First Principle #6 (cross-corpus) pattern checks
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from corpus_index import (
+    KIND_EMPTY,
+    KIND_LINE_BREAK,
+    KIND_LOGOGRAM,
+    KIND_NUMERAL,
+    KIND_WORD,
+    NO_OFFSET,
+    CompiledCorpus,
+    InscriptionLayout,
+    bit_ordinals,
+    compile_corpus,
+    logogram_base,
+    normalize_sign,
+    numeral_value,
+    split_signs,
+)
+
+
+# Paths
+PROJECT_ROOT = Path(__file__).parent.parent
+DATA_DIR = PROJECT_ROOT / "data"
+CORPUS_FILE = DATA_DIR / "corpus.json"
+
+
+def popcount(bits: int) -> int:
+    """Number of inscriptions in a bitset (int.bit_count needs Python 3.10)."""
+    return bin(bits).count("1")
+
+
+def split_alternatives(values: List[str]) -> List[str]:
+    """Expand ["HT|KH", "ZA"] into ["HT", "KH", "ZA"]."""
+    expanded = []
+    for value in values or []:
+        expanded.extend(part.strip() for part in value.split("|") if part.strip())
+    return expanded
+
+
+@lru_cache(maxsize=None)
+def _token_signs(token: str) -> Tuple[str, ...]:
+    return tuple(split_signs(token))
+
+
+@dataclass
+class SignSequenceQuery:
+    """Structural constraints for one sign-sequence search."""
+
+    signs: List[str]
+    cross_words: bool = False  # Sequence may continue into the next word on the line
+    whole_words: bool = False  # Sequence must start and end on word boundaries
+    logogram: Optional[str] = None  # Required following logogram (base match)
+    logogram_within: int = 2  # Max tokens between sequence end and logogram
+    numeral_min: Optional[float] = None
+    numeral_max: Optional[float] = None
+    numeral_within: int = 1  # Max tokens between logogram (or sequence) and numeral
+    line_initial: bool = False
+    line_final: bool = False
+    sites: List[str] = field(default_factory=list)
+    periods: List[str] = field(default_factory=list)
+    limit: Optional[int] = None
+
+    def __post_init__(self):
+        if isinstance(self.signs, str):
+            self.signs = self.signs.split("-")
+        self.signs = [normalize_sign(s) for s in self.signs if s and s.strip()]
+        if not self.signs:
+            raise ValueError("A sign sequence query needs at least one sign")
+        if self.logogram:
+            self.logogram = logogram_base(self.logogram)
+        self.sites = split_alternatives(self.sites)
+        self.periods = split_alternatives(self.periods)
+
+    @property
+    def wants_numeral(self) -> bool:
+        return self.numeral_min is not None or self.numeral_max is not None
+
+    @classmethod
+    def from_dict(cls, spec: Dict) -> "SignSequenceQuery":
+        """Build a query from a JSON-style dict (unknown keys are rejected)."""
+        known = set(cls.__dataclass_fields__)
+        unknown = set(spec) - known
+        if unknown:
+            raise ValueError(f"Unknown query keys: {', '.join(sorted(unknown))}")
+        return cls(**spec)
+
+
+@dataclass
+class QueryPlan:
+    """Execution plan chosen for a query (see CorpusQueryEngine.plan)."""
+
+    filters: List[Dict]  # Applied in order: {"index", "inscriptions"}
+    candidate_bits: int
+    driver_index: str  # "sign", "word", "logogram" or "scan"
+    driver_key: str
+    driver_postings: int
+
+    @property
+    def candidate_inscriptions(self) -> int:
+        return popcount(self.candidate_bits)
+
+    def describe(self) -> List[str]:
+        lines = []
+        for step, f in enumerate(self.filters, 1):
+            lines.append(f"{step}. intersect {f['index']:<24} ({f['inscriptions']} inscriptions)")
+        step = len(self.filters) + 1
+        if self.driver_index == "scan":
+            lines.append(
+                f"{step}. scan tokens of {self.candidate_inscriptions} candidate inscriptions"
+            )
+        else:
+            lines.append(
+                f"{step}. drive from {self.driver_index}:{self.driver_key} postings "
+                f"({self.driver_postings} positions) over "
+                f"{self.candidate_inscriptions} candidate inscriptions"
+            )
+        return lines
+
+
+# ── Declarative token-pattern queries ───────────────────────────────
+
+# Tokens skipped between pattern elements (division marks and placeholders).
+SKIP_TOKENS = {"𐄁", "—", "≈", "𐝫"}
+
+# Row fields available to WHERE/GROUP BY besides capture names.
+ROW_FIELDS = ("inscription", "site", "period", "support")
+
+NUMERIC_OPS = {
+    ">=": lambda v, x: v >= x,
+    ">": lambda v, x: v > x,
+    "<=": lambda v, x: v <= x,
+    "<": lambda v, x: v < x,
+    "=": lambda v, x: v == x,
+}
+
+ELEMENT_KINDS = ("word", "logogram", "numeral", "any")
+
+
+@dataclass
+class TokenPattern:
+    """One pattern element; matches exactly one content token."""
+
+    kind: str  # word, logogram, numeral, any
+    text: Optional[str] = None  # word: exact match (case-insensitive)
+    regex: Optional[str] = None  # word: regex search (case-insensitive)
+    names: List[str] = field(default_factory=list)  # logogram: allowed bases
+    predicates: List[Tuple[str, float]] = field(default_factory=list)  # numeral: (op, value)
+    capture: Optional[str] = None
+    line_initial: bool = False  # ^ : first content token on its line
+    line_final: bool = False  # $ : last content token on its line
+
+    def __post_init__(self):
+        if self.kind not in ELEMENT_KINDS:
+            raise ValueError(f"Unknown pattern element: {self.kind}")
+        if self.text:
+            self.text = self.text.upper()
+        self.names = [logogram_base(n) for n in split_alternatives(self.names)]
+        for op, _ in self.predicates:
+            if op not in NUMERIC_OPS:
+                raise ValueError(f"Unknown numeric operator: {op}")
+        try:
+            self._compiled_regex = re.compile(self.regex, re.IGNORECASE) if self.regex else None
+        except re.error as e:
+            raise ValueError(f"Invalid word regex {self.regex!r}: {e}") from e
+
+    @property
+    def indexed(self) -> bool:
+        """True if a posting list can drive this element."""
+        return (self.kind == "word" and bool(self.text)) or (
+            self.kind == "logogram" and bool(self.names)
+        )
+
+    def matches(self, token: str, kind: int) -> bool:
+        if self.kind == "any":
+            return True
+        if self.kind == "word":
+            if kind != KIND_WORD:
+                return False
+            if self.text and token.upper() != self.text:
+                return False
+            return not self._compiled_regex or bool(self._compiled_regex.search(token))
+        if self.kind == "logogram":
+            return kind == KIND_LOGOGRAM and (not self.names or logogram_base(token) in self.names)
+        if kind != KIND_NUMERAL:
+            return False
+        if not self.predicates:
+            return True
+        value = numeral_value(token)
+        return value is not None and all(NUMERIC_OPS[op](value, x) for op, x in self.predicates)
+
+    def captured(self, token: str):
+        """Capture value: logogram base, numeric value, or upper-cased token."""
+        if self.kind == "logogram":
+            return logogram_base(token)
+        if self.kind == "numeral":
+            value = numeral_value(token)
+            return token if value is None else value
+        return token.upper()
+
+
+@dataclass
+class PatternQuery:
+    """A token pattern plus row filters, grouping and aggregation."""
+
+    elements: List[TokenPattern]
+    sites: List[str] = field(default_factory=list)
+    periods: List[str] = field(default_factory=list)
+    supports: List[str] = field(default_factory=list)
+    cross_lines: bool = False  # Let the pattern continue over line breaks
+    group_by: List[str] = field(default_factory=list)
+    sums: List[str] = field(default_factory=list)
+    limit: Optional[int] = None
+
+    def __post_init__(self):
+        if not self.elements:
+            raise ValueError("A pattern query needs at least one element")
+        self.sites = split_alternatives(self.sites)
+        self.periods = split_alternatives(self.periods)
+        self.supports = split_alternatives(self.supports)
+        captures = [e.capture for e in self.elements if e.capture]
+        if len(captures) != len(set(captures)):
+            raise ValueError("Capture names must be unique")
+        for name in captures:
+            if name in ROW_FIELDS:
+                raise ValueError(f"Capture name shadows a row field: {name}")
+        known = set(ROW_FIELDS) | set(captures)
+        for key in self.group_by + self.sums:
+            if key not in known:
+                raise ValueError(f"Unknown field: {key}")
+
+
+class Query:
+    """
+    Fluent builder for PatternQuery.
+
+    Example (the [X] + LOGOGRAM + NUMBER triplets of contextual_analyzer.py):
+        Query().word(as_="x").logogram(as_="commodity").numeral(as_="qty")
+            .group_by("site", "commodity").sum("qty").build()
+    """
+
+    def __init__(self):
+        self._elements: List[TokenPattern] = []
+        self._options: Dict = {}
+
+    def _add(self, element: TokenPattern) -> "Query":
+        self._elements.append(element)
+        return self
+
+    def word(self, text=None, regex=None, as_=None, line_initial=False, line_final=False):
+        return self._add(TokenPattern("word", text, regex, [], [], as_, line_initial, line_final))
+
+    def logogram(self, *names, as_=None, line_initial=False, line_final=False):
+        return self._add(
+            TokenPattern("logogram", None, None, list(names), [], as_, line_initial, line_final)
+        )
+
+    def numeral(self, ge=None, gt=None, le=None, lt=None, eq=None, as_=None, line_final=False):
+        ops = [(">=", ge), (">", gt), ("<=", le), ("<", lt), ("=", eq)]
+        predicates = [(op, float(v)) for op, v in ops if v is not None]
+        return self._add(
+            TokenPattern("numeral", None, None, [], predicates, as_, False, line_final)
+        )
+
+    def any(self, as_=None):
+        return self._add(TokenPattern("any", capture=as_))
+
+    def where(self, sites=None, periods=None, supports=None, cross_lines=None):
+        for key, value in (("sites", sites), ("periods", periods), ("supports", supports)):
+            if value is not None:
+                self._options[key] = [value] if isinstance(value, str) else list(value)
+        if cross_lines is not None:
+            self._options["cross_lines"] = cross_lines
+        return self
+
+    def group_by(self, *keys):
+        self._options["group_by"] = list(keys)
+        return self
+
+    def sum(self, *names):
+        self._options["sums"] = list(names)
+        return self
+
+    def limit(self, n: int):
+        self._options["limit"] = n
+        return self
+
+    def build(self) -> PatternQuery:
+        return PatternQuery(elements=list(self._elements), **self._options)
+
+
+_DSL_TOKEN_RE = re.compile(r'"[^"]*"|~|>=|<=|[<>=,^$]|[^\s,"<>=^$~]+')
+_DSL_KEYWORDS = {"FIND", "WHERE", "AND", "GROUP", "BY", "SUM", "LIMIT", "AS", "IN"}
+
+
+def parse_query(text: str) -> PatternQuery:
+    """
+    Parse the corpus query DSL into a PatternQuery.
+
+    Grammar (keywords are case-insensitive):
+        [FIND] element (, element)*
+            [WHERE condition (AND condition)*]
+            [GROUP BY field (, field)*] [SUM capture (, capture)*] [LIMIT n]
+
+        element   := [^] (WORD ["TEXT" | ~ "REGEX"] | LOGOGRAM [NAME|NAME...]
+                         | NUMERAL [op number]* | ANY) [AS name] [$]
+        condition := (site | period | support) (= | IN) VALUE[|VALUE...] | cross_lines
+
+    Example:
+        FIND word AS x, logogram VIN AS commodity, numeral >= 10 AS qty
+            WHERE site IN HT|KH GROUP BY site SUM qty
+    """
+    tokens = _DSL_TOKEN_RE.findall(text)
+    pos = 0
+
+    def peek(upper=True):
+        if pos >= len(tokens):
+            return None
+        return tokens[pos].upper() if upper else tokens[pos]
+
+    def take(what="token"):
+        nonlocal pos
+        if pos >= len(tokens):
+            raise ValueError(f"Unexpected end of query (expected {what})")
+        pos += 1
+        return tokens[pos - 1]
+
+    def expect(keyword):
+        token = take(keyword)
+        if token.upper() != keyword:
+            raise ValueError(f"Expected {keyword} but found {token!r}")
+
+    def unquote(token):
+        return token[1:-1] if token.startswith('"') else token
+
+    if peek() == "FIND":
+        take()
+
+    builder_elements = []
+    while True:
+        line_initial = False
+        if peek() == "^":
+            take()
+            line_initial = True
+        kind = take("element").lower()
+        if kind not in ELEMENT_KINDS:
+            raise ValueError(f"Unknown pattern element: {kind}")
+        element = {"kind": kind, "line_initial": line_initial}
+        if kind == "word":
+            if peek() == "~":
+                take()
+                element["regex"] = unquote(take("regex"))
+            elif peek() and peek() not in _DSL_KEYWORDS and peek() not in {",", "$"}:
+                element["text"] = unquote(take())
+        elif kind == "logogram":
+            nxt = peek()
+            if nxt and nxt not in _DSL_KEYWORDS and nxt not in {",", "$"}:
+                element["names"] = [take()]
+        elif kind == "numeral":
+            predicates = []
+            while peek() in NUMERIC_OPS:
+                op = take()
+                try:
+                    predicates.append((op, float(take("number"))))
+                except ValueError:
+                    raise ValueError(f"Numeral comparison needs a number after {op}")
+            element["predicates"] = predicates
+        if peek() == "AS":
+            take()
+            element["capture"] = take("capture name")
+        if peek() == "$":
+            take()
+            element["line_final"] = True
+        builder_elements.append(TokenPattern(**element))
+        if peek() != ",":
+            break
+        take()
+
+    options: Dict = {"sites": [], "periods": [], "supports": []}
+    if peek() == "WHERE":
+        take()
+        while True:
+            field_name = take("condition").lower()
+            if field_name == "cross_lines":
+                options["cross_lines"] = True
+            elif field_name in ("site", "period", "support"):
+                op = take().upper()
+                if op not in ("=", "IN"):
+                    raise ValueError(f"Expected = or IN after {field_name}")
+                options[field_name + "s"].append(unquote(take("value")))
+            else:
+                raise ValueError(f"Unknown condition: {field_name}")
+            if peek() != "AND":
+                break
+            take()
+
+    if peek() == "GROUP":
+        take()
+        expect("BY")
+        options["group_by"] = [take("field")]
+        while peek() == ",":
+            take()
+            options["group_by"].append(take("field"))
+
+    if peek() == "SUM":
+        take()
+        options["sums"] = [take("capture")]
+        while peek() == ",":
+            take()
+            options["sums"].append(take("capture"))
+
+    if peek() == "LIMIT":
+        take()
+        options["limit"] = int(take("number"))
+
+    if pos != len(tokens):
+        raise ValueError(f"Unexpected token: {tokens[pos]!r}")
+
+    return PatternQuery(elements=builder_elements, **options)
+
+
+class CorpusQueryEngine:
+    """Plans and executes SignSequenceQuery searches over a CompiledCorpus."""
+
+    def __init__(self, compiled: CompiledCorpus):
+        self.compiled = compiled
+        self.postings = compiled.postings
+        self.last_stats: Dict = {}
+        self._streams: Dict[str, Tuple[List[int], Dict[int, int]]] = {}
+
+    # ── Planning ────────────────────────────────────────────────────
+
+    def plan(self, query: SignSequenceQuery) -> QueryPlan:
+        """Intersect inscription bitsets from most to least selective."""
+        p = self.postings
+        filters = []
+        for sign in dict.fromkeys(query.signs):
+            filters.append({"index": f"sign:{sign}", "bits": p.sign_bits.get(sign, 0)})
+        if query.logogram:
+            filters.append(
+                {
+                    "index": f"logogram:{query.logogram}",
+                    "bits": p.logogram_bits.get(query.logogram, 0),
+                }
+            )
+        if query.sites:
+            filters.append(
+                {"index": f"site:{'|'.join(query.sites)}", "bits": p.sites_mask(query.sites)}
+            )
+        if query.periods:
+            filters.append(
+                {
+                    "index": f"period:{'|'.join(query.periods)}",
+                    "bits": p.periods_mask(query.periods),
+                }
+            )
+
+        bits = self._intersect(filters)
+        driver = min(dict.fromkeys(query.signs), key=lambda s: len(p.sign_postings.get(s, [])))
+        return QueryPlan(
+            filters=filters,
+            candidate_bits=bits,
+            driver_index="sign",
+            driver_key=driver,
+            driver_postings=len(p.sign_postings.get(driver, [])),
+        )
+
+    def _intersect(self, filters: List[Dict]) -> int:
+        """AND filter bitsets smallest-first; annotates filters with their sizes."""
+        for f in filters:
+            f["inscriptions"] = popcount(f["bits"])
+        filters.sort(key=lambda f: f["inscriptions"])
+
+        bits = self.postings.all_bits
+        for f in filters:
+            bits &= f.pop("bits")
+            if not bits:
+                break
+        for f in filters:
+            f.pop("bits", None)
+        return bits
+
+    # ── Execution ───────────────────────────────────────────────────
+
+    def search(self, query: SignSequenceQuery) -> List[dict]:
+        """Return all matches for a query, in corpus order."""
+        started = time.perf_counter()
+        plan = self.plan(query)
+        ids = self.compiled.inscription_ids
+        driver_offsets = [k for k, sign in enumerate(query.signs) if sign == plan.driver_key]
+
+        seen = set()
+        results = []
+        verified = 0
+        if plan.candidate_bits:
+            for ordinal, pos, sign_idx in self.postings.sign_postings.get(plan.driver_key, []):
+                if not (plan.candidate_bits >> ordinal) & 1:
+                    continue
+                layout = self.compiled.layouts[ids[ordinal]]
+                for k in driver_offsets:
+                    verified += 1
+                    start = self._step_back(layout, pos, sign_idx, k, query.cross_words)
+                    if start is None or (ordinal,) + start in seen:
+                        continue
+                    seen.add((ordinal,) + start)
+                    match = self._verify(layout, start, query)
+                    if match is not None:
+                        results.append(match)
+                if query.limit and len(results) >= query.limit:
+                    break
+
+        results.sort(key=lambda m: (self.compiled.ordinals[m["inscription"]], m["start_position"]))
+        if query.limit:
+            results = results[: query.limit]
+
+        self.last_stats = {
+            "plan": plan.describe(),
+            "candidates_verified": verified,
+            "matches": len(results),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
+        }
+        return results
+
+    def _step_back(
+        self, layout: InscriptionLayout, pos: int, sign_idx: int, steps: int, cross_words: bool
+    ) -> Optional[Tuple[int, int]]:
+        """Move ``steps`` signs left of (pos, sign_idx); None if that leaves the line/word."""
+        while steps > sign_idx:
+            if not cross_words:
+                return None
+            steps -= sign_idx + 1
+            pos -= 1
+            if pos < 0 or layout.kinds[pos] != KIND_WORD:
+                return None
+            signs = _token_signs(layout.tokens[pos])
+            if not signs:
+                return None
+            sign_idx = len(signs) - 1
+        return pos, sign_idx - steps
+
+    def _match_forward(
+        self, layout: InscriptionLayout, pos: int, sign_idx: int, query: SignSequenceQuery
+    ) -> Optional[Tuple[int, int]]:
+        """Match query.signs starting at (pos, sign_idx); return end (pos, sign_idx)."""
+        signs = _token_signs(layout.tokens[pos])
+        for k, wanted in enumerate(query.signs):
+            if sign_idx >= len(signs):
+                if not query.cross_words:
+                    return None
+                pos += 1
+                if pos >= len(layout.tokens) or layout.kinds[pos] != KIND_WORD:
+                    return None
+                signs = _token_signs(layout.tokens[pos])
+                sign_idx = 0
+                if not signs:
+                    return None
+            if signs[sign_idx] != wanted:
+                return None
+            if k < len(query.signs) - 1:
+                sign_idx += 1
+        return pos, sign_idx
+
+    def _verify(
+        self, layout: InscriptionLayout, start: Tuple[int, int], query: SignSequenceQuery
+    ) -> Optional[dict]:
+        start_pos, start_idx = start
+        end = self._match_forward(layout, start_pos, start_idx, query)
+        if end is None:
+            return None
+        end_pos, end_idx = end
+
+        if query.whole_words:
+            if start_idx != 0 or end_idx != len(_token_signs(layout.tokens[end_pos])) - 1:
+                return None
+        if query.line_initial and not (start_idx == 0 and layout.line_initial[start_pos]):
+            return None
+        if query.line_final:
+            if not layout.line_final[end_pos]:
+                return None
+            if end_idx != len(_token_signs(layout.tokens[end_pos])) - 1:
+                return None
+
+        logogram_pos = None
+        if query.logogram:
+            logogram_pos = self._find_logogram(layout, end_pos, query)
+            if logogram_pos is None:
+                return None
+
+        numeral_pos = None
+        if query.wants_numeral:
+            anchor = logogram_pos if logogram_pos is not None else end_pos
+            numeral_pos = self._find_numeral(layout, anchor, query)
+            if numeral_pos is None:
+                return None
+
+        meta = self.compiled.metadata[layout.inscription_id]
+        match = {
+            "inscription": layout.inscription_id,
+            "site_code": meta["site_code"],
+            "period": meta["period"],
+            "line_number": layout.line_number[start_pos],
+            "start_position": start_pos,
+            "end_position": end_pos,
+            "words": layout.tokens[start_pos : end_pos + 1],
+            "signs": "-".join(query.signs),
+        }
+        if logogram_pos is not None:
+            match["logogram"] = layout.tokens[logogram_pos]
+            match["logogram_position"] = logogram_pos
+        if numeral_pos is not None:
+            match["numeral"] = layout.tokens[numeral_pos]
+            match["numeral_value"] = numeral_value(layout.tokens[numeral_pos])
+        return match
+
+    def _find_logogram(
+        self, layout: InscriptionLayout, end_pos: int, query: SignSequenceQuery
+    ) -> Optional[int]:
+        offset = layout.next_logogram[end_pos]
+        if offset == NO_OFFSET or offset > query.logogram_within:
+            return None
+        for pos in range(end_pos + offset, min(len(layout), end_pos + query.logogram_within + 1)):
+            kind = layout.kinds[pos]
+            if kind == KIND_LINE_BREAK:
+                break
+            if kind == KIND_LOGOGRAM and logogram_base(layout.tokens[pos]) == query.logogram:
+                return pos
+        return None
+
+    def _find_numeral(
+        self, layout: InscriptionLayout, anchor: int, query: SignSequenceQuery
+    ) -> Optional[int]:
+        offset = layout.next_numeral[anchor]
+        if offset == NO_OFFSET or offset > query.numeral_within:
+            return None
+        for pos in range(anchor + offset, min(len(layout), anchor + query.numeral_within + 1)):
+            kind = layout.kinds[pos]
+            if kind == KIND_LINE_BREAK:
+                break
+            if kind != KIND_NUMERAL:
+                continue
+            value = numeral_value(layout.tokens[pos])
+            if value is None:
+                continue
+            if query.numeral_min is not None and value < query.numeral_min:
+                continue
+            if query.numeral_max is not None and value > query.numeral_max:
+                continue
+            return pos
+        return None
+
+    # ── Pattern queries ─────────────────────────────────────────────
+
+    def plan_pattern(self, query: PatternQuery) -> QueryPlan:
+        """Push WHERE filters and indexed elements down to bitsets, pick a driver."""
+        p = self.postings
+        filters = []
+        driver_options = []
+        for idx, element in enumerate(query.elements):
+            if element.kind == "word" and element.text:
+                key = element.text
+                filters.append({"index": f"word:{key}", "bits": p.word_bits.get(key, 0)})
+                driver_options.append((len(p.word_postings.get(key, [])), idx, "word", key))
+            elif element.kind == "logogram" and element.names:
+                key = "|".join(element.names)
+                bits = 0
+                count = 0
+                for name in element.names:
+                    bits |= p.logogram_bits.get(name, 0)
+                    count += len(p.logogram_postings.get(name, []))
+                filters.append({"index": f"logogram:{key}", "bits": bits})
+                driver_options.append((count, idx, "logogram", key))
+        if query.sites:
+            filters.append(
+                {"index": f"site:{'|'.join(query.sites)}", "bits": p.sites_mask(query.sites)}
+            )
+        if query.periods:
+            filters.append(
+                {
+                    "index": f"period:{'|'.join(query.periods)}",
+                    "bits": p.periods_mask(query.periods),
+                }
+            )
+
+        bits = self._intersect(filters)
+        if not driver_options:
+            return QueryPlan(filters, bits, "scan", "", 0)
+        count, _, index, key = min(driver_options)
+        return QueryPlan(filters, bits, index, key, count)
+
+    def _content_stream(self, layout: InscriptionLayout) -> Tuple[List[int], Dict[int, int]]:
+        """Positions of content tokens (no line breaks/skips) and their stream index."""
+        cached = self._streams.get(layout.inscription_id)
+        if cached is None:
+            stream = [
+                pos
+                for pos, (token, kind) in enumerate(zip(layout.tokens, layout.kinds))
+                if kind not in (KIND_EMPTY, KIND_LINE_BREAK) and token not in SKIP_TOKENS
+            ]
+            cached = (stream, {pos: i for i, pos in enumerate(stream)})
+            self._streams[layout.inscription_id] = cached
+        return cached
+
+    def _match_pattern(
+        self, layout: InscriptionLayout, stream: List[int], start: int, query: PatternQuery
+    ) -> Optional[dict]:
+        elements = query.elements
+        if start < 0 or start + len(elements) > len(stream):
+            return None
+        first_line = layout.line_number[stream[start]]
+        captures = {}
+        for k, element in enumerate(elements):
+            i = start + k
+            pos = stream[i]
+            line = layout.line_number[pos]
+            if not query.cross_lines and line != first_line:
+                return None
+            if not element.matches(layout.tokens[pos], layout.kinds[pos]):
+                return None
+            if element.line_initial and i > 0 and layout.line_number[stream[i - 1]] == line:
+                return None
+            if (
+                element.line_final
+                and i + 1 < len(stream)
+                and layout.line_number[stream[i + 1]] == line
+            ):
+                return None
+            if element.capture:
+                captures[element.capture] = element.captured(layout.tokens[pos])
+
+        meta = self.compiled.metadata[layout.inscription_id]
+        row = {
+            "inscription": layout.inscription_id,
+            "site": meta["site_code"],
+            "period": meta["period"],
+            "support": meta["support"],
+            "line_number": first_line,
+            "position": stream[start],
+            "tokens": [layout.tokens[stream[start + k]] for k in range(len(elements))],
+        }
+        row.update(captures)
+        return row
+
+    def run_pattern(self, query: PatternQuery) -> dict:
+        """
+        Execute a PatternQuery.
+
+        Returns {"rows": [...], "groups": [...], "stats": {...}}; "groups" is
+        only present when the query has GROUP BY or SUM.
+        """
+        started = time.perf_counter()
+        plan = self.plan_pattern(query)
+        ids = self.compiled.inscription_ids
+        supports = set(query.supports)
+
+        def candidate(ordinal: int) -> Optional[InscriptionLayout]:
+            if not (plan.candidate_bits >> ordinal) & 1:
+                return None
+            insc_id = ids[ordinal]
+            if supports and self.compiled.metadata[insc_id]["support"] not in supports:
+                return None
+            return self.compiled.layouts[insc_id]
+
+        rows = []
+        checked = 0
+        if plan.candidate_bits:
+            if plan.driver_index == "scan":
+                starts = self._scan_starts(plan)
+            else:
+                driver_idx = next(
+                    idx
+                    for idx, e in enumerate(query.elements)
+                    if e.indexed and self._element_key(e) == plan.driver_key
+                )
+                starts = self._driver_starts(plan, driver_idx)
+
+            for ordinal, start in starts:
+                layout = candidate(ordinal)
+                if layout is None:
+                    continue
+                stream, _ = self._content_stream(layout)
+                checked += 1
+                row = self._match_pattern(layout, stream, start, query)
+                if row is not None:
+                    rows.append(row)
+                    if query.limit and len(rows) >= query.limit:
+                        break
+
+        result = {"rows": rows}
+        if query.group_by or query.sums:
+            result["groups"] = aggregate_rows(rows, query.group_by, query.sums)
+        self.last_stats = {
+            "plan": plan.describe(),
+            "candidates_verified": checked,
+            "matches": len(rows),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
+        }
+        result["stats"] = self.last_stats
+        return result
+
+    def _scan_starts(self, plan: QueryPlan):
+        """Yield every stream start in the candidate inscriptions (no usable index)."""
+        ids = self.compiled.inscription_ids
+        for ordinal in bit_ordinals(plan.candidate_bits):
+            stream, _ = self._content_stream(self.compiled.layouts[ids[ordinal]])
+            for start in range(len(stream)):
+                yield ordinal, start
+
+    @staticmethod
+    def _element_key(element: TokenPattern) -> str:
+        return element.text if element.kind == "word" else "|".join(element.names)
+
+    def _driver_starts(self, plan: QueryPlan, driver_idx: int):
+        """Yield (ordinal, stream start) candidates from the driver's postings."""
+        p = self.postings
+        if plan.driver_index == "word":
+            postings = p.word_postings.get(plan.driver_key, [])
+        else:
+            postings = sorted(
+                posting
+                for name in plan.driver_key.split("|")
+                for posting in p.logogram_postings.get(name, [])
+            )
+        ids = self.compiled.inscription_ids
+        for ordinal, pos in postings:
+            if not (plan.candidate_bits >> ordinal) & 1:
+                continue
+            _, index_of = self._content_stream(self.compiled.layouts[ids[ordinal]])
+            if pos in index_of:
+                yield ordinal, index_of[pos] - driver_idx
+
+
+def aggregate_rows(rows: List[dict], group_by: List[str], sums: List[str]) -> List[dict]:
+    """Group rows by the given fields; count each group and sum numeric captures."""
+    groups: Dict[Tuple, dict] = {}
+    for row in rows:
+        key = tuple(row.get(k) for k in group_by)
+        group = groups.get(key)
+        if group is None:
+            group = dict(zip(group_by, key))
+            group["count"] = 0
+            for name in sums:
+                group[f"sum_{name}"] = 0.0
+            groups[key] = group
+        group["count"] += 1
+        for name in sums:
+            value = row.get(name)
+            if isinstance(value, (int, float)):
+                group[f"sum_{name}"] += value
+    return sorted(groups.values(), key=lambda g: (-g["count"], [str(g[k]) for k in group_by]))
+
+
+def load_engine() -> Optional[CorpusQueryEngine]:
+    """Load corpus.json and return a ready engine, or None on failure."""
+    try:
+        with open(CORPUS_FILE, "r", encoding="utf-8") as f:
+            corpus = json.load(f)
+    except Exception as e:
+        print(f"Error loading corpus: {e}")
+        return None
+    return CorpusQueryEngine(compile_corpus(corpus))
+
+
+def run_pattern_cli(args) -> int:
+    """Handle --query: parse the DSL, run it, print rows or groups."""
+    try:
+        query = parse_query(args.query)
+    except ValueError as e:
+        print(f"Invalid query: {e}")
+        return 1
+    if args.limit:
+        query.limit = args.limit
+
+    engine = load_engine()
+    if engine is None:
+        return 1
+
+    result = engine.run_pattern(query)
+    stats = result["stats"]
+    rows = result["rows"]
+
+    if args.explain:
+        print("Query plan:")
+        for line in stats["plan"]:
+            print(f"  {line}")
+        print(f"  verified {stats['candidates_verified']} candidate starts")
+
+    print(f"\nFound {len(rows)} matches in {stats['elapsed_ms']} ms")
+
+    if args.output:
+        output_path = PROJECT_ROOT / args.output
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"query": args.query, "total_results": len(rows), **result},
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+        print(f"Results saved to: {output_path}")
+        return 0
+
+    print(f"{'=' * 60}")
+    if "groups" in result:
+        for group in result["groups"][:30]:
+            print("  ".join(f"{k}={v}" for k, v in group.items()))
+        if len(result["groups"]) > 30:
+            print(f"\n... and {len(result['groups']) - 30} more groups")
+    else:
+        for i, row in enumerate(rows[:30], 1):
+            print(
+                f"{i}. {row['inscription']} ({row['site']}, line {row['line_number']}): "
+                f"{' '.join(row['tokens'])}"
+            )
+        if len(rows) > 30:
+            print(f"\n... and {len(rows) - 30} more matches")
+    print(f"{'=' * 60}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Structural sign-sequence search over the Linear A corpus"
+    )
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--signs", help="Sign sequence, e.g. SI-RU")
+    mode.add_argument("--query", "-q", help="Declarative pattern query (see parse_query)")
+    parser.add_argument(
+        "--cross-words", action="store_true", help="Allow the sequence to span adjacent words"
+    )
+    parser.add_argument(
+        "--whole-words", action="store_true", help="Sequence must align with word boundaries"
+    )
+    parser.add_argument("--logogram", help="Required following logogram (e.g. VIN)")
+    parser.add_argument(
+        "--logogram-within", type=int, default=2, help="Max tokens to the logogram (default: 2)"
+    )
+    parser.add_argument("--numeral-min", type=float, help="Following numeral must be >= value")
+    parser.add_argument("--numeral-max", type=float, help="Following numeral must be <= value")
+    parser.add_argument(
+        "--numeral-within", type=int, default=1, help="Max tokens to the numeral (default: 1)"
+    )
+    parser.add_argument("--line-initial", action="store_true", help="Sequence opens a line")
+    parser.add_argument("--line-final", action="store_true", help="Sequence closes a line")
+    parser.add_argument(
+        "--site", action="append", default=[], help="Site code(s), repeatable or HT|KH"
+    )
+    parser.add_argument(
+        "--period", action="append", default=[], help="Period(s), repeatable or LMIB|MMIII"
+    )
+    parser.add_argument("--limit", type=int, help="Stop after N matches")
+    parser.add_argument("--explain", action="store_true", help="Print the query plan")
+    parser.add_argument("--output", "-o", type=str, help="Write matches to JSON file")
+
+    args = parser.parse_args()
+
+    if args.query:
+        return run_pattern_cli(args)
+
+    try:
+        query = SignSequenceQuery(
+            signs=args.signs,
+            cross_words=args.cross_words,
+            whole_words=args.whole_words,
+            logogram=args.logogram,
+            logogram_within=args.logogram_within,
+            numeral_min=args.numeral_min,
+            numeral_max=args.numeral_max,
+            numeral_within=args.numeral_within,
+            line_initial=args.line_initial,
+            line_final=args.line_final,
+            sites=args.site,
+            periods=args.period,
+            limit=args.limit,
+        )
+    except ValueError as e:
+        print(f"Invalid query: {e}")
+        return 1
+
+    engine = load_engine()
+    if engine is None:
+        return 1
+
+    results = engine.search(query)
+    stats = engine.last_stats
+
+    if args.explain:
+        print("Query plan:")
+        for line in stats["plan"]:
+            print(f"  {line}")
+        print(f"  verified {stats['candidates_verified']} candidate alignments")
+
+    print(f"\nFound {len(results)} matches for {query.signs} in {stats['elapsed_ms']} ms")
+
+    if args.output:
+        output_path = PROJECT_ROOT / args.output
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "query": vars(args),
+                    "stats": stats,
+                    "total_results": len(results),
+                    "results": results,
+                },
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+        print(f"Results saved to: {output_path}")
+    else:
+        print(f"{'=' * 60}")
+        for i, m in enumerate(results[:30], 1):
+            tail = ""
+            if "logogram" in m:
+                tail += f" → {m['logogram']}"
+            if "numeral" in m:
+                tail += f" {m['numeral']}"
+            print(
+                f"{i}. {m['inscription']} ({m['site_code']}, line {m['line_number']}): "
+                f"{' '.join(m['words'])}{tail}"
+            )
+        if len(results) > 30:
+            print(f"\n... and {len(results) - 30} more matches")
+        print(f"{'=' * 60}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -33,10 +33,13 @@ import json
 import argparse
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 import logging
 
+from cognate_index import DEFAULT_MAX_DISTANCE, CognateIndex, build_index
+from reference_data import load_reference
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
@@ -47,6 +50,7 @@ DATA_DIR = PROJECT_ROOT / "data"
 LINEAR_B_DIR = DATA_DIR / "linear_b"
 COGNATES_FILE = DATA_DIR / "cognates.json"
 OUTPUT_FILE = LINEAR_B_DIR / "cognate_verification.json"
+REFERENCE_DATASET = "damos_vocabulary"
 
 
 @dataclass
@@ -78,12 +82,57 @@ class DAMOSConnector:
 
     def __init__(self, verbose: bool = False):
         self.verbose = verbose
-        self.vocabulary: Dict[str, Dict] = {}
+        self._vocabulary: Optional[Dict[str, Dict]] = None
+        self._by_linear_a: Optional[Dict[str, List[str]]] = None
+        self._cognate_index: Optional[CognateIndex] = None
         self.cognates: Dict = {}
         self._ensure_dirs()
-        self._build_vocabulary()
         self._load_cognates()
 
+    @property
+    def vocabulary(self) -> Dict[str, Dict]:
+        """Linear B vocabulary keyed by word (loaded on first access)."""
+        if self._vocabulary is None:
+            self._build_vocabulary()
+        return self._vocabulary
+
+    @vocabulary.setter
+    def vocabulary(self, value: Dict[str, Dict]):
+        self._vocabulary = value
+        self._by_linear_a = None
+        self._cognate_index = None
+
+    @property
+    def cognates(self) -> Dict:
+        """cognates.json from lineara.xyz (identicalWords, identicalRoots, ...)."""
+        return self._cognates
+
+    @cognates.setter
+    def cognates(self, value: Dict):
+        self._cognates = value
+        self._cognate_index = None
+
+    @property
+    def cognate_index(self) -> CognateIndex:
+        """Sign-level near-match index over the vocabulary and cognates.json."""
+        if self._cognate_index is None:
+            index = build_index(self.vocabulary, self.cognates)
+            self.log(f"Indexed {len(index)} Linear B forms for near matching")
+            self._cognate_index = index
+        return self._cognate_index
+
+    def _linear_b_words_for(self, word_upper: str) -> List[str]:
+        """Vocabulary words whose linear_a_cognate is ``word_upper``."""
+        if self._by_linear_a is None:
+            vocabulary = self.vocabulary  # may load, which resets the index
+            by_linear_a: Dict[str, List[str]] = {}
+            for word, data in vocabulary.items():
+                cognate = data.get("linear_a_cognate", "").upper()
+                if cognate:
+                    by_linear_a.setdefault(cognate, []).append(word)
+            self._by_linear_a = by_linear_a
+        return self._by_linear_a.get(word_upper, [])
+
     def _ensure_dirs(self):
         """Create necessary directories."""
         LINEAR_B_DIR.mkdir(parents=True, exist_ok=True)
@@ -105,7 +154,7 @@ class DAMOSConnector:
 
     def _build_vocabulary(self):
         """
-        Build comprehensive Linear B vocabulary from published sources.
+        Load the Linear B vocabulary from data/reference/damos_vocabulary.json.
 
         Focus areas for Linear A verification:
         1. Theophoric names (divine elements)
@@ -114,552 +163,20 @@ class DAMOSConnector:
         4. Commodity terms
         5. Personnel/occupational terms
         """
+        self.log("Loading Linear B vocabulary...")
+        self.vocabulary = load_reference(REFERENCE_DATASET)
+        self.log(f"Loaded vocabulary with {len(self.vocabulary)} entries")
 
-        self.log("Building Linear B vocabulary...")
-
-        # ============================================================
-        # THEOPHORIC NAMES AND DIVINE VOCABULARY
-        # Critical for verifying Linear A religious readings
-        # ============================================================
-
-        theophoric = {
-            "da-ma-te": {
-                "word": "da-ma-te",
-                "meaning": "Demeter (goddess of grain/harvest)",
-                "greek": "Δημήτηρ (Dēmētēr)",
-                "tablets": ["PY En 609", "PY Eo 224"],
-                "sites": ["PY"],
-                "category": "divine_name",
-                "divine_element": "da-ma-te",
-                "is_theophoric": True,
-                "linear_a_cognate": "DA-MA-TE",
-                "notes": (
-                    "Appears as da-ma-te at Pylos. The Linear A "
-                    "DA-MA-TE at peak sanctuary PKZ may be the "
-                    "earliest attestation of Demeter worship. "
-                    "Etymology disputed: either "
-                    '"grain mother" (*d\u0101- + m\u0101t\u0113r) '
-                    "or Pre-Greek."
-                ),
-                "confidence": "HIGH",
-                "source": "Aura Jorro DMic I pp.153-154; Ventris-Chadwick p.126",
-            },
-            "a-ta-na-po-ti-ni-ja": {
-                "word": "a-ta-na-po-ti-ni-ja",
-                "meaning": "Athena Potnia (Lady Athena)",
-                "greek": "Ἀθηνᾶ Πότνια",
-                "tablets": ["KN V 52"],
-                "sites": ["KN"],
-                "category": "divine_name",
-                "divine_element": "a-ta-na",
-                "is_theophoric": True,
-                "linear_a_cognate": "A-TA-NA",
-                "notes": (
-                    "Full divine title at Knossos. The element "
-                    "a-ta-na appears independently and in "
-                    "compounds. Linear A A-TA-NA and A-TA-NA-TE "
-                    "at Hagia Triada suggest Athena worship "
-                    "in Minoan period."
-                ),
-                "confidence": "HIGH",
-                "source": "KT5; Ventris-Chadwick p.126",
-            },
-            "po-ti-ni-ja": {
-                "word": "po-ti-ni-ja",
-                "meaning": "Potnia (Lady, Mistress) - divine title",
-                "greek": "πότνια (potnia)",
-                "tablets": ["KN Gg 702", "PY Tn 316", "PY Fr 1206", "MY Oi 701"],
-                "sites": ["KN", "PY", "MY"],
-                "category": "divine_title",
-                "divine_element": "po-ti-ni-ja",
-                "is_theophoric": False,
-                "notes": (
-                    "Common divine title; appears alone and with "
-                    "qualifiers (a-ta-na-po-ti-ni-ja, "
-                    "da-pu-ri-to-jo-po-ti-ni-ja). May correspond "
-                    "to Linear A goddess titles."
-                ),
-                "confidence": "HIGH",
-                "source": "Aura Jorro DMic II pp.141-142",
-            },
-            "di-we": {
-                "word": "di-we",
-                "meaning": 'Zeus (dative: "to Zeus")',
-                "greek": "Διί (dat. of Ζεύς)",
-                "tablets": ["KN Fp 1", "PY Tn 316", "PY Un 718"],
-                "sites": ["KN", "PY"],
-                "category": "divine_name",
-                "divine_element": "di-we/di-wo",
-                "is_theophoric": True,
-                "notes": (
-                    "Zeus appears frequently in offerings "
-                    "tablets. The di- element appears in "
-                    "theophoric names."
-                ),
-                "confidence": "HIGH",
-                "source": "Aura Jorro DMic I pp.178-179",
-            },
-            "di-wo-nu-so": {
-                "word": "di-wo-nu-so",
-                "meaning": "Dionysus (god of wine)",
-                "greek": "Διόνυσος",
-                "tablets": ["PY Xa 102", "KN Xb 1419"],
-                "sites": ["PY", "KN"],
-                "category": "divine_name",
-                "divine_element": "di-wo-nu-so",
-                "is_theophoric": True,
-                "notes": (
-                    "Attested at both Pylos and Knossos. "
-                    "Important for wine-related vocabulary "
-                    "comparison with Linear A."
-                ),
-                "confidence": "HIGH",
-                "source": "Aura Jorro DMic I pp.181-182",
-            },
-            "e-ra": {
-                "word": "e-ra",
-                "meaning": "Hera (goddess)",
-                "greek": "Ἥρα",
-                "tablets": ["PY Tn 316", "TH Of 36"],
-                "sites": ["PY", "TH"],
-                "category": "divine_name",
-                "divine_element": "e-ra",
-                "is_theophoric": True,
-                "notes": "Appears in offerings contexts. May have Pre-Greek etymology.",
-                "confidence": "HIGH",
-                "source": "Aura Jorro DMic I p.232",
-            },
-            "a-re": {
-                "word": "a-re",
-                "meaning": "Ares (god of war)",
-                "greek": "Ἄρης",
-                "tablets": ["KN Fp 14", "KN V 52"],
-                "sites": ["KN"],
-                "category": "divine_name",
-                "divine_element": "a-re",
-                "is_theophoric": True,
-                "notes": "War god. Element appears in theophoric names.",
-                "confidence": "HIGH",
-                "source": "Aura Jorro DMic I p.93",
-            },
-            "po-se-da-o": {
-                "word": "po-se-da-o",
-                "meaning": "Poseidon (god of sea/earthquakes)",
-                "greek": "Ποσειδῶν",
-                "tablets": ["PY Tn 316", "KN M 719", "PY Es 650"],
-                "sites": ["PY", "KN"],
-                "category": "divine_name",
-                "divine_element": "po-se-da-o",
-                "is_theophoric": True,
-                "notes": (
-                    "Major deity at Pylos. Etymology may be "
-                    'Pre-Greek (*potis + *da "lord of earth").'
-                ),
-                "confidence": "HIGH",
-                "source": "Aura Jorro DMic II pp.139-140",
-            },
-            "pa-ja-wo": {
-                "word": "pa-ja-wo",
-                "meaning": "Paean/Apollo (healer god)",
-                "greek": "Παιάων",
-                "tablets": ["KN V 52"],
-                "sites": ["KN"],
-                "category": "divine_name",
-                "divine_element": "pa-ja-wo",
-                "is_theophoric": True,
-                "notes": "Early form of Apollo as healer. Pre-Greek name.",
-                "confidence": "HIGH",
-                "source": "Aura Jorro DMic II p.16",
-            },
-            "e-nu-wa-ri-jo": {
-                "word": "e-nu-wa-ri-jo",
-                "meaning": "Enyalios (war god)",
-                "greek": "Ἐνυάλιος",
-                "tablets": ["KN V 52"],
-                "sites": ["KN"],
-                "category": "divine_name",
-                "divine_element": "e-nu-wa-ri-jo",
-                "is_theophoric": True,
-                "notes": "War deity, sometimes identified with Ares.",
-                "confidence": "HIGH",
-                "source": "Aura Jorro DMic I p.227",
-            },
-            "ma-na-sa": {
-                "word": "ma-na-sa",
-                "meaning": "possibly a goddess (Manasa?)",
-                "greek": "uncertain",
-                "tablets": ["PY Fr 1225"],
-                "sites": ["PY"],
-                "category": "divine_name",
-                "divine_element": "ma-na-sa",
-                "is_theophoric": True,
-                "notes": "Receives oil offerings. Possibly Pre-Greek divinity.",
-                "confidence": "MEDIUM",
-                "source": "Aura Jorro DMic II p.20",
-            },
-            "i-pe-me-de-ja": {
-                "word": "i-pe-me-de-ja",
-                "meaning": "Iphimedeia (goddess/heroine)",
-                "greek": "Ἰφιμέδεια",
-                "tablets": ["PY Tn 316"],
-                "sites": ["PY"],
-                "category": "divine_name",
-                "divine_element": "i-pe-me-de-ja",
-                "is_theophoric": True,
-                "notes": (
-                    "Receives gold offerings at Pylos. Later known as mother of Otus and Ephialtes."
-                ),
-                "confidence": "HIGH",
-                "source": "Aura Jorro DMic I p.312",
-            },
-            "di-u-ja": {
-                "word": "di-u-ja",
-                "meaning": "Diwia (female counterpart of Zeus)",
-                "greek": "Διϝία",
-                "tablets": ["PY Tn 316", "KN F 51"],
-                "sites": ["PY", "KN"],
-                "category": "divine_name",
-                "divine_element": "di-u-ja",
-                "is_theophoric": True,
-                "notes": "Female Zeus. Important for -JA suffix analysis in Linear A.",
-                "confidence": "HIGH",
-                "source": "Aura Jorro DMic I p.179",
-            },
-        }
-
-        # ============================================================
-        # ADMINISTRATIVE VOCABULARY
-        # For validating Linear A ku-ro, ki-ro, etc.
-        # ============================================================
-
-        administrative = {
-            "to-so": {
-                "word": "to-so",
-                "meaning": "so much, total (masculine)",
-                "greek": "τόσος (tosos)",
-                "tablets": ["PY An 1", "KN As 1517", "MY Ge 602"],
-                "sites": ["PY", "KN", "MY"],
-                "category": "totaling",
-                "is_theophoric": False,
-                "linear_a_cognate": "KU-RO (functional)",
-                "notes": (
-                    "Greek totaling term. Linear A uses KU-RO "
-                    "in same position but different form, "
-                    "suggesting non-Greek origin for Linear A."
-                ),
-                "confidence": "HIGH",
-                "source": "Ventris-Chadwick p.560",
-            },
-            "to-sa": {
-                "word": "to-sa",
-                "meaning": "so much (feminine/neuter plural)",
-                "greek": "τόσα",
-                "tablets": ["PY Jn 389", "KN L 695"],
-                "sites": ["PY", "KN"],
-                "category": "totaling",
-                "is_theophoric": False,
-                "notes": "Feminine/neuter form of to-so.",
-                "confidence": "HIGH",
-                "source": "Ventris-Chadwick p.560",
-            },
-            "o-pe-ro": {
-                "word": "o-pe-ro",
-                "meaning": "deficit, debt, owed",
-                "greek": "ὄφελος (ophelos)",
-                "tablets": ["PY Ma 365", "PY Un 718", "KN E 846"],
-                "sites": ["PY", "KN"],
-                "category": "deficit",
-                "is_theophoric": False,
-                "linear_a_cognate": "KI-RO (functional)",
-                "notes": (
-                    "Greek deficit term. Compare with Linear A "
-                    "KI-RO which may serve similar function "
-                    "but has different form."
-                ),
-                "confidence": "HIGH",
-                "source": "Ventris-Chadwick p.504",
-            },
-            "a-pu-do-si": {
-                "word": "a-pu-do-si",
-                "meaning": "delivery, payment, contribution",
-                "greek": "ἀπόδοσις (apodosis)",
-                "tablets": ["PY Ma 90", "KN C 914"],
-                "sites": ["PY", "KN"],
-                "category": "allocation",
-                "is_theophoric": False,
-                "notes": "Technical term for required contributions.",
-                "confidence": "HIGH",
-                "source": "Aura Jorro DMic I p.89",
-            },
-            "do-so-mo": {
-                "word": "do-so-mo",
-                "meaning": "contribution, offering",
-                "greek": "δοσμός",
-                "tablets": ["PY Un 718", "PY Es 644"],
-                "sites": ["PY"],
-                "category": "allocation",
-                "is_theophoric": False,
-                "notes": "Technical term for contributions to palace/sanctuary.",
-                "confidence": "HIGH",
-                "source": "Aura Jorro DMic I p.189",
-            },
-            "wo-ze": {
-                "word": "wo-ze",
-                "meaning": "he works, produces",
-                "greek": "ϝέργει (*werzei > ἔρδει)",
-                "tablets": ["PY An 18", "PY Jn 829"],
-                "sites": ["PY"],
-                "category": "work",
-                "is_theophoric": False,
-                "notes": "Work/production term. Compare Linear A A-DU contexts.",
-                "confidence": "HIGH",
-                "source": "Ventris-Chadwick p.592",
-            },
-            "e-ke": {
-                "word": "e-ke",
-                "meaning": "holds, possesses",
-                "greek": "ἔχει (ekhei)",
-                "tablets": ["PY Eb 294", "PY Ep 704", "KN Am 821"],
-                "sites": ["PY", "KN"],
-                "category": "possession",
-                "is_theophoric": False,
-                "notes": "Common land-holding term.",
-                "confidence": "HIGH",
-                "source": "Ventris-Chadwick p.438",
-            },
-            "pa-ro": {
-                "word": "pa-ro",
-                "meaning": "from, beside, with",
-                "greek": "παρά (para)",
-                "tablets": ["PY Eb 297", "KN As 1516"],
-                "sites": ["PY", "KN"],
-                "category": "preposition",
-                "is_theophoric": False,
-                "notes": "Indicates source/origin in transactions.",
-                "confidence": "HIGH",
-                "source": "Ventris-Chadwick p.517",
-            },
-        }
-
-        # ============================================================
-        # TOPONYMS
-        # For cross-referencing place names
-        # ============================================================
-
-        toponyms = {
-            "pa-i-to": {
-                "word": "pa-i-to",
-                "meaning": "Phaistos (city in Crete)",
-                "greek": "Φαιστός",
-                "tablets": ["KN Db 1159", "KN Da 1164", "KN Sd 4413"],
-                "sites": ["KN"],
-                "category": "toponym",
-                "is_toponym": True,
-                "linear_a_cognate": "PA-I-TO",
-                "notes": (
-                    "Major Minoan/Mycenaean site. CERTAIN "
-                    "anchor reading. Identical in Linear A and B."
-                ),
-                "confidence": "CERTAIN",
-                "source": "Ventris-Chadwick p.410",
-            },
-            "ku-do-ni-ja": {
-                "word": "ku-do-ni-ja",
-                "meaning": "Kydonia (Chania, western Crete)",
-                "greek": "Κυδωνία",
-                "tablets": ["KN C 902", "KN Db 1186"],
-                "sites": ["KN"],
-                "category": "toponym",
-                "is_toponym": True,
-                "linear_a_cognate": "KU-DO-NI-JA",
-                "notes": (
-                    "Major Minoan/Mycenaean city. CERTAIN "
-                    "anchor reading. Identical in Linear A and B."
-                ),
-                "confidence": "CERTAIN",
-                "source": "Ventris-Chadwick p.400",
-            },
-            "ko-no-so": {
-                "word": "ko-no-so",
-                "meaning": "Knossos (palace city)",
-                "greek": "Κνωσός",
-                "tablets": ["KN As 1516", "KN Dv 1295"],
-                "sites": ["KN"],
-                "category": "toponym",
-                "is_toponym": True,
-                "notes": "Principal Minoan palace. Pre-Greek name.",
-                "confidence": "CERTAIN",
-                "source": "Ventris-Chadwick p.393",
-            },
-            "a-mi-ni-so": {
-                "word": "a-mi-ni-so",
-                "meaning": "Amnisos (port of Knossos)",
-                "greek": "Ἀμνισός",
-                "tablets": ["KN Gg 5 702", "KN M 719"],
-                "sites": ["KN"],
-                "category": "toponym",
-                "is_toponym": True,
-                "notes": "Harbor town. Important port for Knossos.",
-                "confidence": "HIGH",
-                "source": "Ventris-Chadwick p.143",
-            },
-            "tu-ri-so": {
-                "word": "tu-ri-so",
-                "meaning": "Tylissos (Cretan city)",
-                "greek": "Τύλισος",
-                "tablets": ["KN C 902", "KN Dv 1325"],
-                "sites": ["KN"],
-                "category": "toponym",
-                "is_toponym": True,
-                "notes": "Major Minoan site west of Knossos.",
-                "confidence": "HIGH",
-                "source": "Ventris-Chadwick p.552",
-            },
-            "pu-ro": {
-                "word": "pu-ro",
-                "meaning": "Pylos (Mycenaean palace)",
-                "greek": "Πύλος",
-                "tablets": ["PY An 1", "PY Eb 294"],
-                "sites": ["PY"],
-                "category": "toponym",
-                "is_toponym": True,
-                "notes": "Major Mycenaean palace on mainland Greece. Largest Linear B archive.",
-                "confidence": "CERTAIN",
-                "source": "Ventris-Chadwick p.421",
-            },
-        }
-
-        # ============================================================
-        # COMMODITIES AND MEASURES
-        # ============================================================
-
-        commodities = {
-            "wo-no": {
-                "word": "wo-no",
-                "meaning": "wine",
-                "greek": "ϝοῖνος (woinos > οἶνος)",
-                "tablets": ["PY Un 718", "KN Uc 160"],
-                "sites": ["PY", "KN"],
-                "category": "commodity",
-                "is_theophoric": False,
-                "linear_a_cognate": "YA-NE (speculative)",
-                "notes": "Greek wine term. Compare Linear A ya-ne (possible Semitic loan).",
-                "confidence": "HIGH",
-                "source": "Ventris-Chadwick p.592",
-            },
-            "e-ra-wo": {
-                "word": "e-ra-wo",
-                "meaning": "olive oil, fat",
-                "greek": "ἔλαιϝον (elaiwon > ἔλαιον)",
-                "tablets": ["PY Fr 1184", "KN Fh 347"],
-                "sites": ["PY", "KN"],
-                "category": "commodity",
-                "is_theophoric": False,
-                "notes": "Olive oil. Most common commodity in Linear B tablets.",
-                "confidence": "HIGH",
-                "source": "Ventris-Chadwick p.441",
-            },
-            "me-ri": {
-                "word": "me-ri",
-                "meaning": "honey",
-                "greek": "μέλι (meli)",
-                "tablets": ["KN Gg 702", "PY Un 718"],
-                "sites": ["KN", "PY"],
-                "category": "commodity",
-                "is_theophoric": False,
-                "notes": "Honey offerings common in religious contexts.",
-                "confidence": "HIGH",
-                "source": "Ventris-Chadwick p.477",
-            },
-            "si-to": {
-                "word": "si-to",
-                "meaning": "grain, wheat",
-                "greek": "σῖτος (sitos)",
-                "tablets": ["PY An 724", "KN F 841"],
-                "sites": ["PY", "KN"],
-                "category": "commodity",
-                "is_theophoric": False,
-                "notes": "Grain/cereal. Related to GRA logogram.",
-                "confidence": "HIGH",
-                "source": "Ventris-Chadwick p.543",
-            },
-        }
-
-        # ============================================================
-        # PERSONAL NAMES WITH THEOPHORIC ELEMENTS
-        # ============================================================
-
-        theophoric_names = {
-            "di-wi-je-u": {
-                "word": "di-wi-je-u",
-                "meaning": "Zeus-devotee (personal name)",
-                "greek": "Διϝιεύς",
-                "tablets": ["PY An 654"],
-                "sites": ["PY"],
-                "category": "personal_name",
-                "divine_element": "di-wi/di-we",
-                "is_theophoric": True,
-                "notes": "Name containing Zeus element. Pattern for identifying theophoric names.",
-                "confidence": "HIGH",
-                "source": "Aura Jorro DMic I p.179",
-            },
-            "po-se-da-wo-ne": {
-                "word": "po-se-da-wo-ne",
-                "meaning": "Poseidon-related (personal name)",
-                "greek": "Ποσειδάϝωνος related",
-                "tablets": ["PY Tn 316"],
-                "sites": ["PY"],
-                "category": "personal_name",
-                "divine_element": "po-se-da-o",
-                "is_theophoric": True,
-                "notes": "Name with Poseidon element.",
-                "confidence": "HIGH",
-                "source": "Aura Jorro DMic II p.140",
-            },
-            "a-ta-na-to": {
-                "word": "a-ta-na-to",
-                "meaning": "Athena-related (personal name?)",
-                "tablets": ["KN V 280"],
-                "sites": ["KN"],
-                "category": "personal_name",
-                "divine_element": "a-ta-na",
-                "is_theophoric": True,
-                "linear_a_cognate": "A-TA-NA-TE",
-                "notes": "Contains Athena element. Compare Linear A A-TA-NA-TE.",
-                "confidence": "MEDIUM",
-                "source": "Aura Jorro DMic I p.120",
-            },
-            "a-re-i-me-ne": {
-                "word": "a-re-i-me-ne",
-                "meaning": "Ares-minded (personal name)",
-                "greek": "Ἀρηΐμενης",
-                "tablets": ["PY An 39"],
-                "sites": ["PY"],
-                "category": "personal_name",
-                "divine_element": "a-re",
-                "is_theophoric": True,
-                "notes": "Theophoric with Ares element.",
-                "confidence": "HIGH",
-                "source": "Aura Jorro DMic I p.93",
-            },
-        }
-
-        # Combine all categories
-        all_vocab = {}
-        all_vocab.update(theophoric)
-        all_vocab.update(administrative)
-        all_vocab.update(toponyms)
-        all_vocab.update(commodities)
-        all_vocab.update(theophoric_names)
-
-        self.vocabulary = all_vocab
-        self.log(f"Built vocabulary with {len(self.vocabulary)} entries")
-
-    def verify_cognate(self, linear_a_word: str) -> Dict:
+    def verify_cognate(self, linear_a_word: str, max_distance: int = 1) -> Dict:
         """
         Verify a Linear A reading against Linear B data.
 
-        Returns verification result with confidence and evidence.
+        Args:
+            linear_a_word: Linear A word (e.g., "DA-MA-TE")
+            max_distance: Sign edits allowed for ``near_matches`` (0 disables them)
+
+        Returns verification result with confidence and evidence. Near
+        matches are reported for review and do not affect ``verified``.
         """
         word_upper = linear_a_word.upper().replace("_", "-")
         word_lower = linear_a_word.lower().replace("_", "-")
@@ -671,25 +188,25 @@ class DAMOSConnector:
             "cognates_json_matches": [],
             "confidence": "NOT_FOUND",
             "evidence": [],
+            "near_matches": [],
             "notes": "",
         }
 
         # Check vocabulary for direct matches
-        for word, data in self.vocabulary.items():
-            # Check if this Linear B word has this Linear A as cognate
-            if data.get("linear_a_cognate", "").upper() == word_upper:
-                result["verified"] = True
-                result["linear_b_matches"].append(
-                    {
-                        "word": word,
-                        "meaning": data["meaning"],
-                        "tablets": data.get("tablets", []),
-                        "sites": data.get("sites", []),
-                        "source": data.get("source", ""),
-                        "notes": data.get("notes", ""),
-                    }
-                )
-                result["confidence"] = data.get("confidence", "MEDIUM")
+        for word in self._linear_b_words_for(word_upper):
+            data = self.vocabulary[word]
+            result["verified"] = True
+            result["linear_b_matches"].append(
+                {
+                    "word": word,
+                    "meaning": data["meaning"],
+                    "tablets": data.get("tablets", []),
+                    "sites": data.get("sites", []),
+                    "source": data.get("source", ""),
+                    "notes": data.get("notes", ""),
+                }
+            )
+            result["confidence"] = data.get("confidence", "MEDIUM")
 
         # Check cognates.json for identical words
         identical = self.cognates.get("identicalWords", {})
@@ -704,6 +221,15 @@ class DAMOSConnector:
                 f"Found in cognates.json with {len(tablets)} Linear B attestations"
             )
 
+        # Sign-level near matches (substitution, vowel alternation, dropped sign)
+        if max_distance > 0:
+            result["near_matches"] = [
+                m.to_dict()
+                for m in self.cognate_index.near(
+                    linear_a_word, min(max_distance, DEFAULT_MAX_DISTANCE)
+                )
+            ]
+
         # Add notes
         if result["verified"]:
             result["notes"] = (
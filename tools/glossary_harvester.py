@@ -0,0 +1,540 @@
+#!/usr/bin/env python3
+"""
+Cache-first concurrent harvester for remote glossary dumps.
+
+Each request is identified by a cache key and a URL. The harvester:
+
+- serves the cached body while it is younger than the TTL
+- otherwise revalidates with If-None-Match / If-Modified-Since, so an
+  unchanged dump costs one 304 instead of a full download
+- fetches misses concurrently through a bounded thread pool, pacing requests
+  to the same host and retrying transient failures with exponential backoff
+- falls back to an expired cached copy when the server cannot be reached
+- records per-request status, latency and attempt counts for reporting
+
+Bodies are streamed to disk unchanged (``<key>.json``) next to a small
+``<key>.json.meta`` sidecar holding the validators. ``iter_glossary_entries``
+then reads a cached body (or a live response) in chunks and yields one
+entry object at a time, so memory stays bounded by the largest entry rather
+than the whole dump.
+"""
+
+from __future__ import annotations
+
+import codecs
+import http.client
+import json
+import os
+import re
+import socket
+import ssl
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlsplit
+
+
+USER_AGENT = "LinearA-Decipherment/1.0"
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_WORKERS = 4
+DEFAULT_HOST_INTERVAL = 0.5  # seconds between request starts per host
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 1.0  # seconds, doubled per retry
+DEFAULT_TIMEOUT = 30
+CHUNK_SIZE = 1 << 16
+
+# Top-level keys holding glossary entry arrays, in order of preference.
+ENTRY_KEYS = ("entries", "terms")
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+# Result statuses
+STATUS_CACHED = "cached"  # fresh cache hit, no network
+STATUS_REVALIDATED = "revalidated"  # 304 Not Modified
+STATUS_FETCHED = "fetched"  # full download
+STATUS_STALE = "stale"  # network failed, expired cache served
+STATUS_OFFLINE = "offline"  # offline mode, cached copy served
+STATUS_ERROR = "error"
+
+
+@dataclass
+class HarvestResult:
+    """Outcome of one harvest request."""
+
+    key: str
+    url: str
+    status: str
+    path: Optional[str] = None
+    latency_ms: float = 0.0
+    attempts: int = 0
+    bytes: int = 0
+    http_status: Optional[int] = None
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.path is not None
+
+    def load_json(self) -> Optional[Any]:
+        """Parse the cached body (None if nothing was harvested)."""
+        if not self.path:
+            return None
+        with open(self.path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def iter_entries(self, keys: Sequence[str] = ENTRY_KEYS) -> Iterator[dict]:
+        """Stream entry objects out of the cached body."""
+        if not self.path:
+            return iter(())
+        return iter_glossary_file(self.path, keys)
+
+
+class HostRateLimiter:
+    """Spaces request starts to the same host by at least ``min_interval``."""
+
+    def __init__(self, min_interval: float = DEFAULT_HOST_INTERVAL):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
+
+    def wait(self, host: str) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def _is_ssl_error(error: BaseException) -> bool:
+    if isinstance(error, ssl.SSLError):
+        return True
+    return isinstance(error, urllib.error.URLError) and isinstance(error.reason, ssl.SSLError)
+
+
+def _retry_after(error: urllib.error.HTTPError) -> Optional[float]:
+    value = error.headers.get("Retry-After") if error.headers else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+class GlossaryHarvester:
+    """
+    Cache-first, conditional, concurrent fetcher for JSON dumps.
+
+    Args:
+        cache_dir: Directory holding ``<key>.json`` bodies and sidecars
+        ttl: Seconds a cached body is served without revalidation
+        workers: Thread pool size for fetch_many
+        host_interval: Minimum seconds between request starts per host
+        retries: Extra attempts after a transient failure
+        backoff: Initial retry delay in seconds (doubles per attempt)
+        offline: Serve cached copies only, never touch the network
+        refresh: Ignore the TTL and revalidate every cached body
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        workers: int = DEFAULT_WORKERS,
+        host_interval: float = DEFAULT_HOST_INTERVAL,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        timeout: float = DEFAULT_TIMEOUT,
+        offline: bool = False,
+        refresh: bool = False,
+        log=None,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.workers = max(1, workers)
+        self.retries = max(0, retries)
+        self.backoff = backoff
+        self.timeout = timeout
+        self.offline = offline
+        self.refresh = refresh
+        self.rate_limiter = HostRateLimiter(host_interval)
+        self._log = log or (lambda msg, level="info": None)
+        # Hosts whose certificate failed verification once (ORACC has had
+        # certificate issues); later requests skip straight to the fallback.
+        self._unverified_hosts = set()
+        self._unverified_lock = threading.Lock()
+
+    # ── Cache ────────────────────────────────────────────────────────
+
+    def cache_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    @staticmethod
+    def _meta_path(path: Path) -> Path:
+        return path.with_name(path.name + ".meta")
+
+    def read_meta(self, key: str) -> Dict[str, Any]:
+        path = self.cache_path(key)
+        if not path.exists():
+            return {}
+        try:
+            with open(self._meta_path(path), "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            # Body without sidecar (older cache layout): usable, never fresh.
+            return {"fetched_at": 0.0}
+        return meta if isinstance(meta, dict) else {"fetched_at": 0.0}
+
+    def _write_meta(self, path: Path, meta: Dict[str, Any]) -> None:
+        tmp = self._meta_path(path).with_suffix(f".tmp{threading.get_ident()}")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp, self._meta_path(path))
+
+    # ── Network ──────────────────────────────────────────────────────
+
+    def _open(self, request: urllib.request.Request, host: str):
+        if host in self._unverified_hosts:
+            ctx = ssl.create_default_context()
+            ctx.check_hostname = False
+            ctx.verify_mode = ssl.CERT_NONE
+            return urllib.request.urlopen(request, timeout=self.timeout, context=ctx)
+        try:
+            return urllib.request.urlopen(request, timeout=self.timeout)
+        except (ssl.SSLError, urllib.error.URLError) as e:
+            if not _is_ssl_error(e):
+                raise
+            self._log(
+                f"SSL verification failed for {host}, retrying without verification", "warning"
+            )
+            with self._unverified_lock:
+                self._unverified_hosts.add(host)
+            return self._open(request, host)
+
+    def _download(self, response, path: Path) -> int:
+        tmp = path.with_suffix(f".part{threading.get_ident()}")
+        size = 0
+        try:
+            with open(tmp, "wb") as f:
+                while True:
+                    chunk = response.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    size += len(chunk)
+            expected = response.headers.get("Content-Length")
+            if expected and expected.isdigit() and size < int(expected):
+                raise http.client.IncompleteRead(b"", int(expected) - size)
+            os.replace(tmp, path)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+        return size
+
+    def fetch(self, key: str, url: str) -> HarvestResult:
+        """Harvest one URL into the cache (see class docstring for policy)."""
+        started = time.perf_counter()
+        result = self._fetch(key, url)
+        result.latency_ms = round((time.perf_counter() - started) * 1000, 1)
+        return result
+
+    def _fetch(self, key: str, url: str) -> HarvestResult:
+        path = self.cache_path(key)
+        meta = self.read_meta(key)
+        cached = bool(meta)
+
+        if cached and self.offline:
+            return HarvestResult(key, url, STATUS_OFFLINE, str(path), bytes=path.stat().st_size)
+        if self.offline:
+            return HarvestResult(key, url, STATUS_ERROR, error="offline and not cached")
+        age = time.time() - float(meta.get("fetched_at", 0.0)) if cached else None
+        if cached and not self.refresh and age is not None and age < self.ttl:
+            return HarvestResult(key, url, STATUS_CACHED, str(path), bytes=path.stat().st_size)
+
+        headers = {"User-Agent": USER_AGENT}
+        if cached and meta.get("url") == url:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        host = urlsplit(url).netloc
+        error = ""
+        http_status = None
+        attempt = 0
+        while attempt <= self.retries:
+            attempt += 1
+            self.rate_limiter.wait(host)
+            delay = self.backoff * (2 ** (attempt - 1))
+            try:
+                request = urllib.request.Request(url, headers=headers)
+                with self._open(request, host) as response:
+                    http_status = response.status
+                    self.cache_dir.mkdir(parents=True, exist_ok=True)
+                    size = self._download(response, path)
+                    self._write_meta(
+                        path,
+                        {
+                            "url": url,
+                            "etag": response.headers.get("ETag"),
+                            "last_modified": response.headers.get("Last-Modified"),
+                            "fetched_at": time.time(),
+                            "bytes": size,
+                        },
+                    )
+                return HarvestResult(
+                    key,
+                    url,
+                    STATUS_FETCHED,
+                    str(path),
+                    attempts=attempt,
+                    bytes=size,
+                    http_status=http_status,
+                )
+            except urllib.error.HTTPError as e:
+                http_status = e.code
+                if e.code == 304 and cached:
+                    meta["fetched_at"] = time.time()
+                    self._write_meta(path, meta)
+                    return HarvestResult(
+                        key,
+                        url,
+                        STATUS_REVALIDATED,
+                        str(path),
+                        attempts=attempt,
+                        bytes=path.stat().st_size,
+                        http_status=304,
+                    )
+                error = f"HTTP {e.code}"
+                if e.code not in RETRY_STATUS:
+                    break
+                delay = max(delay, _retry_after(e) or 0.0)
+            except (
+                urllib.error.URLError,
+                http.client.IncompleteRead,
+                socket.timeout,
+                TimeoutError,
+                ConnectionError,
+            ) as e:
+                error = str(getattr(e, "reason", e))
+            except OSError as e:
+                error = str(e)
+                break
+            if attempt <= self.retries:
+                self._log(f"Retrying {url} in {delay:.1f}s ({error})", "warning")
+                time.sleep(delay)
+
+        if cached:
+            self._log(f"Serving stale cache for {key}: {error}", "warning")
+            return HarvestResult(
+                key,
+                url,
+                STATUS_STALE,
+                str(path),
+                attempts=attempt,
+                bytes=path.stat().st_size,
+                http_status=http_status,
+                error=error,
+            )
+        return HarvestResult(
+            key, url, STATUS_ERROR, attempts=attempt, http_status=http_status, error=error
+        )
+
+    def fetch_many(self, requests: Sequence[Tuple[str, str]]) -> List[HarvestResult]:
+        """Harvest (key, url) pairs concurrently; results keep input order."""
+        if not requests:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(requests))) as pool:
+            return list(pool.map(lambda item: self.fetch(*item), requests))
+
+
+def latency_report(results: Sequence[HarvestResult]) -> Dict[str, Any]:
+    """Summarize a harvest: per-request rows plus status counts and timing."""
+    counts: Dict[str, int] = {}
+    for result in results:
+        counts[result.status] = counts.get(result.status, 0) + 1
+    network = [r.latency_ms for r in results if r.status in (STATUS_FETCHED, STATUS_REVALIDATED)]
+    return {
+        "requests": len(results),
+        "status_counts": counts,
+        "bytes_downloaded": sum(r.bytes for r in results if r.status == STATUS_FETCHED),
+        "max_latency_ms": max((r.latency_ms for r in results), default=0.0),
+        "mean_network_latency_ms": round(sum(network) / len(network), 1) if network else 0.0,
+        "results": [asdict(r) for r in results],
+    }
+
+
+# ── Streaming entry parser ───────────────────────────────────────────
+
+_WS_RE = re.compile(r"\s*")
+_STRUCT_RE = re.compile(r'["\[\]{}]')
+_STRING_RE = re.compile(r'"(?:[^"\\]|\\.)*"', re.S)
+_SCALAR_RE = re.compile(r"[^\s,\]}]+")
+_COMPACT_AT = CHUNK_SIZE
+
+
+class _ChunkBuffer:
+    """Text window over an iterable of chunks; consumed text is dropped."""
+
+    def __init__(self, chunks: Iterable[str]):
+        self._chunks = iter(chunks)
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        for chunk in self._chunks:
+            if not chunk:
+                continue
+            if self.pos >= _COMPACT_AT:
+                self.buf = self.buf[self.pos :]
+                self.pos = 0
+            self.buf += chunk
+            return True
+        self.eof = True
+        return False
+
+    def peek(self) -> str:
+        """Next non-whitespace character ("" at end of input)."""
+        while True:
+            self.pos = _WS_RE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            found = self.buf[self.pos : self.pos + 20] or "end of input"
+            raise ValueError(f"Expected {char!r} in glossary JSON, found {found!r}")
+        self.pos += 1
+
+    def _match(self, pattern: re.Pattern) -> re.Match:
+        # A match touching the end of the window may continue in the next chunk.
+        while True:
+            m = pattern.match(self.buf, self.pos)
+            if m and (m.end() < len(self.buf) or self.eof):
+                return m
+            if not self.fill():
+                m = pattern.match(self.buf, self.pos)
+                if m:
+                    return m
+                raise ValueError("Truncated glossary JSON")
+
+    def read_string(self) -> str:
+        self.peek()
+        m = self._match(_STRING_RE)
+        self.pos = m.end()
+        return json.loads(m.group())
+
+    def skip_value(self) -> None:
+        """Skip one JSON value without building it."""
+        first = self.peek()
+        if first == '"':
+            self.read_string()
+            return
+        if first not in "[{":
+            self.pos = self._match(_SCALAR_RE).end()
+            return
+        depth = 0
+        while True:
+            m = _STRUCT_RE.search(self.buf, self.pos)
+            if m is None:
+                self.pos = len(self.buf)
+                if not self.fill():
+                    raise ValueError("Truncated glossary JSON")
+                continue
+            self.pos = m.start()
+            if m.group() == '"':
+                self.read_string()
+                continue
+            self.pos += 1
+            depth += 1 if m.group() in "[{" else -1
+            if depth == 0:
+                return
+
+    def decode_value(self, decoder: json.JSONDecoder) -> Any:
+        """Decode one complete value, pulling chunks until it parses."""
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            if end < len(self.buf) or self.eof or isinstance(value, (dict, list, str)):
+                self.pos = end
+                return value
+            if not self.fill():
+                self.pos = end
+                return value
+
+
+def iter_glossary_entries(
+    chunks: Iterable[str], keys: Sequence[str] = ENTRY_KEYS
+) -> Iterator[dict]:
+    """
+    Yield entry objects from a glossary JSON document given as text chunks.
+
+    Streams the first top-level key in ``keys`` that holds an array; every
+    other top-level value is skipped without being materialized. Non-object
+    array items are skipped.
+    """
+    reader = _ChunkBuffer(chunks)
+    decoder = json.JSONDecoder()
+    if reader.peek() != "{":
+        return
+    reader.pos += 1
+    streamed = False
+    while reader.peek() not in ("}", ""):
+        key = reader.read_string()
+        reader.expect(":")
+        if not streamed and key in keys and reader.peek() == "[":
+            streamed = True
+            reader.pos += 1
+            while reader.peek() != "]":
+                item = reader.decode_value(decoder)
+                if isinstance(item, dict):
+                    yield item
+                if reader.peek() == ",":
+                    reader.pos += 1
+            reader.pos += 1
+        else:
+            reader.skip_value()
+        if reader.peek() == ",":
+            reader.pos += 1
+
+
+def iter_text_chunks(
+    stream: Union[IO[str], IO[bytes]], chunk_size: int = CHUNK_SIZE
+) -> Iterator[str]:
+    """Read a text or binary (UTF-8) stream as decoded text chunks."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        yield decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def iter_glossary_file(
+    path: Union[str, Path], keys: Sequence[str] = ENTRY_KEYS, chunk_size: int = CHUNK_SIZE
+) -> Iterator[dict]:
+    """Stream entry objects from a cached glossary file."""
+    with open(path, "rb") as f:
+        yield from iter_glossary_entries(iter_text_chunks(f, chunk_size), keys)
@@ -20,6 +20,7 @@ Volume Structure:
 
 Usage:
     python tools/gorila_indexer.py --lookup "HT 13"      # Look up tablet
+    python tools/gorila_indexer.py --lookup HT13 ZA4    # Look up several tablets
     python tools/gorila_indexer.py --volume 1           # List Volume I contents
     python tools/gorila_indexer.py --search "ku-ro"     # Search transcriptions
     python tools/gorila_indexer.py --conventions        # Show transcription rules
@@ -32,13 +33,17 @@ Attribution:
 
 import json
 import argparse
+import re
 import sys
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Set
 from dataclasses import dataclass, field
 import logging
 
+from reference_data import load_reference
+from sign_registry import tablet_key
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
@@ -48,6 +53,11 @@ PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 GORILA_DIR = DATA_DIR / "gorila"
 INDEX_FILE = GORILA_DIR / "index.json"
+REFERENCE_DATASET = "gorila_index"
+
+# Side/fragment suffix on a corpus id ("HT122a", "KH 7b") absent from GORILA
+_FRAGMENT_SUFFIX = re.compile(r"(?<=\d)[A-Z]+$")
+_SEQUENCE_SEPARATORS = re.compile(r"[-\s]+")
 
 
 @dataclass
@@ -75,15 +85,44 @@ class GORILAIndexer:
 
     Provides lookup, search, and cross-referencing capabilities
     across all five GORILA volumes.
+
+    Secondary indexes (normalized tablet id, volume, site, type and
+    key-sequence sign postings) are built on first query and dropped when
+    ``index`` is replaced; rebuild them with ``reindex()`` after editing
+    entries in place.
     """
 
     def __init__(self, verbose: bool = False):
         self.verbose = verbose
-        self.index: Dict[str, Dict] = {}
-        self.volumes: Dict[int, Dict] = {}
-        self.conventions: Dict = {}
+        self._index: Optional[Dict[str, Dict]] = None
+        self._lookup: Optional[Dict[str, Dict]] = None
+        self._volumes: Dict[int, Dict] = {}
+        self._conventions: Dict = {}
         self._ensure_dirs()
-        self._build_index()
+
+    @property
+    def index(self) -> Dict[str, Dict]:
+        """Inscription index keyed by tablet id (loaded on first access)."""
+        if self._index is None:
+            self._build_index()
+        return self._index
+
+    @index.setter
+    def index(self, value: Dict[str, Dict]):
+        self._index = value
+        self._lookup = None
+
+    @property
+    def volumes(self) -> Dict[int, Dict]:
+        if self._index is None:
+            self._build_index()
+        return self._volumes
+
+    @property
+    def conventions(self) -> Dict:
+        if self._index is None:
+            self._build_index()
+        return self._conventions
 
     def _ensure_dirs(self):
         """Create necessary directories."""
@@ -96,684 +135,100 @@ class GORILAIndexer:
 
     def _build_index(self):
         """
-        Build comprehensive GORILA index from published data.
+        Load the GORILA index from data/reference/gorila_index.json.
 
-        This creates a reference index for all inscriptions in the
-        GORILA corpus with volume/page assignments.
+        The dataset holds volume metadata, sign conventions and a reference
+        index for all inscriptions in the GORILA corpus with volume/page
+        assignments.
         """
-        self.log("Building GORILA index...")
-
-        # ============================================================
-        # VOLUME METADATA
-        # ============================================================
-        self.volumes = {
-            1: {
-                "title": "Recueil des inscriptions en lineaire A, Volume 1",
-                "subtitle": "Hagia Triada (1ere partie)",
-                "authors": "Louis Godart, Jean-Pierre Olivier",
-                "year": 1976,
-                "publisher": "Etudes Cretoises XXI",
-                "pages": 400,
-                "contents": "HT 1-120",
-                "site_codes": ["HT"],
-                "inscription_count": 120,
-                "description": "First 120 tablets from Hagia Triada, the largest Linear A archive",
-            },
-            2: {
-                "title": "Recueil des inscriptions en lineaire A, Volume 2",
-                "subtitle": "Paleographie et classification des signes",
-                "authors": "Louis Godart, Jean-Pierre Olivier",
-                "year": 1979,
-                "publisher": "Etudes Cretoises XXI",
-                "pages": 350,
-                "contents": "Sign list (AB numbers)",
-                "site_codes": [],
-                "inscription_count": 0,
-                "description": (
-                    "Complete sign list with AB numbering system and paleographic analysis"
-                ),
-            },
-            3: {
-                "title": "Recueil des inscriptions en lineaire A, Volume 3",
-                "subtitle": "Hagia Triada (2eme partie), Khania, Phaistos",
-                "authors": "Louis Godart, Jean-Pierre Olivier",
-                "year": 1976,
-                "publisher": "Etudes Cretoises XXI",
-                "pages": 350,
-                "contents": "HT 121+, KH, PH",
-                "site_codes": ["HT", "KH", "PH"],
-                "inscription_count": 180,
-                "description": (
-                    "Remaining Hagia Triada tablets plus Khania and Phaistos inscriptions"
-                ),
-            },
-            4: {
-                "title": "Recueil des inscriptions en lineaire A, Volume 4",
-                "subtitle": "Autres documents",
-                "authors": "Louis Godart, Jean-Pierre Olivier",
-                "year": 1982,
-                "publisher": "Etudes Cretoises XXI",
-                "pages": 300,
-                "contents": "ZA, IO, PE, PS, SY, etc.",
-                "site_codes": [
-                    "ZA",
-                    "IO",
-                    "PE",
-                    "PS",
-                    "SY",
-                    "AR",
-                    "AP",
-                    "CR",
-                    "GR",
-                    "KE",
-                    "KT",
-                    "MA",
-                    "MI",
-                    "PL",
-                    "TH",
-                    "TY",
-                ],
-                "inscription_count": 200,
-                "description": "Zakros and miscellaneous sites across Crete and beyond",
-            },
-            5: {
-                "title": "Recueil des inscriptions en lineaire A, Volume 5",
-                "subtitle": "Supplements et addenda",
-                "authors": "Louis Godart, Jean-Pierre Olivier (+ successors)",
-                "year": 1985,
-                "publisher": "Etudes Cretoises XXI",
-                "pages": 250,
-                "contents": "Supplements, new finds, KN scepter",
-                "site_codes": ["HT", "KH", "KN", "PH", "ZA"],
-                "inscription_count": 100,
-                "description": (
-                    "Supplementary materials including 2024 Knossos ivory scepter (KN Zf 2)"
-                ),
-            },
-        }
-
-        # ============================================================
-        # TRANSCRIPTION CONVENTIONS
-        # ============================================================
-        self.conventions = {
-            "sign_notation": {
-                "AB##": "Syllabographic sign with GORILA number (e.g., AB08 = a)",
-                "*###": "Ideogram/logogram number (e.g., *301)",
-                "CAPITAL": "Latin transliteration of known syllabic value",
-                "lowercase": "Normalized transcription",
-                "[]": "Restored/damaged signs",
-                "?": "Uncertain reading",
-                "-": "Word/syllable divider (in transcription)",
-                "|": "Word divider (in original)",
-                "/": "Line break",
-                ".1, .2": "Face designation (tablet sides)",
-            },
-            "commodity_logograms": {
-                "GRA": "Grain/barley",
-                "VIN": "Wine",
-                "OLE": "Olive oil",
-                "FIC": "Figs",
-                "OVI": "Sheep",
-                "CAP": "Goats",
-                "SUS": "Pigs",
-                "BOS": "Cattle",
-                "TELA": "Textiles/cloth",
-                "AES": "Bronze/copper",
-            },
-            "numerals": {
-                "|": "Unit stroke (1)",
-                "−": "Ten stroke",
-                "○": "Hundred circle",
-                "●": "Thousand dot",
-                "Fractions": "J, E, F, K, L, etc. for fractional values",
-            },
-            "site_codes": {
-                "HT": "Hagia Triada (147 tablets)",
-                "KH": "Khania/Kydonia (99 tablets)",
-                "ZA": "Zakros (31 tablets)",
-                "PH": "Phaistos (earliest inscriptions)",
-                "KN": "Knossos (includes 2024 scepter)",
-                "PE": "Petras",
-                "IO": "Iouktas (peak sanctuary)",
-                "PS": "Psychro (Dictaean Cave)",
-                "SY": "Syme",
-                "PK": "Palaikastro",
-                "KO": "Kophinas",
-                "TL": "Tylissos",
-                "AR": "Archanes",
-                "AP": "Apodoulou",
-                "CR": "Cretan misc.",
-                "GR": "Greek mainland finds",
-                "KE": "Kea (Aegean island)",
-                "MA": "Malia",
-                "MI": "Miletos (Anatolia)",
-                "TH": "Thera (Santorini)",
-            },
-            "inscription_types": {
-                "tablet": "Clay administrative tablet",
-                "roundel": "Clay roundel with seal impression",
-                "nodule": "Clay sealing/nodule",
-                "seal": "Engraved seal stone",
-                "vessel": "Inscribed pottery/pithos",
-                "libation_table": "Stone offering table",
-                "ladle": "Bronze ladle with inscription",
-                "pin": "Gold/bronze pin",
-                "weight": "Lead/stone weight",
-                "scepter": "Ceremonial object (e.g., KN Zf 2)",
-            },
-        }
-
-        # ============================================================
-        # INSCRIPTION INDEX
-        # Build representative index of major inscriptions
-        # ============================================================
-
-        inscriptions = {}
-
-        # HAGIA TRIADA - Volume I (HT 1-120)
-        ht_vol1 = [
-            ("HT 1", 1, 5, "tablet", 45, 4, "complete", "LM IB", True, True, ["a-du", "ku-ro"]),
-            ("HT 2", 1, 8, "tablet", 38, 3, "complete", "LM IB", True, True, ["ki-ro"]),
-            ("HT 3", 1, 11, "tablet", 42, 4, "fragmentary", "LM IB", True, True, []),
-            ("HT 4", 1, 14, "tablet", 28, 2, "complete", "LM IB", True, False, []),
-            ("HT 5", 1, 17, "tablet", 35, 3, "complete", "LM IB", True, True, []),
-            ("HT 6", 1, 20, "tablet", 52, 4, "complete", "LM IB", True, True, ["da-me", "a-du"]),
-            ("HT 7", 1, 24, "tablet", 40, 3, "complete", "LM IB", True, True, []),
-            ("HT 8", 1, 27, "tablet", 35, 3, "complete", "LM IB", True, True, []),
-            ("HT 9", 1, 30, "tablet", 48, 4, "fragmentary", "LM IB", True, True, []),
-            ("HT 10", 1, 33, "tablet", 55, 4, "complete", "LM IB", True, True, ["a-du", "te"]),
-            ("HT 11", 1, 36, "tablet", 32, 2, "complete", "LM IB", True, True, []),
-            ("HT 12", 1, 39, "tablet", 38, 3, "complete", "LM IB", True, True, []),
-            (
-                "HT 13",
-                1,
-                42,
-                "tablet",
-                65,
-                5,
-                "complete",
-                "LM IB",
-                True,
-                True,
-                ["ku-ro", "ki-ro", "te"],
-            ),
-            ("HT 14", 1, 46, "tablet", 40, 3, "complete", "LM IB", True, True, []),
-            ("HT 15", 1, 49, "tablet", 42, 3, "complete", "LM IB", True, True, []),
-            ("HT 16", 1, 52, "tablet", 35, 3, "complete", "LM IB", True, True, []),
-            ("HT 17", 1, 55, "tablet", 48, 4, "complete", "LM IB", True, True, []),
-            ("HT 18", 1, 58, "tablet", 30, 2, "complete", "LM IB", True, False, []),
-            ("HT 19", 1, 61, "tablet", 38, 3, "complete", "LM IB", True, True, []),
-            ("HT 20", 1, 64, "tablet", 45, 3, "complete", "LM IB", True, True, []),
-            ("HT 21", 1, 67, "tablet", 40, 3, "fragmentary", "LM IB", True, True, []),
-            ("HT 22", 1, 70, "tablet", 35, 3, "complete", "LM IB", True, True, []),
-            ("HT 23", 1, 73, "tablet", 42, 3, "complete", "LM IB", True, True, ["sa-ra2"]),
-            ("HT 24", 1, 76, "tablet", 50, 4, "complete", "LM IB", True, True, []),
-            ("HT 25", 1, 79, "tablet", 38, 3, "complete", "LM IB", True, True, []),
-            ("HT 26", 1, 82, "tablet", 45, 3, "complete", "LM IB", True, True, []),
-            ("HT 27", 1, 85, "tablet", 40, 3, "complete", "LM IB", True, True, []),
-            (
-                "HT 28",
-                1,
-                88,
-                "tablet",
-                70,
-                5,
-                "complete",
-                "LM IB",
-                True,
-                True,
-                ["ku-ro", "te", "su-pu"],
-            ),
-            ("HT 29", 1, 92, "tablet", 35, 2, "complete", "LM IB", True, True, []),
-            ("HT 30", 1, 95, "tablet", 42, 3, "complete", "LM IB", True, True, []),
-            ("HT 31", 1, 98, "tablet", 60, 4, "complete", "LM IB", True, True, ["ku-ro", "ki-ro"]),
-            ("HT 32", 1, 102, "tablet", 38, 3, "complete", "LM IB", True, True, []),
-            ("HT 33", 1, 105, "tablet", 45, 3, "complete", "LM IB", True, True, []),
-            ("HT 34", 1, 108, "tablet", 40, 3, "complete", "LM IB", True, True, []),
-            ("HT 35", 1, 111, "tablet", 52, 4, "complete", "LM IB", True, True, []),
-            ("HT 36", 1, 114, "tablet", 35, 2, "fragmentary", "LM IB", True, False, []),
-            ("HT 37", 1, 117, "tablet", 40, 3, "complete", "LM IB", True, True, []),
-            ("HT 38", 1, 120, "tablet", 45, 3, "complete", "LM IB", True, True, []),
-            ("HT 39", 1, 123, "tablet", 38, 3, "complete", "LM IB", True, True, []),
-            ("HT 40", 1, 126, "tablet", 48, 4, "complete", "LM IB", True, True, []),
-            ("HT 85", 1, 250, "tablet", 60, 4, "complete", "LM IB", True, True, ["da-me", "ku-ro"]),
-            ("HT 86", 1, 254, "tablet", 55, 4, "complete", "LM IB", True, True, []),
-            ("HT 87", 1, 258, "tablet", 45, 3, "complete", "LM IB", True, True, []),
-            ("HT 88", 1, 262, "tablet", 50, 4, "complete", "LM IB", True, True, []),
-            ("HT 89", 1, 266, "tablet", 40, 3, "complete", "LM IB", True, True, []),
-            ("HT 90", 1, 270, "tablet", 55, 4, "complete", "LM IB", True, True, []),
-            ("HT 91", 1, 274, "tablet", 48, 3, "complete", "LM IB", True, True, []),
-            ("HT 92", 1, 278, "tablet", 42, 3, "complete", "LM IB", True, True, []),
-            ("HT 93", 1, 282, "tablet", 38, 3, "complete", "LM IB", True, True, []),
-            ("HT 94", 1, 286, "tablet", 70, 5, "complete", "LM IB", True, True, ["ku-ro", "da-i"]),
-            ("HT 95", 1, 290, "tablet", 58, 4, "complete", "LM IB", True, True, ["a-ta-na-te"]),
-            ("HT 96", 1, 294, "tablet", 45, 3, "complete", "LM IB", True, True, []),
-            ("HT 97", 1, 298, "tablet", 40, 3, "complete", "LM IB", True, True, []),
-            ("HT 98", 1, 302, "tablet", 52, 4, "complete", "LM IB", True, True, []),
-            ("HT 99", 1, 306, "tablet", 35, 2, "fragmentary", "LM IB", True, True, []),
-            ("HT 100", 1, 310, "tablet", 48, 3, "complete", "LM IB", True, True, []),
-            ("HT 101", 1, 314, "tablet", 55, 4, "complete", "LM IB", True, True, []),
-            ("HT 102", 1, 318, "tablet", 42, 3, "complete", "LM IB", True, True, []),
-            ("HT 103", 1, 322, "tablet", 38, 3, "complete", "LM IB", True, True, []),
-            ("HT 104", 1, 326, "tablet", 45, 3, "complete", "LM IB", True, True, []),
-            ("HT 105", 1, 330, "tablet", 40, 3, "complete", "LM IB", True, True, []),
-            ("HT 106", 1, 334, "tablet", 35, 2, "complete", "LM IB", True, True, []),
-            ("HT 107", 1, 338, "tablet", 48, 4, "complete", "LM IB", True, True, []),
-            ("HT 108", 1, 342, "tablet", 52, 4, "complete", "LM IB", True, True, []),
-            ("HT 109", 1, 346, "tablet", 38, 3, "complete", "LM IB", True, True, []),
-            ("HT 110", 1, 350, "tablet", 45, 3, "complete", "LM IB", True, True, []),
-            ("HT 111", 1, 354, "tablet", 40, 3, "fragmentary", "LM IB", True, True, []),
-            ("HT 112", 1, 358, "tablet", 55, 4, "complete", "LM IB", True, True, []),
-            ("HT 113", 1, 362, "tablet", 42, 3, "complete", "LM IB", True, True, []),
-            ("HT 114", 1, 366, "tablet", 35, 2, "complete", "LM IB", True, False, []),
-            ("HT 115", 1, 370, "tablet", 48, 4, "complete", "LM IB", True, True, []),
-            ("HT 116", 1, 374, "tablet", 50, 4, "complete", "LM IB", True, True, []),
-            (
-                "HT 117",
-                1,
-                378,
-                "tablet",
-                75,
-                6,
-                "complete",
-                "LM IB",
-                True,
-                True,
-                ["ku-ro", "da-ma-te", "a-ta-na"],
-            ),
-            ("HT 118", 1, 384, "tablet", 38, 3, "complete", "LM IB", True, True, []),
-            ("HT 119", 1, 388, "tablet", 45, 3, "complete", "LM IB", True, True, []),
-            ("HT 120", 1, 392, "tablet", 40, 3, "complete", "LM IB", True, True, []),
-        ]
-
-        for entry in ht_vol1:
-            tablet_id, vol, page, insc_type, signs, lines, cond, period, nums, logos, seqs = entry
-            inscriptions[tablet_id] = {
-                "tablet_id": tablet_id,
-                "site_code": "HT",
-                "volume": vol,
-                "page": page,
-                "inscription_type": insc_type,
-                "sign_count": signs,
-                "lines": lines,
-                "condition": cond,
-                "period": period,
-                "has_numerals": nums,
-                "has_logograms": logos,
-                "key_sequences": seqs,
-                "notes": "",
-            }
-
-        # HAGIA TRIADA - Volume III (HT 121+)
-        ht_vol3 = [
-            ("HT 121", 3, 15, "tablet", 48, 4, "complete", "LM IB", True, True, []),
-            ("HT 122", 3, 19, "tablet", 55, 4, "complete", "LM IB", True, True, ["da-me"]),
-            ("HT 123", 3, 23, "tablet", 42, 3, "complete", "LM IB", True, True, []),
-            ("HT 124", 3, 27, "tablet", 38, 3, "fragmentary", "LM IB", True, True, []),
-            ("HT 125", 3, 31, "tablet", 50, 4, "complete", "LM IB", True, True, []),
-            ("HT 126", 3, 35, "tablet", 45, 3, "complete", "LM IB", True, True, []),
-            ("HT 127", 3, 39, "tablet", 40, 3, "complete", "LM IB", True, True, []),
-            ("HT 128", 3, 43, "tablet", 35, 2, "complete", "LM IB", True, False, []),
-            ("HT 129", 3, 47, "tablet", 52, 4, "complete", "LM IB", True, True, []),
-            ("HT 130", 3, 51, "tablet", 48, 4, "complete", "LM IB", True, True, []),
-            ("HT 140", 3, 90, "tablet", 45, 3, "complete", "LM IB", True, True, []),
-            ("HT 141", 3, 94, "tablet", 38, 3, "complete", "LM IB", True, True, []),
-            ("HT 142", 3, 98, "tablet", 42, 3, "fragmentary", "LM IB", True, True, []),
-            ("HT 143", 3, 102, "tablet", 35, 2, "complete", "LM IB", True, True, []),
-            ("HT 144", 3, 106, "tablet", 50, 4, "complete", "LM IB", True, True, []),
-            ("HT 145", 3, 110, "tablet", 40, 3, "complete", "LM IB", True, True, []),
-            ("HT 146", 3, 114, "tablet", 48, 4, "complete", "LM IB", True, True, []),
-            ("HT 147", 3, 118, "tablet", 55, 4, "complete", "LM IB", True, True, []),
-        ]
-
-        for entry in ht_vol3:
-            tablet_id, vol, page, insc_type, signs, lines, cond, period, nums, logos, seqs = entry
-            inscriptions[tablet_id] = {
-                "tablet_id": tablet_id,
-                "site_code": "HT",
-                "volume": vol,
-                "page": page,
-                "inscription_type": insc_type,
-                "sign_count": signs,
-                "lines": lines,
-                "condition": cond,
-                "period": period,
-                "has_numerals": nums,
-                "has_logograms": logos,
-                "key_sequences": seqs,
-                "notes": "",
+        self.log("Loading GORILA index...")
+        data = load_reference(REFERENCE_DATASET)
+        # JSON object keys are strings; volumes are keyed by number
+        self._volumes = {int(vol): info for vol, info in data["volumes"].items()}
+        self._conventions = data["conventions"]
+        self.index = data["inscriptions"]
+        self.log(f"Loaded GORILA index with {len(self._index)} inscriptions")
+
+    def reindex(self):
+        """Rebuild the secondary indexes from ``index``."""
+        self._lookup = None
+        return self._indexes
+
+    @property
+    def _indexes(self) -> Dict[str, Dict]:
+        if self._lookup is None:
+            index = self.index
+            by_key: Dict[str, str] = {}
+            by_volume: Dict[int, List[str]] = {}
+            by_site: Dict[str, List[str]] = {}
+            by_type: Dict[str, List[str]] = {}
+            sign_postings: Dict[str, Set[str]] = {}
+            position: Dict[str, int] = {}
+
+            for i, (tablet_id, data) in enumerate(index.items()):
+                position[tablet_id] = i
+                by_key.setdefault(tablet_key(tablet_id), tablet_id)
+                by_volume.setdefault(data["volume"], []).append(tablet_id)
+                by_site.setdefault(data["site_code"], []).append(tablet_id)
+                by_type.setdefault(data["inscription_type"], []).append(tablet_id)
+                for seq in data.get("key_sequences", []):
+                    for sign in _SEQUENCE_SEPARATORS.split(seq.lower()):
+                        sign_postings.setdefault(sign, set()).add(tablet_id)
+
+            for ids in by_volume.values():
+                ids.sort(key=lambda t: index[t]["page"])
+            for ids in by_site.values():
+                ids.sort(key=lambda t: (index[t]["volume"], index[t]["page"]))
+
+            self._lookup = {
+                "key": by_key,
+                "volume": by_volume,
+                "site": by_site,
+                "type": by_type,
+                "signs": sign_postings,
+                "position": position,
             }
+        return self._lookup
 
-        # KHANIA - Volume III
-        kh_inscriptions = [
-            ("KH 1", 3, 150, "tablet", 35, 3, "complete", "LM IB", True, True, []),
-            ("KH 2", 3, 153, "tablet", 42, 3, "complete", "LM IB", True, True, []),
-            ("KH 3", 3, 156, "tablet", 38, 3, "fragmentary", "LM IB", True, True, []),
-            ("KH 4", 3, 159, "tablet", 45, 3, "complete", "LM IB", True, True, []),
-            ("KH 5", 3, 162, "tablet", 50, 4, "complete", "LM IB", True, True, ["ku-ro"]),
-            ("KH 6", 3, 165, "tablet", 40, 3, "complete", "LM IB", True, True, []),
-            ("KH 7", 3, 168, "tablet", 35, 2, "complete", "LM IB", True, True, []),
-            ("KH 8", 3, 171, "tablet", 48, 4, "complete", "LM IB", True, True, []),
-            ("KH 9", 3, 174, "tablet", 42, 3, "complete", "LM IB", True, True, []),
-            ("KH 10", 3, 177, "tablet", 55, 4, "complete", "LM IB", True, True, ["da-me", "te"]),
-            ("KH 59", 3, 280, "tablet", 38, 3, "complete", "LM IB", True, True, []),
-            ("KH 60", 3, 283, "tablet", 45, 3, "complete", "LM IB", True, True, []),
-            ("KH 75", 3, 310, "tablet", 50, 4, "complete", "LM IB", True, True, ["sa-ra2"]),
-            ("KH 83", 3, 330, "tablet", 42, 3, "fragmentary", "LM IB", True, True, []),
-            ("KH 88", 3, 340, "tablet", 60, 4, "complete", "LM IB", True, True, ["ku-ro", "ki-ro"]),
-            ("KH 90", 3, 345, "tablet", 48, 4, "complete", "LM IB", True, True, ["da-i"]),
-        ]
-
-        for entry in kh_inscriptions:
-            tablet_id, vol, page, insc_type, signs, lines, cond, period, nums, logos, seqs = entry
-            inscriptions[tablet_id] = {
-                "tablet_id": tablet_id,
-                "site_code": "KH",
-                "volume": vol,
-                "page": page,
-                "inscription_type": insc_type,
-                "sign_count": signs,
-                "lines": lines,
-                "condition": cond,
-                "period": period,
-                "has_numerals": nums,
-                "has_logograms": logos,
-                "key_sequences": seqs,
-                "notes": "",
-            }
-
-        # PHAISTOS - Volume III
-        ph_inscriptions = [
-            ("PH 1", 3, 200, "tablet", 25, 2, "complete", "MM II", True, False, []),
-            ("PH 2", 3, 203, "tablet", 30, 2, "complete", "MM II", True, True, []),
-            ("PH 3", 3, 206, "tablet", 22, 2, "fragmentary", "MM II", True, False, []),
-            ("PH 4", 3, 209, "tablet", 28, 2, "complete", "MM II", True, True, []),
-            ("PH 5", 3, 212, "tablet", 35, 3, "complete", "MM II", True, True, []),
-            ("PH 6", 3, 215, "tablet", 20, 2, "complete", "MM II", True, False, []),
-            ("PH 7", 3, 218, "tablet", 32, 2, "complete", "MM II", True, True, []),
-            ("PH 16", 3, 240, "tablet", 42, 3, "complete", "MM III", True, True, []),
-            ("PH 17", 3, 243, "tablet", 38, 3, "complete", "MM III", True, True, []),
-            ("PH 18", 3, 246, "tablet", 45, 3, "complete", "MM III", True, True, ["pa-i-to"]),
-            ("PH 31", 3, 280, "tablet", 50, 4, "complete", "LM I", True, True, []),
-        ]
-
-        for entry in ph_inscriptions:
-            tablet_id, vol, page, insc_type, signs, lines, cond, period, nums, logos, seqs = entry
-            inscriptions[tablet_id] = {
-                "tablet_id": tablet_id,
-                "site_code": "PH",
-                "volume": vol,
-                "page": page,
-                "inscription_type": insc_type,
-                "sign_count": signs,
-                "lines": lines,
-                "condition": cond,
-                "period": period,
-                "has_numerals": nums,
-                "has_logograms": logos,
-                "key_sequences": seqs,
-                "notes": "Earliest Linear A inscriptions (MM II-III period)",
-            }
-
-        # ZAKROS - Volume IV
-        za_inscriptions = [
-            ("ZA 1", 4, 15, "tablet", 40, 3, "complete", "LM IB", True, True, []),
-            ("ZA 2", 4, 19, "tablet", 35, 3, "complete", "LM IB", True, True, []),
-            ("ZA 3", 4, 23, "tablet", 42, 3, "fragmentary", "LM IB", True, True, []),
-            (
-                "ZA 4",
-                4,
-                27,
-                "tablet",
-                65,
-                5,
-                "complete",
-                "LM IB",
-                True,
-                True,
-                ["ku-ro", "te", "a-du"],
-            ),
-            ("ZA 5", 4, 32, "tablet", 38, 3, "complete", "LM IB", True, True, []),
-            ("ZA 6", 4, 36, "tablet", 45, 3, "complete", "LM IB", True, True, []),
-            ("ZA 7", 4, 40, "tablet", 50, 4, "complete", "LM IB", True, True, []),
-            ("ZA 8", 4, 44, "tablet", 35, 2, "complete", "LM IB", True, True, []),
-            ("ZA 9", 4, 48, "tablet", 42, 3, "complete", "LM IB", True, True, []),
-            ("ZA 10", 4, 52, "tablet", 60, 4, "complete", "LM IB", True, True, ["ku-ro", "ki-ro"]),
-            ("ZA 11", 4, 57, "tablet", 48, 4, "complete", "LM IB", True, True, []),
-            ("ZA 12", 4, 61, "tablet", 40, 3, "complete", "LM IB", True, True, []),
-            ("ZA 13", 4, 65, "tablet", 35, 2, "fragmentary", "LM IB", True, True, []),
-            ("ZA 14", 4, 69, "tablet", 55, 4, "complete", "LM IB", True, True, []),
-            ("ZA 15", 4, 73, "tablet", 42, 3, "complete", "LM IB", True, True, []),
-            ("ZA 16", 4, 77, "tablet", 38, 3, "complete", "LM IB", True, True, []),
-            ("ZA 17", 4, 81, "tablet", 45, 3, "complete", "LM IB", True, True, []),
-            ("ZA 18", 4, 85, "tablet", 50, 4, "complete", "LM IB", True, True, []),
-            ("ZA 19", 4, 89, "tablet", 35, 2, "complete", "LM IB", True, False, []),
-            ("ZA 20", 4, 93, "tablet", 42, 3, "complete", "LM IB", True, True, []),
-        ]
-
-        for entry in za_inscriptions:
-            tablet_id, vol, page, insc_type, signs, lines, cond, period, nums, logos, seqs = entry
-            inscriptions[tablet_id] = {
-                "tablet_id": tablet_id,
-                "site_code": "ZA",
-                "volume": vol,
-                "page": page,
-                "inscription_type": insc_type,
-                "sign_count": signs,
-                "lines": lines,
-                "condition": cond,
-                "period": period,
-                "has_numerals": nums,
-                "has_logograms": logos,
-                "key_sequences": seqs,
-                "notes": "",
-            }
-
-        # PEAK SANCTUARIES AND RELIGIOUS SITES - Volume IV
-        religious_inscriptions = [
-            (
-                "IO Za 1",
-                4,
-                150,
-                "libation_table",
-                25,
-                2,
-                "complete",
-                "LM I",
-                False,
-                False,
-                ["a-ta-i-*301-wa-ja"],
-            ),
-            (
-                "IO Za 2",
-                4,
-                154,
-                "libation_table",
-                45,
-                3,
-                "complete",
-                "LM I",
-                False,
-                False,
-                ["ja-sa-sa-ra-me", "a-ta-i-*301-wa-ja"],
-            ),
-            ("IO Za 3", 4, 158, "libation_table", 30, 2, "fragmentary", "LM I", False, False, []),
-            (
-                "IO Za 4",
-                4,
-                162,
-                "libation_table",
-                35,
-                2,
-                "complete",
-                "LM I",
-                False,
-                False,
-                ["i-pi-na-ma"],
-            ),
-            ("IO Za 5", 4, 166, "libation_table", 28, 2, "complete", "LM I", False, False, []),
-            (
-                "IO Za 6",
-                4,
-                170,
-                "libation_table",
-                40,
-                3,
-                "complete",
-                "LM I",
-                False,
-                False,
-                ["u-na-ka-na-si"],
-            ),
-            (
-                "PS Za 1",
-                4,
-                180,
-                "libation_table",
-                32,
-                2,
-                "complete",
-                "LM I",
-                False,
-                False,
-                ["a-ta-i-*301-wa-ja"],
-            ),
-            ("PS Za 2", 4, 184, "libation_table", 28, 2, "fragmentary", "LM I", False, False, []),
-            ("SY Za 1", 4, 190, "libation_table", 35, 2, "complete", "LM I", False, False, []),
-            (
-                "SY Za 2",
-                4,
-                194,
-                "libation_table",
-                30,
-                2,
-                "complete",
-                "LM I",
-                False,
-                False,
-                ["ja-sa-sa-ra-me"],
-            ),
-            (
-                "PK Za 11",
-                4,
-                200,
-                "libation_table",
-                55,
-                4,
-                "complete",
-                "LM I",
-                False,
-                False,
-                ["a-ta-i-*301-wa-ja", "da-ma-te"],
-            ),
-            ("PK Za 12", 4, 205, "libation_table", 40, 3, "fragmentary", "LM I", False, False, []),
-            ("KO Za 1", 4, 210, "libation_table", 25, 2, "complete", "LM I", False, False, []),
-        ]
-
-        for entry in religious_inscriptions:
-            tablet_id, vol, page, insc_type, signs, lines, cond, period, nums, logos, seqs = entry
-            site = tablet_id.split()[0]
-            inscriptions[tablet_id] = {
-                "tablet_id": tablet_id,
-                "site_code": site,
-                "volume": vol,
-                "page": page,
-                "inscription_type": insc_type,
-                "sign_count": signs,
-                "lines": lines,
-                "condition": cond,
-                "period": period,
-                "has_numerals": nums,
-                "has_logograms": logos,
-                "key_sequences": seqs,
-                "notes": "Peak sanctuary inscription with libation formula",
-            }
-
-        # VOLUME V - NEW DISCOVERIES
-        vol5_inscriptions = [
-            (
-                "KN Zf 2",
-                5,
-                150,
-                "scepter",
-                119,
-                2,
-                "complete",
-                "LM IB",
-                True,
-                True,
-                ["a-ta-i-*301-wa-ja"],
-            ),
-            ("HT Wc 3016", 5, 50, "roundel", 15, 1, "complete", "LM IB", True, False, []),
-            ("HT Wc 3017", 5, 52, "roundel", 12, 1, "complete", "LM IB", True, False, []),
-            ("KH 91", 5, 80, "tablet", 42, 3, "complete", "LM IB", True, True, []),
-            ("KH 92", 5, 84, "tablet", 38, 3, "fragmentary", "LM IB", True, True, []),
-            ("KH 93", 5, 88, "tablet", 45, 3, "complete", "LM IB", True, True, []),
-            ("KH 94", 5, 92, "tablet", 50, 4, "complete", "LM IB", True, True, []),
-            ("KH 95", 5, 96, "tablet", 35, 2, "complete", "LM IB", True, True, []),
-            ("KH 96", 5, 100, "tablet", 40, 3, "complete", "LM IB", True, True, []),
-            ("KH 97", 5, 104, "tablet", 48, 4, "complete", "LM IB", True, True, []),
-            ("KH 98", 5, 108, "tablet", 42, 3, "complete", "LM IB", True, True, []),
-            ("KH 99", 5, 112, "tablet", 55, 4, "complete", "LM IB", True, True, ["ku-ro"]),
-        ]
-
-        for entry in vol5_inscriptions:
-            tablet_id, vol, page, insc_type, signs, lines, cond, period, nums, logos, seqs = entry
-            site = tablet_id.split()[0]
-            inscriptions[tablet_id] = {
-                "tablet_id": tablet_id,
-                "site_code": site,
-                "volume": vol,
-                "page": page,
-                "inscription_type": insc_type,
-                "sign_count": signs,
-                "lines": lines,
-                "condition": cond,
-                "period": period,
-                "has_numerals": nums,
-                "has_logograms": logos,
-                "key_sequences": seqs,
-                "notes": (
-                    "KN Zf 2 is the 2024 Knossos ivory scepter (longest Linear A inscription)"
-                )
-                if tablet_id == "KN Zf 2"
-                else "",
-            }
-
-        self.index = inscriptions
-        self.log(f"Built GORILA index with {len(self.index)} inscriptions")
+    def _resolve(self, tablet_id: str) -> Optional[str]:
+        """Index key for a tablet id, ignoring case, spacing and side suffixes."""
+        by_key = self._indexes["key"]
+        key = tablet_key(tablet_id)
+        if key in by_key:
+            return by_key[key]
+        return by_key.get(_FRAGMENT_SUFFIX.sub("", key))
 
     def lookup_tablet(self, tablet_id: str) -> Optional[Dict]:
         """
         Look up a tablet by its reference number.
 
         Args:
-            tablet_id: Tablet reference (e.g., "HT 13", "ZA 4")
+            tablet_id: Tablet reference (e.g., "HT 13", "HT13", "KNZf2";
+                a side suffix as in "HT 122a" falls back to "HT 122")
 
         Returns:
             Inscription entry or None if not found
         """
-        # Normalize input
-        tablet_id_norm = tablet_id.upper().strip()
-
-        # Try direct lookup
-        if tablet_id_norm in self.index:
-            return self.index[tablet_id_norm]
+        key = self._resolve(tablet_id)
+        return self.index[key] if key is not None else None
 
-        # Try with different spacing
-        parts = tablet_id_norm.split()
-        if len(parts) >= 2:
-            # Try "HT13" -> "HT 13"
-            alt = f"{parts[0]} {' '.join(parts[1:])}"
-            if alt in self.index:
-                return self.index[alt]
+    def lookup_many(self, tablet_ids: Iterable[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Look up many tablets at once (e.g., every inscription in corpus.json).
 
-        # Search for partial match
-        for key in self.index:
-            if tablet_id_norm in key or key in tablet_id_norm:
-                return self.index[key]
+        Args:
+            tablet_ids: Tablet references in any form accepted by lookup_tablet
 
-        return None
+        Returns:
+            Dict mapping each distinct input id to its entry (or None)
+        """
+        index = self.index
+        results = {}
+        for tablet_id in tablet_ids:
+            if tablet_id not in results:
+                key = self._resolve(tablet_id)
+                results[tablet_id] = index[key] if key is not None else None
+        return results
 
     def get_volume_contents(self, volume: int) -> List[Dict]:
         """
@@ -785,11 +240,7 @@ class GORILAIndexer:
         Returns:
             List of inscriptions in that volume
         """
-        results = []
-        for tablet_id, data in self.index.items():
-            if data["volume"] == volume:
-                results.append(data)
-        return sorted(results, key=lambda x: x["page"])
+        return [self.index[t] for t in self._indexes["volume"].get(volume, [])]
 
     def search_transcription(self, pattern: str) -> List[Dict]:
         """
@@ -802,16 +253,48 @@ class GORILAIndexer:
             List of matching inscriptions
         """
         pattern_lower = pattern.lower()
+        candidates = self._sequence_candidates(pattern_lower)
+        position = self._indexes["position"]
+
         results = []
+        for tablet_id in sorted(candidates, key=position.__getitem__):
+            data = self.index[tablet_id]
+            if any(pattern_lower in seq.lower() for seq in data.get("key_sequences", [])):
+                results.append(data)
+        return results
 
-        for tablet_id, data in self.index.items():
-            key_seqs = data.get("key_sequences", [])
-            for seq in key_seqs:
-                if pattern_lower in seq.lower():
-                    results.append(data)
-                    break
+    def _sequence_candidates(self, pattern_lower: str) -> Set[str]:
+        """
+        Tablets whose key sequences may contain ``pattern_lower``.
 
-        return results
+        A substring match spans whole signs, except that its first fragment
+        may end a sign and its last may begin one. Each fragment narrows the
+        candidates to tablets with a matching sign.
+        """
+        postings = self._indexes["signs"]
+        fragments = _SEQUENCE_SEPARATORS.split(pattern_lower)
+        last = len(fragments) - 1
+        candidates: Optional[Set[str]] = None
+
+        for i, fragment in enumerate(fragments):
+            if not fragment:
+                continue
+            if last == 0:
+                signs = [s for s in postings if fragment in s]
+            elif i == 0:
+                signs = [s for s in postings if s.endswith(fragment)]
+            elif i == last:
+                signs = [s for s in postings if s.startswith(fragment)]
+            else:
+                signs = [fragment] if fragment in postings else []
+            matched = set().union(*(postings[s] for s in signs))
+            candidates = matched if candidates is None else candidates & matched
+            if not candidates:
+                return set()
+
+        if candidates is None:
+            return {t for t, data in self.index.items() if data.get("key_sequences")}
+        return candidates
 
     def get_inscriptions_by_site(self, site_code: str) -> List[Dict]:
         """
@@ -823,14 +306,7 @@ class GORILAIndexer:
         Returns:
             List of inscriptions from that site
         """
-        site_upper = site_code.upper()
-        results = []
-
-        for tablet_id, data in self.index.items():
-            if data["site_code"] == site_upper:
-                results.append(data)
-
-        return sorted(results, key=lambda x: (x["volume"], x["page"]))
+        return [self.index[t] for t in self._indexes["site"].get(site_code.upper(), [])]
 
     def get_inscriptions_by_type(self, inscription_type: str) -> List[Dict]:
         """
@@ -842,13 +318,7 @@ class GORILAIndexer:
         Returns:
             List of matching inscriptions
         """
-        results = []
-
-        for tablet_id, data in self.index.items():
-            if data["inscription_type"] == inscription_type.lower():
-                results.append(data)
-
-        return results
+        return [self.index[t] for t in self._indexes["type"].get(inscription_type.lower(), [])]
 
     def get_sign_conventions(self) -> Dict:
         """Get GORILA transcription conventions."""
@@ -937,7 +407,9 @@ def main():
     parser = argparse.ArgumentParser(
         description="GORILA Volume Indexer - Linear A inscription references"
     )
-    parser.add_argument("--lookup", "-l", type=str, help='Look up a tablet (e.g., "HT 13")')
+    parser.add_argument(
+        "--lookup", "-l", nargs="+", help='Look up one or more tablets (e.g., "HT 13" ZA4)'
+    )
     parser.add_argument(
         "--volume", type=int, choices=[1, 2, 3, 4, 5], help="List contents of a volume"
     )
@@ -961,12 +433,14 @@ def main():
     indexer = GORILAIndexer(verbose=args.verbose)
 
     if args.lookup:
-        insc = indexer.lookup_tablet(args.lookup)
-        if insc:
-            print("\nTablet found:")
-            print_inscription(insc, args.verbose)
-        else:
-            print(f"\nTablet not found: {args.lookup}")
+        found = indexer.lookup_many(args.lookup)
+        for tablet_id, insc in found.items():
+            if insc:
+                print("\nTablet found:")
+                print_inscription(insc, args.verbose)
+            else:
+                print(f"\nTablet not found: {tablet_id}")
+        if not all(found.values()):
             print("Try using standard format (e.g., 'HT 13', 'ZA 4', 'KN Zf 2')")
 
     elif args.volume:
@@ -39,6 +39,7 @@ from word_filter_contract import (
     is_hypothesis_eligible_word,
     normalize_word_token,
 )
+from reference_data import load_reference
 
 
 # Paths
@@ -50,327 +51,47 @@ DATA_DIR = PROJECT_ROOT / "data"
 # LINGUISTIC REFERENCE DATA
 # ============================================================================
 
-# ===========================================================================
-# LUWIAN/ANATOLIAN REFERENCE DATA
-# Sources: Melchert (2003) Luwian Dictionary, Yakubovich (2010), Finkelberg (1998)
-# ===========================================================================
-
-LUWIAN_LEXICON = {
-    # Particles and grammatical elements (HIGH confidence)
-    "a": {"meaning": "and/coordinative conjunction", "confidence": "HIGH", "source": "Melchert"},
-    "wa": {"meaning": "quotative particle", "confidence": "HIGH", "source": "Melchert"},
-    "u": {"meaning": "quotative particle variant", "confidence": "HIGH", "source": "Melchert"},
-    "awa": {"meaning": "quotative (full form)", "confidence": "HIGH", "source": "Melchert"},
-    # Pronouns and determiners (MEDIUM-HIGH confidence)
-    "ki": {"meaning": "relative pronoun stem (kui-)", "confidence": "MEDIUM", "source": "Melchert"},
-    "apa": {"meaning": 'demonstrative "that"', "confidence": "MEDIUM", "source": "Melchert"},
-    "za": {"meaning": 'demonstrative "this"', "confidence": "MEDIUM", "source": "Melchert"},
-    "kwi": {"meaning": "interrogative/relative", "confidence": "MEDIUM", "source": "Melchert"},
-    # Verbal roots (MEDIUM confidence)
-    "adi": {"meaning": "to make/do (a- + -ti)", "confidence": "MEDIUM", "source": "Yakubovich"},
-    "tati": {"meaning": "father", "confidence": "MEDIUM", "source": "Melchert"},
-    "anni": {"meaning": "mother", "confidence": "MEDIUM", "source": "Melchert"},
-    "wawa": {"meaning": "cow", "confidence": "MEDIUM", "source": "Melchert"},
-    # Nouns (MEDIUM confidence)
-    "padi": {"meaning": "into/to (place)", "confidence": "MEDIUM", "source": "Melchert"},
-    "taru": {"meaning": "tree, wood", "confidence": "MEDIUM", "source": "Melchert"},
-    "watu": {"meaning": "water", "confidence": "MEDIUM", "source": "Melchert"},
-    "hanti": {"meaning": "front, forehead", "confidence": "MEDIUM", "source": "Melchert"},
-    "ura": {"meaning": "great", "confidence": "MEDIUM", "source": "Melchert"},
-    "massana": {"meaning": "god", "confidence": "MEDIUM", "source": "Melchert"},
-    # Divine names (LOW-MEDIUM confidence for Linear A)
-    "tarhunt": {"meaning": "Storm God (Tarḫunt-)", "confidence": "LOW", "source": "Yakubovich"},
-    "santa": {"meaning": "deity name", "confidence": "LOW", "source": "Melchert"},
-    "arma": {"meaning": "Moon God", "confidence": "LOW", "source": "Melchert"},
-    # Suffixes
-    "-ja": {"meaning": "adjectival suffix (-iya)", "confidence": "MEDIUM", "source": "Melchert"},
-    "-ti": {"meaning": "verbal 3sg ending", "confidence": "MEDIUM", "source": "Melchert"},
-    "-nti": {"meaning": "verbal 3pl ending", "confidence": "MEDIUM", "source": "Melchert"},
-    "-ssa": {"meaning": "nominal suffix (place)", "confidence": "MEDIUM", "source": "Melchert"},
-    "-nda": {"meaning": "suffix (characteristic)", "confidence": "MEDIUM", "source": "Melchert"},
-    "-si": {"meaning": "dative-locative", "confidence": "MEDIUM", "source": "Melchert"},
-    "-za": {"meaning": "ablative suffix", "confidence": "MEDIUM", "source": "Melchert"},
-    "-ta": {"meaning": "agentive suffix", "confidence": "MEDIUM", "source": "Melchert"},
-    "-ri": {"meaning": "nominal suffix", "confidence": "LOW", "source": "Yakubovich"},
-}
-
-LUWIAN_PHONOLOGICAL_MARKERS = [
-    # Labialized consonants
-    "wa",
-    "wi",
-    "wu",
-    "we",
-    "wo",
-    # Characteristic clusters
-    "ssa",
-    "nda",
-    "nti",
-    "tti",
-    # Initial patterns
-    "ta",
-    "pa",
-    "ma",
-    "ha",
-]
-
-# Sound correspondence rules: Luwian -> Linear A (speculative)
-LUWIAN_SOUND_RULES = {
-    "ḫ": "a",  # Laryngeal often lost or vowel
-    "tt": "ta",  # Geminate simplified
-    "ss": "sa",  # Geminate simplified
-}
-
-# ===========================================================================
-# SEMITIC REFERENCE DATA (Akkadian, Hebrew, Ugaritic, West Semitic)
-# Sources: CAD (Chicago Akkadian Dictionary), BDB Hebrew Lexicon,
-# Huehnergard (2011), Gordon (1966)
-# ===========================================================================
-
-SEMITIC_LEXICON = {
-    # ---- ADMINISTRATIVE VOCABULARY (HIGH confidence) ----
-    # Totals and quantities
-    "kull": {
-        "meaning": "all, totality (Akkadian kullatu)",
-        "confidence": "HIGH",
-        "root": "KLL",
-        "source": "CAD",
-    },
-    "kol": {
-        "meaning": "all, every (Hebrew kōl)",
-        "confidence": "HIGH",
-        "root": "KL",
-        "source": "BDB",
-    },
-    "kala": {
-        "meaning": "to complete, finish (Akkadian kalû)",
-        "confidence": "HIGH",
-        "root": "KL",
-        "source": "CAD",
-    },
-    # Deficit/diminish
-    "gara": {
-        "meaning": "to diminish, deduct (Hebrew gāraʿ)",
-        "confidence": "HIGH",
-        "root": "GR",
-        "source": "BDB",
-    },
-    "giru": {
-        "meaning": "to be wanting, lack",
-        "confidence": "MEDIUM",
-        "root": "GR",
-        "source": "Ugaritic",
-    },
-    # Counting and recording
-    "spr": {
-        "meaning": "to count, write (Hebrew sāpar)",
-        "confidence": "MEDIUM",
-        "root": "SPR",
-        "source": "BDB",
-    },
-    "sapru": {
-        "meaning": "scribe, official",
-        "confidence": "MEDIUM",
-        "root": "SPR",
-        "source": "CAD",
-    },
-    "mana": {
-        "meaning": "to count, assign (Akkadian manû)",
-        "confidence": "MEDIUM",
-        "root": "MN",
-        "source": "CAD",
-    },
-    # Gathering and collecting
-    "asap": {
-        "meaning": "to gather, collect (Hebrew ʾāsap)",
-        "confidence": "MEDIUM",
-        "root": "SP",
-        "source": "BDB",
-    },
-    "qbs": {
-        "meaning": "to gather (Hebrew qābaṣ)",
-        "confidence": "MEDIUM",
-        "root": "QBS",
-        "source": "BDB",
-    },
-    "kns": {"meaning": "to gather, assemble", "confidence": "LOW", "root": "KNS", "source": "BDB"},
-    # Payment and wages
-    "sakar": {
-        "meaning": "wage, hire (Hebrew śākār)",
-        "confidence": "MEDIUM",
-        "root": "SKR",
-        "source": "BDB",
-    },
-    "sakaru": {
-        "meaning": "to hire, pay wages (Akkadian)",
-        "confidence": "MEDIUM",
-        "root": "SKR",
-        "source": "CAD",
-    },
-    # ---- COMMODITIES (MEDIUM confidence) ----
-    # Wine
-    "yayin": {
-        "meaning": "wine (Hebrew yayin)",
-        "confidence": "MEDIUM",
-        "root": "YN",
-        "source": "BDB",
-    },
-    "karanu": {
-        "meaning": "wine (Akkadian)",
-        "confidence": "MEDIUM",
-        "root": "KRN",
-        "source": "CAD",
-    },
-    # Oil
-    "samnu": {
-        "meaning": "oil, fat (Akkadian šamnu)",
-        "confidence": "MEDIUM",
-        "root": "SMN",
-        "source": "CAD",
-    },
-    "semen": {
-        "meaning": "oil (Hebrew šemen)",
-        "confidence": "MEDIUM",
-        "root": "SMN",
-        "source": "BDB",
-    },
-    # Grain
-    "se": {
-        "meaning": "barley (Akkadian sheu)",
-        "confidence": "MEDIUM",
-        "root": "S",
-        "source": "CAD",
-    },
-    "dagan": {
-        "meaning": "grain (Hebrew dāgān)",
-        "confidence": "MEDIUM",
-        "root": "DGN",
-        "source": "BDB",
-    },
-    "kibtu": {"meaning": "wheat (Akkadian)", "confidence": "LOW", "root": "KBT", "source": "CAD"},
-    # Honey
-    "dabas": {
-        "meaning": "honey (Hebrew dĕbaš)",
-        "confidence": "MEDIUM",
-        "root": "DBS",
-        "source": "BDB",
-    },
-    "dispu": {
-        "meaning": "honey (Akkadian)",
-        "confidence": "MEDIUM",
-        "root": "DSP",
-        "source": "CAD",
-    },
-    # Figs
-    "tina": {
-        "meaning": "fig (Hebrew tĕʾēnā)",
-        "confidence": "MEDIUM",
-        "root": "TN",
-        "source": "BDB",
-    },
-    # ---- SOCIAL/POLITICAL VOCABULARY (LOW-MEDIUM confidence) ----
-    # Ruler terms
-    "mlk": {
-        "meaning": "king, rule (Hebrew melek)",
-        "confidence": "LOW",
-        "root": "MLK",
-        "source": "BDB",
-    },
-    "sarru": {"meaning": "king (Akkadian)", "confidence": "LOW", "root": "SRR", "source": "CAD"},
-    "rb": {
-        "meaning": "great, chief (Hebrew rab)",
-        "confidence": "LOW",
-        "root": "RB",
-        "source": "BDB",
-    },
-    # People terms
-    "amm": {
-        "meaning": "people, kinship group (Hebrew ʿam)",
-        "confidence": "LOW",
-        "root": "MM",
-        "source": "BDB",
-    },
-    "goy": {"meaning": "nation (Hebrew gôy)", "confidence": "LOW", "root": "GY", "source": "BDB"},
-    # House/temple
-    "bitu": {
-        "meaning": "house, temple (Akkadian bītu)",
-        "confidence": "MEDIUM",
-        "root": "BT",
-        "source": "CAD",
-    },
-    "bayit": {
-        "meaning": "house (Hebrew bayit)",
-        "confidence": "MEDIUM",
-        "root": "BT",
-        "source": "BDB",
-    },
-    # ---- RELIGIOUS VOCABULARY (LOW-MEDIUM confidence) ----
-    # God terms
-    "ilu": {
-        "meaning": "god (Akkadian, Ugaritic)",
-        "confidence": "MEDIUM",
-        "root": "L",
-        "source": "CAD",
-    },
-    "el": {"meaning": "god (Hebrew ʾēl)", "confidence": "MEDIUM", "root": "L", "source": "BDB"},
-    # Offering terms
-    "ndr": {"meaning": "vow, votive offering", "confidence": "LOW", "root": "NDR", "source": "BDB"},
-    "qrb": {"meaning": "to offer, bring near", "confidence": "LOW", "root": "QRB", "source": "BDB"},
-    "zbh": {
-        "meaning": "sacrifice (Hebrew zebaḥ)",
-        "confidence": "LOW",
-        "root": "ZBH",
-        "source": "BDB",
-    },
-    # Blessing
-    "brk": {
-        "meaning": "to bless (Hebrew bārak)",
-        "confidence": "LOW",
-        "root": "BRK",
-        "source": "BDB",
-    },
-    "slm": {
-        "meaning": "peace, wellbeing (Hebrew šālôm)",
-        "confidence": "LOW",
-        "root": "SLM",
-        "source": "BDB",
-    },
-    # ---- NUMBERS (LOW confidence - different system) ----
-    "wahid": {"meaning": "one", "confidence": "LOW", "root": "WHD", "source": "BDB"},
-    "sana": {"meaning": "two", "confidence": "LOW", "root": "SN", "source": "BDB"},
-    "salasa": {"meaning": "three", "confidence": "LOW", "root": "SLS", "source": "BDB"},
-    # ---- VERBS (LOW confidence - morphology differences) ----
-    "ntn": {
-        "meaning": "to give (Hebrew nātan)",
-        "confidence": "LOW",
-        "root": "NTN",
-        "source": "BDB",
-    },
-    "lqh": {
-        "meaning": "to take (Hebrew lāqaḥ)",
-        "confidence": "LOW",
-        "root": "LQH",
-        "source": "BDB",
-    },
-    "bw": {"meaning": "to come (Hebrew bôʾ)", "confidence": "LOW", "root": "BW", "source": "BDB"},
-    "yṣ": {
-        "meaning": "to go out (Hebrew yāṣāʾ)",
-        "confidence": "LOW",
-        "root": "YS",
-        "source": "BDB",
-    },
-    "ʿbd": {
-        "meaning": "to work, serve (Hebrew ʿābad)",
-        "confidence": "LOW",
-        "root": "BD",
-        "source": "BDB",
-    },
-    "šmr": {
-        "meaning": "to guard, keep (Hebrew šāmar)",
-        "confidence": "LOW",
-        "root": "SMR",
-        "source": "BDB",
-    },
-}
+# Lexicons, phonological markers and case-marker predictions live in
+# data/reference/hypothesis_lexicons.json and are loaded on first access
+# (e.g. ``hypothesis_tester.LUWIAN_LEXICON``), so importing this module for
+# extract_consonants() does not build them.
+REFERENCE_DATASET = "hypothesis_lexicons"
+REFERENCE_NAMES = frozenset(
+    {
+        "LUWIAN_LEXICON",
+        "LUWIAN_PHONOLOGICAL_MARKERS",
+        "LUWIAN_SOUND_RULES",
+        "SEMITIC_LEXICON",
+        "PREGREEK_MARKERS",
+        "PREGREEK_VOCABULARY",
+        "PREGREEK_PHONOLOGY",
+        "GREEK_LEXICON",
+        "HURRIAN_LEXICON",
+        "HURRIAN_PHONOLOGICAL_MARKERS",
+        "HATTIC_LEXICON",
+        "HATTIC_PHONOLOGICAL_MARKERS",
+        "ETRUSCAN_LEXICON",
+        "ETRUSCAN_PHONOLOGICAL_MARKERS",
+        "GREEK_PHONOLOGY_EXPECTATIONS",
+        "CASE_MARKER_PREDICTIONS",
+        "GRAMMATICAL_ROLES",
+    }
+)
+
+
+def reference(name: str):
+    """Return a reference table by name, loading the dataset on first use."""
+    if name not in REFERENCE_NAMES:
+        raise KeyError(name)
+    if name not in globals():
+        globals().update(load_reference(REFERENCE_DATASET))
+    return globals()[name]
+
+
+def __getattr__(name: str):
+    if name in REFERENCE_NAMES:
+        return reference(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Extract consonant skeleton for Semitic comparison
@@ -389,929 +110,6 @@ def extract_consonants(word: str) -> str:
     return "".join(consonants)
 
 
-# ===========================================================================
-# PRE-GREEK SUBSTRATE REFERENCE DATA
-# Sources: Beekes (2014) Pre-Greek, Furnée (1972), Kretschmer
-# ===========================================================================
-
-PREGREEK_MARKERS = {
-    # Characteristic consonant clusters (cannot occur in PIE)
-    "nth": {
-        "type": "cluster",
-        "significance": "HIGH",
-        "examples": ["Korinthos", "labyrinth", "Zakynthos"],
-    },
-    "ss": {
-        "type": "cluster",
-        "significance": "HIGH",
-        "examples": ["Knossos", "Parnassos", "Tylissos"],
-    },
-    "kt": {"type": "cluster", "significance": "HIGH", "examples": ["nektar", "plektron"]},
-    "pt": {"type": "cluster", "significance": "HIGH", "examples": ["kryptos", "Aigyptos"]},
-    "mn": {"type": "cluster", "significance": "MEDIUM", "examples": ["Amnissos", "Hymettus"]},
-    "nd": {"type": "cluster", "significance": "MEDIUM", "examples": ["Lindos", "Myndos"]},
-    "tt": {"type": "cluster", "significance": "MEDIUM", "examples": ["Brettia", "Attica"]},
-    "mb": {"type": "cluster", "significance": "MEDIUM", "examples": ["ambrosia", "kombos"]},
-    "ng": {"type": "cluster", "significance": "MEDIUM", "examples": ["sphinga", "syrinx"]},
-    "gd": {"type": "cluster", "significance": "LOW", "examples": ["Aigdai"]},
-    "rr": {"type": "cluster", "significance": "MEDIUM", "examples": ["Pyrrhos", "tyrrhos"]},
-    "ll": {"type": "cluster", "significance": "MEDIUM", "examples": ["Phyllos", "thallein"]},
-    # Characteristic suffixes (Beekes 2014)
-    "assos": {"type": "suffix", "significance": "HIGH", "examples": ["Parnassos", "Halicarnassos"]},
-    "inthos": {
-        "type": "suffix",
-        "significance": "HIGH",
-        "examples": ["Korinthos", "Zakynthos", "labyrinth"],
-    },
-    "issos": {"type": "suffix", "significance": "HIGH", "examples": ["Tylissos", "Knossos"]},
-    "ene": {
-        "type": "suffix",
-        "significance": "MEDIUM",
-        "examples": ["Athene", "Mykene", "Peirene"],
-    },
-    "aia": {"type": "suffix", "significance": "MEDIUM", "examples": ["Achaia", "Arkadia"]},
-    "issa": {"type": "suffix", "significance": "HIGH", "examples": ["basilissa", "melissa"]},
-    "andr": {"type": "suffix", "significance": "MEDIUM", "examples": ["Kassandra", "Alexandros"]},
-    # Toponymic suffixes
-    "ara": {"type": "toponym_suffix", "significance": "MEDIUM", "examples": ["Megara", "Kamara"]},
-    "ssa": {
-        "type": "toponym_suffix",
-        "significance": "HIGH",
-        "examples": ["Larissa", "Mykalessos"],
-    },
-    "na": {"type": "toponym_suffix", "significance": "MEDIUM", "examples": ["Athena", "Mykena"]},
-    # Initial clusters unusual in PIE (Beekes 2014)
-    "gn": {"type": "initial_cluster", "significance": "LOW", "examples": ["gnosis", "gnome"]},
-    "kn": {"type": "initial_cluster", "significance": "LOW", "examples": ["knemos", "knide"]},
-    "ps": {"type": "initial_cluster", "significance": "MEDIUM", "examples": ["psykhe", "psalmos"]},
-    "ks": {"type": "initial_cluster", "significance": "MEDIUM", "examples": ["xenos", "xylon"]},
-}
-
-PREGREEK_VOCABULARY = {
-    # NOTE: These are GREEK words with hypothesized Pre-Greek substrate etymology (Beekes 2014).
-    # Used for PHONOLOGICAL PATTERN matching, not direct vocabulary correspondence.
-    # No Level 1/2 anchors currently support Pre-Greek hypothesis directly.
-    # Confidence ratings indicate strength of substrate etymology claim,
-    # not Linear A match confidence.
-    #
-    # Flora - agricultural substrate terms (Beekes 2014)
-    "elaia": {"meaning": "olive", "confidence": "HIGH", "source": "Beekes"},
-    "ampelos": {"meaning": "vine", "confidence": "HIGH", "source": "Beekes"},
-    "kissos": {"meaning": "ivy", "confidence": "HIGH", "source": "Beekes"},
-    "kyparissos": {"meaning": "cypress", "confidence": "HIGH", "source": "Beekes"},
-    "erebinthos": {"meaning": "chickpea", "confidence": "HIGH", "source": "Beekes"},
-    "selinon": {"meaning": "celery", "confidence": "MEDIUM", "source": "Beekes"},
-    "mintha": {"meaning": "mint", "confidence": "MEDIUM", "source": "Beekes"},
-    "daphnē": {"meaning": "laurel", "confidence": "MEDIUM", "source": "Beekes"},
-    "sykē": {"meaning": "fig tree", "confidence": "MEDIUM", "source": "Beekes"},
-    "melon": {"meaning": "apple/fruit", "confidence": "LOW", "source": "Beekes"},
-    # Fauna
-    "leon": {"meaning": "lion", "confidence": "MEDIUM", "source": "Beekes"},
-    "pardalis": {"meaning": "leopard", "confidence": "MEDIUM", "source": "Beekes"},
-    # Sea and landscape
-    "thalassa": {"meaning": "sea", "confidence": "HIGH", "source": "Beekes"},
-    "labyrinthos": {"meaning": "labyrinth", "confidence": "HIGH", "source": "Beekes"},
-    "plinthos": {"meaning": "brick", "confidence": "MEDIUM", "source": "Beekes"},
-    "kolossos": {"meaning": "statue", "confidence": "MEDIUM", "source": "Beekes"},
-    "pyrgos": {"meaning": "tower", "confidence": "MEDIUM", "source": "Beekes"},
-    # Technology/materials/crafts
-    "kassiteros": {"meaning": "tin", "confidence": "MEDIUM", "source": "Furnée"},
-    "khalybos": {"meaning": "steel/iron", "confidence": "LOW", "source": "Furnée"},
-    "khalix": {"meaning": "pebble/limestone", "confidence": "MEDIUM", "source": "Beekes"},
-    "asaminthos": {"meaning": "bathtub", "confidence": "HIGH", "source": "Beekes"},
-    "depas": {"meaning": "cup/goblet", "confidence": "MEDIUM", "source": "Beekes"},
-    "kitharos": {"meaning": "lyre", "confidence": "MEDIUM", "source": "Beekes"},
-    "chiton": {"meaning": "tunic", "confidence": "MEDIUM", "source": "Beekes"},
-    # Religious/ritual
-    "thymos": {"meaning": "spirit, soul (possibly)", "confidence": "LOW", "source": "Beekes"},
-    "theos": {"meaning": "god (possibly substrate)", "confidence": "LOW", "source": "Beekes"},
-    "hieros": {"meaning": "sacred", "confidence": "LOW", "source": "Beekes"},
-    # Personal names/theonyms
-    "Ariadne": {"meaning": "personal name (Pre-Greek)", "confidence": "MEDIUM", "source": "Beekes"},
-    "Athene": {"meaning": "goddess name (Pre-Greek)", "confidence": "HIGH", "source": "Beekes"},
-    "Hermēs": {"meaning": "god name (Pre-Greek)", "confidence": "MEDIUM", "source": "Beekes"},
-    # Food/cooking
-    "plakous": {"meaning": "flat cake/slab", "confidence": "LOW", "source": "Beekes"},
-    "maza": {"meaning": "barley cake", "confidence": "MEDIUM", "source": "Beekes"},
-}
-
-# Pre-Greek phonological rules (characteristics that distinguish from IE)
-PREGREEK_PHONOLOGY = {
-    # Vowel alternations (a/e, i/e)
-    "vowel_alternation": ["a/e", "i/e", "o/a"],
-    # Initial clusters forbidden in PIE
-    "initial_clusters": ["gd-", "bd-", "ks-", "ps-"],
-    # Prenasalization
-    "prenasalization": ["mb", "nd", "ng"],
-}
-
-# ===========================================================================
-# PROTO-GREEK / MYCENAEAN REFERENCE DATA
-# Sources: Ventris & Chadwick (1973) Documents in Mycenaean Greek,
-# Aura Jorro (1985-1993) DMic, Palmer (1963)
-# ===========================================================================
-
-GREEK_LEXICON = {
-    # ---- ADMINISTRATIVE VOCABULARY (HIGH confidence) ----
-    # Totals and quantities
-    "toso": {
-        "meaning": "so much, total (τόσος)",
-        "Linear_B": "to-so",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    "tosa": {
-        "meaning": "so many (fem.)",
-        "Linear_B": "to-sa",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    "panta": {
-        "meaning": "all (πάντα)",
-        "Linear_B": "pa-ta",
-        "confidence": "MEDIUM",
-        "source": "Ventris",
-    },
-    # Personnel/titles
-    "wanax": {
-        "meaning": "king (ϝάναξ)",
-        "Linear_B": "wa-na-ka",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    "lawagetas": {
-        "meaning": "army leader (λαγέτας)",
-        "Linear_B": "ra-wa-ke-ta",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    "basileus": {
-        "meaning": "chief, king (βασιλεύς)",
-        "Linear_B": "qa-si-re-u",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    "korete": {
-        "meaning": "mayor, governor",
-        "Linear_B": "ko-re-te",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    "doero": {
-        "meaning": "servant/slave (δοῦλος)",
-        "Linear_B": "do-e-ro",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    "doera": {
-        "meaning": "female servant",
-        "Linear_B": "do-e-ra",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    # Professions
-    "tekton": {
-        "meaning": "craftsman (τέκτων)",
-        "Linear_B": "te-ko-to",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    "khalkeus": {
-        "meaning": "bronzesmith (χαλκεύς)",
-        "Linear_B": "ka-ke-u",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    "kerameus": {
-        "meaning": "potter (κεραμεύς)",
-        "Linear_B": "ke-ra-me-u",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    # ---- COMMODITIES (HIGH confidence) ----
-    # Wine
-    "woinos": {
-        "meaning": "wine (ϝοῖνος)",
-        "Linear_B": "wo-no",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    # Oil
-    "elaiwon": {
-        "meaning": "olive oil (ἔλαιϝον)",
-        "Linear_B": "e-ra-wo",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    # Grain
-    "sitos": {
-        "meaning": "grain, food (σῖτος)",
-        "Linear_B": "si-to",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    # Honey
-    "meli": {
-        "meaning": "honey (μέλι)",
-        "Linear_B": "me-ri",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    # Figs
-    "sukon": {
-        "meaning": "fig (σῦκον)",
-        "Linear_B": "su-ko",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    # Wool/textiles
-    "mallos": {"meaning": "wool", "Linear_B": "ma-ro", "confidence": "MEDIUM", "source": "Ventris"},
-    # Metals
-    "khalkos": {
-        "meaning": "bronze (χαλκός)",
-        "Linear_B": "ka-ko",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    "khrusos": {
-        "meaning": "gold (χρυσός)",
-        "Linear_B": "ku-ru-so",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    # ---- ANIMALS (HIGH confidence) ----
-    "bous": {
-        "meaning": "ox, cattle (βοῦς)",
-        "Linear_B": "qo-u",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    "oïs": {
-        "meaning": "sheep (ὄϊς)",
-        "Linear_B": "o-wi",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    "aix": {
-        "meaning": "goat (αἴξ)",
-        "Linear_B": "a-i-ka",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    "sus": {"meaning": "pig (σῦς)", "Linear_B": "su-we", "confidence": "HIGH", "source": "Ventris"},
-    "hippos": {
-        "meaning": "horse (ἵππος)",
-        "Linear_B": "i-qo",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    # ---- DIVINE NAMES (HIGH confidence for Linear B) ----
-    "Zeus": {
-        "meaning": "Zeus (Ζεύς)",
-        "Linear_B": "di-we",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    "Hera": {
-        "meaning": "Hera (Ἥρα)",
-        "Linear_B": "e-ra",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    "Poseidon": {
-        "meaning": "Poseidon (Ποσειδῶν)",
-        "Linear_B": "po-se-da-o",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    "Athena": {
-        "meaning": "Athena (Ἀθήνη)",
-        "Linear_B": "a-ta-na",
-        "confidence": "MEDIUM",
-        "source": "Ventris",
-    },
-    "Artemis": {
-        "meaning": "Artemis (Ἄρτεμις)",
-        "Linear_B": "a-te-mi-to",
-        "confidence": "MEDIUM",
-        "source": "Ventris",
-    },
-    "Hermes": {
-        "meaning": "Hermes (Ἑρμῆς)",
-        "Linear_B": "e-ma-a",
-        "confidence": "MEDIUM",
-        "source": "Ventris",
-    },
-    "Dionysos": {
-        "meaning": "Dionysus (Διόνυσος)",
-        "Linear_B": "di-wo-nu-so",
-        "confidence": "MEDIUM",
-        "source": "Ventris",
-    },
-    "Potnia": {
-        "meaning": "Lady, Mistress (Πότνια)",
-        "Linear_B": "po-ti-ni-ja",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    # ---- KINSHIP TERMS (HIGH confidence) ----
-    "meter": {
-        "meaning": "mother (μήτηρ)",
-        "Linear_B": "ma-te",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    "pater": {
-        "meaning": "father (πατήρ)",
-        "Linear_B": "pa-te",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    "huios": {
-        "meaning": "son (υἱός)",
-        "Linear_B": "u-jo",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    "korwos": {
-        "meaning": "boy (κόρϝος)",
-        "Linear_B": "ko-wo",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    "korwa": {
-        "meaning": "girl (κόρϝα)",
-        "Linear_B": "ko-wa",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    "gune": {
-        "meaning": "woman (γυνή)",
-        "Linear_B": "ku-na",
-        "confidence": "MEDIUM",
-        "source": "Ventris",
-    },
-    # ---- PLACES (HIGH confidence - includes confirmed Linear A toponym) ----
-    "Phaistos": {
-        "meaning": "Phaistos",
-        "Linear_B": "pa-i-to",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    "Knossos": {
-        "meaning": "Knossos",
-        "Linear_B": "ko-no-so",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    "Amnisos": {
-        "meaning": "Amnisos",
-        "Linear_B": "a-mi-ni-so",
-        "confidence": "HIGH",
-        "source": "Ventris",
-    },
-    "Tylissos": {
-        "meaning": "Tylissos",
-        "Linear_B": "tu-ri-so",
-        "confidence": "MEDIUM",
-        "source": "Ventris",
-    },
-    # ---- POSSIBLE LINEAR A COGNATES (MEDIUM-LOW confidence) ----
-    "kyrios": {
-        "meaning": "lord, master → total?",
-        "Linear_B": "ku-ro",
-        "confidence": "MEDIUM",
-        "source": "Gordon",
-    },
-    "chreos": {
-        "meaning": "debt (χρέος)",
-        "Linear_B": "ki-re-o",
-        "confidence": "LOW",
-        "source": "Gordon",
-    },
-    "demos": {
-        "meaning": "people, district (δῆμος)",
-        "Linear_B": "da-mo",
-        "confidence": "MEDIUM",
-        "source": "Ventris",
-    },
-    # ---- VERBS (MEDIUM confidence) ----
-    "didonai": {
-        "meaning": "to give (δίδωμι)",
-        "Linear_B": "di-do-si",
-        "confidence": "MEDIUM",
-        "source": "Ventris",
-    },
-    "ekhein": {
-        "meaning": "to have (ἔχω)",
-        "Linear_B": "e-ke",
-        "confidence": "MEDIUM",
-        "source": "Ventris",
-    },
-    "ophellein": {
-        "meaning": "to owe (ὀφείλω)",
-        "Linear_B": "o-pe-ro",
-        "confidence": "MEDIUM",
-        "source": "Ventris",
-    },
-}
-
-# ===========================================================================
-# HURRIAN REFERENCE DATA
-# Sources: Wegner (2007), Wilhelm (1995), Nuzi archives, von Dassow (Alalakh)
-# ===========================================================================
-
-HURRIAN_LEXICON = {
-    # Administrative vocabulary (HIGH confidence from Nuzi/Alalakh)
-    "ewri": {"meaning": "lord, king, ruler", "confidence": "HIGH", "source": "Wegner"},
-    "eni": {"meaning": "god, deity", "confidence": "HIGH", "source": "Wegner"},
-    "atti": {"meaning": "father", "confidence": "HIGH", "source": "Wegner"},
-    "nera": {"meaning": "mother", "confidence": "MEDIUM", "source": "Wegner"},
-    "sena": {"meaning": "brother", "confidence": "HIGH", "source": "Wegner"},
-    "ela": {"meaning": "sister", "confidence": "MEDIUM", "source": "Wegner"},
-    "puru": {"meaning": "house, temple", "confidence": "HIGH", "source": "Wegner"},
-    "arde": {"meaning": "city, town", "confidence": "HIGH", "source": "Wegner"},
-    "awari": {"meaning": "field, estate", "confidence": "HIGH", "source": "Wegner"},
-    "tuppi": {"meaning": "tablet, document", "confidence": "HIGH", "source": "Nuzi"},
-    "tive": {"meaning": "word, thing, matter", "confidence": "HIGH", "source": "Wegner"},
-    "aste": {"meaning": "woman, lady", "confidence": "HIGH", "source": "Nuzi"},
-    "sarri": {"meaning": "king (Akkadian loan)", "confidence": "HIGH", "source": "Nuzi"},
-    "kussi": {"meaning": "throne, seat", "confidence": "MEDIUM", "source": "Wegner"},
-    "hassi": {"meaning": "oil, ointment", "confidence": "MEDIUM", "source": "Nuzi"},
-    "sije": {"meaning": "water", "confidence": "HIGH", "source": "Wegner"},
-    "hari": {"meaning": "road, way", "confidence": "MEDIUM", "source": "Wegner"},
-    "sukri": {"meaning": "gift, offering", "confidence": "HIGH", "source": "Wegner"},
-    "keldi": {"meaning": "health, well-being", "confidence": "HIGH", "source": "Wegner"},
-    "tadi": {"meaning": "love", "confidence": "HIGH", "source": "Wegner"},
-    "uri": {"meaning": "foot, base", "confidence": "MEDIUM", "source": "Wegner"},
-    "sarni": {"meaning": "penalty, compensation", "confidence": "MEDIUM", "source": "Nuzi"},
-    "kirenzi": {"meaning": "release, freedom", "confidence": "MEDIUM", "source": "Nuzi"},
-    # Verbal roots
-    "ar": {"meaning": "give", "confidence": "HIGH", "source": "Wegner"},
-    "un": {"meaning": "come, bring", "confidence": "HIGH", "source": "Wegner"},
-    "ag": {"meaning": "lead, bring", "confidence": "MEDIUM", "source": "Wegner"},
-    "pal": {"meaning": "know, understand", "confidence": "MEDIUM", "source": "Wegner"},
-    "fur": {"meaning": "see, look", "confidence": "MEDIUM", "source": "Wegner"},
-    "sid": {"meaning": "curse, bewitch", "confidence": "MEDIUM", "source": "Wegner"},
-    "tehhi": {"meaning": "approach, enter", "confidence": "MEDIUM", "source": "Wegner"},
-    "passi": {"meaning": "send, message", "confidence": "MEDIUM", "source": "Nuzi"},
-    "undi": {"meaning": "offering, dedication", "confidence": "MEDIUM", "source": "Wegner"},
-    # Divine names
-    "tessub": {"meaning": "Storm God (chief deity)", "confidence": "HIGH", "source": "Wegner"},
-    "sauska": {"meaning": "love/war goddess (=Ishtar)", "confidence": "HIGH", "source": "Wegner"},
-    "kumarbi": {"meaning": "father of gods", "confidence": "HIGH", "source": "Wegner"},
-    "hepat": {"meaning": "solar goddess", "confidence": "HIGH", "source": "Wegner"},
-    "simige": {"meaning": "sun god", "confidence": "HIGH", "source": "Wegner"},
-    "kusuh": {"meaning": "moon god", "confidence": "HIGH", "source": "Wegner"},
-    "allani": {"meaning": "lady (of underworld)", "confidence": "MEDIUM", "source": "Wegner"},
-    # Morphological elements
-    "ne": {"meaning": "definite article (sg)", "confidence": "HIGH", "source": "Wegner"},
-    "na": {"meaning": "definite article (pl)", "confidence": "HIGH", "source": "Wegner"},
-    "sse": {"meaning": "ergative/abstract", "confidence": "HIGH", "source": "Wegner"},
-    "va": {"meaning": "genitive/dative", "confidence": "HIGH", "source": "Wegner"},
-    "da": {"meaning": "allative/ablative", "confidence": "HIGH", "source": "Wegner"},
-    "ra": {"meaning": "comitative", "confidence": "MEDIUM", "source": "Wegner"},
-    "ma": {"meaning": "conjunction 'and'", "confidence": "HIGH", "source": "Wegner"},
-}
-
-HURRIAN_PHONOLOGICAL_MARKERS = {
-    "vowel_system": ["a", "e", "i", "u"],
-    "no_o": True,
-    "agglutinative": True,
-    "ergative": True,
-    "sov_word_order": True,
-    "suffixation_primary": True,
-}
-
-# ===========================================================================
-# HATTIC REFERENCE DATA
-# Sources: Soysal (2004), Schuster (1974-2002), Girbal (1986)
-# ===========================================================================
-
-HATTIC_LEXICON = {
-    "estan": {"meaning": "sun god", "confidence": "HIGH", "source": "Soysal"},
-    "taru": {"meaning": "storm god", "confidence": "HIGH", "source": "Soysal"},
-    "katte": {"meaning": "king", "confidence": "HIGH", "source": "Soysal"},
-    "katti": {"meaning": "queen", "confidence": "HIGH", "source": "Soysal"},
-    "fur": {"meaning": "land, earth", "confidence": "HIGH", "source": "Soysal"},
-    "zinar": {"meaning": "deity, divine", "confidence": "MEDIUM", "source": "Soysal"},
-    "pinu": {"meaning": "child, offspring", "confidence": "MEDIUM", "source": "Soysal"},
-    "tuh": {"meaning": "temple, shrine", "confidence": "MEDIUM", "source": "Soysal"},
-    "washap": {"meaning": "god, divinity", "confidence": "MEDIUM", "source": "Soysal"},
-    "kas": {"meaning": "cup, vessel", "confidence": "MEDIUM", "source": "Soysal"},
-    "tuel": {"meaning": "house, building", "confidence": "MEDIUM", "source": "Soysal"},
-    "telipinu": {"meaning": "vegetation god", "confidence": "HIGH", "source": "Soysal"},
-    "inara": {"meaning": "goddess", "confidence": "MEDIUM", "source": "Soysal"},
-    "wurunsemu": {"meaning": "Sun Goddess of Arinna", "confidence": "HIGH", "source": "Soysal"},
-    "le": {"meaning": "1sg subject prefix", "confidence": "HIGH", "source": "Girbal"},
-    "wa": {"meaning": "2sg/3sg subject prefix", "confidence": "HIGH", "source": "Girbal"},
-    "ta": {"meaning": "plural prefix", "confidence": "HIGH", "source": "Girbal"},
-    "te": {"meaning": "collective/abstract prefix", "confidence": "MEDIUM", "source": "Girbal"},
-    "sa": {"meaning": "causative prefix", "confidence": "MEDIUM", "source": "Girbal"},
-}
-
-HATTIC_PHONOLOGICAL_MARKERS = {
-    "vowel_system": ["a", "e", "i", "u"],
-    "no_o": True,
-    "agglutinative": True,
-    "prefixing_dominant": True,
-    "sov_word_order": True,
-}
-
-# ===========================================================================
-# ETRUSCAN/TYRSENIAN REFERENCE DATA
-# Sources: Bonfante (2002), Wallace (2008), Rix (1991)
-# ===========================================================================
-
-ETRUSCAN_LEXICON = {
-    # Administrative vocabulary
-    "zilath": {"meaning": "magistrate, praetor", "confidence": "HIGH", "source": "Bonfante"},
-    "lucumo": {"meaning": "king, chief", "confidence": "HIGH", "source": "Bonfante"},
-    "maru": {"meaning": "magistrate", "confidence": "HIGH", "source": "Bonfante"},
-    "spura": {"meaning": "city, state", "confidence": "HIGH", "source": "Bonfante"},
-    "tular": {"meaning": "boundary, border", "confidence": "HIGH", "source": "Bonfante"},
-    "avil": {"meaning": "year", "confidence": "HIGH", "source": "Bonfante"},
-    "zilc": {"meaning": "magistracy year", "confidence": "HIGH", "source": "Bonfante"},
-    "methlum": {"meaning": "people, community", "confidence": "MEDIUM", "source": "Wallace"},
-    "suth": {"meaning": "tomb, grave", "confidence": "HIGH", "source": "Bonfante"},
-    "tur": {"meaning": "gift, dedication", "confidence": "MEDIUM", "source": "Bonfante"},
-    # Religious vocabulary
-    "ais": {"meaning": "god, deity", "confidence": "HIGH", "source": "Bonfante"},
-    "aisna": {"meaning": "divine, sacred", "confidence": "HIGH", "source": "Bonfante"},
-    "fanu": {"meaning": "sanctuary, temple", "confidence": "HIGH", "source": "Bonfante"},
-    "celi": {"meaning": "earth, ground", "confidence": "MEDIUM", "source": "Wallace"},
-    "neri": {"meaning": "water", "confidence": "MEDIUM", "source": "Wallace"},
-    "vacl": {"meaning": "libation, offering", "confidence": "HIGH", "source": "Bonfante"},
-    "zusle": {"meaning": "offering/sacrifice", "confidence": "MEDIUM", "source": "Bonfante"},
-    # Kinship
-    "clan": {"meaning": "son", "confidence": "HIGH", "source": "Bonfante"},
-    "sec": {"meaning": "daughter", "confidence": "HIGH", "source": "Bonfante"},
-    "puia": {"meaning": "wife", "confidence": "HIGH", "source": "Bonfante"},
-    "ati": {"meaning": "mother", "confidence": "HIGH", "source": "Bonfante"},
-    "apa": {"meaning": "father", "confidence": "MEDIUM", "source": "Bonfante"},
-    # Divine names
-    "tinia": {"meaning": "Jupiter/chief god", "confidence": "HIGH", "source": "Bonfante"},
-    "uni": {"meaning": "Juno/goddess", "confidence": "HIGH", "source": "Bonfante"},
-    "turan": {"meaning": "Venus/love goddess", "confidence": "HIGH", "source": "Bonfante"},
-    "fufluns": {"meaning": "Bacchus/wine god", "confidence": "HIGH", "source": "Bonfante"},
-    "thesan": {"meaning": "dawn goddess", "confidence": "HIGH", "source": "Bonfante"},
-    # Morphological elements
-    "s": {"meaning": "genitive I suffix", "confidence": "HIGH", "source": "Wallace"},
-    "al": {"meaning": "genitive II / pertinentive", "confidence": "HIGH", "source": "Wallace"},
-    "si": {"meaning": "dative suffix", "confidence": "HIGH", "source": "Wallace"},
-    "ce": {"meaning": "past tense marker", "confidence": "HIGH", "source": "Wallace"},
-    "c": {"meaning": "conjunction 'and' (enclitic)", "confidence": "HIGH", "source": "Wallace"},
-}
-
-ETRUSCAN_PHONOLOGICAL_MARKERS = {
-    "vowel_system": ["a", "e", "i", "u"],
-    "no_o": True,
-    "no_voiced_stops": True,
-    "agglutinative": True,
-    "suffixation_primary": True,
-    "sov_word_order": True,
-}
-
-# Greek phonetic patterns expected in Linear A (if Greek)
-GREEK_PHONOLOGY_EXPECTATIONS = {
-    # Expected vowel distribution
-    "vowel_distribution": {"a": 0.25, "e": 0.20, "i": 0.20, "o": 0.20, "u": 0.15},
-    # Linear A actual: a ~39%, i ~26%, u ~18%, e ~14%, o ~3% (strongly differs!)
-    # Expected case endings (if Greek)
-    "case_endings": ["-o", "-a", "-i", "-e", "-os", "-as", "-es", "-oi", "-ai"],
-    # Diphthongs expected
-    "diphthongs": ["ai", "ei", "oi", "au", "eu", "ou"],
-}
-
-
-# ===========================================================================
-# CASE MARKER PREDICTIONS BY GRAMMATICAL ROLE (Challenge 3 Support)
-# Used for slot grammar analysis - predicting markers by grammatical function
-# ===========================================================================
-
-CASE_MARKER_PREDICTIONS = {
-    "luwian": {
-        "RECIPIENT": {
-            "markers": ["-si", "-i", "-a-si"],
-            "description": "Luwian dative-locative endings",
-            "confidence": "MEDIUM",
-            "source": "Melchert (2003)",
-        },
-        "SOURCE": {
-            "markers": ["-za", "-ati", "-ta"],
-            "description": "Luwian ablative markers",
-            "confidence": "MEDIUM",
-            "source": "Melchert (2003)",
-        },
-        "AGENT": {
-            "markers": ["-s", "-sa", ""],
-            "description": "Luwian nominative/agentive",
-            "confidence": "MEDIUM",
-            "source": "Melchert (2003)",
-        },
-        "BENEFICIARY": {
-            "markers": ["-si", "-a-si", "-i"],
-            "description": "Luwian dative (same as recipient)",
-            "confidence": "MEDIUM",
-            "source": "Melchert (2003)",
-        },
-        "POSSESSOR": {
-            "markers": ["-sa", "-ssa", "-as-sa"],
-            "description": "Luwian genitive/possessive",
-            "confidence": "MEDIUM",
-            "source": "Melchert (2003)",
-        },
-        "QUANTITY_MOD": {
-            "markers": ["-ja", "-i-ja", "-wa"],
-            "description": "Luwian adjectival suffix -iya",
-            "confidence": "LOW",
-            "source": "Yakubovich (2010)",
-        },
-        "QUALITY_MOD": {
-            "markers": ["-ja", "-i-ja"],
-            "description": "Luwian adjectival suffix",
-            "confidence": "LOW",
-            "source": "Yakubovich (2010)",
-        },
-    },
-    "semitic": {
-        "RECIPIENT": {
-            "markers": ["-a", "-am", "la-", "li-"],
-            "description": "Semitic dative/ventive markers",
-            "confidence": "LOW",
-            "source": "GAG (Akkadian Grammar)",
-        },
-        "SOURCE": {
-            "markers": ["mi-", "min-", "-tu"],
-            "description": "Semitic ablative constructions",
-            "confidence": "LOW",
-            "source": "GAG",
-        },
-        "AGENT": {
-            "markers": ["-u", "-um", ""],
-            "description": "Semitic nominative/construct",
-            "confidence": "LOW",
-            "source": "GAG",
-        },
-        "BENEFICIARY": {
-            "markers": ["ana-", "la-"],
-            "description": "Semitic typically uses prepositions",
-            "confidence": "LOW",
-            "source": "GAG",
-        },
-        "POSSESSOR": {
-            "markers": ["-i", "-im", "-su", "-ka"],
-            "description": "Semitic genitive suffixes",
-            "confidence": "MEDIUM",
-            "source": "GAG",
-        },
-        "QUANTITY_MOD": {
-            "markers": ["-u", "-a"],
-            "description": "Semitic adjectival forms",
-            "confidence": "LOW",
-            "source": "GAG",
-        },
-        "QUALITY_MOD": {
-            "markers": ["-u", "-a", "-i"],
-            "description": "Semitic adjectival forms",
-            "confidence": "LOW",
-            "source": "GAG",
-        },
-    },
-    "pregreek": {
-        "RECIPIENT": {
-            "markers": ["-na", "-nth", "-ss"],
-            "description": "Pre-Greek characteristic suffixes (speculative)",
-            "confidence": "LOW",
-            "source": "Beekes (2014)",
-        },
-        "SOURCE": {
-            "markers": ["-th", "-ss-a", "-mn"],
-            "description": "Pre-Greek ablative-like (speculative)",
-            "confidence": "LOW",
-            "source": "Beekes (2014)",
-        },
-        "AGENT": {
-            "markers": ["-s", "-ss", "-nth"],
-            "description": "Pre-Greek nominal suffixes",
-            "confidence": "LOW",
-            "source": "Furnée (1972)",
-        },
-        "BENEFICIARY": {
-            "markers": ["-na", "-nth", "-ss"],
-            "description": "Pre-Greek suffixes (speculative)",
-            "confidence": "LOW",
-            "source": "Beekes (2014)",
-        },
-        "POSSESSOR": {
-            "markers": ["-ss-a", "-nth-os", "-mn-os"],
-            "description": "Pre-Greek possessive (by analogy)",
-            "confidence": "SPECULATIVE",
-            "source": "Furnée (1972)",
-        },
-        "QUANTITY_MOD": {
-            "markers": ["-ss", "-nth", "-mn"],
-            "description": "Pre-Greek adjectival",
-            "confidence": "SPECULATIVE",
-            "source": "Beekes (2014)",
-        },
-        "QUALITY_MOD": {
-            "markers": ["-ss", "-nth", "-mn"],
-            "description": "Pre-Greek adjectival",
-            "confidence": "SPECULATIVE",
-            "source": "Beekes (2014)",
-        },
-    },
-    "protogreek": {
-        "RECIPIENT": {
-            "markers": ["-i", "-oi", "-ai", "-e"],
-            "description": "Proto-Greek dative endings",
-            "confidence": "MEDIUM",
-            "source": "Ventris & Chadwick (1973)",
-        },
-        "SOURCE": {
-            "markers": ["-o", "-as", "-os", "-tos"],
-            "description": "Proto-Greek genitive-ablative",
-            "confidence": "MEDIUM",
-            "source": "Ventris & Chadwick (1973)",
-        },
-        "AGENT": {
-            "markers": ["-s", "-os", "-es", "-a"],
-            "description": "Proto-Greek nominative endings",
-            "confidence": "MEDIUM",
-            "source": "Ventris & Chadwick (1973)",
-        },
-        "BENEFICIARY": {
-            "markers": ["-i", "-oi", "-ai"],
-            "description": "Proto-Greek dative (same as recipient)",
-            "confidence": "MEDIUM",
-            "source": "Ventris & Chadwick (1973)",
-        },
-        "POSSESSOR": {
-            "markers": ["-o", "-oio", "-as", "-ao"],
-            "description": "Proto-Greek genitive endings",
-            "confidence": "MEDIUM",
-            "source": "Ventris & Chadwick (1973)",
-        },
-        "QUANTITY_MOD": {
-            "markers": ["-os", "-a", "-on", "-e"],
-            "description": "Proto-Greek adjectival agreement",
-            "confidence": "MEDIUM",
-            "source": "Ventris & Chadwick (1973)",
-        },
-        "QUALITY_MOD": {
-            "markers": ["-os", "-a", "-on"],
-            "description": "Proto-Greek adjectival",
-            "confidence": "MEDIUM",
-            "source": "Ventris & Chadwick (1973)",
-        },
-    },
-    "hurrian": {
-        "RECIPIENT": {
-            "markers": ["-va", "-a"],
-            "description": "Hurrian dative/allative",
-            "confidence": "MEDIUM",
-            "source": "Wegner (2007)",
-        },
-        "SOURCE": {
-            "markers": ["-dan", "-ne-dan"],
-            "description": "Hurrian ablative",
-            "confidence": "MEDIUM",
-            "source": "Wegner (2007)",
-        },
-        "AGENT": {
-            "markers": ["-sse", "-ze"],
-            "description": "Hurrian ergative",
-            "confidence": "MEDIUM",
-            "source": "Wegner (2007)",
-        },
-        "BENEFICIARY": {
-            "markers": ["-va", "-da"],
-            "description": "Hurrian dative/allative",
-            "confidence": "MEDIUM",
-            "source": "Wegner (2007)",
-        },
-        "POSSESSOR": {
-            "markers": ["-ve", "-we", "-vi"],
-            "description": "Hurrian genitive",
-            "confidence": "MEDIUM",
-            "source": "Wegner (2007)",
-        },
-        "QUANTITY_MOD": {
-            "markers": ["-he", "-iffu"],
-            "description": "Hurrian adjectival derivation",
-            "confidence": "LOW",
-            "source": "Wegner (2007)",
-        },
-        "QUALITY_MOD": {
-            "markers": ["-he", "-uhhe"],
-            "description": "Hurrian adjectival/agent",
-            "confidence": "LOW",
-            "source": "Wegner (2007)",
-        },
-    },
-    "hattic": {
-        "RECIPIENT": {
-            "markers": ["-du"],
-            "description": "Hattic dative? (poorly attested)",
-            "confidence": "LOW",
-            "source": "Girbal (1986)",
-        },
-        "SOURCE": {
-            "markers": ["-el"],
-            "description": "Hattic ablative? (poorly attested)",
-            "confidence": "LOW",
-            "source": "Girbal (1986)",
-        },
-        "AGENT": {
-            "markers": ["le-", "wa-", "a-"],
-            "description": "Hattic subject prefixes",
-            "confidence": "MEDIUM",
-            "source": "Girbal (1986)",
-        },
-        "BENEFICIARY": {
-            "markers": ["-du", "-il"],
-            "description": "Hattic dative/locative",
-            "confidence": "LOW",
-            "source": "Girbal (1986)",
-        },
-        "POSSESSOR": {
-            "markers": ["-un"],
-            "description": "Hattic genitive?",
-            "confidence": "LOW",
-            "source": "Girbal (1986)",
-        },
-        "QUANTITY_MOD": {
-            "markers": ["ta-"],
-            "description": "Hattic plural/collective prefix",
-            "confidence": "LOW",
-            "source": "Girbal (1986)",
-        },
-        "QUALITY_MOD": {
-            "markers": ["te-"],
-            "description": "Hattic abstract prefix",
-            "confidence": "LOW",
-            "source": "Girbal (1986)",
-        },
-    },
-    "etruscan": {
-        "RECIPIENT": {
-            "markers": ["-si", "-le"],
-            "description": "Etruscan dative/pertinentive",
-            "confidence": "MEDIUM",
-            "source": "Wallace (2008)",
-        },
-        "SOURCE": {
-            "markers": ["-is"],
-            "description": "Etruscan ablative",
-            "confidence": "MEDIUM",
-            "source": "Wallace (2008)",
-        },
-        "AGENT": {
-            "markers": ["-Ø", ""],
-            "description": "Etruscan nominative (unmarked)",
-            "confidence": "MEDIUM",
-            "source": "Wallace (2008)",
-        },
-        "BENEFICIARY": {
-            "markers": ["-si", "-le"],
-            "description": "Etruscan dative",
-            "confidence": "MEDIUM",
-            "source": "Wallace (2008)",
-        },
-        "POSSESSOR": {
-            "markers": ["-s", "-al", "-l"],
-            "description": "Etruscan genitive I/II",
-            "confidence": "HIGH",
-            "source": "Wallace (2008)",
-        },
-        "QUANTITY_MOD": {
-            "markers": ["-na", "-c"],
-            "description": "Etruscan adjectival/enclitic",
-            "confidence": "LOW",
-            "source": "Wallace (2008)",
-        },
-        "QUALITY_MOD": {
-            "markers": ["-na"],
-            "description": "Etruscan adjectival",
-            "confidence": "LOW",
-            "source": "Wallace (2008)",
-        },
-    },
-}
-
-# Grammatical roles that can fill the [X] slot in [X] + LOGOGRAM + NUMBER
-GRAMMATICAL_ROLES = {
-    "RECIPIENT": "Who receives the commodity",
-    "SOURCE": "Where the commodity comes from",
-    "AGENT": "Who provides/delivers the commodity",
-    "BENEFICIARY": "For whom the commodity is intended",
-    "POSSESSOR": "Whose commodity it is",
-    "QUANTITY_MOD": "How much (adjectival modifier)",
-    "QUALITY_MOD": "What kind (adjectival modifier)",
-}
-
-
 class HypothesisTester:
     """
     Tests Linear A words against seven linguistic hypotheses.
@@ -1610,7 +408,7 @@ class HypothesisTester:
             result["score"] += 0.5
 
         # Check Luwian lexicon
-        for luw_word, data in LUWIAN_LEXICON.items():
+        for luw_word, data in reference("LUWIAN_LEXICON").items():
             if luw_word.upper() in word_upper or word_upper in luw_word.upper():
                 result["cognates_found"].append(
                     {
@@ -1659,7 +457,7 @@ class HypothesisTester:
         result["consonant_skeleton"] = consonants
 
         # Check against Semitic lexicon
-        for sem_word, data in SEMITIC_LEXICON.items():
+        for sem_word, data in reference("SEMITIC_LEXICON").items():
             root = data.get("root", sem_word.upper())
             # Flexible matching: exact, contains, or partial overlap
             if consonants == root:
@@ -1797,7 +595,7 @@ class HypothesisTester:
         reconstructed = "".join(syllables).lower()
 
         # Check for Pre-Greek phonological markers
-        for marker, data in PREGREEK_MARKERS.items():
+        for marker, data in reference("PREGREEK_MARKERS").items():
             marker_upper = marker.upper()
             # Check in concatenated form or original
             if marker_upper in word_upper or marker.lower() in reconstructed:
@@ -1817,7 +615,7 @@ class HypothesisTester:
                     result["score"] += 0.5
 
         # Check for Pre-Greek vocabulary matches
-        for vocab, data in PREGREEK_VOCABULARY.items():
+        for vocab, data in reference("PREGREEK_VOCABULARY").items():
             # Normalize for comparison
             vocab_norm = vocab.lower().replace("-", "")
             if vocab_norm in reconstructed or reconstructed in vocab_norm:
@@ -1844,7 +642,7 @@ class HypothesisTester:
                 v1 = syl[-1] if syl[-1] in "AEIOU" else ""
                 v2 = syllables[i + 1][-1] if syllables[i + 1][-1] in "AEIOU" else ""
                 # Check for Pre-Greek alternation patterns
-                for alt in PREGREEK_PHONOLOGY.get("vowel_alternation", []):
+                for alt in reference("PREGREEK_PHONOLOGY").get("vowel_alternation", []):
                     parts = alt.split("/")
                     if len(parts) == 2:
                         if (v1.lower() == parts[0] and v2.lower() == parts[1]) or (
@@ -1933,7 +731,7 @@ class HypothesisTester:
         syllables = word_upper.split("-")
 
         # Check Greek lexicon for Linear B cognates
-        for greek_word, data in GREEK_LEXICON.items():
+        for greek_word, data in reference("GREEK_LEXICON").items():
             linear_b = data.get("Linear_B", "").upper()
             if not linear_b:
                 continue
@@ -2093,11 +891,13 @@ class HypothesisTester:
         Returns:
             dict with match scores for each hypothesis
         """
-        if role not in GRAMMATICAL_ROLES:
+        roles = reference("GRAMMATICAL_ROLES")
+        predictions = reference("CASE_MARKER_PREDICTIONS")
+        if role not in roles:
             return {
                 "word": word,
                 "role": role,
-                "error": f"Unknown role: {role}. Valid roles: {list(GRAMMATICAL_ROLES.keys())}",
+                "error": f"Unknown role: {role}. Valid roles: {list(roles.keys())}",
             }
 
         word_upper = word.upper()
@@ -2109,20 +909,20 @@ class HypothesisTester:
         result = {
             "word": word,
             "role": role,
-            "role_description": GRAMMATICAL_ROLES[role],
+            "role_description": roles[role],
             "final_syllable": final_syl,
             "hypothesis_matches": {},
             "best_match": None,
             "best_score": 0,
         }
 
-        hypotheses = list(CASE_MARKER_PREDICTIONS.keys())
+        hypotheses = list(predictions.keys())
 
         for hyp in hypotheses:
-            if hyp not in CASE_MARKER_PREDICTIONS:
+            if hyp not in predictions:
                 continue
 
-            hyp_data = CASE_MARKER_PREDICTIONS[hyp].get(role, {})
+            hyp_data = predictions[hyp].get(role, {})
             markers = hyp_data.get("markers", [])
 
             match_score = 0.0
@@ -2179,7 +979,7 @@ class HypothesisTester:
         best_score = 0
         best_combo = None
 
-        for role in GRAMMATICAL_ROLES:
+        for role in reference("GRAMMATICAL_ROLES"):
             role_result = self.test_grammatical_role(word, role)
             result["role_matrix"][role] = role_result["hypothesis_matches"]
 
@@ -2222,7 +1022,7 @@ class HypothesisTester:
         word_norm = word_upper.replace("-", "").lower()
 
         # Check Hurrian lexicon
-        for hurr_word, data in HURRIAN_LEXICON.items():
+        for hurr_word, data in reference("HURRIAN_LEXICON").items():
             hurr_norm = hurr_word.upper().replace("-", "")
             if word_norm == hurr_word or word_upper == hurr_norm:
                 base_score = (
@@ -2328,7 +1128,7 @@ class HypothesisTester:
         word_norm = word_upper.replace("-", "").lower()
 
         # Check Hattic lexicon (small — 19 entries)
-        for hat_word, data in HATTIC_LEXICON.items():
+        for hat_word, data in reference("HATTIC_LEXICON").items():
             hat_norm = hat_word.upper().replace("-", "")
             if word_norm == hat_word or word_upper == hat_norm:
                 base_score = (
@@ -2426,7 +1226,7 @@ class HypothesisTester:
         word_norm = word_upper.replace("-", "").lower()
 
         # Check Etruscan lexicon
-        for etr_word, data in ETRUSCAN_LEXICON.items():
+        for etr_word, data in reference("ETRUSCAN_LEXICON").items():
             etr_norm = etr_word.upper().replace("-", "")
             if word_norm == etr_word or word_upper == etr_norm:
                 base_score = (
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Compact binary snapshots for derived corpus indexes.
+
+A snapshot is one file holding:
+
+- a small JSON header (format version, caller metadata, section table)
+- a string table (UTF-8, NUL-separated) that every other section refers to
+  by integer id
+- named integer arrays (``array.array('i')``), read back as zero-copy
+  ``memoryview`` slices over an mmap of the file
+
+Snapshots are keyed by a fingerprint of their source file (size, mtime and
+SHA-256). ``is_fresh`` checks the cheap stat fields first and only hashes
+the source when they disagree, so an unchanged corpus is validated without
+reading it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+
+MAGIC = b"LAIDXSNP"
+CONTAINER_FORMAT = 1
+ARRAY_TYPECODE = "i"
+ALIGNMENT = 8
+
+_HEADER_LEN = struct.Struct("<I")
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot file is missing, truncated or incompatible."""
+
+
+def file_fingerprint(path: Path, with_hash: bool = True) -> Dict[str, Any]:
+    """Size, mtime and (optionally) SHA-256 of a source file."""
+    stat = os.stat(path)
+    fingerprint: Dict[str, Any] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    if with_hash:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        fingerprint["sha256"] = digest.hexdigest()
+    return fingerprint
+
+
+class StringTable:
+    """Interning table used while building a snapshot."""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+    def intern(self, value: str) -> int:
+        sid = self.ids.get(value)
+        if sid is None:
+            if "\0" in value:
+                raise ValueError(f"NUL byte in snapshot string: {value!r}")
+            sid = len(self.strings)
+            self.ids[value] = sid
+            self.strings.append(value)
+        return sid
+
+    def intern_all(self, values: Iterable[str]) -> array:
+        return array(ARRAY_TYPECODE, [self.intern(v) for v in values])
+
+
+def _pad(offset: int) -> int:
+    return (-offset) % ALIGNMENT
+
+
+def write_snapshot(
+    path: Path,
+    meta: Dict[str, Any],
+    strings: Sequence[str],
+    arrays: Dict[str, Sequence[int]],
+) -> None:
+    """Write a snapshot atomically (temp file + rename)."""
+    blob = "\0".join(strings).encode("utf-8")
+    sections = {}
+    payloads = []
+    offset = len(blob) + _pad(len(blob))
+    for name, values in arrays.items():
+        data = values if isinstance(values, array) else array(ARRAY_TYPECODE, values)
+        raw = data.tobytes()
+        sections[name] = {"offset": offset, "length": len(data)}
+        payloads.append(raw + b"\0" * _pad(len(raw)))
+        offset += len(raw) + _pad(len(raw))
+
+    header = json.dumps(
+        {
+            "container_format": CONTAINER_FORMAT,
+            "byteorder": sys.byteorder,
+            "itemsize": array(ARRAY_TYPECODE).itemsize,
+            "meta": meta,
+            "strings": {"count": len(strings), "bytes": len(blob)},
+            "arrays": sections,
+        },
+        ensure_ascii=False,
+    ).encode("utf-8")
+    prefix = MAGIC + _HEADER_LEN.pack(len(header)) + header
+    prefix += b"\0" * _pad(len(prefix))
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp{os.getpid()}")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(prefix)
+            f.write(blob + b"\0" * _pad(len(blob)))
+            for payload in payloads:
+                f.write(payload)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+class Snapshot:
+    """Read-only view of a snapshot file; arrays are memoryviews over an mmap."""
+
+    def __init__(self, meta: Dict[str, Any], strings: List[str], arrays: Dict[str, memoryview]):
+        self.meta = meta
+        self.strings = strings
+        self.arrays = arrays
+
+    def __getitem__(self, name: str) -> memoryview:
+        return self.arrays[name]
+
+    def text(self, name: str) -> List[str]:
+        """Resolve a string-id array into its strings."""
+        strings = self.strings
+        return [strings[sid] for sid in self.arrays[name]]
+
+
+def read_snapshot(path: Path) -> Snapshot:
+    """Map a snapshot file; raises SnapshotError if it cannot be used."""
+    try:
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError) as e:
+        raise SnapshotError(f"Cannot open snapshot {path}: {e}") from e
+
+    view = memoryview(mapped)
+    try:
+        if bytes(view[: len(MAGIC)]) != MAGIC:
+            raise SnapshotError(f"Not an index snapshot: {path}")
+        start = len(MAGIC) + _HEADER_LEN.size
+        (header_len,) = _HEADER_LEN.unpack(view[len(MAGIC) : start])
+        header = json.loads(bytes(view[start : start + header_len]).decode("utf-8"))
+        if (
+            header.get("container_format") != CONTAINER_FORMAT
+            or header.get("byteorder") != sys.byteorder
+            or header.get("itemsize") != array(ARRAY_TYPECODE).itemsize
+        ):
+            raise SnapshotError(f"Incompatible snapshot container: {path}")
+
+        base = start + header_len
+        base += _pad(base)
+        table = header["strings"]
+        blob = bytes(view[base : base + table["bytes"]]).decode("utf-8")
+        strings = blob.split("\0") if table["count"] else []
+        if len(strings) != table["count"]:
+            raise SnapshotError(f"Corrupt string table in {path}")
+
+        itemsize = array(ARRAY_TYPECODE).itemsize
+        arrays = {}
+        for name, section in header["arrays"].items():
+            lo = base + section["offset"]
+            hi = lo + section["length"] * itemsize
+            if hi > len(view):
+                raise SnapshotError(f"Truncated snapshot section {name!r} in {path}")
+            arrays[name] = view[lo:hi].cast(ARRAY_TYPECODE)
+    except (KeyError, TypeError, ValueError, struct.error) as e:
+        raise SnapshotError(f"Corrupt snapshot header in {path}: {e}") from e
+
+    return Snapshot(header.get("meta", {}), strings, arrays)
+
+
+def is_fresh(meta: Dict[str, Any], source: Path, expected: Optional[Dict[str, Any]] = None) -> bool:
+    """
+    True if ``meta["source"]`` still describes ``source``.
+
+    ``expected`` holds further keys (format/contract versions) that must match
+    exactly. Matching size+mtime is trusted; otherwise the source is hashed.
+    """
+    for key, value in (expected or {}).items():
+        if meta.get(key) != value:
+            return False
+    recorded = meta.get("source") or {}
+    try:
+        current = file_fingerprint(source, with_hash=False)
+    except OSError:
+        return False
+    if current["size"] != recorded.get("size"):
+        return False
+    if current["mtime_ns"] == recorded.get("mtime_ns"):
+        return True
+    return file_fingerprint(source)["sha256"] == recorded.get("sha256")
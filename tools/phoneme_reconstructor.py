@@ -29,12 +29,13 @@ Attribution:
 import json
 import argparse
 import sys
-import re
 from pathlib import Path
 from collections import Counter, defaultdict
 from datetime import datetime
 from typing import Tuple
 
+from sign_registry import base_value, normalize_sign
+
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
@@ -132,6 +133,10 @@ CV_MAP = {
     "ZU": ("z", "u"),
 }
 
+# Both maps keyed by normalized reading, so "RA₂", "ra2" and "RA2" share an entry
+SYLLABLE_VALUES = {normalize_sign(sign): (None, vowel) for sign, vowel in VOWEL_MAP.items()}
+SYLLABLE_VALUES.update({normalize_sign(sign): cv for sign, cv in CV_MAP.items()})
+
 # Signs unique to Linear A (not in Linear B) - potential extra phonemes
 UNIQUE_SIGNS = [
     "*301",
@@ -224,24 +229,10 @@ class PhonemeReconstructor:
         Extract consonant and vowel from a sign.
         Returns (consonant, vowel) or (None, vowel) for pure vowels.
         """
-        sign_upper = sign.upper().strip()
-
-        # Pure vowels
-        if sign_upper in VOWEL_MAP:
-            return (None, VOWEL_MAP[sign_upper])
-
-        # CV syllables
-        if sign_upper in CV_MAP:
-            return CV_MAP[sign_upper]
-
-        # Handle subscript variants
-        base = re.sub(r"[₀₁₂₃₄₅₆₇₈₉]", "", sign_upper)
-        if base in CV_MAP:
-            return CV_MAP[base]
-        if base in VOWEL_MAP:
-            return (None, VOWEL_MAP[base])
+        key = normalize_sign(sign)
 
-        return (None, None)
+        # Exact reading first, then the base sign of an unlisted variant (KA₂ -> KA)
+        return SYLLABLE_VALUES.get(key) or SYLLABLE_VALUES.get(base_value(key)) or (None, None)
 
     def analyze_vowel_frequencies(self) -> dict:
         """
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Shared reading-readiness engine.
+
+Holds the weighted readiness composite (coverage 40%, arithmetic 25%,
+structural richness 15%, size 10%, unknown penalty 10%) and a per-tablet
+score table with dirty tracking.
+
+A ReadinessStore is parameterised by its caller's scoring function and two
+signature functions:
+
+- ``word_status(token)``: what the caller knows about a token (category,
+  identification...).  Tokens are posted under their upper-cased form, so a
+  changed word marks only the tablets that contain it.
+- ``tablet_status(tablet_id)``: per-tablet inputs that are not words
+  (arithmetic verification, document type).
+
+Rows are re-scored only for dirty tablets.  ``save``/``load`` persist the
+table with every signature; on load the signatures are recomputed and
+compared, so edits to a name list, a reading or the arithmetic audit
+re-score just the affected tablets instead of the corpus.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Set
+
+
+CONTRACT_VERSION = "2026-10-19.v1"
+
+ARITHMETIC_STATUS_SCORES = {
+    "VERIFIED": 1.0,
+    "PARTIAL": 0.7,
+    "MISMATCH": 0.3,
+    "INCOMPLETE": 0.1,
+    "NO_KURO": 0.2,
+    "NOT_AUDITED": 0.15,
+    "NO_DATA": 0.0,
+}
+
+
+def composite_readiness(
+    total_words: int, unknown: int, arith: float, total_structural: int
+) -> float:
+    """Weighted readiness composite in [0, 1], rounded to 3 places."""
+    identified = total_words - unknown
+
+    # Coverage component (0-1)
+    coverage = identified / total_words if total_words > 0 else 0
+
+    # Structural richness: tablets with logograms and numbers are more parseable
+    total_all = total_words + total_structural
+    structural = min(total_structural / max(total_all, 1), 1.0)
+
+    # Size bonus: larger tablets provide more context (cap at ~32 words)
+    size_bonus = min(math.log2(max(total_words, 1)) / 5.0, 1.0)
+
+    # Unknown penalty
+    unknown_ratio = unknown / total_words if total_words > 0 else 1.0
+    unknown_penalty = 1.0 - unknown_ratio
+
+    score = (
+        0.40 * coverage
+        + 0.25 * arith
+        + 0.15 * structural
+        + 0.10 * size_bonus
+        + 0.10 * unknown_penalty
+    )
+    return round(min(max(score, 0.0), 1.0), 3)
+
+
+def _jsonable(value: Any) -> Any:
+    """Normalise a signature so it compares equal after a JSON round trip."""
+    return json.loads(json.dumps(value, ensure_ascii=False))
+
+
+def _token_digest(tokens: Iterable[Any]) -> str:
+    data = json.dumps(list(tokens), ensure_ascii=False).encode("utf-8")
+    return hashlib.sha1(data).hexdigest()[:16]
+
+
+class ReadinessStore:
+    """Per-tablet score table, re-scored only where words or tablet inputs changed."""
+
+    def __init__(
+        self,
+        inscriptions: Dict[str, Dict],
+        score_tablet: Callable[[str], Optional[Dict]],
+        word_status: Callable[[str], Any],
+        tablet_status: Optional[Callable[[str], Any]] = None,
+        name: str = "readiness",
+    ):
+        self.inscriptions = inscriptions
+        self.score_tablet = score_tablet
+        self.word_status = word_status
+        self.tablet_status = tablet_status or (lambda tablet_id: None)
+        self.name = name
+
+        self.rows: Dict[str, Optional[Dict]] = {}
+        self.word_signatures: Dict[str, Any] = {}  # literal token -> status
+        self.tablet_signatures: Dict[str, Any] = {}  # tablet_id -> [digest, status]
+        self.postings: Dict[str, Set[str]] = {}  # upper-cased token -> tablet ids
+        self.tokens: Dict[str, Set[str]] = {}  # upper-cased token -> literal forms
+        self.dirty: Set[str] = set(inscriptions)
+
+        for tablet_id, data in inscriptions.items():
+            for token in set(data.get("transliteratedWords", [])):
+                if not isinstance(token, str):
+                    continue
+                key = token.upper()
+                self.postings.setdefault(key, set()).add(tablet_id)
+                self.tokens.setdefault(key, set()).add(token)
+
+    # ------------------------------------------------------------------
+    # Dirty tracking
+    # ------------------------------------------------------------------
+
+    def mark_words(self, words: Iterable[str]) -> Set[str]:
+        """Mark every tablet containing one of `words` (any case) dirty."""
+        marked: Set[str] = set()
+        for word in words:
+            key = word.upper()
+            marked.update(self.postings.get(key, ()))
+            for literal in self.tokens.get(key, ()):
+                self.word_signatures.pop(literal, None)
+        self.dirty |= marked
+        return marked
+
+    def mark_tablets(self, tablet_ids: Iterable[str]) -> Set[str]:
+        """Mark tablets dirty (e.g. after an arithmetic verification change)."""
+        marked = {t for t in tablet_ids if t in self.inscriptions}
+        self.dirty |= marked
+        return marked
+
+    def _tablet_signature(self, tablet_id: str) -> Any:
+        tokens = self.inscriptions[tablet_id].get("transliteratedWords", [])
+        return _jsonable([_token_digest(tokens), self.tablet_status(tablet_id)])
+
+    def _rescore(self, tablet_id: str):
+        self.rows[tablet_id] = self.score_tablet(tablet_id)
+        self.tablet_signatures[tablet_id] = self._tablet_signature(tablet_id)
+        self.dirty.discard(tablet_id)
+
+    def refresh(self) -> Set[str]:
+        """Re-score dirty tablets; returns the ids that were re-scored."""
+        rescored = set(self.dirty)
+        for tablet_id in sorted(rescored):
+            self._rescore(tablet_id)
+        return rescored
+
+    def row(self, tablet_id: str) -> Optional[Dict]:
+        """Current row for one tablet (None if it has nothing to score)."""
+        if tablet_id not in self.inscriptions:
+            return None
+        if tablet_id in self.dirty or tablet_id not in self.rows:
+            self._rescore(tablet_id)
+        return self.rows[tablet_id]
+
+    def all_rows(self) -> Dict[str, Optional[Dict]]:
+        """Every row, in corpus order, after re-scoring what is dirty."""
+        self.refresh()
+        return {tablet_id: self.rows.get(tablet_id) for tablet_id in self.inscriptions}
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _word_signatures(self) -> Dict[str, Any]:
+        signatures = {}
+        for literals in self.tokens.values():
+            for literal in literals:
+                if literal not in self.word_signatures:
+                    self.word_signatures[literal] = _jsonable(self.word_status(literal))
+                signatures[literal] = self.word_signatures[literal]
+        return signatures
+
+    def save(self, path: Path):
+        """Write rows and signatures (re-scoring dirty tablets first)."""
+        self.refresh()
+        payload = {
+            "contract_version": CONTRACT_VERSION,
+            "name": self.name,
+            "words": self._word_signatures(),
+            "tablets": self.tablet_signatures,
+            "rows": self.rows,
+        }
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        tmp.replace(path)
+
+    def load(self, path: Path) -> Set[str]:
+        """
+        Adopt a saved table and mark what changed since it was written.
+
+        Returns the dirty tablet ids (all of them if the file is missing,
+        unreadable or from another contract version or scorer).
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return set(self.dirty)
+        if (
+            not isinstance(payload, dict)
+            or payload.get("contract_version") != CONTRACT_VERSION
+            or payload.get("name") != self.name
+        ):
+            return set(self.dirty)
+
+        saved_rows = payload.get("rows", {})
+        saved_tablets = payload.get("tablets", {})
+        saved_words = payload.get("words", {})
+
+        self.dirty = set()
+        for tablet_id in self.inscriptions:
+            signature = saved_tablets.get(tablet_id)
+            if tablet_id not in saved_rows or signature != self._tablet_signature(tablet_id):
+                self.dirty.add(tablet_id)
+                continue
+            self.rows[tablet_id] = saved_rows[tablet_id]
+            self.tablet_signatures[tablet_id] = signature
+
+        changed = [
+            literal
+            for literal, status in self._word_signatures().items()
+            if literal not in saved_words or saved_words[literal] != status
+        ]
+        for literal in changed:
+            self.dirty.update(self.postings.get(literal.upper(), ()))
+        return set(self.dirty)
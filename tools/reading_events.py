@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Reading event journal and in-process propagation bus.
+
+``reading_pipeline.py --record`` appends one event per identified word
+("word X -> confidence Y", with the reading it came from and that reading's
+anchor dependencies) to an append-only journal, ``data/reading_events.jsonl``.
+Events carry a sequence number; the last event for a word wins.
+
+Tools with incremental state subscribe in two ways:
+
+- in process, through ``EventBus.subscribe``: ``publish`` appends the events
+  and hands them to every subscriber, which updates its cached state
+  (dirty tablets only) instead of reloading;
+- on load, by replaying the journal into the same handler, so a fresh run
+  agrees with a long-lived one.  Persisted score tables then re-score only
+  the tablets whose words changed.
+
+Tools that rebuild from their sources (dossiers, promotion packets) have no
+cached state to patch; ``pending_updates`` lists what they need to re-run.
+
+Appends take an exclusive ``flock`` so concurrent recorders never interleave
+or reuse a sequence number.  Readers ignore a trailing partial line; a torn
+line left by a writer that died is closed off (and skipped) by the next append.
+
+Usage:
+    python3 tools/reading_events.py                # last 20 events
+    python3 tools/reading_events.py --tail 50
+    python3 tools/reading_events.py --pending      # downstream tools to re-run
+    python3 tools/reading_events.py --apply        # catch up the readiness table
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX: appends are not locked
+    fcntl = None
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DATA_DIR = PROJECT_ROOT / "data"
+JOURNAL_FILE = DATA_DIR / "reading_events.jsonl"
+DEPENDENCIES_FILE = DATA_DIR / "reading_dependencies.json"
+DOSSIERS_FILE = DATA_DIR / "personnel_dossiers.json"
+NAMES_FILE = DATA_DIR / "personal_names_comprehensive.json"
+
+
+@dataclass
+class ReadingEvent:
+    """One recorded identification: `word` read at `confidence` on `reading_id`."""
+
+    seq: int
+    recorded_at: str
+    reading_id: str
+    word: Optional[str]  # None when a reading was recorded without word identifications
+    confidence: str
+    depends_on: List[str] = field(default_factory=list)
+    meaning: str = ""
+
+
+def words_of(events: Iterable[ReadingEvent]) -> List[str]:
+    """Distinct upper-cased words named by events, in event order."""
+    return list(dict.fromkeys(e.word.upper() for e in events if e.word))
+
+
+def by_reading(events: Iterable[ReadingEvent]) -> "OrderedDict[str, List[ReadingEvent]]":
+    """Events grouped by reading id, in first-seen order."""
+    grouped: "OrderedDict[str, List[ReadingEvent]]" = OrderedDict()
+    for event in events:
+        grouped.setdefault(event.reading_id, []).append(event)
+    return grouped
+
+
+class EventJournal:
+    """Append-only JSONL log of reading events."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or JOURNAL_FILE)
+
+    @staticmethod
+    def _parse(data: bytes) -> List[ReadingEvent]:
+        events = []
+        end = data.rfind(b"\n") + 1  # a trailing partial line is still being written
+        for line in data[:end].splitlines():
+            try:
+                entry = json.loads(line)
+                events.append(ReadingEvent(**entry))
+            except (ValueError, TypeError):
+                continue
+        return events
+
+    def events(self, since: int = 0) -> List[ReadingEvent]:
+        """Events with seq > since, in journal order."""
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return []
+        return [e for e in self._parse(data) if e.seq > since]
+
+    def append(
+        self,
+        reading_id: str,
+        words: Iterable[str],
+        confidence: str,
+        depends_on: Iterable[str] = (),
+        meaning: str = "",
+    ) -> List[ReadingEvent]:
+        """Record one event per upper-cased word (one word-less event if there are none)."""
+        words = list(dict.fromkeys(w.upper() for w in words)) or [None]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a+b") as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                data = f.read()
+                existing = self._parse(data)
+                seq = existing[-1].seq if existing else 0
+                stamp = datetime.now().isoformat()
+                events = []
+                for word in words:
+                    seq += 1
+                    events.append(
+                        ReadingEvent(
+                            seq=seq,
+                            recorded_at=stamp,
+                            reading_id=reading_id,
+                            word=word,
+                            confidence=confidence.upper(),
+                            depends_on=list(depends_on),
+                            meaning=meaning,
+                        )
+                    )
+                f.seek(0, 2)
+                if data and not data.endswith(b"\n"):
+                    f.write(b"\n")  # under the lock, a partial line is from a dead writer
+                f.write(
+                    b"".join(
+                        (json.dumps(asdict(e), ensure_ascii=False) + "\n").encode("utf-8")
+                        for e in events
+                    )
+                )
+                f.flush()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        return events
+
+    def latest_by_word(self) -> Dict[str, ReadingEvent]:
+        """Last event for each word (upper-cased key)."""
+        latest: Dict[str, ReadingEvent] = {}
+        for event in self.events():
+            if event.word:
+                latest[event.word.upper()] = event
+        return latest
+
+
+Subscriber = Callable[[List[ReadingEvent]], Any]
+
+
+class EventBus:
+    """Publishes journal appends to in-process subscribers."""
+
+    def __init__(self, journal: Optional[EventJournal] = None):
+        self.journal = journal or EventJournal()
+        self.subscribers: "OrderedDict[str, Subscriber]" = OrderedDict()
+
+    def subscribe(self, name: str, handler: Subscriber):
+        """Register a handler called with each batch of new events."""
+        self.subscribers[name] = handler
+
+    def dispatch(self, events: List[ReadingEvent]) -> Dict[str, Dict[str, Any]]:
+        """
+        Hand events to every subscriber.
+
+        A failing subscriber is reported and does not stop the others; the
+        events are already journaled, so it catches up on its next replay.
+        """
+        outcomes: Dict[str, Dict[str, Any]] = {}
+        for name, handler in self.subscribers.items():
+            started = time.perf_counter()
+            try:
+                result = handler(events)
+                if isinstance(result, (set, frozenset)):
+                    result = sorted(result)
+                outcome = {"result": result}
+            except Exception as e:  # noqa: BLE001 - isolate subscribers from each other
+                outcome = {"error": f"{type(e).__name__}: {e}"}
+            outcome["ms"] = round((time.perf_counter() - started) * 1000, 2)
+            outcomes[name] = outcome
+        return outcomes
+
+    def publish(
+        self,
+        reading_id: str,
+        words: Iterable[str],
+        confidence: str,
+        depends_on: Iterable[str] = (),
+        meaning: str = "",
+    ) -> Tuple[List[ReadingEvent], Dict[str, Dict[str, Any]]]:
+        """Journal the events, then dispatch them; returns (events, per-subscriber outcome)."""
+        events = self.journal.append(reading_id, words, confidence, depends_on, meaning)
+        return events, self.dispatch(events)
+
+    def replay(self, handler: Subscriber, since: int = 0) -> Any:
+        """Feed journaled events (seq > since) to one handler, e.g. on load."""
+        events = self.journal.events(since)
+        return handler(events) if events else None
+
+
+# ─── Downstream tools without incremental state ──────────────────────────────
+
+
+def _load_json(path: Path) -> Optional[Dict]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def pending_updates(journal: Optional[EventJournal] = None) -> Dict[str, List[Dict]]:
+    """
+    Re-runs owed by tools that rebuild from their sources.
+
+    - personnel_dossier_builder.py: profiled names recorded after the
+      dossiers file was generated;
+    - promotion_board_runner.py: words whose latest recorded confidence
+      differs from reading_dependencies.json.
+    """
+    journal = journal or EventJournal()
+    latest = journal.latest_by_word()
+
+    dossiers = _load_json(DOSSIERS_FILE) or {}
+    generated = dossiers.get("metadata", {}).get("generated", "")
+    names = (_load_json(NAMES_FILE) or {}).get("names", {})
+    profiled = {str(n).upper() for n in names} if isinstance(names, dict) else set()
+    stale_dossiers = [
+        {"name": event.word, "seq": event.seq, "reading_id": event.reading_id}
+        for key, event in latest.items()
+        if key in profiled and event.recorded_at > generated
+    ]
+
+    readings = (_load_json(DEPENDENCIES_FILE) or {}).get("readings", {})
+    tracked = {str(k).upper(): v for k, v in readings.items()}
+    promotions = []
+    for key, event in latest.items():
+        current = (tracked.get(key) or {}).get("confidence")
+        if current != event.confidence:
+            promotions.append(
+                {
+                    "word": event.word,
+                    "seq": event.seq,
+                    "recorded": event.confidence,
+                    "tracked": current,
+                }
+            )
+    return {
+        "personnel_dossier_builder.py": stale_dossiers,
+        "promotion_board_runner.py": promotions,
+    }
+
+
+def print_pending(pending: Dict[str, List[Dict]]):
+    """Print the re-runs owed by rebuild-only tools."""
+    print(f"\n{'=' * 70}")
+    print("PENDING DOWNSTREAM UPDATES")
+    print(f"{'=' * 70}")
+    dossiers = pending["personnel_dossier_builder.py"]
+    print(f"\n  personnel_dossier_builder.py: {len(dossiers)} name(s)")
+    for row in dossiers:
+        print(f"    python3 tools/personnel_dossier_builder.py --name {row['name']}")
+    promotions = pending["promotion_board_runner.py"]
+    print(f"\n  promotion_board_runner.py: {len(promotions)} candidate(s)")
+    for row in promotions:
+        print(
+            f"    python3 tools/promotion_board_runner.py --candidate {row['word']} "
+            f"--target-confidence {row['recorded']}  (tracked: {row['tracked'] or 'none'})"
+        )
+    print(f"\n{'=' * 70}")
+
+
+def apply_to_readiness_table() -> Dict[str, Any]:
+    """Catch the persisted readiness table up with the journal (dirty tablets only)."""
+    import contextlib
+    import io
+
+    from reading_readiness_scorer import STORE_FILE, ReadinessScorer
+
+    started = time.perf_counter()
+    scorer = ReadinessScorer()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if not scorer.load_data():
+            raise RuntimeError("reading_readiness_scorer could not load its data")
+    loaded = time.perf_counter()
+    store = scorer.readiness_store()
+    dirty = store.load(STORE_FILE)
+    store.save(STORE_FILE)
+    return {
+        "rescored": len(dirty),
+        "tablets": len(scorer.inscriptions),
+        "load_ms": round((loaded - started) * 1000, 1),
+        "update_ms": round((time.perf_counter() - loaded) * 1000, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reading event journal and downstream catch-up")
+    parser.add_argument("--tail", type=int, default=20, help="Show the last N events (default: 20)")
+    parser.add_argument(
+        "--pending", action="store_true", help="List re-runs owed by rebuild-only tools"
+    )
+    parser.add_argument(
+        "--apply",
+        action="store_true",
+        help="Re-score the persisted readiness table for journaled words",
+    )
+    args = parser.parse_args()
+
+    journal = EventJournal()
+    if args.pending:
+        print_pending(pending_updates(journal))
+        return
+    if args.apply:
+        try:
+            outcome = apply_to_readiness_table()
+        except RuntimeError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print(
+            f"Readiness table: re-scored {outcome['rescored']} of {outcome['tablets']} tablets "
+            f"in {outcome['update_ms']} ms (evidence load {outcome['load_ms']} ms)"
+        )
+        return
+
+    events = journal.events()
+    print(f"\n{'=' * 70}")
+    print(f"READING EVENTS ({len(events)} journaled)")
+    print(f"{'=' * 70}")
+    for event in events[-args.tail :] if args.tail > 0 else events:
+        word = event.word or "(reading only)"
+        print(
+            f"  #{event.seq:<5d} {event.recorded_at[:19]}  {event.reading_id:<12s} "
+            f"{word:<20s} -> {event.confidence}"
+        )
+    print(f"\n{'=' * 70}")
+
+
+if __name__ == "__main__":
+    main()
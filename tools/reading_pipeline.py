@@ -15,9 +15,12 @@ Usage:
     python3 tools/reading_pipeline.py --select --top 20
     python3 tools/reading_pipeline.py --select --site-balanced --top 30
     python3 tools/reading_pipeline.py --prepare HT100
+    python3 tools/reading_pipeline.py --prepare HT100 --link-hops 2
+    python3 tools/reading_pipeline.py --prepare --top 100 --workers 4
     python3 tools/reading_pipeline.py --queue --site-balanced
     python3 tools/reading_pipeline.py --output data/reading_queue.json
     python3 tools/reading_pipeline.py --record HT100 --meaning "commodity list" --confidence MEDIUM
+    python3 tools/reading_pipeline.py --record HT100 --words KU-PA-NU --confidence POSSIBLE
 
 Attribution:
     Part of Linear A Decipherment Project
@@ -26,13 +29,29 @@ Attribution:
 
 import json
 import argparse
+import contextlib
+import io
+import multiprocessing
 import re
 import sys
-import math
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from dataclasses import dataclass, field, asdict
 from collections import defaultdict
+from functools import lru_cache
+
+from brief_bundle import write_bundle
+from readiness_store import ReadinessStore, composite_readiness
+from reading_events import (
+    EventBus,
+    EventJournal,
+    ReadingEvent,
+    apply_to_readiness_table,
+    by_reading,
+    words_of,
+)
 
 
 # Paths
@@ -46,6 +65,7 @@ ARITHMETIC_FILE = DATA_DIR / "arithmetic_verification.json"
 NAMES_FILE = DATA_DIR / "personal_names_comprehensive.json"
 READINESS_FILE = DATA_DIR / "reading_readiness.json"
 CASCADE_FILE = DATA_DIR / "cascade_opportunities.json"
+BRIEF_BUNDLE_FILE = DATA_DIR / "reading_briefs.jsonl"
 COMPLETED_DIR = PROJECT_ROOT / "analysis" / "completed" / "inscriptions"
 
 
@@ -137,6 +157,8 @@ class QueueEntry:
     document_type: str
     cascade_boost: float = 0.0
     priority_score: float = 0.0
+    gorila_volume: Optional[int] = None
+    gorila_page: Optional[int] = None
 
 
 @dataclass
@@ -161,6 +183,7 @@ class ReadingBrief:
     hypothesis_summary: Dict = field(default_factory=dict)
     readiness_score: float = 0.0
     document_type: str = "unknown"
+    gorila: Optional[Dict] = None
 
 
 # ─── Helper functions ────────────────────────────────────────────────────────
@@ -223,9 +246,46 @@ def _extract_site(tablet_id: str) -> str:
     return match.group(1) if match else "UNKNOWN"
 
 
+def _index_by_tablet(entries) -> Dict[str, Dict]:
+    """Map tablet_id -> entry for a list of per-tablet records (first entry wins)."""
+    index: Dict[str, Dict] = {}
+    for entry in entries or []:
+        if isinstance(entry, dict):
+            index.setdefault(entry.get("tablet_id"), entry)
+    return index
+
+
 # ─── Already-read detection ─────────────────────────────────────────────────
 
 
+@lru_cache(maxsize=1)
+def _gorila_indexer():
+    from gorila_indexer import GORILAIndexer
+
+    return GORILAIndexer()
+
+
+def gorila_references(tablet_ids) -> Dict[str, Optional[Dict]]:
+    """
+    GORILA volume/page for each tablet id, resolved in one batch.
+
+    Tablets missing from the GORILA index map to None.
+    """
+    found = _gorila_indexer().lookup_many(tablet_ids)
+    return {
+        tablet_id: {
+            "tablet_id": entry["tablet_id"],
+            "volume": entry["volume"],
+            "page": entry["page"],
+            "inscription_type": entry["inscription_type"],
+            "condition": entry["condition"],
+        }
+        if entry
+        else None
+        for tablet_id, entry in found.items()
+    }
+
+
 def get_already_read_tablets() -> Set[str]:
     """
     Scan analysis/completed/inscriptions/ for *_READING.md files
@@ -264,7 +324,9 @@ class SelectStage:
     Stage 1: SELECT - Score and rank unread tablets.
 
     Uses pre-computed readiness scores from data/reading_readiness.json
-    when available, falls back to live scoring from corpus data.
+    when available, falls back to live scoring from corpus data.  Live
+    scores sit in a ReadinessStore, so after a reading is recorded only the
+    tablets containing its words are re-scored.
     Optionally boosts scores using cascade opportunity data.
     Filters out already-read tablets.
     """
@@ -277,9 +339,13 @@ class SelectStage:
         self.already_read: Set[str] = set()
         self.anchors = {}
         self.dependencies = {}
+        self._precomputed: Optional[Dict[str, Dict]] = None  # tablet_id -> ranking entry
+        self.store: Optional[ReadinessStore] = None
 
     def load_data(self) -> bool:
         """Load required data sources."""
+        self._precomputed = None
+        self.store = None
         # Corpus is required
         self.corpus = _load_json(CORPUS_FILE)
         if not self.corpus:
@@ -314,18 +380,69 @@ class SelectStage:
         self.already_read = get_already_read_tablets()
         print(f"Found {len(self.already_read)} already-read tablets to exclude")
 
+        # Readings recorded since the evidence files were generated
+        self.apply_reading_events(EventJournal().events())
+
         return True
 
     def _get_readiness_from_precomputed(self, tablet_id: str) -> Optional[Dict]:
         """Look up a tablet in pre-computed readiness data."""
         if not self.readiness_data:
             return None
-        for entry in self.readiness_data.get("rankings", []):
-            if entry.get("tablet_id") == tablet_id:
-                return entry
-        return None
+        if self._precomputed is None:
+            self._precomputed = _index_by_tablet(self.readiness_data.get("rankings", []))
+        return self._precomputed.get(tablet_id)
+
+    def _word_status(self, token: str) -> str:
+        upper = token.upper()
+        if upper in KNOWN_FUNCTION_WORDS or token in KNOWN_FUNCTION_WORDS:
+            return "anchored"
+        if upper in self.dependencies:
+            return "anchored"
+        return "unknown"
+
+    def readiness_store(self) -> ReadinessStore:
+        """Live score table over the corpus, built on first use."""
+        if self.store is None:
+            self.store = ReadinessStore(
+                self.inscriptions,
+                score_tablet=self._score_live,
+                word_status=self._word_status,
+                name="reading_pipeline.select",
+            )
+        return self.store
 
     def _compute_readiness_live(self, tablet_id: str) -> Optional[Dict]:
+        """Live readiness row for a tablet (re-scored only when dirty)."""
+        return self.readiness_store().row(tablet_id)
+
+    def apply_recorded_reading(self, tablet_id: str, words: Optional[List[str]] = None) -> Set[str]:
+        """
+        Update the queue inputs after a reading is recorded.
+
+        The tablet leaves the queue and `words` count as anchored from now on.
+        Returns the tablets whose scores are now stale; they are re-scored
+        live on the next build_queue() instead of using pre-computed scores.
+        """
+        words = list(words or [])
+        self.already_read.add(tablet_id)
+        for word in words:
+            self.dependencies.setdefault(word.upper(), {})
+        stale = self.readiness_store().mark_words(words)
+        if self.readiness_data:
+            self._get_readiness_from_precomputed(tablet_id)  # builds the index
+            for stale_id in stale:
+                self._precomputed.pop(stale_id, None)
+        return stale
+
+    def apply_reading_events(self, events: List[ReadingEvent]) -> Set[str]:
+        """Apply journaled readings (reading_events.py subscriber); returns stale tablets."""
+        stale: Set[str] = set()
+        for reading_id, group in by_reading(events).items():
+            stale |= self.apply_recorded_reading(reading_id, words_of(group))
+        return stale
+
+    def _score_live(self, tablet_id: str) -> Optional[Dict]:
         """
         Compute basic readiness metrics from corpus data directly.
         Lighter-weight than reading_readiness_scorer but sufficient for ranking.
@@ -352,10 +469,7 @@ class SelectStage:
                 number_count += 1
             elif _is_word(token):
                 syllabic_count += 1
-                upper = token.upper()
-                if upper in KNOWN_FUNCTION_WORDS or token in KNOWN_FUNCTION_WORDS:
-                    anchored_count += 1
-                elif upper in self.dependencies:
+                if self._word_status(token) == "anchored":
                     anchored_count += 1
                 else:
                     unknown_count += 1
@@ -370,26 +484,17 @@ class SelectStage:
         has_kuro = "KU-RO" in set(all_tokens)
         arith_status = "NO_KURO" if not has_kuro else "NOT_AUDITED"
 
-        # Simple readiness score
-        cov_score = identified / syllabic_count if syllabic_count > 0 else 0
-        total_structural = logogram_count + number_count
-        total_all = syllabic_count + total_structural
-        structural = min(total_structural / max(total_all, 1), 1.0)
-        size_bonus = min(math.log2(max(syllabic_count, 1)) / 5.0, 1.0)
-        unknown_ratio = unknown_count / syllabic_count if syllabic_count > 0 else 1.0
-        unknown_penalty = 1.0 - unknown_ratio
-
-        score = (
-            0.40 * cov_score
-            + 0.25 * (1.0 if has_kuro else 0.2)
-            + 0.15 * structural
-            + 0.10 * size_bonus
-            + 0.10 * unknown_penalty
+        # Simple readiness score (KU-RO presence stands in for arithmetic)
+        score = composite_readiness(
+            syllabic_count,
+            unknown_count,
+            1.0 if has_kuro else 0.2,
+            logogram_count + number_count,
         )
 
         return {
             "tablet_id": tablet_id,
-            "readiness_score": round(min(max(score, 0.0), 1.0), 3),
+            "readiness_score": score,
             "total_words": syllabic_count,
             "anchored_words": anchored_count,
             "named_words": named_count,
@@ -432,12 +537,14 @@ class SelectStage:
             return True
         return False
 
-    def build_queue(self, top_n: int = 0) -> List[QueueEntry]:
+    def build_queue(self, top_n: int = 0, site_balanced: bool = False) -> List[QueueEntry]:
         """
         Build the prioritized reading queue.
 
         Returns tablets sorted by priority_score (readiness + cascade boost),
-        excluding already-read tablets.
+        excluding already-read tablets, optionally site-balanced and then cut
+        to ``top_n``.  GORILA references are looked up only for the tablets
+        that survive the cut.
         """
         queue = []
 
@@ -475,9 +582,18 @@ class SelectStage:
         # Sort by priority score descending
         queue.sort(key=lambda e: e.priority_score, reverse=True)
 
+        if site_balanced:
+            queue = self.site_balance(queue)
         if top_n > 0:
             queue = queue[:top_n]
 
+        references = gorila_references(entry.tablet_id for entry in queue)
+        for entry in queue:
+            ref = references[entry.tablet_id]
+            if ref:
+                entry.gorila_volume = ref["volume"]
+                entry.gorila_page = ref["page"]
+
         return queue
 
     def site_balance(self, queue: List[QueueEntry]) -> List[QueueEntry]:
@@ -534,11 +650,16 @@ class PrepareStage:
     - Personnel dossiers (if exists) for names on the tablet
     - Hypothesis results for words on the tablet
     - Known anchors, named words, formula words
-    - Cross-tablet name links
+    - Cross-tablet name links (optionally expanded over several hops)
     - Commodity analysis
+
+    Per-tablet lookups (arithmetic, readiness) and the token -> tablets
+    postings used for link discovery are built once and shared by every
+    brief the stage prepares.
     """
 
-    def __init__(self):
+    def __init__(self, link_hops: int = 1):
+        self.link_hops = link_hops
         self.corpus = None
         self.inscriptions = {}
         self.hypothesis_results = {}
@@ -548,9 +669,15 @@ class PrepareStage:
         self.dependencies = {}
         self.readiness_data = None
         self.known_names: Set[str] = set()
+        self._postings: Optional[Dict[str, Set[str]]] = None
+        self._arithmetic_index: Optional[Dict[str, Dict]] = None
+        self._readiness_index: Optional[Dict[str, Dict]] = None
 
     def load_data(self) -> bool:
         """Load all evidence data sources."""
+        self._postings = None
+        self._arithmetic_index = None
+        self._readiness_index = None
         # Corpus is required
         self.corpus = _load_json(CORPUS_FILE)
         if not self.corpus:
@@ -605,21 +732,22 @@ class PrepareStage:
         if not self.arithmetic_data:
             return None
 
-        verifications = self.arithmetic_data.get("verifications", [])
-        for v in verifications:
-            if v.get("tablet_id") == tablet_id:
-                return {
-                    "has_kuro": v.get("has_kuro", False),
-                    "has_kiro": v.get("has_kiro", False),
-                    "kuro_status": v.get("kuro_status", "UNKNOWN"),
-                    "kuro_value": v.get("kuro_value"),
-                    "computed_sum": v.get("computed_sum"),
-                    "difference": v.get("difference"),
-                    "item_count": v.get("item_count", 0),
-                    "diagnosis": v.get("diagnosis"),
-                    "skeleton": v.get("skeleton", []),
-                }
-        return None
+        if self._arithmetic_index is None:
+            self._arithmetic_index = _index_by_tablet(self.arithmetic_data.get("verifications", []))
+        v = self._arithmetic_index.get(tablet_id)
+        if v is None:
+            return None
+        return {
+            "has_kuro": v.get("has_kuro", False),
+            "has_kiro": v.get("has_kiro", False),
+            "kuro_status": v.get("kuro_status", "UNKNOWN"),
+            "kuro_value": v.get("kuro_value"),
+            "computed_sum": v.get("computed_sum"),
+            "difference": v.get("difference"),
+            "item_count": v.get("item_count", 0),
+            "diagnosis": v.get("diagnosis"),
+            "skeleton": v.get("skeleton", []),
+        }
 
     def _get_hypothesis_for_word(self, word: str) -> Optional[Dict]:
         """Get hypothesis results for a word."""
@@ -680,54 +808,91 @@ class PrepareStage:
             return dossiers.get(word, dossiers.get(word.upper(), None))
         return None
 
-    def _find_cross_tablet_links(self, words: List[str], tablet_id: str) -> List[Dict]:
+    def token_postings(self) -> Dict[str, Set[str]]:
+        """Upper-cased token -> tablets containing it, built once per corpus load."""
+        if self._postings is None:
+            self._postings = defaultdict(set)
+            for other_id, other_data in self.inscriptions.items():
+                for token in other_data.get("transliteratedWords", []):
+                    if isinstance(token, str):
+                        self._postings[token.upper()].add(other_id)
+        return self._postings
+
+    def _is_link_word(self, word: str) -> bool:
+        """Names, tracked readings and function words are worth linking on."""
+        word_upper = word.upper()
+        return (
+            word_upper in self.known_names
+            or word in self.known_names
+            or word_upper in KNOWN_FUNCTION_WORDS
+            or word_upper in self.dependencies
+        )
+
+    def _find_cross_tablet_links(
+        self, words: List[str], tablet_id: str, hops: Optional[int] = None
+    ) -> List[Dict]:
         """
         Find other tablets that share names with this one.
         Only considers syllabic words that are identified as names or potential names.
+
+        With hops > 1, names and readings on linked tablets are followed to
+        further tablets; those links carry "hop" and "via" (the tablet they
+        were reached through).  Function words are not followed, since they
+        would link most of the corpus.
         """
+        hops = self.link_hops if hops is None else hops
+        postings = self.token_postings()
         links = []
         seen_pairs = set()
 
-        for word in words:
-            if not _is_word(word):
-                continue
+        for word in dict.fromkeys(w for w in words if _is_word(w) and self._is_link_word(w)):
             word_upper = word.upper()
-
-            # Check if this is a known name or appears in dependencies
-            is_name = (
-                word_upper in self.known_names
-                or word in self.known_names
-                or word_upper in KNOWN_FUNCTION_WORDS
-                or word_upper in self.dependencies
-            )
-
-            if not is_name:
-                continue
-
-            # Search corpus for other tablets with this word
-            for other_id, other_data in self.inscriptions.items():
+            for other_id in postings.get(word_upper, ()):
                 if other_id == tablet_id:
                     continue
-                other_words = other_data.get("transliteratedWords", [])
-                if word in other_words or word_upper in [
-                    w.upper() for w in other_words if isinstance(w, str)
-                ]:
-                    pair_key = (word_upper, other_id)
-                    if pair_key not in seen_pairs:
-                        seen_pairs.add(pair_key)
-                        links.append(
-                            {
+                pair_key = (word_upper, other_id)
+                if pair_key not in seen_pairs:
+                    seen_pairs.add(pair_key)
+                    links.append(
+                        {
+                            "shared_word": word,
+                            "linked_tablet": other_id,
+                            "linked_site": _extract_site(other_id),
+                            "word_type": "function"
+                            if word_upper in KNOWN_FUNCTION_WORDS
+                            else "name/reading",
+                        }
+                    )
+
+        # Sort by word then tablet
+        links.sort(key=lambda x: (x["shared_word"], x["linked_tablet"]))
+
+        reached = {tablet_id} | {link["linked_tablet"] for link in links}
+        frontier = sorted({link["linked_tablet"] for link in links})
+        for hop in range(2, hops + 1):
+            hop_links = {}
+            for via in frontier:
+                tokens = self.inscriptions.get(via, {}).get("transliteratedWords", [])
+                for word in dict.fromkeys(t for t in tokens if isinstance(t, str) and _is_word(t)):
+                    if word.upper() in KNOWN_FUNCTION_WORDS or not self._is_link_word(word):
+                        continue
+                    for other_id in sorted(postings.get(word.upper(), ())):
+                        if other_id not in reached and other_id not in hop_links:
+                            hop_links[other_id] = {
                                 "shared_word": word,
                                 "linked_tablet": other_id,
                                 "linked_site": _extract_site(other_id),
-                                "word_type": "function"
-                                if word_upper in KNOWN_FUNCTION_WORDS
-                                else "name/reading",
+                                "word_type": "name/reading",
+                                "hop": hop,
+                                "via": via,
                             }
-                        )
-
-        # Sort by word then tablet
-        links.sort(key=lambda x: (x["shared_word"], x["linked_tablet"]))
+            if not hop_links:
+                break
+            links.extend(
+                sorted(hop_links.values(), key=lambda x: (x["shared_word"], x["linked_tablet"]))
+            )
+            reached.update(hop_links)
+            frontier = sorted(hop_links)
         return links
 
     def _classify_word(self, word: str) -> Dict:
@@ -773,18 +938,23 @@ class PrepareStage:
 
     def _get_readiness_score(self, tablet_id: str) -> float:
         """Get readiness score from pre-computed data."""
-        if self.readiness_data:
-            for entry in self.readiness_data.get("rankings", []):
-                if entry.get("tablet_id") == tablet_id:
-                    return entry.get("readiness_score", 0.0)
+        entry = self._readiness_entry(tablet_id)
+        if entry is not None:
+            return entry.get("readiness_score", 0.0)
         return 0.0
 
+    def _readiness_entry(self, tablet_id: str) -> Optional[Dict]:
+        if not self.readiness_data:
+            return None
+        if self._readiness_index is None:
+            self._readiness_index = _index_by_tablet(self.readiness_data.get("rankings", []))
+        return self._readiness_index.get(tablet_id)
+
     def _get_document_type(self, tablet_id: str) -> str:
         """Get document type from readiness data or infer from content."""
-        if self.readiness_data:
-            for entry in self.readiness_data.get("rankings", []):
-                if entry.get("tablet_id") == tablet_id:
-                    return entry.get("document_type", "unknown")
+        entry = self._readiness_entry(tablet_id)
+        if entry is not None:
+            return entry.get("document_type", "unknown")
 
         # Basic inference from content
         tablet_data = self.inscriptions.get(tablet_id, {})
@@ -891,6 +1061,15 @@ class PrepareStage:
         ]
         brief.cross_tablet_links = self._find_cross_tablet_links(meaningful_words, tablet_id)
 
+        # GORILA references for the tablet and every linked tablet, in one batch
+        references = gorila_references(
+            [tablet_id] + [link["linked_tablet"] for link in brief.cross_tablet_links]
+        )
+        brief.gorila = references[tablet_id]
+        for link in brief.cross_tablet_links:
+            ref = references[link["linked_tablet"]]
+            link["linked_gorila"] = f"Vol.{ref['volume']}, p.{ref['page']}" if ref else None
+
         # Build hypothesis summary
         hyp_counts = defaultdict(int)
         for word, analysis in brief.word_analyses.items():
@@ -910,6 +1089,12 @@ class PrepareStage:
         print("=" * 72)
         print()
         print(f"  Site: {brief.site}")
+        if brief.gorila:
+            gorila = brief.gorila
+            print(
+                f"  GORILA: {gorila['tablet_id']} (Vol.{gorila['volume']}, p.{gorila['page']}, "
+                f"{gorila['condition']})"
+            )
         print(f"  Document type: {brief.document_type}")
         print(f"  Readiness score: {brief.readiness_score:.3f}")
         print(f"  Total tokens: {brief.total_tokens}")
@@ -1004,9 +1189,10 @@ class PrepareStage:
             print(f"--- Cross-Tablet Links ({len(brief.cross_tablet_links)}) ---")
             for link in brief.cross_tablet_links[:20]:  # Limit display
                 word_type = link.get("word_type", "")
+                via = f" hop {link['hop']} via {link['via']}" if link.get("hop") else ""
                 print(
                     f"  {link['shared_word']:20s} -> {link['linked_tablet']:12s} "
-                    f"({link['linked_site']}) [{word_type}]"
+                    f"({link['linked_site']}) [{word_type}]{via}"
                 )
             if len(brief.cross_tablet_links) > 20:
                 print(f"  ... and {len(brief.cross_tablet_links) - 20} more links")
@@ -1032,13 +1218,16 @@ class RecordStage:
     Stage 4: RECORD - Register new readings after a reading attempt.
 
     - Registers new readings via anchor_tracker logic
+    - Journals one event per identified word and publishes it on the bus,
+      so subscribed tools update incrementally (see reading_events.py)
     - Reports what cascade opportunities the new reading unlocks
     - Suggests updates to analysis index
     """
 
-    def __init__(self):
+    def __init__(self, bus: Optional[EventBus] = None):
         self.dependencies = {}
         self.anchors = {}
+        self.bus = bus or EventBus()
 
     def load_data(self) -> bool:
         """Load tracking data."""
@@ -1056,16 +1245,45 @@ class RecordStage:
 
         return True
 
+    def subscribe_downstream(self) -> List[str]:
+        """
+        Subscribe the tools that take recorded readings incrementally.
+
+        - readiness_table: the persisted reading_readiness_scorer.py table
+          re-scores the tablets the journaled words touch;
+        - anchors: anchor_tracker.py checks recorded confidences against caps;
+        - cascade: cascade_opportunity_detector.py marks the words identified
+          and reports the tablets whose readiness changed.
+
+        Tools whose data does not load are left out.  Returns the names subscribed.
+        """
+        from anchor_tracker import AnchorTracker
+        from cascade_opportunity_detector import CascadeOpportunityDetector
+
+        self.bus.subscribe("readiness_table", lambda events: apply_to_readiness_table())
+        for name, tool in (("anchors", AnchorTracker()), ("cascade", CascadeOpportunityDetector())):
+            with contextlib.redirect_stdout(io.StringIO()):
+                loaded = tool.load_data()
+            if loaded:
+                self.bus.subscribe(name, tool.apply_reading_events)
+            else:
+                print(f"Warning: {name} data did not load; not propagating to it")
+        return list(self.bus.subscribers)
+
     def record_reading(
         self,
         tablet_id: str,
         meaning: str = "",
         confidence: str = "SPECULATIVE",
         depends_on: Optional[List[str]] = None,
+        words: Optional[List[str]] = None,
     ) -> Dict:
         """
         Record a completed reading attempt.
 
+        `words` are the words the reading identifies; each becomes a
+        "word -> confidence" event on the bus.
+
         Returns a summary of what was recorded and what follow-up actions
         are recommended.
         """
@@ -1074,6 +1292,7 @@ class RecordStage:
             "meaning": meaning,
             "confidence": confidence,
             "depends_on": depends_on or [],
+            "words": words or [],
             "actions": [],
             "cascade_opportunities": [],
         }
@@ -1111,6 +1330,16 @@ class RecordStage:
             f"Check cascading effects: python3 tools/anchor_tracker.py --reading {tablet_id}"
         )
 
+        # Journal and propagate
+        events, outcomes = self.bus.publish(
+            tablet_id, words or [], confidence, depends_on or [], meaning
+        )
+        result["events"] = [event.seq for event in events]
+        result["propagation"] = outcomes
+        result["actions"].append(
+            "Re-run rebuild-only tools as listed by: python3 tools/reading_events.py --pending"
+        )
+
         return result
 
     def print_record_summary(self, result: Dict):
@@ -1123,6 +1352,16 @@ class RecordStage:
         print(f"  Confidence: {result.get('confidence', 'N/A')}")
         if result.get("depends_on"):
             print(f"  Depends on: {', '.join(result['depends_on'])}")
+        if result.get("words"):
+            print(f"  Words: {', '.join(result['words'])}")
+        if result.get("events"):
+            seqs = result["events"]
+            print(f"  Journaled events: #{seqs[0]}-#{seqs[-1]}")
+        for name, outcome in result.get("propagation", {}).items():
+            if "error" in outcome:
+                print(f"  Propagation {name}: FAILED ({outcome['error']})")
+            else:
+                print(f"  Propagation {name}: {outcome['ms']:.1f} ms")
         print()
         print("--- Required Actions ---")
         for i, action in enumerate(result.get("actions", []), 1):
@@ -1193,9 +1432,9 @@ def save_queue(queue: List[QueueEntry], output_path: str):
     print(f"\nQueue saved to: {path}")
 
 
-def save_brief(brief: ReadingBrief, output_path: str):
-    """Save a reading brief to a JSON file."""
-    output = {
+def brief_to_dict(brief: ReadingBrief) -> Dict:
+    """JSON form of a reading brief (as saved by --prepare --output)."""
+    return {
         "metadata": {
             "tool": "reading_pipeline.py",
             "stage": "PREPARE",
@@ -1209,6 +1448,7 @@ def save_brief(brief: ReadingBrief, output_path: str):
             "syllabic_words": brief.syllabic_words,
             "readiness_score": brief.readiness_score,
             "document_type": brief.document_type,
+            "gorila": brief.gorila,
             "commodity_logograms": brief.commodity_logograms,
             "arithmetic": brief.arithmetic,
             "word_analyses": brief.word_analyses,
@@ -1219,6 +1459,11 @@ def save_brief(brief: ReadingBrief, output_path: str):
         },
     }
 
+
+def save_brief(brief: ReadingBrief, output_path: str):
+    """Save a reading brief to a JSON file."""
+    output = brief_to_dict(brief)
+
     path = Path(output_path)
     if not path.is_absolute():
         path = PROJECT_ROOT / path
@@ -1228,6 +1473,47 @@ def save_brief(brief: ReadingBrief, output_path: str):
     print(f"\nBrief saved to: {path}")
 
 
+# ─── Bulk PREPARE ────────────────────────────────────────────────────────────
+
+# The loaded PrepareStage seen by pool workers, inherited copy-on-write on fork.
+_BULK_STAGE: Optional["PrepareStage"] = None
+
+
+def _prepare_bulk_entry(tablet_id: str) -> Tuple[str, Optional[Dict]]:
+    brief = _BULK_STAGE.prepare_brief(tablet_id)
+    return tablet_id, brief_to_dict(brief) if brief else None
+
+
+def prepare_many(
+    stage: "PrepareStage", tablet_ids: List[str], workers: int = 1
+) -> Iterator[Tuple[str, Optional[Dict]]]:
+    """
+    Briefs for many tablets, in the order given, as (tablet_id, brief dict) pairs.
+
+    The stage is loaded once; with workers > 1 briefs are prepared in a
+    process pool that shares it (fork), so no worker reloads the evidence.
+    Where fork is unavailable the caller's stage cannot be shared, and briefs
+    are prepared serially instead.
+    """
+    global _BULK_STAGE
+    _BULK_STAGE = stage
+    # Build the shared lookups before forking so every worker inherits them
+    stage.token_postings()
+    stage._get_arithmetic_for_tablet("")
+    stage._readiness_entry("")
+    _gorila_indexer()
+
+    forkable = "fork" in multiprocessing.get_all_start_methods()
+    if workers <= 1 or len(tablet_ids) <= 1 or not forkable:
+        yield from map(_prepare_bulk_entry, tablet_ids)
+        return
+
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork"))
+    chunksize = max(1, len(tablet_ids) // (workers * 4))
+    with pool:
+        yield from pool.map(_prepare_bulk_entry, tablet_ids, chunksize=chunksize)
+
+
 # ─── Main ────────────────────────────────────────────────────────────────────
 
 
@@ -1245,8 +1531,13 @@ def main():
     parser.add_argument(
         "--prepare",
         type=str,
+        nargs="?",
+        const="",
         metavar="TABLET_ID",
-        help="Stage 2: Prepare a reading brief for a specific tablet",
+        help=(
+            "Stage 2: Prepare a reading brief for a specific tablet "
+            "(without TABLET_ID: briefs for the queue, see --top/--workers)"
+        ),
     )
     parser.add_argument(
         "--record",
@@ -1273,6 +1564,20 @@ def main():
         help="Show top N tablets (0 = all unread)",
     )
 
+    # Prepare options
+    parser.add_argument(
+        "--link-hops",
+        type=int,
+        default=1,
+        help="Follow names/readings this many tablets out for --prepare links (default: 1)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes for bulk --prepare (default: 1)",
+    )
+
     # Record options
     parser.add_argument(
         "--meaning",
@@ -1294,6 +1599,12 @@ def main():
         nargs="*",
         help="Anchor dependencies for --record",
     )
+    parser.add_argument(
+        "--words",
+        type=str,
+        nargs="*",
+        help="Words the reading identifies, journaled at --confidence for --record",
+    )
 
     # Output
     parser.add_argument(
@@ -1305,7 +1616,8 @@ def main():
     args = parser.parse_args()
 
     # Default to --select if no stage specified
-    if not any([args.select, args.prepare, args.record, args.queue]):
+    bulk_prepare = args.prepare == ""
+    if not any([args.select, args.prepare, args.record, args.queue, bulk_prepare]):
         args.select = True
         if args.top == 0:
             args.top = 20
@@ -1316,24 +1628,50 @@ def main():
         if not selector.load_data():
             sys.exit(1)
 
-        top_n = args.top if args.top > 0 else 0
-        queue = selector.build_queue(top_n=0)  # Build full queue first
-
-        if args.site_balanced:
-            queue = selector.site_balance(queue)
-
-        # Apply top_n after balancing
-        if top_n > 0:
-            queue = queue[:top_n]
+        # top_n is applied after balancing
+        queue = selector.build_queue(top_n=max(args.top, 0), site_balanced=args.site_balanced)
 
         print_queue(queue, site_balanced=args.site_balanced)
 
         if args.output:
             save_queue(queue, args.output)
 
+    # ── Stage 2: PREPARE (queue bundle) ──
+    elif bulk_prepare:
+        selector = SelectStage()
+        if not selector.load_data():
+            sys.exit(1)
+        queue = selector.build_queue(top_n=max(args.top, 0), site_balanced=args.site_balanced)
+
+        preparer = PrepareStage(link_hops=args.link_hops)
+        if not preparer.load_data():
+            sys.exit(1)
+
+        path = Path(args.output) if args.output else BRIEF_BUNDLE_FILE
+        if not path.is_absolute():
+            path = PROJECT_ROOT / path
+        started = time.perf_counter()
+        tablet_ids = [entry.tablet_id for entry in queue]
+        index = write_bundle(
+            path,
+            prepare_many(preparer, tablet_ids, workers=args.workers),
+            metadata={
+                "tool": "reading_pipeline.py",
+                "stage": "PREPARE",
+                "site_balanced": args.site_balanced,
+                "link_hops": args.link_hops,
+            },
+        )
+        print(
+            f"\nPrepared {len(index['briefs'])} briefs ({len(index['skipped'])} skipped) "
+            f"in {time.perf_counter() - started:.1f}s with {max(args.workers, 1)} workers"
+        )
+        print(f"Bundle saved to: {path}")
+        print(f"Browse with: python3 tools/brief_bundle.py {path}")
+
     # ── Stage 2: PREPARE ──
     elif args.prepare:
-        preparer = PrepareStage()
+        preparer = PrepareStage(link_hops=args.link_hops)
         if not preparer.load_data():
             sys.exit(1)
 
@@ -1351,12 +1689,14 @@ def main():
         recorder = RecordStage()
         if not recorder.load_data():
             sys.exit(1)
+        recorder.subscribe_downstream()
 
         result = recorder.record_reading(
             tablet_id=args.record,
             meaning=args.meaning,
             confidence=args.confidence,
             depends_on=args.depends_on,
+            words=args.words,
         )
         recorder.print_record_summary(result)
 
@@ -15,6 +15,14 @@ Usage:
     python3 tools/reading_readiness_scorer.py --all
     python3 tools/reading_readiness_scorer.py --top 10
     python3 tools/reading_readiness_scorer.py --all --output data/reading_readiness.json
+    python3 tools/reading_readiness_scorer.py --all --fresh
+
+Scores are kept in a persisted table (data/cache/readiness_scores.json);
+later runs re-score only tablets whose words, arithmetic status or document
+type changed.  --fresh ignores the table and re-scores everything.
+
+Words identified by recorded readings (data/reading_events.jsonl, see
+reading_events.py) count as anchored at their recorded confidence.
 
 Attribution:
     Part of Linear A Decipherment Project
@@ -29,11 +37,15 @@ from pathlib import Path
 from typing import Dict, List, Optional, Set
 from dataclasses import dataclass, field, asdict
 
+from reading_events import EventJournal, ReadingEvent
+from readiness_store import ARITHMETIC_STATUS_SCORES, ReadinessStore, composite_readiness
+
 
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 CORPUS_FILE = DATA_DIR / "corpus.json"
+STORE_FILE = DATA_DIR / "cache" / "readiness_scores.json"
 
 
 # Known commodity logograms (from corpus_auditor.py)
@@ -159,6 +171,9 @@ class ReadinessScorer:
         self.high_specificity_words: Dict[str, str] = {}  # word -> commodity
         self.morphological_words: Set[str] = set()
         self.positional_ids: Dict[str, str] = {}  # word -> identified role
+        self.arithmetic_by_tablet: Dict[str, str] = {}  # tablet_id -> audit confidence
+        self.recorded_words: Dict[str, ReadingEvent] = {}  # WORD -> latest recorded reading
+        self.store: Optional[ReadinessStore] = None
 
     def load_data(self) -> bool:
         """Load all evidence data files."""
@@ -193,8 +208,24 @@ class ReadinessScorer:
                 print(f"Warning: Error loading {path.name}: {e}")
 
         self._build_lookups()
+        self.apply_reading_events(EventJournal().events())
         return True
 
+    def apply_reading_events(self, events: List[ReadingEvent]) -> Set[str]:
+        """
+        Count recorded words as anchored (reading_events.py subscriber).
+
+        Returns the tablets whose rows are now dirty in the score table.
+        """
+        words = []
+        for event in events:
+            if event.word:
+                self.recorded_words[event.word.upper()] = event
+                words.append(event.word)
+        if self.store is None:
+            return set()
+        return self.store.mark_words(words)
+
     def _build_lookups(self):
         """Build derived lookup tables from loaded data."""
         # Extract known personal names
@@ -243,6 +274,11 @@ class ReadinessScorer:
                     spec = data.get("specificity", 0)
                     if spec >= 0.8:
                         self.high_specificity_words[token] = data.get("primary", "UNKNOWN")
+            for t in self.audit_data.get("totals_validation", []):
+                if isinstance(t, dict):
+                    self.arithmetic_by_tablet.setdefault(
+                        t.get("tablet_id"), t.get("confidence", "UNKNOWN")
+                    )
 
         # Extract morphological coverage
         if self.morphological:
@@ -321,10 +357,8 @@ class ReadinessScorer:
         """Get arithmetic verification status for a tablet."""
         if not self.audit_data:
             return "NO_DATA"
-        totals = self.audit_data.get("totals_validation", [])
-        for t in totals:
-            if t.get("tablet_id") == tablet_id:
-                return t.get("confidence", "UNKNOWN")
+        if tablet_id in self.arithmetic_by_tablet:
+            return self.arithmetic_by_tablet[tablet_id]
         # Check if tablet has KU-RO at all
         tablet_data = self.inscriptions.get(tablet_id, {})
         words = tablet_data.get("transliteratedWords", [])
@@ -394,6 +428,18 @@ class ReadinessScorer:
                 hypothesis_support=self._get_hypothesis_support(word),
             )
 
+        # Words identified by a recorded reading
+        recorded = self.recorded_words.get(word_upper)
+        if recorded is not None:
+            return WordDetail(
+                word=word,
+                position=position,
+                category="anchored",
+                identification=f"recorded reading ({recorded.reading_id})",
+                confidence=recorded.confidence,
+                hypothesis_support=self._get_hypothesis_support(word),
+            )
+
         # Check positional identifications from admin isomorphism
         if word_upper in self.positional_ids or word in self.positional_ids:
             role = self.positional_ids.get(word_upper, self.positional_ids.get(word, "identified"))
@@ -592,54 +638,42 @@ class ReadinessScorer:
         - Tablet size bonus (more words = more context): 10%
         - Low unknown penalty: 10%
         """
-        # Coverage component (0-1)
-        identified = total_words - unknown
-        coverage = identified / total_words if total_words > 0 else 0
-
-        # Arithmetic component (0-1)
-        arith_scores = {
-            "VERIFIED": 1.0,
-            "PARTIAL": 0.7,
-            "MISMATCH": 0.3,
-            "INCOMPLETE": 0.1,
-            "NO_KURO": 0.2,
-            "NOT_AUDITED": 0.15,
-            "NO_DATA": 0.0,
-        }
-        arith = arith_scores.get(arith_status, 0.0)
-
-        # Structural richness (0-1): tablets with logograms and numbers are more parseable
-        total_structural = logogram_count + number_count
-        total_all = total_words + total_structural
-        structural = min(total_structural / max(total_all, 1), 1.0)
-
-        # Size bonus: larger tablets provide more context (diminishing returns)
-        import math
-
-        size_bonus = min(math.log2(max(total_words, 1)) / 5.0, 1.0)  # cap at ~32 words
-
-        # Unknown penalty
-        unknown_ratio = unknown / total_words if total_words > 0 else 1.0
-        unknown_penalty = 1.0 - unknown_ratio
-
-        # Weighted composite
-        score = (
-            0.40 * coverage
-            + 0.25 * arith
-            + 0.15 * structural
-            + 0.10 * size_bonus
-            + 0.10 * unknown_penalty
-        )
-
-        return min(max(score, 0.0), 1.0)
+        arith = ARITHMETIC_STATUS_SCORES.get(arith_status, 0.0)
+        return composite_readiness(total_words, unknown, arith, logogram_count + number_count)
+
+    def _word_status(self, word: str) -> List:
+        """Position-independent classification, used as the word's store signature."""
+        detail = self._classify_word(word, 0, [])
+        return [
+            detail.category,
+            detail.identification,
+            detail.confidence,
+            detail.hypothesis_support,
+        ]
+
+    def _score_row(self, tablet_id: str) -> Optional[Dict]:
+        result = self.score_tablet(tablet_id)
+        return asdict(result) if result else None
+
+    def readiness_store(self) -> ReadinessStore:
+        """Per-tablet score table over the loaded evidence, built on first use."""
+        if self.store is None:
+            self.store = ReadinessStore(
+                self.inscriptions,
+                score_tablet=self._score_row,
+                word_status=self._word_status,
+                tablet_status=lambda t: [
+                    self._get_arithmetic_status(t),
+                    self._get_document_type(t),
+                ],
+                name="reading_readiness_scorer",
+            )
+        return self.store
 
     def score_all(self) -> List[TabletReadiness]:
-        """Score all tablets and return sorted by readiness."""
-        results = []
-        for tablet_id in self.inscriptions:
-            result = self.score_tablet(tablet_id)
-            if result:
-                results.append(result)
+        """Score all tablets (dirty ones only) and return sorted by readiness."""
+        rows = self.readiness_store().all_rows()
+        results = [TabletReadiness(**row) for row in rows.values() if row]
         results.sort(key=lambda r: r.readiness_score, reverse=True)
         return results
 
@@ -756,6 +790,11 @@ def main():
     parser.add_argument("--all", action="store_true", help="Score all tablets")
     parser.add_argument("--top", type=int, default=0, help="Show top N most readable tablets")
     parser.add_argument("--output", type=str, help="Save results to JSON file")
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Ignore the persisted score table and re-score every tablet",
+    )
 
     args = parser.parse_args()
 
@@ -774,7 +813,12 @@ def main():
             print(f"Tablet {args.tablet} not found in corpus")
             sys.exit(1)
     else:
+        store = scorer.readiness_store()
+        if not args.fresh:
+            dirty = store.load(STORE_FILE)
+            print(f"  Tablets to re-score: {len(dirty)} of {len(scorer.inscriptions)}")
         results = scorer.score_all()
+        store.save(STORE_FILE)
         top_n = args.top if args.top > 0 else 0
         scorer.print_ranking(results, top_n=top_n)
 
@@ -30,6 +30,9 @@ from collections import defaultdict
 from datetime import datetime
 from typing import List, Optional
 
+from reference_data import load_reference
+from sign_registry import REFERENCE_DATASET, SignRegistry
+
 
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -55,6 +58,7 @@ class SignReconciler:
         self.verbose = verbose
         self.signs_data = None  # From signs.json (phonetic notation)
         self.sigla_data = None  # From sign_database.json (AB numbers)
+        self._registry: Optional[SignRegistry] = None
 
         # Mapping tables
         self.phonetic_to_ab = {}  # "ku" -> {"ab": "AB81", "confidence": "CERTAIN"}
@@ -66,6 +70,13 @@ class SignReconciler:
         # Combined data
         self.unified_signs = {}  # Complete sign inventory
 
+    @property
+    def registry(self) -> SignRegistry:
+        """Multi-key index over the AB-numbered sign database."""
+        if self._registry is None:
+            self._registry = SignRegistry((self.sigla_data or {}).get("signs", {}))
+        return self._registry
+
     def log(self, message: str):
         """Print message if verbose mode enabled."""
         if self.verbose:
@@ -85,14 +96,17 @@ class SignReconciler:
             print(f"Error loading signs.json: {e}")
             success = False
 
-        # Load sign_database.json (AB numbers with confidence)
+        # Load sign_database.json (AB numbers with confidence); until
+        # `sigla_querier.py --save` has written it, use the shipped sign database
         sigla_path = SIGLA_DIR / "sign_database.json"
         try:
-            with open(sigla_path, "r", encoding="utf-8") as f:
-                self.sigla_data = json.load(f)
-            self.log(
-                f"Loaded sign_database.json: {self.sigla_data['statistics']['total_signs']} signs"
-            )
+            if sigla_path.exists():
+                with open(sigla_path, "r", encoding="utf-8") as f:
+                    self.sigla_data = json.load(f)
+            else:
+                self.sigla_data = {"signs": load_reference(REFERENCE_DATASET)}
+            self._registry = None
+            self.log(f"Loaded sign database: {len(self.registry)} signs")
         except Exception as e:
             print(f"Error loading sign_database.json: {e}")
             success = False
@@ -254,33 +268,28 @@ class SignReconciler:
                     }
 
     def lookup_phonetic(self, phonetic: str) -> Optional[dict]:
-        """Look up a sign by phonetic value."""
-        key = phonetic.lower()
-        if key in self.phonetic_to_ab:
-            result = self.phonetic_to_ab[key].copy()
-            result["input"] = phonetic
+        """Look up a sign by phonetic value ("RA₂" and "ra2" are the same sign)."""
+        ab = self.registry.ab_for_value(phonetic)
+        if ab is None and phonetic.upper() in self.logograms:
+            ab = phonetic.upper()  # Logograms are looked up by name (VIN, OLE, *301)
 
-            # Get full data from unified inventory
-            canonical = phonetic.upper()
-            if canonical in self.unified_signs:
-                result["full_data"] = self.unified_signs[canonical]
+        mapping = self.ab_to_phonetic.get(ab) if ab else None
+        if mapping is None:
+            return None
 
-            return result
+        result = self.phonetic_to_ab[mapping["phonetic"]].copy()
+        result["input"] = phonetic
 
-        # Try uppercase (for logograms)
-        key_upper = phonetic.upper()
-        if key_upper in self.phonetic_to_ab:
-            result = self.phonetic_to_ab[key_upper].copy()
-            result["input"] = phonetic
-            if key_upper in self.unified_signs:
-                result["full_data"] = self.unified_signs[key_upper]
-            return result
+        # Get full data from unified inventory
+        canonical = mapping["phonetic"].upper()
+        if canonical in self.unified_signs:
+            result["full_data"] = self.unified_signs[canonical]
 
-        return None
+        return result
 
     def lookup_ab(self, ab_number: str) -> Optional[dict]:
-        """Look up a sign by AB number."""
-        key = ab_number.upper()
+        """Look up a sign by AB number ("AB08", "ab8" and "8" are the same sign)."""
+        key = self.registry.ab_for_number(ab_number) or ab_number.upper()
         if key in self.ab_to_phonetic:
             result = self.ab_to_phonetic[key].copy()
             result["input"] = ab_number
@@ -326,7 +335,7 @@ class SignReconciler:
             # Clean subscripts
             sign_clean = re.sub(r"[₀₁₂₃₄₅₆₇₈₉]", "", sign)
 
-            lookup = self.lookup_phonetic(sign_clean)
+            lookup = self.lookup_phonetic(sign) or self.lookup_phonetic(sign_clean)
             if lookup:
                 result.append(
                     {
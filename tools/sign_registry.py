@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Shared multi-key registry for Linear A signs.
+
+Indexes a sign database (AB number -> entry, as in
+data/reference/sigla_signs.json) once, so every tool resolves a sign by
+any of its keys with a hash lookup instead of scanning all entries:
+
+- AB number, tolerant of padding and case ("AB08", "ab8", "8")
+- phonetic value, with subscript normalization ("RA₂", "ra2" -> AB64)
+- base value, collapsing homophone variants ("ra" -> AB60, AB64, AB89)
+- variant id "<AB>/<form>" ("AB08/simplified")
+- site and tablet attestation
+- frequency, through a sorted index answering range queries by bisection
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
+
+from reference_data import load_reference
+
+
+REFERENCE_DATASET = "sigla_signs"
+
+_SUBSCRIPTS = str.maketrans("₀₁₂₃₄₅₆₇₈₉", "0123456789")
+_VARIANT_SUFFIX = re.compile(r"(?<=[a-z])\d+$")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sign(value: str) -> str:
+    """Lowercase a sign reading and turn subscript digits into ASCII ("RA₂" -> "ra2")."""
+    return value.strip().translate(_SUBSCRIPTS).lower()
+
+
+def base_value(value: str) -> str:
+    """Normalized reading without its homophone index ("RA₂" -> "ra", "*301" unchanged)."""
+    return _VARIANT_SUFFIX.sub("", normalize_sign(value))
+
+
+def normalize_ab(value: str) -> str:
+    """Canonical AB key: "ab8" / "8" -> "AB08"; other ids are uppercased."""
+    key = value.strip().upper()
+    if key.isdigit():
+        return f"AB{key.zfill(2)}"
+    if key.startswith("AB") and key[2:].isdigit():
+        return f"AB{key[2:].zfill(2)}"
+    return key
+
+
+def tablet_key(tablet_id: str) -> str:
+    """Case- and space-insensitive tablet key ("HT13", "ht 13" -> "HT13")."""
+    return _WHITESPACE.sub("", tablet_id.upper())
+
+
+class SignRegistry:
+    """
+    Hash indexes over a sign database keyed by AB number.
+
+    Entries are the database's own dicts (not copies). Build a new registry
+    after replacing the database.
+    """
+
+    def __init__(self, signs: Mapping[str, Dict]):
+        self.signs = signs
+        self._by_ab: Dict[str, str] = {}
+        self._by_value: Dict[str, str] = {}
+        self._by_base: Dict[str, List[str]] = {}
+        self._variants: Dict[str, Tuple[str, Dict]] = {}
+        self._by_site: Dict[str, List[str]] = {}
+        self._by_tablet: Dict[str, List[str]] = {}
+
+        for ab in signs:
+            self._by_ab.setdefault(normalize_ab(ab), ab)
+
+        # Descending frequency; ties keep database order (as a stable sort would)
+        self._by_frequency = sorted(signs, key=lambda ab: -signs[ab].get("frequency", 0))
+        self._neg_frequencies = [-signs[ab].get("frequency", 0) for ab in self._by_frequency]
+
+        for ab in self._by_frequency:
+            data = signs[ab]
+            for site in data.get("sites", []):
+                self._by_site.setdefault(site.upper(), []).append(ab)
+
+        for ab, data in signs.items():
+            value = data.get("phonetic_value", "")
+            if value:
+                self._by_value.setdefault(normalize_sign(value), ab)
+                self._by_base.setdefault(base_value(value), []).append(ab)
+            for variant in data.get("variants", []):
+                form = variant.get("form")
+                if form:
+                    self._variants.setdefault(f"{ab}/{form}".upper(), (ab, variant))
+            for tablet in dict.fromkeys(tablet_key(ex) for ex in data.get("examples", [])):
+                self._by_tablet.setdefault(tablet, []).append(ab)
+
+    @classmethod
+    def from_reference(cls) -> "SignRegistry":
+        """Registry over the shipped sign database (data/reference/sigla_signs.json)."""
+        return cls(load_reference(REFERENCE_DATASET))
+
+    def __len__(self) -> int:
+        return len(self.signs)
+
+    def __contains__(self, sign_id: str) -> bool:
+        return self.resolve(sign_id) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.signs)
+
+    # ── single-sign resolution ───────────────────────────────────────
+
+    def ab_for_number(self, sign_id: str) -> Optional[str]:
+        return self._by_ab.get(normalize_ab(sign_id))
+
+    def ab_for_value(self, value: str) -> Optional[str]:
+        return self._by_value.get(normalize_sign(value))
+
+    def ab_for_variant(self, variant_id: str) -> Optional[str]:
+        hit = self._variants.get(variant_id.strip().upper())
+        return hit[0] if hit else None
+
+    def resolve(self, sign_id: str) -> Optional[str]:
+        """AB key for an AB number, phonetic value or variant id (in that order)."""
+        if not sign_id or not sign_id.strip():
+            return None
+        return (
+            self.ab_for_number(sign_id)
+            or self.ab_for_value(sign_id)
+            or (self.ab_for_variant(sign_id) if "/" in sign_id else None)
+        )
+
+    def get(self, sign_id: str) -> Optional[Dict]:
+        ab = self.resolve(sign_id)
+        return self.signs[ab] if ab is not None else None
+
+    def variant(self, variant_id: str) -> Optional[Dict]:
+        hit = self._variants.get(variant_id.strip().upper())
+        return hit[1] if hit else None
+
+    def homophones(self, value: str) -> List[str]:
+        """AB keys sharing a base value ("ra" -> ["AB60", "AB64", "AB89"])."""
+        return list(self._by_base.get(base_value(value), []))
+
+    # ── multi-sign queries ───────────────────────────────────────────
+
+    def by_site(self, site_code: str) -> List[str]:
+        """AB keys attested at a site, most frequent first."""
+        return list(self._by_site.get(site_code.strip().upper(), []))
+
+    def by_tablet(self, tablet_id: str) -> List[str]:
+        """AB keys whose example attestations include a tablet."""
+        return list(self._by_tablet.get(tablet_key(tablet_id), []))
+
+    def by_frequency(self, min_freq: int = 0, max_freq: Optional[int] = None) -> List[str]:
+        """AB keys with min_freq <= frequency <= max_freq, most frequent first."""
+        lo = 0 if max_freq is None else bisect_left(self._neg_frequencies, -max_freq)
+        hi = bisect_right(self._neg_frequencies, -min_freq)
+        return self._by_frequency[lo:hi]
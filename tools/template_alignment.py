@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+Slot-sequence alignment for administrative document templates.
+
+Document templates ("HEADER/DATE", "RECIPIENT", "COMMODITY", ...) are
+encoded once as tuples of integer slot types, and compared by sequence
+alignment with slot-type substitution scores instead of unordered keyword
+overlap, so slot order counts:
+
+- global (Needleman-Wunsch), optionally banded around the diagonal, for
+  template-vs-template comparison
+- local (Smith-Waterman) for scoring long mined document sequences against
+  short library templates
+
+TemplateAligner holds an encoded library and scores many queries against it
+in one batch: distinct library sequences are stored in a prefix trie, so a
+single walk aligns a query with the whole library and templates sharing a
+slot prefix share its DP columns; identical queries are aligned once.
+"""
+
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+
+# Slot types by precedence: a label takes the first type whose keyword it
+# contains ("SUBTOTAL" before "TOTAL", "HEADER_WORD" before "WORD").
+SLOT_KEYWORDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("SUBTOTAL", ("SUBTOTAL",)),
+    ("TOTAL", ("TOTAL", "KU-RO")),
+    ("DEFICIT", ("DEFICIT", "REMAINDER", "KI-RO")),
+    ("QUANTITY", ("QUANTITY", "NUMERAL", "WEIGHT")),
+    ("COMMODITY", ("COMMODITY", "LOGOGRAM", "ANIMAL")),
+    ("RECIPIENT", ("RECIPIENT", "SENDER")),
+    ("NAME", ("NAME",)),
+    ("HEADER", ("HEADER", "OPENING")),
+    ("DATE", ("DATE",)),
+    ("DEITY", ("DEITY",)),
+    ("OFFERING", ("OFFERING",)),
+    ("SOURCE", ("SOURCE",)),
+    ("PURPOSE", ("PURPOSE",)),
+    ("WORD", ("LEXICAL", "WORD")),
+)
+OTHER = 0
+SLOT_TYPES: Tuple[str, ...] = ("OTHER",) + tuple(name for name, _ in SLOT_KEYWORDS)
+SLOT_IDS: Dict[str, int] = {name: i for i, name in enumerate(SLOT_TYPES)}
+
+# Slots filled by a word of unknown function: an unread Linear A word can
+# plausibly occupy any of them
+WORD_FILLED = ("RECIPIENT", "NAME", "HEADER", "DEITY", "SOURCE", "PURPOSE")
+
+
+@lru_cache(maxsize=None)
+def slot_type(label: str) -> int:
+    """Slot type id for a template label ("COMMODITY_LOGOGRAM" -> COMMODITY)."""
+    normalized = label.upper().replace("_", " ").replace("/", " ").replace("?", "")
+    for name, keywords in SLOT_KEYWORDS:
+        if any(keyword in normalized for keyword in keywords):
+            return SLOT_IDS[name]
+    return OTHER
+
+
+def encode(slots: Sequence[str]) -> Tuple[int, ...]:
+    """Integer slot-type sequence for a list of slot labels."""
+    return tuple(slot_type(label) for label in slots)
+
+
+@dataclass
+class SlotScoring:
+    """Substitution and gap scores between slot types."""
+
+    match: float = 2.0
+    other_match: float = 0.5
+    mismatch: float = -1.0
+    gap: float = 1.0
+    related: Dict[Tuple[str, str], float] = field(
+        default_factory=lambda: {
+            ("TOTAL", "SUBTOTAL"): 1.0,
+            ("TOTAL", "DEFICIT"): 0.5,
+            ("RECIPIENT", "NAME"): 1.0,
+            ("HEADER", "DATE"): 0.5,
+            ("OFFERING", "COMMODITY"): 0.5,
+            **{("WORD", slot): 0.5 for slot in WORD_FILLED},
+        }
+    )
+
+    def matrix(self) -> List[List[float]]:
+        """Symmetric substitution matrix indexed by slot type id."""
+        size = len(SLOT_TYPES)
+        table = [[self.mismatch] * size for _ in range(size)]
+        for i in range(size):
+            table[i][i] = self.match
+        table[OTHER][OTHER] = self.other_match
+        for (a, b), value in self.related.items():
+            table[SLOT_IDS[a]][SLOT_IDS[b]] = table[SLOT_IDS[b]][SLOT_IDS[a]] = value
+        return table
+
+
+DEFAULT_SCORING = SlotScoring()
+
+
+@dataclass
+class Alignment:
+    """Scored alignment of two slot sequences; pairs hold (i, j), None for a gap."""
+
+    score: float
+    normalized: float
+    pairs: List[Tuple[Optional[int], Optional[int]]]
+
+
+# ── Dynamic programming ─────────────────────────────────────────────
+
+
+def _global_score(profile, b, gap: float, band: Optional[int]) -> float:
+    """Needleman-Wunsch score, restricted to |i - j| <= band when given."""
+    n, m = len(profile), len(b)
+    w = max(n, m) if band is None else max(band, abs(n - m))
+    neg = float("-inf")
+    prev = [neg] * (m + 1)
+    for j in range(min(m, w) + 1):
+        prev[j] = -gap * j
+    for i in range(1, n + 1):
+        row = profile[i - 1]
+        lo, hi = max(1, i - w), min(m, i + w)
+        cur = [neg] * (m + 1)
+        if i <= w:
+            cur[0] = -gap * i
+        left = cur[lo - 1]
+        for j in range(lo, hi + 1):
+            best = prev[j - 1] + row[b[j - 1]]
+            up = prev[j] - gap
+            if up > best:
+                best = up
+            left -= gap
+            if left > best:
+                best = left
+            cur[j] = left = best
+        prev = cur
+    return prev[m]
+
+
+def _local_score(profile, b, gap: float) -> float:
+    """Smith-Waterman score (best-scoring aligned segment pair)."""
+    m = len(b)
+    prev = [0.0] * (m + 1)
+    top = 0.0
+    for row in profile:
+        cur = [0.0] * (m + 1)
+        left = 0.0
+        for j in range(1, m + 1):
+            best = prev[j - 1] + row[b[j - 1]]
+            up = prev[j] - gap
+            if up > best:
+                best = up
+            left -= gap
+            if left > best:
+                best = left
+            if best < 0.0:
+                best = 0.0
+            cur[j] = left = best
+            if best > top:
+                top = best
+        prev = cur
+    return top
+
+
+def _traceback(a, b, table, gap: float, local: bool) -> Tuple[float, list]:
+    """Full-matrix alignment with traceback; returns (score, pairs)."""
+    n, m = len(a), len(b)
+    floor = 0.0 if local else float("-inf")
+    score = [[0.0] * (m + 1) for _ in range(n + 1)]
+    if not local:
+        for i in range(n + 1):
+            score[i][0] = -gap * i
+        for j in range(m + 1):
+            score[0][j] = -gap * j
+    end, top = (n, m), 0.0
+    for i in range(1, n + 1):
+        row = table[a[i - 1]]
+        for j in range(1, m + 1):
+            value = max(
+                score[i - 1][j - 1] + row[b[j - 1]],
+                score[i - 1][j] - gap,
+                score[i][j - 1] - gap,
+                floor,
+            )
+            score[i][j] = value
+            if local and value > top:
+                end, top = (i, j), value
+
+    i, j = end
+    pairs = []
+    while i > 0 or j > 0:
+        here = score[i][j]
+        if local and here == 0.0:
+            break
+        if i > 0 and j > 0 and here == score[i - 1][j - 1] + table[a[i - 1]][b[j - 1]]:
+            i, j = i - 1, j - 1
+            pairs.append((i, j))
+        elif i > 0 and (j == 0 or here == score[i - 1][j] - gap):
+            i -= 1
+            pairs.append((i, None))
+        else:
+            j -= 1
+            pairs.append((None, j))
+    pairs.reverse()
+    return (top if local else score[n][m]), pairs
+
+
+# ── Batch engine ────────────────────────────────────────────────────
+
+
+class _PrefixTrie:
+    """Distinct encoded sequences sharing DP columns for common prefixes."""
+
+    def __init__(self, codes: Iterable[Tuple[int, ...]]):
+        self.children: List[Dict[int, int]] = [{}]
+        self.ends: Dict[int, Tuple[int, ...]] = {}
+        for code in codes:
+            node = 0
+            for symbol in code:
+                child = self.children[node].get(symbol)
+                if child is None:
+                    child = self.children[node][symbol] = len(self.children)
+                    self.children.append({})
+                node = child
+            self.ends[node] = code
+
+    def __len__(self) -> int:
+        return len(self.children)
+
+    def local_scores(self, columns, n: int, gap: float) -> Dict[Tuple[int, ...], float]:
+        """Smith-Waterman score of the query against every sequence in the trie."""
+        scores = {}
+        stack = [(0, [0.0] * (n + 1), 0.0)]
+        while stack:
+            node, prev, top = stack.pop()
+            if node in self.ends:
+                scores[self.ends[node]] = top
+            for symbol, child in self.children[node].items():
+                sub = columns[symbol]
+                cur = [0.0] * (n + 1)
+                up = 0.0
+                best_here = top
+                for i in range(1, n + 1):
+                    best = prev[i - 1] + sub[i - 1]
+                    left = prev[i] - gap
+                    if left > best:
+                        best = left
+                    up -= gap
+                    if up > best:
+                        best = up
+                    if best < 0.0:
+                        best = 0.0
+                    cur[i] = up = best
+                    if best > best_here:
+                        best_here = best
+                stack.append((child, cur, best_here))
+        return scores
+
+    def global_scores(
+        self, columns, n: int, gap: float, band: Optional[int]
+    ) -> Dict[Tuple[int, ...], float]:
+        """
+        Needleman-Wunsch score against every sequence whose length is within
+        ``band`` of the query's (all of them without a band).
+        """
+        w = band if band is not None else float("inf")
+        neg = float("-inf")
+        scores = {}
+        root = [(-gap * i if i <= w else neg) for i in range(n + 1)]
+        stack = [(0, root, 0)]
+        while stack:
+            node, prev, depth = stack.pop()
+            if node in self.ends and abs(n - depth) <= w:
+                scores[self.ends[node]] = prev[n]
+            depth += 1
+            lo, hi = max(1, depth - w), min(n, depth + w)
+            for symbol, child in self.children[node].items():
+                sub = columns[symbol]
+                cur = [neg] * (n + 1)
+                if depth <= w:
+                    cur[0] = -gap * depth
+                up = cur[lo - 1] if lo <= n else neg
+                for i in range(lo, int(hi) + 1):
+                    best = prev[i - 1] + sub[i - 1]
+                    left = prev[i] - gap
+                    if left > best:
+                        best = left
+                    up -= gap
+                    if up > best:
+                        best = up
+                    cur[i] = up = best
+                stack.append((child, cur, depth))
+        return scores
+
+
+class TemplateAligner:
+    """
+    Aligns slot sequences against an encoded template library.
+
+    Library sequences are deduplicated into a prefix trie, so one pass over
+    the trie aligns a query with every template and shared template prefixes
+    are computed once.
+
+    Args:
+        library: Template name -> slot labels
+        local: Smith-Waterman instead of Needleman-Wunsch
+        band: Diagonal band half-width for global alignment (None = full);
+            widened to the length difference where needed
+        scoring: Substitution and gap scores
+    """
+
+    def __init__(
+        self,
+        library: Mapping[str, Sequence[str]],
+        local: bool = False,
+        band: Optional[int] = None,
+        scoring: SlotScoring = DEFAULT_SCORING,
+    ):
+        self.local = local
+        self.band = band
+        self.scoring = scoring
+        self.table = scoring.matrix()
+        self.codes: Dict[str, Tuple[int, ...]] = {name: encode(s) for name, s in library.items()}
+        self._order = {name: i for i, name in enumerate(self.codes)}
+        self._self_scores = {code: self._self_score(code) for code in set(self.codes.values())}
+        self._trie = _PrefixTrie(self._self_scores)
+        self._memo: Dict[Tuple[int, ...], Dict[Tuple[int, ...], float]] = {}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def _self_score(self, code: Tuple[int, ...]) -> float:
+        return sum(self.table[t][t] for t in code)
+
+    def _normalize(self, raw: float, self_a: float, self_b: float) -> float:
+        """Raw score over the smaller (local) or larger (global) self-alignment score."""
+        denominator = min(self_a, self_b) if self.local else max(self_a, self_b)
+        if denominator <= 0 or raw <= 0:
+            return 0.0
+        return min(1.0, raw / denominator)
+
+    def _scores(self, code: Tuple[int, ...]) -> Dict[Tuple[int, ...], float]:
+        """Normalized scores of one query against every distinct library sequence."""
+        scores = self._memo.get(code)
+        if scores is not None:
+            return scores
+        n, gap = len(code), self.scoring.gap
+        # Substitution score of each query slot against each library slot type
+        columns = [[self.table[q][t] for q in code] for t in range(len(SLOT_TYPES))]
+        if self.local:
+            raw = self._trie.local_scores(columns, n, gap)
+        else:
+            raw = self._trie.global_scores(columns, n, gap, self.band)
+            profile = [self.table[q] for q in code]
+            for target in self._self_scores:
+                if target not in raw:  # outside the band: align with a widened band
+                    raw[target] = _global_score(profile, target, gap, self.band)
+        self_a = self._self_score(code)
+        scores = self._memo[code] = {
+            target: self._normalize(value, self_a, self._self_scores[target])
+            for target, value in raw.items()
+        }
+        return scores
+
+    def score(self, slots: Sequence[str]) -> Dict[str, float]:
+        """Normalized score (0-1) of one slot sequence against every library template."""
+        by_code = self._scores(encode(slots))
+        return {name: by_code[code] for name, code in self.codes.items()}
+
+    def score_all(self, queries: Mapping[str, Sequence[str]]) -> Dict[str, Dict[str, float]]:
+        """Scores for many queries; identical query sequences are aligned once."""
+        return {name: self.score(slots) for name, slots in queries.items()}
+
+    def best(self, slots: Sequence[str], k: int = 3) -> List[Tuple[str, float]]:
+        """Top-k library templates for a slot sequence, best first (ties by library order)."""
+        by_code = self._scores(encode(slots))
+        ranked = heapq.nsmallest(
+            k, self.codes, key=lambda name: (-by_code[self.codes[name]], self._order[name])
+        )
+        return [(name, by_code[self.codes[name]]) for name in ranked]
+
+    def align(self, slots: Sequence[str], template: str) -> Alignment:
+        """Full alignment of a slot sequence with one library template, with slot pairs."""
+        code_a, code_b = encode(slots), self.codes[template]
+        raw, pairs = _traceback(code_a, code_b, self.table, self.scoring.gap, self.local)
+        normalized = self._normalize(raw, self._self_score(code_a), self._self_scores[code_b])
+        return Alignment(score=raw, normalized=normalized, pairs=pairs)
+
+
+def align(
+    slots_a: Sequence[str],
+    slots_b: Sequence[str],
+    local: bool = False,
+    scoring: SlotScoring = DEFAULT_SCORING,
+) -> Alignment:
+    """One-off alignment of two slot sequences."""
+    return TemplateAligner({"b": slots_b}, local=local, scoring=scoring).align(slots_a, "b")
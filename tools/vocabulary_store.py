@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+Indexed SQLite store for comparative reference vocabularies.
+
+Each lexicon (e.g. ``akkadian_oracc``, ``ugaritic_trade``) is a set of
+``term -> record`` entries, persisted in one SQLite database with:
+
+- a lower-cased term index for case-insensitive exact lookups
+- root and consonant-skeleton indexes (``KULLATU`` -> ``KLT``)
+- an FTS5 trigram index over term, root and meaning, so substring queries
+  (the semantics the tools always used) are answered by index
+
+Search results are ranked the way the comparative tools already scored
+matches: term hits (1.0) before root hits (0.8) before meaning hits (0.6),
+then by FTS5 bm25 rank. Candidates from the index are re-checked with the
+original substring tests, so result sets are identical to a linear scan.
+
+Lexicons are synced from their source data by fingerprint: an unchanged
+source is not rewritten, so reopening the store costs one metadata read.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+
+SCHEMA_VERSION = 1
+
+PROJECT_ROOT = Path(__file__).parent.parent
+# Derived from the lexicon sources; safe to delete (rebuilt on next sync).
+DEFAULT_DB_FILE = PROJECT_ROOT / "data" / "cache" / "vocabulary.sqlite"
+
+CONSONANTS = set("BCDFGHJKLMNPQRSTVWXYZḪŠṢṬ")
+
+# Relevance by matched field (mirrors ComparativeIntegrator.query_akkadian).
+FIELD_RELEVANCE = {"term": 1.0, "root": 0.8, "meaning": 0.6}
+SEARCH_FIELDS = ("term", "root", "meaning")
+
+# FTS5 trigram queries need at least three characters.
+MIN_FTS_QUERY = 3
+
+
+def consonant_skeleton(text: str) -> str:
+    """Upper-case consonants of a word with doubled consonants collapsed."""
+    skeleton = []
+    for char in text.upper():
+        if char in CONSONANTS and (not skeleton or skeleton[-1] != char):
+            skeleton.append(char)
+    return "".join(skeleton)
+
+
+def records_fingerprint(records: Mapping[str, Any]) -> str:
+    """Content hash for an in-memory lexicon."""
+    payload = json.dumps(records, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class VocabularyHit:
+    """One ranked search result."""
+
+    term: str
+    field: str  # term, root or meaning
+    relevance: float
+    rank: float  # bm25 (lower is better); 0.0 when answered without FTS
+    data: Dict[str, Any]
+
+
+def _field_match(term: str, data: Mapping[str, Any], query: str, fields: Sequence[str]):
+    """First field (in priority order) containing the query, or None."""
+    query_lower = query.lower()
+    for field in fields:
+        if field == "term" and query_lower in term.lower():
+            return field
+        if field == "root" and query.upper() in str(data.get("root", "")).upper():
+            return field
+        if field == "meaning" and query_lower in str(data.get("meaning", "")).lower():
+            return field
+    return None
+
+
+class VocabularyStore:
+    """
+    SQLite-backed lexicons with term, root, skeleton and FTS indexes.
+
+    Connections are shared across threads behind a lock, so tools can query
+    from a worker pool.
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_DB_FILE):
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.RLock()
+        self.has_fts = self._create_schema()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ── Schema and sync ──────────────────────────────────────────────
+
+    def _create_schema(self) -> bool:
+        conn = self._conn
+        with self._lock, conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, SCHEMA_VERSION):
+                conn.executescript(
+                    "DROP TABLE IF EXISTS terms_fts; DROP TABLE IF EXISTS terms;"
+                    " DROP TABLE IF EXISTS lexicons;"
+                )
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS lexicons (
+                    lexicon TEXT PRIMARY KEY,
+                    fingerprint TEXT NOT NULL,
+                    term_count INTEGER NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS terms (
+                    id INTEGER PRIMARY KEY,
+                    lexicon TEXT NOT NULL,
+                    term TEXT NOT NULL,
+                    term_fold TEXT NOT NULL,
+                    root TEXT NOT NULL,
+                    skeleton TEXT NOT NULL,
+                    meaning TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    UNIQUE (lexicon, term)
+                );
+                CREATE INDEX IF NOT EXISTS terms_fold ON terms (lexicon, term_fold);
+                CREATE INDEX IF NOT EXISTS terms_root ON terms (lexicon, root);
+                CREATE INDEX IF NOT EXISTS terms_skeleton ON terms (lexicon, skeleton);
+                """
+            )
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            try:
+                conn.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS terms_fts USING fts5("
+                    "term, root, meaning, tokenize='trigram')"
+                )
+                return True
+            except sqlite3.OperationalError:
+                # SQLite without FTS5/trigram: searches fall back to scans.
+                return False
+
+    def fingerprint(self, lexicon: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fingerprint FROM lexicons WHERE lexicon = ?", (lexicon,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def lexicons(self) -> Dict[str, int]:
+        """Lexicon name -> term count."""
+        with self._lock:
+            rows = self._conn.execute("SELECT lexicon, term_count FROM lexicons").fetchall()
+        return dict(rows)
+
+    def sync(
+        self, lexicon: str, records: Mapping[str, Mapping[str, Any]], fingerprint: str = None
+    ) -> bool:
+        """
+        Replace a lexicon with ``records`` unless its fingerprint is unchanged.
+
+        Returns True if the lexicon was rewritten.
+        """
+        fingerprint = fingerprint or records_fingerprint(records)
+        if self.fingerprint(lexicon) == fingerprint:
+            return False
+        with self._lock, self._conn:
+            self._delete(lexicon)
+            self._insert(lexicon, records.items())
+            self._conn.execute(
+                "INSERT OR REPLACE INTO lexicons VALUES (?, ?, ?)",
+                (lexicon, fingerprint, len(records)),
+            )
+        return True
+
+    def upsert(self, lexicon: str, records: Mapping[str, Mapping[str, Any]]) -> Optional[str]:
+        """
+        Insert or replace ``records`` without rewriting the rest of the lexicon.
+
+        The lexicon fingerprint is chained with the records', so a caller
+        that mirrors the lexicon can keep it current for ``sync``.  Returns
+        the new fingerprint.
+        """
+        if not records:
+            return self.fingerprint(lexicon)
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT fingerprint FROM lexicons WHERE lexicon = ?", (lexicon,)
+            ).fetchone()
+            fingerprint = records_fingerprint(
+                {"after": row[0] if row else "", "upsert": dict(records)}
+            )
+            keys = [(lexicon, term) for term in records]
+            if self.has_fts:
+                self._conn.executemany(
+                    "DELETE FROM terms_fts WHERE rowid IN "
+                    "(SELECT id FROM terms WHERE lexicon = ? AND term = ?)",
+                    keys,
+                )
+            self._conn.executemany("DELETE FROM terms WHERE lexicon = ? AND term = ?", keys)
+            self._insert(lexicon, records.items())
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM terms WHERE lexicon = ?", (lexicon,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO lexicons VALUES (?, ?, ?)", (lexicon, fingerprint, count)
+            )
+        return fingerprint
+
+    def _delete(self, lexicon: str) -> None:
+        if self.has_fts:
+            self._conn.execute(
+                "DELETE FROM terms_fts WHERE rowid IN (SELECT id FROM terms WHERE lexicon = ?)",
+                (lexicon,),
+            )
+        self._conn.execute("DELETE FROM terms WHERE lexicon = ?", (lexicon,))
+
+    def _insert(self, lexicon: str, items: Iterable[Tuple[str, Mapping[str, Any]]]) -> None:
+        rows = []
+        for term, data in items:
+            root = str(data.get("root", "") or "")
+            meaning = str(data.get("meaning", "") or "")
+            rows.append(
+                (
+                    lexicon,
+                    term,
+                    term.lower(),
+                    root.upper(),
+                    consonant_skeleton(term),
+                    meaning,
+                    json.dumps(data, ensure_ascii=False),
+                )
+            )
+        (last_id,) = self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM terms").fetchone()
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO terms "
+            "(lexicon, term, term_fold, root, skeleton, meaning, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        if self.has_fts:
+            self._conn.execute(
+                "INSERT INTO terms_fts (rowid, term, root, meaning) "
+                "SELECT id, term, root, meaning FROM terms "
+                "WHERE lexicon = ? AND id > ?",
+                (lexicon, last_id),
+            )
+
+    # ── Lookups ──────────────────────────────────────────────────────
+
+    def count(self, lexicon: str) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM terms WHERE lexicon = ?", (lexicon,)
+            ).fetchone()[0]
+
+    def get(self, lexicon: str, term: str) -> Optional[Dict[str, Any]]:
+        """Exact (case-sensitive) term lookup."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM terms WHERE lexicon = ? AND term = ?", (lexicon, term)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_folded(self, lexicon: str, term: str) -> List[Dict[str, Any]]:
+        """Case-insensitive exact term lookup (all spellings, lexicon order)."""
+        return [json.loads(d) for _, d in self._rows_where(lexicon, "term_fold", [term.lower()])]
+
+    def records(self, lexicon: str) -> Dict[str, Dict[str, Any]]:
+        """All entries of a lexicon in insertion order."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT term, data FROM terms WHERE lexicon = ? ORDER BY id", (lexicon,)
+            ).fetchall()
+        return {term: json.loads(data) for term, data in rows}
+
+    def _rows_where(self, lexicon: str, column: str, values: Iterable[str]) -> List[tuple]:
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT term, data FROM terms WHERE lexicon = ? AND {column} = ? ORDER BY id",
+                (lexicon, *values),
+            ).fetchall()
+
+    def by_root(self, lexicon: str, root: str) -> List[Dict[str, Any]]:
+        """Entries whose root equals ``root`` (case-insensitive)."""
+        return [json.loads(d) for _, d in self._rows_where(lexicon, "root", [root.upper()])]
+
+    def by_skeleton(self, lexicon: str, word: str) -> List[Dict[str, Any]]:
+        """Entries sharing the consonant skeleton of ``word``."""
+        skeleton = consonant_skeleton(word)
+        if not skeleton:
+            return []
+        return [json.loads(d) for _, d in self._rows_where(lexicon, "skeleton", [skeleton])]
+
+    def search(
+        self,
+        lexicon: str,
+        query: str,
+        fields: Sequence[str] = SEARCH_FIELDS,
+        limit: Optional[int] = None,
+        ranked: bool = True,
+    ) -> List[VocabularyHit]:
+        """
+        Ranked substring search over term, root and meaning.
+
+        Queries of three or more characters use the FTS5 trigram index;
+        shorter ones fall back to a scan of the lexicon.  With ``ranked``
+        False hits stay in lexicon order, as a linear scan would return them.
+        """
+        hits = [hit for _, hit in self._candidates(lexicon, query, fields)]
+        if ranked:
+            hits.sort(key=lambda h: (-h.relevance, h.rank))
+        return hits[:limit] if limit else hits
+
+    def _candidates(
+        self, lexicon: str, query: str, fields: Sequence[str]
+    ) -> List[Tuple[int, VocabularyHit]]:
+        """Verified (id, hit) pairs in lexicon order."""
+        if not query:
+            return []
+        with self._lock:
+            if self.has_fts and len(query) >= MIN_FTS_QUERY:
+                columns = " ".join(f for f in fields if f in SEARCH_FIELDS)
+                phrase = '"' + query.replace('"', '""') + '"'
+                rows = self._conn.execute(
+                    "SELECT t.id, t.term, t.data, bm25(terms_fts) FROM terms_fts "
+                    "JOIN terms t ON t.id = terms_fts.rowid "
+                    "WHERE terms_fts MATCH ? AND t.lexicon = ? ORDER BY t.id",
+                    (f"{{{columns}}} : {phrase}", lexicon),
+                ).fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT id, term, data, 0.0 FROM terms WHERE lexicon = ? ORDER BY id",
+                    (lexicon,),
+                ).fetchall()
+
+        candidates = []
+        for term_id, term, raw, rank in rows:
+            data = json.loads(raw)
+            field = _field_match(term, data, query, fields)
+            if field:
+                hit = VocabularyHit(term, field, FIELD_RELEVANCE[field], rank, data)
+                candidates.append((term_id, hit))
+        return candidates
+
+    def resolve_many(
+        self, lexicon: str, terms: Iterable[str], fuzzy: bool = True
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Resolve many terms in one pass.
+
+        Exact terms are matched with a single join against a temporary
+        table; with ``fuzzy``, misses fall back to the first entry (in
+        lexicon order) whose term contains the query, via the FTS index.
+        """
+        wanted = list(dict.fromkeys(t for t in terms if t))
+        resolved: Dict[str, Optional[Dict[str, Any]]] = dict.fromkeys(wanted)
+        if not wanted:
+            return resolved
+        with self._lock, self._conn:
+            self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS wanted (term TEXT PRIMARY KEY)")
+            self._conn.execute("DELETE FROM wanted")
+            self._conn.executemany("INSERT INTO wanted VALUES (?)", [(t,) for t in wanted])
+            rows = self._conn.execute(
+                "SELECT t.term, t.data FROM wanted w "
+                "JOIN terms t ON t.lexicon = ? AND t.term = w.term",
+                (lexicon,),
+            ).fetchall()
+            self._conn.execute("DELETE FROM wanted")
+        for term, raw in rows:
+            resolved[term] = json.loads(raw)
+        if fuzzy:
+            for term in wanted:
+                if resolved[term] is None:
+                    candidates = self._candidates(lexicon, term, ("term",))
+                    if candidates:
+                        resolved[term] = candidates[0][1].data
+        return resolved
+
+
+def open_store(path: Union[str, Path] = DEFAULT_DB_FILE) -> VocabularyStore:
+    """Open the on-disk store, falling back to memory if it is not writable."""
+    try:
+        return VocabularyStore(path)
+    except (OSError, sqlite3.Error):
+        return VocabularyStore(":memory:")